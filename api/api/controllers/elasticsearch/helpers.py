@@ -12,6 +12,7 @@ import structlog
 from elasticsearch import BadRequestError, NotFoundError
 from elasticsearch_dsl import Search
 
+from api.utils import request_timing
 from api.utils.dead_link_mask import get_query_hash, get_query_mask
 
 
@@ -24,7 +25,8 @@ def log_timing_info(func):
         start_time = time.time()
 
         # Call the original function
-        result = func(*args, **kwargs)
+        with request_timing.timed("es"):
+            result = func(*args, **kwargs)
 
         response_time_in_ms = int((time.time() - start_time) * 1000)
         if hasattr(result, "took"):
@@ -165,3 +167,32 @@ def get_query_slice(
     if start_slice + end_slice > ELASTICSEARCH_MAX_RESULT_WINDOW:
         raise ValueError(DEEP_PAGINATION_ERROR)
     return start_slice, end_slice
+
+
+def get_cursor_slice(
+    query_hash: str, offset: int, page_size: int, filter_dead: bool | None = False
+) -> int:
+    """
+    Select the number of search results to fetch after a cursor.
+
+    Like ``_paginate_with_dead_link_mask``, the dead link mask is used to predict
+    how many results are needed to fill the page, from the position of the cursor.
+    Beyond the end of the mask, ``DEAD_LINK_RATIO`` is assumed.
+
+    :param query_hash: The hash of the query, see ``get_query_hash``.
+    :param offset: The number of results of the query before the cursor.
+    :param page_size: The number of live results needed.
+    :param filter_dead: Whether dead links will be removed from the results.
+    :return: The number of results to fetch.
+    """
+
+    if not filter_dead:
+        return page_size
+
+    query_mask = get_query_mask(query_hash)[offset:]
+    live_count = 0
+    for size, is_live in enumerate(query_mask, start=1):
+        live_count += is_live
+        if live_count == page_size:
+            return size
+    return len(query_mask) + _unmasked_query_end(page_size - live_count, 1)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from elasticsearch_dsl import Search
 from elasticsearch_dsl.query import Match, Q, Term
 from elasticsearch_dsl.response import Hit
@@ -11,7 +13,51 @@ from api.controllers.search_controller import (
 )
 
 
-def related_media(uuid: str, index: str, filter_dead: bool) -> list[Hit]:
+@dataclass
+class RelatedItem:
+    """The fields of a media item from which its related media are found."""
+
+    title: str | None
+    tags: list[str]
+    creator: str | None
+
+    @classmethod
+    def from_media(cls, media) -> RelatedItem:
+        """
+        Get the fields from a media item.
+
+        :param media: the media item, either an Elasticsearch hit or a model instance
+        :return: the fields from which to find related media
+        """
+
+        tags = getattr(media, "tags", None) or []
+        return cls(
+            title=getattr(media, "title", None),
+            tags=[tag["name"] for tag in tags if "name" in tag],
+            creator=getattr(media, "creator", None),
+        )
+
+
+def get_related_item(uuid: str, index: str) -> RelatedItem:
+    """
+    Get the fields from which to find related media from the Elasticsearch index.
+
+    :param uuid: The UUID of the item to find related results for.
+    :param index: The Elasticsearch index to search (e.g. 'image')
+    :return: The fields of the item.
+    :raises IndexError: if the item is not in the index
+    """
+
+    # Search the default index for the item itself as it might be sensitive.
+    item_search = Search(index=index)
+    # This will raise ``IndexError`` if no hits are found.
+    item_hit = item_search.query(Term(identifier=uuid)).execute().hits[0]
+    return RelatedItem.from_media(item_hit)
+
+
+def related_media(
+    uuid: str, index: str, filter_dead: bool, item: RelatedItem | None = None
+) -> list[Hit]:
     """
     Given a UUID, finds 10 related search results based on title and tags.
 
@@ -22,19 +68,14 @@ def related_media(uuid: str, index: str, filter_dead: bool) -> list[Hit]:
     :param uuid: The UUID of the item to find related results for.
     :param index: The Elasticsearch index to search (e.g. 'image')
     :param filter_dead: Whether dead links should be removed.
+    :param item: The fields of the item, looked up in the index if not given.
     :return: List of related results.
     """
 
-    # Search the default index for the item itself as it might be sensitive.
-    item_search = Search(index=index)
-    # This will raise ``IndexError`` if no hits are found. This error is caught
-    # in the viewset handler function.
-    item_hit = item_search.query(Term(identifier=uuid)).execute().hits[0]
+    if item is None:
+        item = get_related_item(uuid, index)
 
-    # Match related using title.
-    title = getattr(item_hit, "title", None)
-    tags = getattr(item_hit, "tags", None)
-    creator = getattr(item_hit, "creator", None)
+    title, tags, creator = item.title, item.tags, item.creator
 
     related_query = {"must_not": [], "must": [], "should": []}
 
@@ -45,14 +86,14 @@ def related_media(uuid: str, index: str, filter_dead: bool) -> list[Hit]:
             # Only use `creator` query if there are no `title` and `tags`
             related_query["should"].append(Term(creator=creator))
     else:
+        # Match related using title.
         if title:
             related_query["should"].append(Match(title=title))
 
         # Match related using tags, if the item has any.
         # Only use the first 10 tags
         if tags:
-            tags = [tag["name"] for tag in tags[:10]]
-            related_query["should"].append(Q("terms", tags__name__keyword=tags))
+            related_query["should"].append(Q("terms", tags__name__keyword=tags[:10]))
 
     # Exclude the dynamically disabled sources.
     if excluded_sources_query := get_excluded_sources_query():
@@ -9,7 +9,7 @@ from django.core.cache import cache
 
 import structlog
 from decouple import config
-from elasticsearch.exceptions import NotFoundError
+from elasticsearch.exceptions import ApiError, NotFoundError
 from elasticsearch_dsl import Q, Search
 from elasticsearch_dsl.query import EMPTY_QUERY
 from elasticsearch_dsl.response import Hit, Response
@@ -21,11 +21,12 @@ from api.constants.search import SearchStrategy
 from api.constants.sorting import INDEXED_ON
 from api.controllers.elasticsearch.helpers import (
     ELASTICSEARCH_MAX_RESULT_WINDOW,
+    get_cursor_slice,
     get_es_response,
     get_query_slice,
     get_raw_es_response,
 )
-from api.utils import tallies
+from api.utils import request_timing, search_cursor, tallies
 from api.utils.check_dead_links import check_dead_links
 from api.utils.dead_link_mask import get_query_hash
 from api.utils.search_context import SearchContext
@@ -39,6 +40,8 @@ logger = structlog.get_logger(__name__)
 
 
 NESTING_THRESHOLD = config("POST_PROCESS_NESTING_THRESHOLD", cast=int, default=5)
+# The most Elasticsearch queries made to fill a page of results after a cursor
+CURSOR_FETCH_LIMIT = config("CURSOR_FETCH_LIMIT", cast=int, default=3)
 SOURCE_CACHE_TIMEOUT = 60 * 60 * 4  # 4 hours
 FILTER_CACHE_TIMEOUT = 30
 FILTERED_SOURCES_CACHE_KEY = "filtered_sources"
@@ -99,7 +102,8 @@ def _post_process_results(
 
     if filter_dead:
         query_hash = get_query_hash(s)
-        check_dead_links(query_hash, start, results)
+        with request_timing.timed("dead_links"):
+            check_dead_links(query_hash, start, results)
 
         if len(results) == 0:
             # first page is all dead links
@@ -396,6 +400,40 @@ query_builders = {
 }
 
 
+def _build_search(
+    search_params: MediaSearchRequestSerializer, index: SearchIndex
+) -> tuple[Search, SearchStrategy]:
+    """
+    Build the search or collection query.
+
+    :param search_params: Search query params, see :class: `MediaSearchRequestSerializer`.
+    :param index: The Elasticsearch index to search.
+    :return: The Elasticsearch Search object, and the strategy of the query.
+    """
+    strategy: SearchStrategy = (
+        "collection" if search_params.validated_data.get("collection") else "search"
+    )
+
+    query = query_builders[strategy](search_params)
+
+    s = Search(index=index).query(query)
+
+    if strategy == "search":
+        # Use highlighting to determine which fields contribute to the selection of
+        # top results.
+        s = s.highlight(*DEFAULT_SEARCH_FIELDS)
+        s = s.highlight_options(order="score")
+        s.extra(track_scores=True)
+
+    # Sort by `created_on` if the parameter is set or if `strategy` is `collection`.
+    sort_by = search_params.validated_data.get("sort_by")
+    if strategy == "collection" or sort_by == INDEXED_ON:
+        sort_dir = search_params.validated_data.get("sort_dir", "desc")
+        s = s.sort({"created_on": {"order": sort_dir}})
+
+    return s, strategy
+
+
 def query_media(
     search_params: MediaSearchRequestSerializer,
     origin_index: OriginIndex,
@@ -427,44 +465,64 @@ def query_media(
     pages, the number of results, and the ``SearchContext`` as a dict.
     """
     index = get_index(exact_index, origin_index, search_params)
-
-    strategy: SearchStrategy = (
-        "collection" if search_params.validated_data.get("collection") else "search"
-    )
-
-    query = query_builders[strategy](search_params)
-
-    s = Search(index=index).query(query)
-
-    if strategy == "search":
-        # Use highlighting to determine which fields contribute to the selection of
-        # top results.
-        s = s.highlight(*DEFAULT_SEARCH_FIELDS)
-        s = s.highlight_options(order="score")
-        s.extra(track_scores=True)
+    s, strategy = _build_search(search_params, index)
 
     # Route users to the same Elasticsearch worker node to reduce
     # pagination inconsistencies and increase cache hits.
     # TODO: Re-add 7s request_timeout when ES stability is restored
     s = s.params(preference=str(ip))
 
-    # Sort by `created_on` if the parameter is set or if `strategy` is `collection`.
-    sort_by = search_params.validated_data.get("sort_by")
-    if strategy == "collection" or sort_by == INDEXED_ON:
-        sort_dir = search_params.validated_data.get("sort_dir", "desc")
-        s = s.sort({"created_on": {"order": sort_dir}})
-
     # Execute paginated search and tally results
     page_count, result_count, results = execute_search(
         s, page, page_size, filter_dead, index, es_query=strategy
     )
 
     result_ids = [result.identifier for result in results]
-    search_context = SearchContext.build(result_ids, origin_index)
+    with request_timing.timed("search_context"):
+        search_context = SearchContext.build(result_ids, origin_index)
 
     return results, page_count, result_count, search_context.asdict()
 
 
+def query_media_by_cursor(
+    search_params: MediaSearchRequestSerializer,
+    origin_index: OriginIndex,
+    exact_index: bool,
+    page_size: int,
+    filter_dead: bool,
+    cursor: search_cursor.Cursor | None,
+) -> tuple[list[Hit], int, int, dict, str | None]:
+    """
+    Build the search or collection query, execute it and return the page of
+    results after the cursor.
+
+    Unlike ``query_media``, the cost of each page does not depend on its depth,
+    and there is no limit to how deep the results can be paginated.
+
+    :param search_params: Search query params, see :class: `MediaSearchRequestSerializer`.
+    :param origin_index: The Elasticsearch index to search (e.g. 'image')
+    :param exact_index: whether to skip all modifications to the index name
+    :param page_size: The number of results to return per page.
+    :param filter_dead: Whether dead links should be removed.
+    :param cursor: The cursor to the page, or ``None`` for the first page.
+    :return: Tuple with a list of Hits from elasticsearch, the total count of
+    pages, the number of results, the ``SearchContext`` as a dict and the
+    encoded cursor to the next page, if there is one.
+    """
+    index = get_index(exact_index, origin_index, search_params)
+    s, strategy = _build_search(search_params, index)
+
+    page_count, result_count, results, next_cursor = execute_cursor_search(
+        s, cursor, page_size, filter_dead, index, es_query=f"{strategy}_cursor"
+    )
+
+    result_ids = [result.identifier for result in results]
+    with request_timing.timed("search_context"):
+        search_context = SearchContext.build(result_ids, origin_index)
+
+    return results, page_count, result_count, search_context.asdict(), next_cursor
+
+
 def tally_results(
     index: SearchIndex, results: list[Hit] | None, page: int, page_size: int
 ) -> None:
@@ -529,6 +587,128 @@ def execute_search(
     return page_count, result_count, results
 
 
+def execute_cursor_search(
+    s: Search,
+    cursor: search_cursor.Cursor | None,
+    page_size: int,
+    filter_dead: bool,
+    index: SearchIndex,
+    es_query: str,
+) -> tuple[int, int, list[Hit], str | None]:
+    """
+    Execute search for the page after the cursor in a point in time of the index,
+    post-processes the results, and returns the result and page counts, the
+    results and the cursor to the next page.
+
+    Dead links are filtered using and updating the same dead link mask as
+    ``execute_search``, at the position of the page in the results.
+    """
+    query_hash = get_query_hash(s)
+    opened_pit = cursor is None
+    if opened_pit:
+        with request_timing.timed("es"):
+            pit = settings.ES.open_point_in_time(
+                index=index, keep_alive=search_cursor.KEEP_ALIVE
+            )
+        cursor = search_cursor.Cursor(
+            query_hash=query_hash,
+            pit_id=pit["id"],
+            search_after=None,
+            offset=0,
+            page=1,
+        )
+    elif cursor.query_hash != query_hash:
+        raise search_cursor.InvalidCursor("The cursor belongs to a different query.")
+
+    pit_id, search_after, offset = cursor.pit_id, cursor.search_after, cursor.offset
+    try:
+        # A point in time applies to its own indices. Break ties between hits with the
+        # same sort values by their position in the shards, so that ``search_after``
+        # neither skips nor repeats hits.
+        sort = s.to_dict().get("sort", ["_score"])
+        s = s.index().sort(*sort, "_shard_doc")
+
+        results: list[Hit] = []
+        positions: dict[int, tuple[int, list]] = {}
+        exhausted = False
+        for _ in range(CURSOR_FETCH_LIMIT):
+            size = get_cursor_slice(
+                query_hash, offset, page_size - len(results), filter_dead
+            )
+            page_s = s.extra(pit={"id": pit_id, "keep_alive": search_cursor.KEEP_ALIVE})
+            if search_after is not None:
+                page_s = page_s.extra(search_after=search_after)
+
+            try:
+                search_response = get_es_response(page_s[:size], es_query=es_query)
+            except ValueError as e:
+                if isinstance(e.args[0], NotFoundError):
+                    raise search_cursor.InvalidCursor(
+                        "The cursor has expired. Start again from the first page."
+                    )
+                raise
+
+            pit_id = search_response.pit_id
+            hits = list(search_response)
+            for position, hit in enumerate(hits, start=offset):
+                positions[id(hit)] = (position, list(hit.meta.sort))
+            if filter_dead and hits:
+                live_hits = list(hits)
+                with request_timing.timed("dead_links"):
+                    check_dead_links(query_hash, offset, live_hits)
+                results += live_hits
+            else:
+                results += hits
+
+            exhausted = len(hits) < size
+            if hits:
+                offset, search_after = positions[id(hits[-1])]
+                offset += 1
+            if exhausted or len(results) >= page_size:
+                break
+
+        if len(results) > page_size:
+            # Resume after the last hit of the page, rather than after the last hit
+            # fetched, so that the live hits left out of the page are not skipped
+            results = results[:page_size]
+            offset, search_after = positions[id(results[-1])]
+            offset += 1
+            exhausted = False
+
+        result_count, page_count = _get_result_and_page_count(
+            search_response, results, page_size, cursor.page
+        )
+    except BaseException:
+        # Nobody has the cursor to the point in time opened for the first page, so
+        # it would stay open until it expires
+        if opened_pit:
+            _close_point_in_time(pit_id)
+        raise
+
+    tally_results(index, results, cursor.page, page_size)
+
+    if exhausted:
+        _close_point_in_time(pit_id)
+        return page_count, result_count, results, None
+
+    next_cursor = search_cursor.Cursor(
+        query_hash=query_hash,
+        pit_id=pit_id,
+        search_after=search_after,
+        offset=offset,
+        page=cursor.page + 1,
+    )
+    return page_count, result_count, results, search_cursor.encode(next_cursor)
+
+
+def _close_point_in_time(pit_id: str):
+    try:
+        settings.ES.close_point_in_time(id=pit_id)
+    except ApiError as e:
+        # The point in time expires on its own anyway
+        logger.warning("Could not close point in time.", exc=e)
+
+
 def get_sources(index):
     """
     Given an index, find all available data sources and return their counts.
@@ -15,6 +15,8 @@ from api.docs.base_docs import (
     fields_to_md,
 )
 from api.examples import (
+    audio_bulk_200_example,
+    audio_bulk_curl,
     audio_complain_201_example,
     audio_complain_curl,
     audio_detail_200_example,
@@ -33,12 +35,16 @@ from api.examples import (
     audio_waveform_curl,
 )
 from api.serializers.audio_serializers import (
+    AudioBulkSerializer,
     AudioReportRequestSerializer,
     AudioSearchRequestSerializer,
     AudioSerializer,
     AudioWaveformSerializer,
 )
-from api.serializers.media_serializers import MediaThumbnailRequestSerializer
+from api.serializers.media_serializers import (
+    MediaBulkRequestSerializer,
+    MediaThumbnailRequestSerializer,
+)
 from api.serializers.source_serializers import SourceSerializer
 
 
@@ -97,6 +103,24 @@ detail = custom_extend_schema(
     eg=[audio_detail_curl],
 )
 
+bulk = custom_extend_schema(
+    desc=f"""
+        Get the details of several specified audio files at once.
+
+        The results are in the order of the requested identifiers, with `null`
+        in place of the audio files that were not found, whose identifiers are also
+        listed in `not_found`. By using this endpoint, you can obtain the same
+        info as from the detail endpoint, such as
+        {fields_to_md(AudioSerializer.Meta.fields)}""",
+    params=MediaBulkRequestSerializer,
+    res={
+        200: (AudioBulkSerializer, audio_bulk_200_example),
+        400: (ValidationError, None),
+        401: (NotAuthenticated, None),
+    },
+    eg=[audio_bulk_curl],
+)
+
 related = custom_extend_schema(
     desc=f"""
         Get related audio files for a specified audio track.
@@ -15,6 +15,8 @@ from api.docs.base_docs import (
     fields_to_md,
 )
 from api.examples import (
+    image_bulk_200_example,
+    image_bulk_curl,
     image_complain_201_example,
     image_complain_curl,
     image_detail_200_example,
@@ -32,13 +34,17 @@ from api.examples import (
 )
 from api.examples.image_responses import image_oembed_400_example
 from api.serializers.image_serializers import (
+    ImageBulkSerializer,
     ImageReportRequestSerializer,
     ImageSearchRequestSerializer,
     ImageSerializer,
     OembedRequestSerializer,
     OembedSerializer,
 )
-from api.serializers.media_serializers import MediaThumbnailRequestSerializer
+from api.serializers.media_serializers import (
+    MediaBulkRequestSerializer,
+    MediaThumbnailRequestSerializer,
+)
 from api.serializers.source_serializers import SourceSerializer
 
 
@@ -98,6 +104,24 @@ detail = custom_extend_schema(
     eg=[image_detail_curl],
 )
 
+bulk = custom_extend_schema(
+    desc=f"""
+        Get the details of several specified images at once.
+
+        The results are in the order of the requested identifiers, with `null`
+        in place of the images that were not found, whose identifiers are also
+        listed in `not_found`. By using this endpoint, you can obtain the same
+        info as from the detail endpoint, such as
+        {fields_to_md(ImageSerializer.Meta.fields)}""",
+    params=MediaBulkRequestSerializer,
+    res={
+        200: (ImageBulkSerializer, image_bulk_200_example),
+        400: (ValidationError, None),
+        401: (NotAuthenticated, None),
+    },
+    eg=[image_bulk_curl],
+)
+
 related = custom_extend_schema(
     desc=f"""
         Get related images for a specified image.
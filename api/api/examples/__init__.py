@@ -1,4 +1,5 @@
 from api.examples.audio_requests import (
+    audio_bulk_curl,
     audio_complain_curl,
     audio_detail_curl,
     audio_related_curl,
@@ -8,6 +9,7 @@ from api.examples.audio_requests import (
     audio_waveform_curl,
 )
 from api.examples.audio_responses import (
+    audio_bulk_200_example,
     audio_complain_201_example,
     audio_detail_200_example,
     audio_detail_404_example,
@@ -20,6 +22,7 @@ from api.examples.audio_responses import (
     audio_waveform_404_example,
 )
 from api.examples.image_requests import (
+    image_bulk_curl,
     image_complain_curl,
     image_detail_curl,
     image_oembed_curl,
@@ -29,6 +32,7 @@ from api.examples.image_requests import (
     image_stats_curl,
 )
 from api.examples.image_responses import (
+    image_bulk_200_example,
     image_complain_201_example,
     image_detail_200_example,
     image_detail_404_example,
@@ -54,12 +58,14 @@ audio_mappings = {
     audio_search_curl: audio_search_200_example,
     audio_stats_curl: audio_stats_200_example,
     audio_detail_curl: audio_detail_200_example,
+    audio_bulk_curl: audio_bulk_200_example,
     audio_complain_curl: audio_complain_201_example,
 }
 image_mappings = {
     image_search_curl: image_search_200_example,
     image_stats_curl: image_stats_200_example,
     image_detail_curl: image_detail_200_example,
+    image_bulk_curl: image_bulk_200_example,
     image_complain_curl: image_complain_201_example,
     image_oembed_curl: image_oembed_200_example,
 }
@@ -48,6 +48,13 @@ curl \\
   "{ORIGIN}/v1/audio/{identifier}/"
 """
 
+audio_bulk_curl = f"""
+# Get the details of several audio files, including an unknown ID
+curl \\
+  {auth} \\
+  "{ORIGIN}/v1/audio/bulk/?ids={identifier},00000000-0000-0000-0000-000000000000"
+"""
+
 audio_related_curl = f"""
 # Get related audio files for audio ID {identifier}
 curl \\
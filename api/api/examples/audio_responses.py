@@ -106,6 +106,11 @@ audio_detail_200_example = base_audio
 
 audio_detail_404_example = {"detail": "Not found."}
 
+audio_bulk_200_example = {
+    "results": [base_audio, None],
+    "not_found": ["00000000-0000-0000-0000-000000000000"],
+}
+
 audio_related_200_example = {
     "result_count": 1,
     "page_count": 1,
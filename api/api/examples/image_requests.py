@@ -48,6 +48,13 @@ curl \\
   "{ORIGIN}/v1/images/{identifier}/"
 """
 
+image_bulk_curl = f"""
+# Get the details of several images, including an unknown ID
+curl \\
+  {auth} \\
+  "{ORIGIN}/v1/images/bulk/?ids={identifier},00000000-0000-0000-0000-000000000000"
+"""
+
 image_related_curl = f"""
 # Get related images for image ID {identifier}
 curl \\
@@ -95,6 +95,11 @@ image_detail_200_example = base_image
 
 image_detail_404_example = {"detail": "Not found."}
 
+image_bulk_200_example = {
+    "results": [base_image, None],
+    "not_found": ["00000000-0000-0000-0000-000000000000"],
+}
+
 image_related_200_example = {
     "result_count": 1,
     "page_count": 1,
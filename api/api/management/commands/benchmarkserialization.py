@@ -0,0 +1,124 @@
+import functools
+import timeit
+import uuid
+from datetime import datetime, timezone
+from unittest import mock
+
+from django.core.management import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.models import Audio, Image
+from api.serializers import serialization_plan
+from api.serializers.audio_serializers import AudioSerializer
+from api.serializers.image_serializers import ImageSerializer
+from api.utils.drf_renderer import ORJSONRenderer
+
+
+MEDIA = {
+    "image": (Image, ImageSerializer, {"width": 4000, "height": 3000}),
+    "audio": (
+        Audio,
+        AudioSerializer,
+        {"duration": 180_000, "bit_rate": 320_000, "sample_rate": 44_100},
+    ),
+}
+
+
+def compile_drf_plan(readable_fields):
+    """Compile a plan which serializes every field through DRF."""
+
+    return [
+        (
+            field.field_name,
+            functools.partial(serialization_plan._serialize_field, field),
+        )
+        for field in readable_fields
+    ]
+
+
+def get_media(model, index: int, extra_fields: dict):
+    """
+    Get a synthetic, unsaved media item shaped like a typical search result.
+
+    Without a primary key, the item's sensitivity is known without querying the
+    database, so the benchmark only measures the serialization.
+    """
+
+    return model(
+        identifier=uuid.uuid4(),
+        created_on=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        title=f"A view of the old harbour at dusk, with fishing boats moored {index}",
+        foreign_landing_url=f"https://example.com/photos/{index}",
+        url=f"example.com/photos/{index}/large.jpg",
+        thumbnail=f"https://example.com/photos/{index}/thumb.jpg",
+        creator="Jane Doe",
+        creator_url="example.com/people/jane",
+        license="BY-SA",
+        license_version="4.0",
+        provider="flickr",
+        source="flickr",
+        category="photograph",
+        filesize=1_234_567,
+        filetype="jpg",
+        tags=[{"name": f"tag {tag}", "accuracy": 0.9} for tag in range(30)],
+        meta_data={"license_url": "https://creativecommons.org/licenses/by-sa/4.0/"},
+        **extra_fields,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures how long serializing and rendering a page of search results takes,"
+        " with and without the serialization plan and the orjson renderer."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-sizes", type=int, nargs="+", default=[20, 500], metavar="SIZE"
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        request = Request(APIRequestFactory().get("/v1/images/"))
+        context = {"request": request, "validated_data": {}}
+
+        for media_type, (model, serializer_class, extra_fields) in MEDIA.items():
+            for page_size in options["page_sizes"]:
+                page = [get_media(model, i, extra_fields) for i in range(page_size)]
+
+                def render(renderer):
+                    data = serializer_class(page, many=True, context=context).data
+                    return renderer.render(data)
+
+                def baseline():
+                    # Serialize every field through DRF, as without the plan
+                    with mock.patch.object(
+                        serialization_plan, "compile_plan", compile_drf_plan
+                    ):
+                        return render(JSONRenderer())
+
+                def optimized():
+                    return render(ORJSONRenderer())
+
+                if baseline() != optimized():
+                    self.stderr.write(
+                        f"{media_type} x {page_size}: the outputs are different"
+                    )
+
+                timings = {
+                    name: min(
+                        timeit.repeat(function, number=1, repeat=options["repeat"])
+                    )
+                    for name, function in (
+                        ("baseline", baseline),
+                        ("optimized", optimized),
+                    )
+                }
+                self.stdout.write(
+                    f"{media_type} x {page_size}:"
+                    f" baseline {timings['baseline'] * 1e3:.2f}ms,"
+                    f" optimized {timings['optimized'] * 1e3:.2f}ms"
+                    f" ({timings['baseline'] / timings['optimized']:.1f}x)"
+                )
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from api.constants.media_types import MEDIA_TYPES
+from api.controllers.elasticsearch.related import RelatedItem
+from api.models import Audio, Image
+from api.utils import related_cache
+
+
+MODELS = {"image": Image, "audio": Audio}
+
+
+class Command(BaseCommand):
+    help = (
+        "Finds and caches the related media of the items whose related media were"
+        " requested the most since the last run. Meant to be run periodically, more"
+        " often than the related media cache TTL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--media-types", nargs="+", choices=MEDIA_TYPES, default=MEDIA_TYPES
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1000,
+            help="The number of items of each media type to precompute.",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.RELATED_CACHE_TTL:
+            self.stderr.write("The related media cache is disabled.")
+            return
+
+        for media_type in options["media_types"]:
+            index = settings.MEDIA_INDEX_MAPPING[media_type]
+            identifiers = related_cache.pop_most_requested(media_type, options["count"])
+
+            # Prefer the fields cached with the related media to the database
+            items = {
+                identifier: item
+                for identifier in identifiers
+                if (item := related_cache.get_cached_item(media_type, identifier))
+            }
+            missing = [
+                identifier for identifier in identifiers if identifier not in items
+            ]
+            for media in MODELS[media_type].objects.filter(identifier__in=missing):
+                items[str(media.identifier)] = RelatedItem.from_media(media)
+
+            precomputed = 0
+            for identifier, item in items.items():
+                try:
+                    related_cache.refresh(media_type, index, identifier, item)
+                    precomputed += 1
+                except Exception as e:
+                    # Skip the item, e.g. on an Elasticsearch timeout, rather than
+                    # the rest of the run
+                    self.stderr.write(f"{media_type} {identifier}: {e!r}")
+
+            self.stdout.write(
+                f"{media_type}: precomputed the related media of {precomputed} items"
+            )
@@ -0,0 +1,37 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from api.utils import request_timing
+
+
+# Times the stages of each request, and reports them in the ``Server-Timing``
+# header, the logs and the metrics. See ``api.utils.request_timing``.
+def request_timing_middleware(get_response):
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            timing, token = request_timing.start()
+            try:
+                response = await get_response(request)
+            finally:
+                request_timing.stop(token)
+            request_timing.report(request, response, timing)
+            return response
+
+        markcoroutinefunction(middleware)
+
+    else:
+
+        def middleware(request):
+            timing, token = request_timing.start()
+            try:
+                response = get_response(request)
+            finally:
+                request_timing.stop(token)
+            request_timing.report(request, response, timing)
+            return response
+
+    return middleware
+
+
+request_timing_middleware.sync_capable = True
+request_timing_middleware.async_capable = True
@@ -1,3 +1,4 @@
+import functools
 import mimetypes
 from textwrap import dedent
 
@@ -14,6 +15,7 @@ from openverse_attribution.license import License
 from api.constants.moderation import DecisionAction
 from api.models.base import OpenLedgerModel
 from api.models.mixins import ForeignIdentifierMixin, IdentifierMixin, MediaMixin
+from api.utils import search_cache
 
 
 MATURE = "mature"
@@ -23,6 +25,20 @@ OTHER = "other"
 logger = structlog.get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def get_license(slug: str, version: str | None) -> License:
+    """
+    Get the license with the given slug and version.
+
+    Building a ``License`` validates and deduces its fields, which is slow compared
+    to the rest of the serialization of a media item, so licenses are cached.
+
+    :raise ValueError: if the license is invalid
+    """
+
+    return License(slug, version)
+
+
 class AbstractMedia(
     IdentifierMixin, ForeignIdentifierMixin, MediaMixin, OpenLedgerModel
 ):
@@ -127,7 +143,7 @@ class AbstractMedia(
             identifier=self.identifier,
         )
         try:
-            return License(self.license.lower(), self.license_version).url
+            return get_license(self.license.lower(), self.license_version).url
         except ValueError:
             return None
 
@@ -136,7 +152,7 @@ class AbstractMedia(
         """Legally valid attribution for the media item in plain-text English."""
 
         try:
-            return License(
+            return get_license(
                 self.license.lower(),
                 self.license_version,
             ).get_attribution_text(
@@ -404,6 +420,8 @@ class PerformIndexUpdateMixin:
                 )
                 continue
 
+        search_cache.invalidate()
+
     @classmethod
     def _bulk_perform_index_update(
         cls,
@@ -439,6 +457,7 @@ class PerformIndexUpdateMixin:
         # other cases, this raises ``BulkIndexError``.
         helpers.bulk(es, actions, ignore_status=(404,))
         es.indices.refresh(index=cls.indexes())
+        search_cache.invalidate()
 
 
 class AbstractDeletedMedia(PerformIndexUpdateMixin, OpenLedgerModel):
@@ -1,7 +1,10 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from api.constants.media_types import MEDIA_TYPE_CHOICES
 from api.models.base import OpenLedgerModel
+from api.utils import search_cache
 
 
 class ContentSource(models.Model):
@@ -39,6 +42,12 @@ class ContentSource(models.Model):
         db_table = "content_provider"
 
 
+@receiver([post_save, post_delete], sender=ContentSource)
+def invalidate_search_responses(**kwargs):
+    # Hidden sources are excluded from search results
+    search_cache.invalidate()
+
+
 class Tag(OpenLedgerModel):
     foreign_identifier = models.CharField(max_length=255, blank=True, null=True)
     name = models.CharField(max_length=1000, blank=True, null=True)
@@ -10,6 +10,7 @@ from api.serializers.media_serializers import (
     MediaReportRequestSerializer,
     MediaSearchRequestSerializer,
     MediaSerializer,
+    get_bulk_serializer,
     get_hyperlinks_serializer,
 )
 
@@ -198,6 +199,9 @@ class AudioSerializer(AudioHyperlinksSerializer, MediaSerializer):
         return output
 
 
+AudioBulkSerializer = get_bulk_serializer(AudioSerializer)
+
+
 ##########################
 # Additional serializers #
 ##########################
@@ -14,6 +14,7 @@ from api.serializers.media_serializers import (
     MediaReportRequestSerializer,
     MediaSearchRequestSerializer,
     MediaSerializer,
+    get_bulk_serializer,
     get_hyperlinks_serializer,
 )
 
@@ -93,6 +94,9 @@ class ImageSerializer(ImageHyperlinksSerializer, MediaSerializer):
         """
 
 
+ImageBulkSerializer = get_bulk_serializer(ImageSerializer)
+
+
 ##########################
 # Additional serializers #
 ##########################
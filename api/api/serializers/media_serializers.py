@@ -1,6 +1,8 @@
 from collections import namedtuple
+from functools import cached_property
 from math import floor
 from typing import TypedDict
+from uuid import UUID
 
 from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -13,7 +15,6 @@ from rest_framework.request import Request
 from adrf.serializers import Serializer
 from drf_spectacular.utils import extend_schema_serializer
 from elasticsearch_dsl.response import Hit
-from openverse_attribution.license import License
 
 from api.constants import restricted_features, sensitivity
 from api.constants.licenses import LICENSE_GROUPS
@@ -22,7 +23,8 @@ from api.constants.parameters import COLLECTION, TAG
 from api.constants.search import COLLECTIONS
 from api.constants.sorting import DESCENDING, RELEVANCE, SORT_DIRECTIONS, SORT_FIELDS
 from api.controllers import search_controller
-from api.models.media import AbstractMedia
+from api.models.media import AbstractMedia, get_license
+from api.serializers import serialization_plan
 from api.serializers.base import BaseModelSerializer
 from api.serializers.docs import (
     COLLECTION_HELP_TEXT,
@@ -33,6 +35,7 @@ from api.serializers.docs import (
     UNSTABLE_WARNING,
 )
 from api.serializers.fields import SchemableHyperlinkedIdentityField
+from api.utils import search_cursor
 from api.utils.help_text import make_comma_separated_help_text
 from api.utils.url import add_protocol
 
@@ -54,6 +57,7 @@ class PaginatedRequestSerializer(Serializer):
     field_names = [
         "page_size",
         "page",
+        "cursor",
     ]
     page_size = serializers.IntegerField(
         label="page_size",
@@ -69,6 +73,18 @@ class PaginatedRequestSerializer(Serializer):
         default=1,
         min_value=1,
     )
+    cursor = serializers.CharField(
+        label="cursor",
+        help_text=(
+            "Paginate with a cursor instead of page numbers, without limits on the "
+            f"pagination depth. Pass `{search_cursor.START}` for the first page, then "
+            "the `next_cursor` of each response for the following page. Cursors "
+            "expire after five minutes without use. Cannot be combined with `page`. "
+            "Only available to authenticated requests, which can start a limited "
+            "number of cursors per minute."
+        ),
+        required=False,
+    )
 
     def validate_page_size(self, value):
         level, max_value = restricted_features.MAX_PAGE_SIZE.request_level(
@@ -95,6 +111,20 @@ class PaginatedRequestSerializer(Serializer):
 
         return value
 
+    def validate_cursor(self, value) -> search_cursor.Cursor | None:
+        request = self.context.get("request")
+        if request is None or request.auth is None:
+            raise NotAuthenticated(
+                detail="cursor pagination is only available to authenticated requests"
+            )
+
+        if value == search_cursor.START:
+            return None
+        try:
+            return search_cursor.decode(value)
+        except search_cursor.InvalidCursor as e:
+            raise ValidationError(e.detail)
+
     def clamp_result_count(self, real_result_count):
         _, max_depth = restricted_features.MAX_RESULT_COUNT.request_level(
             self.context.get("request")
@@ -121,6 +151,9 @@ class PaginatedRequestSerializer(Serializer):
     def validate(self, data):
         data = super().validate(data)
 
+        if "cursor" in data and "page" in self.initial_data:
+            raise ValidationError({"page": "page cannot be combined with cursor."})
+
         # pagination depth is validated as a combination of page and page size,
         # and so cannot be validated in the individual field validation methods
         level, max_depth = restricted_features.MAX_RESULT_COUNT.request_level(
@@ -394,7 +427,7 @@ class MediaSearchRequestSerializer(PaginatedRequestSerializer):
                 )
             license_groups.append(LICENSE_GROUPS[_type])
         intersected = set.intersection(*license_groups)
-        return ",".join(intersected)
+        return ",".join(sorted(intersected))
 
     def validate_unstable__collection(self, value):
         if self.initial_data.get("q", None) is not None:
@@ -470,7 +503,7 @@ class MediaSearchRequestSerializer(PaginatedRequestSerializer):
                     }
                 )
 
-            return ",".join(valid_sources)
+            return ",".join(sorted(valid_sources))
 
     def validate_excluded_source(self, input_sources):
         if "source" in self.initial_data:
@@ -575,6 +608,41 @@ class MediaThumbnailRequestSerializer(Serializer):
         return data
 
 
+class MediaBulkRequestSerializer(Serializer):
+    """This serializer parses and validates bulk detail query string parameters."""
+
+    ids = serializers.CharField(
+        label="ids",
+        help_text=(
+            "A comma-separated list of the identifiers of the media to retrieve. "
+            "The number of identifiers is limited like `page_size` of search "
+            "requests. "
+            f"{PaginatedRequestSerializer._SUBJECT_TO_PAGINATION_LIMITS}"
+        ),
+    )
+
+    def validate_ids(self, value) -> list[str]:
+        identifiers = []
+        for identifier in value.split(","):
+            try:
+                identifiers.append(str(UUID(identifier.strip())))
+            except ValueError:
+                raise ValidationError(f"'{identifier}' is not a valid identifier.")
+        # Drop duplicates, keeping the order of the request
+        identifiers = list(dict.fromkeys(identifiers))
+
+        level, max_value = restricted_features.MAX_PAGE_SIZE.request_level(
+            self.context.get("request")
+        )
+        if len(identifiers) > max_value:
+            detail = f"ids may not contain more than {max_value} identifiers"
+            if level == restricted_features.PRIVILEGED:
+                raise ValidationError(detail)
+            raise NotAuthenticated(detail=f"{detail} for {level} requests")
+
+        return identifiers
+
+
 class MediaReportRequestSerializer(serializers.ModelSerializer):
     class Meta:
         model = None
@@ -778,6 +846,10 @@ class MediaSerializer(BaseModelSerializer):
 
         return result
 
+    @cached_property
+    def _serialization_plan(self) -> serialization_plan.Plan:
+        return serialization_plan.compile_plan(self._readable_fields)
+
     def to_representation(self, *args, **kwargs):
         # This serializer adapts both ES Hits *and* Media instances. Currently,
         # ES has a `mature` field on it which represents if maturity was present on
@@ -789,7 +861,9 @@ class MediaSerializer(BaseModelSerializer):
         if isinstance(obj, Hit):
             obj.sensitive = obj.mature
 
-        output = super().to_representation(*args, **kwargs)
+        # Search results are serialized in pages of up to 500 items, so skip the
+        # per-field overhead of ``Serializer.to_representation``
+        output = serialization_plan.serialize(self._serialization_plan, obj)
 
         # Ensure lists are ``[]`` instead of ``None``
         # TODO: These fields are still marked 'Nullable' in the API docs
@@ -803,7 +877,7 @@ class MediaSerializer(BaseModelSerializer):
 
         if output.get("license_url") is None:
             try:
-                lic = License(output["license"], output["license_version"])
+                lic = get_license(output["license"], output["license_version"])
                 output["license_url"] = lic.url
             except ValueError:
                 pass
@@ -861,3 +935,24 @@ def get_hyperlinks_serializer(media_type):
         )
 
     return MediaHyperlinksSerializer
+
+
+def get_bulk_serializer(media_serializer):
+    class MediaBulkSerializer(Serializer):
+        """
+        The media requested from the bulk endpoint, in the order of the request.
+
+        This serializer only documents the response; the view serializes the media
+        found with ``media_serializer`` itself.
+        """
+
+        results = serializers.ListField(
+            child=media_serializer(allow_null=True),
+            help_text="The requested media, or `null` for those that were not found.",
+        )
+        not_found = serializers.ListField(
+            child=serializers.UUIDField(),
+            help_text="The identifiers of the requested media that were not found.",
+        )
+
+    return MediaBulkSerializer
@@ -0,0 +1,56 @@
+import asyncio
+import weakref
+
+from django.conf import settings
+from django.dispatch import receiver
+
+import structlog
+from django_asgi_lifespan.signals import asgi_shutdown
+from redis.asyncio import Redis
+
+
+logger = structlog.get_logger(__name__)
+
+
+_CONNECTIONS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Redis]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@receiver(asgi_shutdown)
+async def _close_connections(sender, **kwargs):
+    logger.debug("Closing async Redis connections on application shutdown")
+
+    closed_connections = 0
+
+    while _CONNECTIONS:
+        loop, connections = _CONNECTIONS.popitem()
+        for connection in connections.values():
+            try:
+                await connection.aclose()
+                closed_connections += 1
+            except BaseException as exc:
+                logger.error("Error closing connections", exc=exc, exc_info=True)
+
+    logger.debug("Successfully closed %s connection(s)", closed_connections)
+
+
+def get_redis_connection(alias: str = "default") -> Redis:
+    """
+    Get the asyncio Redis client of a cache for the current event loop.
+
+    The client is the async counterpart of ``django_redis.get_redis_connection``,
+    connecting to the same ``LOCATION`` of ``settings.CACHES``, and pooling its
+    connections. Connections of ``redis.asyncio`` are bound to the loop which
+    opened them, so, like aiohttp sessions in ``api.utils.aiohttp``, each loop
+    gets its own client.
+
+    :param alias: the alias of the cache in ``settings.CACHES``
+    :return: the client of the cache
+    """
+
+    loop = asyncio.get_running_loop()
+    connections = _CONNECTIONS.setdefault(loop, {})
+    if alias not in connections:
+        connections[alias] = Redis.from_url(settings.CACHES[alias]["LOCATION"])
+    return connections[alias]
@@ -227,12 +227,20 @@ def check_dead_links(query_hash: str, start_slice: int, results: list[Hit]) -> N
 
     # Merge and cache the new mask
     mask = get_query_mask(query_hash)
-    if mask:
+    if len(mask) >= start_slice:
         # skip the leading part of the mask that represents results that come before
         # the results we've verified this time around. Overwrite everything after
         # with our new results validation mask.
-        new_mask = mask[:start_slice] + new_mask
-    save_query_mask(query_hash, new_mask)
+        save_query_mask(query_hash, mask[:start_slice] + new_mask)
+    else:
+        # The mask does not reach the verified results, e.g. when paginating with a
+        # cursor after a shallower query replaced it. Appending to it would shift
+        # the positions of the results.
+        logger.debug(
+            "skipping dead link mask update "
+            f"mask_length={len(mask)} "
+            f"start_slice={start_slice} "
+        )
 
     end_time = time.time()
     logger.debug(
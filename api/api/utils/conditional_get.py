@@ -0,0 +1,82 @@
+"""
+Support conditional requests to the endpoints whose responses rarely change.
+
+Before building a response, these views compute an ETag from the state that the
+response is derived from, e.g. the identifier, ``updated_on`` timestamp and
+sensitivity of a media item. When the ETag matches the ``If-None-Match`` header of
+the request, ``not_modified`` returns a ``304 Not Modified`` response, skipping the
+serialization of the response. Both responses get the ETag and the
+``Cache-Control`` headers which let clients and the CDN cache them, and then
+revalidate them with the ETag once stale.
+
+The ETag also covers the API version and the format of the response, so that a
+deployment or a change of renderer never revalidates a stale response.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+def get_etag(request: Request, *state) -> str:
+    """
+    Compute the strong ETag of the response to a request.
+
+    :param request: the request, whose accepted renderer determines the format
+    :param state: the JSON-serializable values from which the response is derived
+    :return: the quoted ETag
+    """
+
+    accepted_renderer = getattr(request, "accepted_renderer", None)
+    payload = json.dumps(
+        [settings.API_VERSION, getattr(accepted_renderer, "format", None), *state],
+        default=str,
+        sort_keys=True,
+    )
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+
+def add_headers(response: Response, etag: str) -> Response:
+    """
+    Add the ETag and caching headers to a response.
+
+    :param response: the response to which to add the headers
+    :param etag: the ETag of the response, from ``get_etag``
+    :return: the same response
+    """
+
+    response["ETag"] = etag
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=settings.CACHE_CONTROL_MAX_AGE,
+        s_maxage=settings.CACHE_CONTROL_S_MAXAGE,
+    )
+    patch_vary_headers(response, ["Accept"])
+    return response
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """
+    Get the ``304 Not Modified`` response to a request, if its ETag matches.
+
+    :param request: the request, with the ``If-None-Match`` header
+    :param etag: the ETag of the current response, from ``get_etag``
+    :return: the response to return, or ``None`` if the response must be built
+    """
+
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return None
+
+    # ``If-None-Match`` uses the weak comparison
+    etags = {tag.removeprefix("W/") for tag in parse_etags(if_none_match)}
+    if "*" not in etags and etag not in etags:
+        return None
+    return add_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
@@ -1,6 +1,5 @@
 import django_redis
 import structlog
-from deepdiff import DeepHash
 from elasticsearch_dsl import Search
 from redis.exceptions import ConnectionError
 
@@ -23,6 +22,9 @@ def get_query_hash(s: Search) -> str:
     :param s: Search object to be serialized and hashed.
     :return: Serialized Search object hash.
     """
+    # ``deepdiff`` is slow to import, and only needed by searches
+    from deepdiff import DeepHash
+
     serialized_search_obj = s.to_dict()
     serialized_search_obj.pop("from", None)
     serialized_search_obj.pop("size", None)
@@ -1,4 +1,59 @@
-from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+import orjson
+
+from api.utils import request_timing
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renders JSON with ``orjson``, which is several times faster than ``json``.
+
+    The output is the compact, UTF-8 JSON of ``JSONRenderer`` with its default
+    settings, including the escaping of U+2028 and U+2029. Types that ``orjson``
+    does not support natively, and dates, are converted by DRF's ``JSONEncoder``
+    as they would be by ``JSONRenderer``. The only differences are that floats in
+    exponent notation are written without a sign or padding, e.g. ``1e-7`` rather
+    than ``1e-07``, which is equivalent JSON, and that NaN and infinities are
+    written as ``null`` rather than rejected.
+
+    Indented output, e.g. for the browsable API, and anything ``orjson`` cannot
+    serialize, like integers over 64 bits, are left to ``JSONRenderer``.
+    """
+
+    options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    default = encoders.JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with request_timing.timed("render"):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if (
+            data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028 and U+2029 like ``JSONRenderer`` so that the output is
+        # a strict subset of JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
 
 
 class BrowsableAPIRendererWithoutForms(BrowsableAPIRenderer):
@@ -1,4 +1,4 @@
-from functools import wraps
+import asyncio
 from typing import Literal
 from urllib.parse import urlparse
 
@@ -7,19 +7,20 @@ from django.http import HttpResponse
 from rest_framework.exceptions import UnsupportedMediaType
 
 import aiohttp
-import django_redis
 import structlog
-from asgiref.sync import sync_to_async
-from redis.client import Redis
 from redis.exceptions import ConnectionError
 
+from api.utils import async_redis, request_timing
 from api.utils.aiohttp import get_aiohttp_session
 from api.utils.image_proxy.dataclasses import MediaInfo, RequestConfig
 from api.utils.image_proxy.exception import UpstreamThumbnailException
-from api.utils.image_proxy.extension import get_image_extension
+from api.utils.image_proxy.extension import (
+    get_cached_image_extension,
+    request_image_extension,
+)
 from api.utils.image_proxy.photon import get_photon_request_params
 from api.utils.image_proxy.wikimedia import get_wikimedia_thumbnail_url
-from api.utils.tallies import get_monthly_timestamp
+from api.utils.tallies import get_monthly_timestamp, tally_buffer
 
 
 logger = structlog.get_logger(__name__)
@@ -88,9 +89,7 @@ def get_request_params_for_extension(
     )
 
 
-@sync_to_async
-def _tally_response(
-    tallies_conn,
+async def _tally_response(
     media_info: MediaInfo,
     month: str,
     domain: str,
@@ -103,115 +102,74 @@ def _tally_response(
     the `get` function, which is complex enough as is.
     """
 
-    with tallies_conn.pipeline() as tallies:
-        tallies.incr(f"thumbnail_response_code:{month}:{status_code}")
-        tallies.incr(
-            f"thumbnail_response_code_by_domain:{domain}:{month}:{status_code}"
-        )
-        tallies.incr(
-            f"thumbnail_response_code_by_provider:{media_info.media_provider}:"
-            f"{month}:{status_code}"
-        )
-        try:
-            tallies.execute()
-        except ConnectionError:
-            logger.warning(
-                "Redis connect failed, thumbnail response codes not tallied."
-            )
+    await tally_buffer.aincr(f"thumbnail_response_code:{month}:{status_code}")
+    await tally_buffer.aincr(
+        f"thumbnail_response_code_by_domain:{domain}:{month}:{status_code}"
+    )
+    await tally_buffer.aincr(
+        f"thumbnail_response_code_by_provider:{media_info.media_provider}:"
+        f"{month}:{status_code}"
+    )
 
 
-@sync_to_async
-def _tally_client_response_errors(tallies, month: str, domain: str, status: int):
-    try:
-        tallies.incr(f"thumbnail_http_error:{domain}:{month}:{status}")
-    except ConnectionError:
-        logger.warning("Redis connect failed, thumbnail HTTP errors not tallied.")
+async def _tally_client_response_errors(month: str, domain: str, status: int):
+    await tally_buffer.aincr(f"thumbnail_http_error:{domain}:{month}:{status}")
 
 
 # thmbfail == THuMBnail FAILures; this key path will exist for every thumbnail
 # requested, so it needs to be space efficient
 FAILURE_CACHE_KEY_TEMPLATE = "thmbfail:{ident}"
 
+# Add ``ARGV[1]`` to the failure count, without going below 0, and push the
+# expiration out to ``ARGV[2]`` seconds, in a single round trip
+_RECORD_OUTCOME_SCRIPT = """
+local count = tonumber(redis.call("GET", KEYS[1]) or "0")
+if count + tonumber(ARGV[1]) < 0 then
+    return count
+end
+count = redis.call("INCRBY", KEYS[1], ARGV[1])
+redis.call("EXPIRE", KEYS[1], ARGV[2])
+return count
+"""
 
-def _cache_repeated_failures(_get):
-    """
-    Wrap ``image_proxy.get`` to cache repeated upstream failures
-    and avoid re-requesting images likely to fail.
-
-    Do this by incrementing a counter for each media identifier each time the inner request
-    fails. Before making thumbnail requests, check this counter. If it is above the configured
-    threshold, assume the request will fail again, and eagerly return a failed response without
-    sending the request upstream.
-
-    Additionally, if the request succeeds and the failure count is not 0, decrement the counter
-    to reflect the successful response, accounting for thumbnails that were temporarily flaky,
-    while still allowing them to get temporarily cached as a failure if additional requests fail
-    and push the counter over the threshold.
-    """
 
-    @wraps(_get)
-    async def do_cache(*args, **kwargs):
-        media_info: MediaInfo = args[0]
-        compressed_ident = str(media_info.media_identifier).replace("-", "")
-        redis_key = FAILURE_CACHE_KEY_TEMPLATE.format(ident=compressed_ident)
-        tallies: Redis = django_redis.get_redis_connection("tallies")
+def _get_failure_cache_key(media_info: MediaInfo) -> str:
+    compressed_ident = str(media_info.media_identifier).replace("-", "")
+    return FAILURE_CACHE_KEY_TEMPLATE.format(ident=compressed_ident)
 
-        try:
-            cached_failure_count = await sync_to_async(tallies.get)(
-                redis_key,
-            )
-            cached_failure_count = (
-                int(cached_failure_count) if cached_failure_count is not None else 0
-            )
-        except ConnectionError:
-            # Ignore the connection error, treat it like it's never been cached
-            cached_failure_count = 0
-
-        if cached_failure_count > settings.THUMBNAIL_FAILURE_CACHE_TOLERANCE:
-            logger.info(
-                "%s thumbnail is too flaky, using cached failure response.",
-                media_info.media_identifier,
-            )
-            raise UpstreamThumbnailException("Thumbnail unavailable from provider.")
-
-        try:
-            response = await _get(*args, **kwargs)
-            if cached_failure_count > 0:
-                # Decrement the key
-                # Do not delete it, because if it isn't 0, then it has failed before
-                # meaning we should continue to monitor it within the cache window
-                # in case the upstream is flaky and eventually goes over the tolerance
-                try:
-                    await sync_to_async(tallies.decr)(redis_key)
-                    await sync_to_async(tallies.expire)(
-                        redis_key, settings.THUMBNAIL_FAILURE_CACHE_WINDOW_SECONDS
-                    )
-                except ConnectionError:
-                    logger.warning(
-                        "Redis connect failed, thumbnail failure not decremented."
-                    )
-            return response
-        except:
-            try:
-                await sync_to_async(tallies.incr)(redis_key)
-                # Call expire each time the key is incremented
-                # This pushes expiration out each time a new failure is cached
-                await sync_to_async(tallies.expire)(
-                    redis_key, settings.THUMBNAIL_FAILURE_CACHE_WINDOW_SECONDS
-                )
-            except ConnectionError:
-                logger.warning(
-                    "Redis connect failed, thumbnail failure not incremented."
-                )
-            raise
 
-    return do_cache
+async def _get_failure_count(key: str) -> int:
+    tallies = async_redis.get_redis_connection("tallies")
+    try:
+        cached_failure_count = await tallies.get(key)
+    except ConnectionError:
+        # Ignore the connection error, treat it like it's never been cached
+        return 0
+    return int(cached_failure_count) if cached_failure_count is not None else 0
+
+
+async def _record_outcome(key: str, is_failure: bool):
+    tallies = async_redis.get_redis_connection("tallies")
+    # Scripts are sent by SHA, and only sent in full the first time
+    record_outcome = tallies.register_script(_RECORD_OUTCOME_SCRIPT)
+    try:
+        await record_outcome(
+            keys=[key],
+            args=[
+                1 if is_failure else -1,
+                settings.THUMBNAIL_FAILURE_CACHE_WINDOW_SECONDS,
+            ],
+        )
+    except ConnectionError:
+        if is_failure:
+            logger.warning("Redis connect failed, thumbnail failure not incremented.")
+        else:
+            logger.warning("Redis connect failed, thumbnail failure not decremented.")
 
 
 _UPSTREAM_TIMEOUT = aiohttp.ClientTimeout(settings.THUMBNAIL_UPSTREAM_TIMEOUT)
 
 
-@_cache_repeated_failures
 async def get(
     media_info: MediaInfo,
     request_config: RequestConfig = RequestConfig(),
@@ -221,15 +179,64 @@ async def get(
 
     Proxy an image through Photon if its file type is supported, else return the
     original image if the file type is SVG. Otherwise, raise an exception.
+
+    Cache repeated upstream failures to avoid re-requesting images likely to fail.
+    Do this by incrementing a counter for each media identifier each time the
+    request fails. Before making thumbnail requests, check this counter. If it is
+    above the configured threshold, assume the request will fail again, and eagerly
+    return a failed response without sending the request upstream.
+
+    Additionally, if the request succeeds and the failure count is not 0, decrement
+    the counter to reflect the successful response, accounting for thumbnails that
+    were temporarily flaky, while still allowing them to get temporarily cached as
+    a failure if additional requests fail and push the counter over the threshold.
     """
+
+    failure_cache_key = _get_failure_cache_key(media_info)
+
+    # The failure count and the extension are in different Redis databases, so
+    # they cannot share a pipeline, but are read concurrently
+    with request_timing.timed("image_extension"):
+        cached_failure_count, image_extension = await asyncio.gather(
+            _get_failure_count(failure_cache_key),
+            get_cached_image_extension(media_info),
+        )
+
+    if cached_failure_count > settings.THUMBNAIL_FAILURE_CACHE_TOLERANCE:
+        logger.info(
+            "%s thumbnail is too flaky, using cached failure response.",
+            media_info.media_identifier,
+        )
+        raise UpstreamThumbnailException("Thumbnail unavailable from provider.")
+
+    try:
+        if not image_extension:
+            with request_timing.timed("image_extension"):
+                image_extension = await request_image_extension(media_info)
+
+        response = await _get_thumbnail(media_info, request_config, image_extension)
+    except:
+        await _record_outcome(failure_cache_key, is_failure=True)
+        raise
+
+    if cached_failure_count > 0:
+        # Decrement the count, but do not delete it, because if it isn't 0, then it
+        # has failed before, meaning we should continue to monitor it within the
+        # cache window in case the upstream is flaky and eventually goes over the
+        # tolerance
+        await _record_outcome(failure_cache_key, is_failure=False)
+    return response
+
+
+async def _get_thumbnail(
+    media_info: MediaInfo,
+    request_config: RequestConfig,
+    image_extension: str | None,
+) -> HttpResponse:
     image_url = media_info.image_url
 
-    tallies = django_redis.get_redis_connection("tallies")
-    tallies_incr = sync_to_async(tallies.incr)
     month = get_monthly_timestamp()
 
-    image_extension = await get_image_extension(media_info)
-
     headers = {"Accept": request_config.accept_header} | HEADERS
 
     parsed_image_url = urlparse(image_url)
@@ -244,32 +251,33 @@ async def get(
     )
 
     try:
-        session = await get_aiohttp_session()
-
-        async with session.get(
-            upstream_url,
-            timeout=_UPSTREAM_TIMEOUT,
-            params=params,
-            headers=headers,
-            trace_request_ctx={
-                "timing_event_name": "thumbnail_upstream_timing",
-                "timing_event_ctx": {
-                    "provider": media_info.media_provider,
-                    "image_url": media_info.image_url,
-                    "image_extension": image_extension,
+        with request_timing.timed("upstream"):
+            session = await get_aiohttp_session()
+
+            async with session.get(
+                upstream_url,
+                timeout=_UPSTREAM_TIMEOUT,
+                params=params,
+                headers=headers,
+                trace_request_ctx={
+                    "timing_event_name": "thumbnail_upstream_timing",
+                    "timing_event_ctx": {
+                        "provider": media_info.media_provider,
+                        "image_url": media_info.image_url,
+                        "image_extension": image_extension,
+                    },
                 },
-            },
-        ) as upstream_response:
-            await _tally_response(
-                tallies, media_info, month, domain, upstream_response.status
-            )
+            ) as upstream_response:
+                await _tally_response(
+                    media_info, month, domain, upstream_response.status
+                )
 
-            upstream_response.raise_for_status()
+                upstream_response.raise_for_status()
 
-            status_code = upstream_response.status
-            content_type = upstream_response.headers.get("Content-Type")
+                status_code = upstream_response.status
+                content_type = upstream_response.headers.get("Content-Type")
 
-            content = await upstream_response.content.read()
+                content = await upstream_response.content.read()
 
         return HttpResponse(
             content,
@@ -280,14 +288,11 @@ async def get(
         exception_name = f"{exc.__class__.__module__}.{exc.__class__.__name__}"
         key = f"thumbnail_error:{exception_name}:{domain}:{month}"
 
-        try:
-            await tallies_incr(key)
-        except ConnectionError:
-            logger.warning("Redis connect failed, thumbnail errors not tallied.")
+        await tally_buffer.aincr(key)
 
         if isinstance(exc, aiohttp.ClientResponseError):
             status = exc.status
-            await _tally_client_response_errors(tallies, month, domain, status)
+            await _tally_client_response_errors(month, domain, status)
             logger.warning(
                 "thumbnail_upstream_failure",
                 url=upstream_url,
@@ -6,11 +6,10 @@ from urllib.parse import urlparse
 from django.conf import settings
 
 import aiohttp
-import django_redis
 import structlog
-from asgiref.sync import sync_to_async
 from redis.exceptions import ConnectionError
 
+from api.utils import async_redis
 from api.utils.aiohttp import get_aiohttp_session
 from api.utils.image_proxy.dataclasses import MediaInfo
 from api.utils.image_proxy.exception import UpstreamThumbnailException
@@ -41,70 +40,86 @@ _NON_ACTIONABLE_NETWORK_EXCEPTIONS = (
 )
 
 
-async def get_image_extension(media_info: MediaInfo) -> str | None:
-    image_url = media_info.image_url
+def _get_cache_key(media_info: MediaInfo) -> str:
+    return f"media:{media_info.media_identifier}:thumb_type"
+
 
-    cache = django_redis.get_redis_connection("default")
-    key = f"media:{media_info.media_identifier}:thumb_type"
-
-    ext = _get_file_extension_from_url(image_url)
-
-    if not ext:
-        # If the extension is not present in the URL, try to get it from the redis cache
-        try:
-            ext = await sync_to_async(cache.get)(key)
-            ext = ext.decode("utf-8") if ext else None
-        except ConnectionError:
-            logger.warning("Redis connect failed, cannot get cached image extension.")
-
-    if not ext:
-        # If the extension is still not present, try getting it from the content type
-        try:
-            session = await get_aiohttp_session()
-
-            async with session.head(
-                image_url,
-                raise_for_status=True,
-                timeout=_HEAD_TIMEOUT,
-                trace_request_ctx={
-                    "timing_event_name": "thumbnail_extension_request_timing",
-                    "timing_event_ctx": {"provider": media_info.media_provider},
-                },
-            ) as response:
-                if response.headers and "Content-Type" in response.headers:
-                    content_type = response.headers["Content-Type"]
-                    ext = _get_file_extension_from_content_type(content_type)
-                else:
-                    ext = None
-
-            await _cache_extension(cache, key, ext)
-        except Exception as exc:
-            # Aside from client errors, the timeout defined for `get_image_extension`
-            # is generous, and if the head request exceeds it, we're comfortable saying
-            # we'll skip generating this thumbnail. In the future, we might adjust
-            # timeouts with per-provider granularity, but for now, we just have to
-            # accept they will happen and are part of the set of non-actionable
-            # networking errors that we don't need to report as errors to Sentry.
-            if not isinstance(exc, asyncio.TimeoutError):
-                if isinstance(exc, _NON_ACTIONABLE_NETWORK_EXCEPTIONS):
-                    log = logger.warning
-                else:
-                    log = logger.error
-
-                log("upstream_thumbnail_exception", exc=exc, exc_info=True)
-
-            raise UpstreamThumbnailException(
-                "Failed to render thumbnail due to inability to check media "
-                f"type. {exc}"
-            )
+async def get_cached_image_extension(media_info: MediaInfo) -> str | None:
+    """
+    Get the extension of the image from its URL, or else from the cache.
+
+    :param media_info: the image
+    :return: the extension, or ``None`` if it must be requested upstream
+    """
+
+    if ext := _get_file_extension_from_url(media_info.image_url):
+        return ext
+
+    # If the extension is not present in the URL, try to get it from the redis cache
+    cache = async_redis.get_redis_connection("default")
+    try:
+        ext = await cache.get(_get_cache_key(media_info))
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot get cached image extension.")
+        return None
+    return ext.decode("utf-8") if ext else None
+
+
+async def request_image_extension(media_info: MediaInfo) -> str | None:
+    """
+    Get the extension of the image from the content type of the upstream, and
+    cache it.
+
+    :param media_info: the image
+    :return: the extension, or ``None`` if the content type is unknown
+    """
+
+    image_url = media_info.image_url
+    try:
+        session = await get_aiohttp_session()
+
+        async with session.head(
+            image_url,
+            raise_for_status=True,
+            timeout=_HEAD_TIMEOUT,
+            trace_request_ctx={
+                "timing_event_name": "thumbnail_extension_request_timing",
+                "timing_event_ctx": {"provider": media_info.media_provider},
+            },
+        ) as response:
+            if response.headers and "Content-Type" in response.headers:
+                content_type = response.headers["Content-Type"]
+                ext = _get_file_extension_from_content_type(content_type)
+            else:
+                ext = None
+
+        await _cache_extension(_get_cache_key(media_info), ext)
+    except Exception as exc:
+        # Aside from client errors, the timeout defined for `request_image_extension`
+        # is generous, and if the head request exceeds it, we're comfortable saying
+        # we'll skip generating this thumbnail. In the future, we might adjust
+        # timeouts with per-provider granularity, but for now, we just have to
+        # accept they will happen and are part of the set of non-actionable
+        # networking errors that we don't need to report as errors to Sentry.
+        if not isinstance(exc, asyncio.TimeoutError):
+            if isinstance(exc, _NON_ACTIONABLE_NETWORK_EXCEPTIONS):
+                log = logger.warning
+            else:
+                log = logger.error
+
+            log("upstream_thumbnail_exception", exc=exc, exc_info=True)
+
+        raise UpstreamThumbnailException(
+            f"Failed to render thumbnail due to inability to check media type. {exc}"
+        )
 
     return ext
 
 
-@sync_to_async
-def _cache_extension(cache, key, ext):
+async def _cache_extension(key, ext):
+    cache = async_redis.get_redis_connection("default")
     try:
-        cache.set(key, ext if ext else "unknown")
+        await cache.set(key, ext if ext else "unknown")
     except ConnectionError:
         logger.warning("Redis connect failed, cannot cache image extension.")
 
@@ -10,6 +10,8 @@ class StandardPagination(PageNumberPagination):
     page_count: int | None
     page: int
     warnings: list[dict]
+    uses_cursor: bool
+    next_cursor: str | None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -17,6 +19,8 @@ class StandardPagination(PageNumberPagination):
         self.page_count = None  # populated later
         self.page = 1  # default, gets updated when necessary
         self.warnings = []  # populated later as needed
+        self.uses_cursor = False  # set when paginating with a cursor
+        self.next_cursor = None  # populated later when paginating with a cursor
 
     def get_paginated_response(self, data):
         response = {
@@ -26,6 +30,8 @@ class StandardPagination(PageNumberPagination):
             "page": self.page,
             "results": data,
         }
+        if self.uses_cursor:
+            response["next_cursor"] = self.next_cursor
         return Response(
             (
                 {
@@ -62,6 +68,14 @@ class StandardPagination(PageNumberPagination):
             }
             for field, (description, example) in field_descriptions.items()
         } | {
+            "next_cursor": {
+                "type": "string",
+                "nullable": True,
+                "description": (
+                    "The cursor to the next page of results, or null on the last "
+                    "page. Only present when paginating with the `cursor` parameter."
+                ),
+            },
             "results": schema,
             "warnings": {
                 "type": "array",
@@ -93,5 +107,5 @@ class StandardPagination(PageNumberPagination):
         return {
             "type": "object",
             "properties": properties,
-            "required": list(set(properties.keys()) - {"warnings"}),
+            "required": list(set(properties.keys()) - {"warnings", "next_cursor"}),
         }
@@ -0,0 +1,269 @@
+"""
+Cache the related media of each media item.
+
+Related media are found with a query on the title, tags and creator of the item
+against the filtered index, followed by dead link checks. The results rarely change,
+so only their identifiers are kept in Redis, along with the fields of the item from
+which they were found, for ``settings.RELATED_CACHE_MAX_AGE`` seconds.
+
+Entries are fresh for ``settings.RELATED_CACHE_TTL`` seconds. Stale entries are
+still served, while the related media are found again in the background from the
+cached fields of the item, so that only the first request for an item waits for
+Elasticsearch. Like cached search responses, every entry is invalidated when the
+generation of ``search_cache`` is bumped by moderation actions and content source
+changes.
+
+Each request for related media is counted in the ``tallies`` Redis database, in a
+sorted set per media type which keeps the ``REQUESTS_MAX_ITEMS`` most requested
+items. The ``precomputerelated`` command, meant to be run periodically, refreshes
+the related media of the most requested items since its last run ahead of their
+next requests.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from django.conf import settings
+from django.db import close_old_connections
+
+import django_redis
+import structlog
+from asgiref.sync import sync_to_async
+from redis.exceptions import ConnectionError
+
+from api.controllers.elasticsearch.related import RelatedItem, related_media
+from api.utils import search_cache
+from api.utils.tallies import tally_buffer
+
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "related"
+REFRESH_LOCK_TIMEOUT = 60  # seconds
+# The number of most requested items whose requests are counted, well above the
+# number of items precomputed by each run of ``precomputerelated``
+REQUESTS_MAX_ITEMS = 10_000
+
+
+@dataclass
+class CachedRelated:
+    identifiers: list[str]
+    """the identifiers of the related media"""
+    item: RelatedItem
+    """the fields of the item from which the related media were found"""
+    computed_at: float
+    """the time at which the related media were found, as a Unix timestamp"""
+
+
+def _key(media_type: str, identifier: str) -> str:
+    return f"{KEY_PREFIX}:{media_type}:{identifier}"
+
+
+def _requests_key(media_type: str) -> str:
+    return f"{KEY_PREFIX}:{media_type}:requests"
+
+
+def _get(redis, key: str) -> tuple[CachedRelated | None, bytes]:
+    with redis.pipeline(transaction=False) as pipe:
+        pipe.hgetall(key)
+        pipe.get(search_cache.GENERATION_KEY)
+        entry, generation = pipe.execute()
+
+    generation = generation or b"0"
+    if not entry or entry.get(b"generation") != generation:
+        return None, generation
+    return (
+        CachedRelated(
+            identifiers=json.loads(entry[b"identifiers"]),
+            item=RelatedItem(**json.loads(entry[b"item"])),
+            computed_at=float(entry[b"computed_at"]),
+        ),
+        generation,
+    )
+
+
+def _set(redis, key: str, entry: CachedRelated, generation: bytes):
+    with redis.pipeline() as pipe:
+        pipe.hset(
+            key,
+            mapping={
+                "identifiers": json.dumps(entry.identifiers),
+                "item": json.dumps(asdict(entry.item)),
+                "computed_at": entry.computed_at,
+                "generation": generation,
+            },
+        )
+        pipe.expire(key, settings.RELATED_CACHE_MAX_AGE)
+        pipe.execute()
+
+
+def _compute(identifier: str, index: str, item: RelatedItem) -> CachedRelated:
+    hits = related_media(uuid=identifier, index=index, filter_dead=True, item=item)
+    return CachedRelated(
+        identifiers=[hit.identifier for hit in hits],
+        item=item,
+        computed_at=time.time(),
+    )
+
+
+def refresh(
+    media_type: str, index: str, identifier: str, item: RelatedItem
+) -> list[str]:
+    """
+    Find the related media of the item again, and cache them.
+
+    :param media_type: the media type of the item
+    :param index: the Elasticsearch index of the media type
+    :param identifier: the identifier of the item
+    :param item: the fields of the item from which to find related media
+    :return: the identifiers of the related media
+    """
+
+    redis = django_redis.get_redis_connection("default")
+    key = _key(media_type, identifier)
+    try:
+        # Read the generation before computing, so that an invalidation while
+        # computing leaves the entry stale
+        generation = redis.get(search_cache.GENERATION_KEY) or b"0"
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot cache related media.")
+        return _compute(identifier, index, item).identifiers
+
+    entry = _compute(identifier, index, item)
+    try:
+        _set(redis, key, entry, generation)
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot cache related media.")
+    return entry.identifiers
+
+
+def get_related(
+    media_type: str,
+    index: str,
+    identifier: str,
+    get_item: Callable[[], RelatedItem],
+) -> list[str]:
+    """
+    Get the identifiers of the related media of the item.
+
+    On a miss, the related media are found from the fields returned by
+    ``get_item``, which raises if the item does not exist. Stale entries are
+    returned as is, and refreshed in the background.
+
+    :param media_type: the media type of the item
+    :param index: the Elasticsearch index of the media type
+    :param identifier: the identifier of the item
+    :param get_item: the function getting the fields of the item on a miss
+    :return: the identifiers of the related media, in order
+    """
+
+    _count_request(media_type, identifier)
+    if not settings.RELATED_CACHE_TTL:
+        return _compute(identifier, index, get_item()).identifiers
+
+    redis = django_redis.get_redis_connection("default")
+    try:
+        entry, _ = _get(redis, _key(media_type, identifier))
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot get cached related media.")
+        return _compute(identifier, index, get_item()).identifiers
+
+    if entry is None:
+        return refresh(media_type, index, identifier, get_item())
+
+    if time.time() - entry.computed_at > settings.RELATED_CACHE_TTL:
+        _refresh_in_background(redis, media_type, index, identifier, entry.item)
+    return entry.identifiers
+
+
+def _count_request(media_type: str, identifier: str):
+    # The counts expire with the entries that they would refresh if
+    # ``precomputerelated`` is not run
+    tally_buffer.zincr(
+        _requests_key(media_type),
+        identifier,
+        max_members=REQUESTS_MAX_ITEMS,
+        ttl=settings.RELATED_CACHE_MAX_AGE,
+    )
+
+
+def pop_most_requested(media_type: str, count: int) -> list[str]:
+    """
+    Get the items whose related media were requested the most, and reset the counts.
+
+    :param media_type: the media type of the items
+    :param count: the number of items to get
+    :return: the identifiers of the items, from the most requested
+    """
+
+    tallies = django_redis.get_redis_connection("tallies")
+    with tallies.pipeline() as pipe:
+        pipe.zrevrange(_requests_key(media_type), 0, count - 1)
+        pipe.delete(_requests_key(media_type))
+        identifiers, _ = pipe.execute()
+    return [identifier.decode() for identifier in identifiers]
+
+
+def get_cached_item(media_type: str, identifier: str) -> RelatedItem | None:
+    """
+    Get the fields of the item cached with its related media, if any.
+
+    :param media_type: the media type of the item
+    :param identifier: the identifier of the item
+    :return: the fields of the item, or ``None`` if its related media are not cached
+    """
+
+    redis = django_redis.get_redis_connection("default")
+    entry, _ = _get(redis, _key(media_type, identifier))
+    return entry.item if entry else None
+
+
+# Background refreshes run on a dedicated event loop, so that the dead link checks
+# of all refreshes share the aiohttp session of that loop.
+_refresh_loop: asyncio.AbstractEventLoop | None = None
+_refresh_loop_lock = threading.Lock()
+
+
+def _get_refresh_loop() -> asyncio.AbstractEventLoop:
+    global _refresh_loop
+
+    with _refresh_loop_lock:
+        if _refresh_loop is None:
+            _refresh_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_refresh_loop.run_forever, name="related_cache", daemon=True
+            ).start()
+    return _refresh_loop
+
+
+def _refresh_in_thread(*args):
+    try:
+        refresh(*args)
+    except Exception:
+        logger.error("Could not refresh related media.", exc_info=True)
+    finally:
+        close_old_connections()
+
+
+def _refresh_in_background(
+    redis, media_type: str, index: str, identifier: str, item: RelatedItem
+):
+    # Only one refresh per item at a time, across all the API workers
+    lock_key = f"{_key(media_type, identifier)}:refresh"
+    try:
+        if not redis.set(lock_key, 1, nx=True, ex=REFRESH_LOCK_TIMEOUT):
+            return
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot refresh related media.")
+        return
+
+    asyncio.run_coroutine_threadsafe(
+        sync_to_async(_refresh_in_thread, thread_sensitive=False)(
+            media_type, index, identifier, item
+        ),
+        _get_refresh_loop(),
+    )
@@ -0,0 +1,191 @@
+"""
+Measure how long each stage of a request takes.
+
+The ``request_timing_middleware`` starts a timing for every request, and the
+stages of the request are measured by wrapping them in ``timed``. Outside of a
+request, e.g. in management commands, ``timed`` does nothing.
+
+Stage timings are exclusive: the time spent in a stage nested in another, like the
+Elasticsearch query made while building the search context, is only counted in the
+innermost stage. The stages therefore never add up to more than the total.
+
+For each request in which at least one stage was measured, the timings are
+
+- sent in the ``Server-Timing`` header of the response;
+- logged in a single ``Timed request`` line;
+- recorded in the histograms served at ``/metrics``, when
+  ``settings.REQUEST_TIMING_METRICS`` is enabled.
+
+The stage names are part of the interface consumed by dashboards. Add new stages
+to ``STAGES`` rather than renaming existing ones.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Literal, get_args
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+import structlog
+
+
+logger = structlog.get_logger(__name__)
+
+Stage = Literal[
+    "throttle",
+    "search_context",
+    "es",
+    "dead_links",
+    "db",
+    "serialize",
+    "render",
+    "image_extension",
+    "upstream",
+]
+STAGES: tuple[Stage, ...] = get_args(Stage)
+
+# The upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"))
+
+METRIC_NAME = "openverse_api_request_stage_duration_seconds"
+
+
+@dataclass
+class RequestTiming:
+    start: float = field(default_factory=time.perf_counter)
+    """the time at which the request started, from ``time.perf_counter``"""
+    stages: dict[Stage, float] = field(default_factory=dict)
+    """the exclusive duration of each measured stage, in seconds"""
+    nested: float = 0.0
+    """the time spent in the stages nested in the current one, in seconds"""
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+@contextmanager
+def timed(stage: Stage) -> Iterator[None]:
+    """
+    Measure the duration of the wrapped code as a stage of the current request.
+
+    Measuring the same stage more than once in a request adds up the durations.
+
+    :param stage: the name of the stage, one of ``STAGES``
+    """
+
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+
+    outer_nested, timing.nested = timing.nested, 0.0
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timing.stages[stage] = timing.stages.get(stage, 0.0) + elapsed - timing.nested
+        timing.nested = outer_nested + elapsed
+
+
+class _Histograms:
+    """The histograms of the stage durations, by view and stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[tuple[str, str], list[int]] = defaultdict(
+            lambda: [0] * len(BUCKETS)
+        )
+        self._sums: dict[tuple[str, str], float] = defaultdict(float)
+
+    def observe(self, view: str, durations: dict[str, float]):
+        with self._lock:
+            for stage, duration in durations.items():
+                counts = self._counts[view, stage]
+                for index, bound in enumerate(BUCKETS):
+                    if duration <= bound:
+                        counts[index] += 1
+                        break
+                self._sums[view, stage] += duration
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {METRIC_NAME} Duration of each stage of API requests.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for (view, stage), counts in sorted(self._counts.items()):
+                labels = f'view="{view}",stage="{stage}"'
+                cumulative = 0
+                for bound, count in zip(BUCKETS, counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else bound
+                    lines.append(
+                        f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} {cumulative}'
+                    )
+                lines.append(f"{METRIC_NAME}_sum{{{labels}}} {self._sums[view, stage]}")
+                lines.append(f"{METRIC_NAME}_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+histograms = _Histograms()
+
+
+def start() -> tuple[RequestTiming, Token]:
+    """
+    Start timing the current request.
+
+    :return: the timing, and the token with which to ``stop`` it
+    """
+
+    timing = RequestTiming()
+    return timing, _current.set(timing)
+
+
+def stop(token: Token):
+    """Stop timing the current request."""
+
+    _current.reset(token)
+
+
+def report(request: HttpRequest, response: HttpResponse, timing: RequestTiming):
+    """
+    Report the timings of the request, see the module docstring.
+
+    :param request: the timed request
+    :param response: the response to the request, to which the header is added
+    :param timing: the timing of the request
+    """
+
+    if not timing.stages:
+        return
+
+    total = time.perf_counter() - timing.start
+    durations = {
+        stage: timing.stages[stage] for stage in STAGES if stage in timing.stages
+    } | {"total": total}
+
+    response["Server-Timing"] = ", ".join(
+        f"{stage};dur={duration * 1000:.1f}" for stage, duration in durations.items()
+    )
+
+    match = request.resolver_match
+    view = match.view_name if match else "unknown"
+    logger.info(
+        "Timed request",
+        view=view,
+        status_code=response.status_code,
+        **{
+            f"{stage}_ms": round(duration * 1000, 1)
+            for stage, duration in durations.items()
+        },
+    )
+
+    if settings.REQUEST_TIMING_METRICS:
+        histograms.observe(view, durations)
@@ -0,0 +1,234 @@
+"""
+Cache the rendered responses of search requests.
+
+Search traffic is dominated by a small set of popular queries, most of them for
+the first page of results with the default filters. Rather than re-running the
+Elasticsearch query, the dead link checks, the database hydration and the
+serialization for each of them, the rendered JSON is kept in Redis for
+``settings.SEARCH_RESPONSE_CACHE_TTL`` seconds.
+
+Entries are keyed by the canonical form of the validated request parameters, along
+with everything else that affects the response: the warnings about the parameters,
+the API version, the access level of the request (which clamps the result and page
+counts) and the base URL (used for the hyperlinks in the results). Each entry also records the cache generation at
+which it was computed. The generation is bumped whenever a moderation action
+updates the indices or a ``ContentSource`` changes, which invalidates every entry at
+once without having to find them.
+
+Concurrent misses for the same key are coalesced: the first request computes the
+response while the others wait for it to be cached, up to ``COALESCE_TIMEOUT``
+seconds, after which they compute it themselves.
+
+Each lookup is counted in the ``tallies`` Redis database under
+``search_response_cache:{media_type}:{week}:{outcome}``, where the outcome is one of
+``hit``, ``coalesced`` or ``miss``. The hit rate is the share of lookups which were
+not misses.
+"""
+
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from django.conf import settings
+from rest_framework.request import Request
+
+import django_redis
+import structlog
+from redis.exceptions import ConnectionError
+
+from api.constants import restricted_features
+from api.utils.tallies import get_weekly_timestamp, tally_buffer
+
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "search_response"
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+LOCK_TIMEOUT = 10  # seconds
+COALESCE_TIMEOUT = 2  # seconds
+COALESCE_INTERVAL = 0.05  # seconds
+
+HIT: Literal["hit"] = "hit"
+COALESCED: Literal["coalesced"] = "coalesced"
+MISS: Literal["miss"] = "miss"
+Outcome = Literal[HIT, COALESCED, MISS]
+
+
+@dataclass
+class CachedSearch:
+    body: bytes
+    """the rendered JSON response"""
+    providers: list[str]
+    """the provider of each hit, used to tally the results of cached responses"""
+
+
+def _canonical(value):
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def get_cache_key(
+    media_type: str, request: Request, validated_data: dict, warnings: list[dict]
+) -> str:
+    """
+    Get the key of the cached response to a search request.
+
+    :param media_type: the media type being searched
+    :param request: the request, which determines the version, access level and
+    base URL of the response
+    :param validated_data: the validated data of the request serializer
+    :param warnings: the warnings of the request serializer, which are included in
+    the response
+    :return: the Redis key of the response
+    """
+
+    access_level, _ = restricted_features.MAX_RESULT_COUNT.request_level(request)
+    canonical = json.dumps(
+        [
+            settings.API_VERSION,
+            request.version,
+            access_level,
+            request.build_absolute_uri("/"),
+            validated_data,
+            warnings,
+        ],
+        sort_keys=True,
+        default=_canonical,
+    )
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{media_type}:{digest}"
+
+
+def _get(redis, key: str) -> tuple[CachedSearch | None, bytes]:
+    with redis.pipeline(transaction=False) as pipe:
+        pipe.hgetall(key)
+        pipe.get(GENERATION_KEY)
+        entry, generation = pipe.execute()
+
+    generation = generation or b"0"
+    if not entry or entry.get(b"generation") != generation:
+        return None, generation
+    return (
+        CachedSearch(body=entry[b"body"], providers=json.loads(entry[b"providers"])),
+        generation,
+    )
+
+
+def _set(redis, key: str, entry: CachedSearch, generation: bytes):
+    with redis.pipeline() as pipe:
+        pipe.hset(
+            key,
+            mapping={
+                "body": entry.body,
+                "providers": json.dumps(entry.providers),
+                "generation": generation,
+            },
+        )
+        pipe.expire(key, settings.SEARCH_RESPONSE_CACHE_TTL)
+        pipe.execute()
+
+
+def _wait(redis, key: str, lock_key: str) -> CachedSearch | None:
+    deadline = time.monotonic() + COALESCE_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(COALESCE_INTERVAL)
+        if entry := _get(redis, key)[0]:
+            return entry
+        if not redis.exists(lock_key):
+            # The request computing the response failed
+            return None
+    return None
+
+
+def get_or_compute(
+    media_type: str, key: str, compute: Callable[[], CachedSearch]
+) -> tuple[CachedSearch, Outcome]:
+    """
+    Get the cached response for the key, computing and caching it on a miss.
+
+    If Redis cannot be reached, the response is always computed.
+
+    :param media_type: the media type being searched, under which to count the
+    outcome of the lookup
+    :param key: the key of the response, see ``get_cache_key``
+    :param compute: the function computing the response on a miss
+    :return: the response, and whether it was a hit, a coalesced miss or a miss
+    """
+
+    redis = django_redis.get_redis_connection("default")
+    lock_key = f"{key}:lock"
+    lock_token = None
+    try:
+        entry, generation = _get(redis, key)
+        if entry:
+            _record_outcome(media_type, HIT)
+            return entry, HIT
+
+        lock_token = uuid.uuid4().hex
+        if not redis.set(lock_key, lock_token, nx=True, ex=LOCK_TIMEOUT):
+            lock_token = None
+            if entry := _wait(redis, key, lock_key):
+                _record_outcome(media_type, COALESCED)
+                return entry, COALESCED
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot get cached search response.")
+        return compute(), MISS
+
+    try:
+        entry = compute()
+        try:
+            _set(redis, key, entry, generation)
+        except ConnectionError:
+            logger.warning("Redis connect failed, cannot cache search response.")
+    finally:
+        # Release the lock after caching the response so that the requests
+        # waiting for it find it as soon as it is gone
+        if lock_token:
+            _release(redis, lock_key, lock_token)
+
+    _record_outcome(media_type, MISS)
+    return entry, MISS
+
+
+def _release(redis, lock_key: str, lock_token: str):
+    try:
+        if redis.get(lock_key) == lock_token.encode():
+            redis.delete(lock_key)
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot release search response lock.")
+
+
+def _record_outcome(media_type: str, outcome: Outcome):
+    structlog.contextvars.bind_contextvars(search_response_cache=outcome)
+    week = get_weekly_timestamp()
+    tally_buffer.incr(f"{KEY_PREFIX}_cache:{media_type}:{week}:{outcome}")
+
+
+def get_generation() -> bytes | None:
+    """
+    Get the current cache generation, which changes with every invalidation.
+
+    :return: the generation, or ``None`` if Redis cannot be reached
+    """
+
+    redis = django_redis.get_redis_connection("default")
+    try:
+        return redis.get(GENERATION_KEY) or b"0"
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot get search cache generation.")
+        return None
+
+
+def invalidate():
+    """Invalidate every cached search response."""
+
+    redis = django_redis.get_redis_connection("default")
+    try:
+        redis.incr(GENERATION_KEY)
+    except ConnectionError:
+        logger.warning("Redis connect failed, cannot invalidate search responses.")
@@ -0,0 +1,76 @@
+"""
+Opaque cursors for paginating through search results without depth limits.
+
+Page-based pagination asks Elasticsearch for ``from + size`` hits, which gets more
+expensive with every page and is capped by the maximum result window. Instead, a
+cursor pins the index with a point in time (PIT) and records the sort values of the
+last hit of the page, so that the next page is fetched with ``search_after`` at a
+constant cost.
+
+Cursors also record the hash of the query they belong to, used to share the dead
+link mask with page-based searches of the same query, and the number of hits of the
+query before the next page, i.e. the position of the page in that mask.
+
+Cursors are signed, so clients cannot forge them, and compressed, as point in time
+IDs are long.
+"""
+
+from dataclasses import asdict, dataclass
+
+from django.core import signing
+from rest_framework.exceptions import APIException
+
+
+# The value of the ``cursor`` parameter which starts a new cursor
+START = "*"
+
+# How long Elasticsearch keeps a point in time open after each page
+KEEP_ALIVE = "5m"
+
+_SALT = "api.utils.search_cursor"
+
+
+class InvalidCursor(APIException):
+    status_code = 400
+    default_detail = "Invalid cursor."
+    default_code = "invalid_cursor"
+
+
+@dataclass
+class Cursor:
+    query_hash: str
+    """the hash of the query, see ``api.utils.dead_link_mask.get_query_hash``"""
+    pit_id: str
+    """the ID of the point in time of the index being searched"""
+    search_after: list | None
+    """the sort values of the last hit before the next page"""
+    offset: int
+    """the number of hits of the query before the next page"""
+    page: int
+    """the number of the next page"""
+
+
+def encode(cursor: Cursor) -> str:
+    """
+    Encode the cursor as an opaque string for the response.
+
+    :param cursor: the cursor to the next page
+    :return: the signed, compressed and URL-safe cursor
+    """
+
+    return signing.dumps(asdict(cursor), salt=_SALT, compress=True)
+
+
+def decode(value: str) -> Cursor:
+    """
+    Decode the cursor sent by a client.
+
+    :param value: the cursor, as returned by ``encode``
+    :return: the decoded cursor
+    :raises InvalidCursor: if the cursor was not issued by the API
+    """
+
+    try:
+        return Cursor(**signing.loads(value, salt=_SALT))
+    except (signing.BadSignature, TypeError):
+        raise InvalidCursor()
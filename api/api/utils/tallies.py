@@ -1,11 +1,19 @@
-from collections import defaultdict
+import threading
+import time
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 
+from django.conf import settings
+from django.dispatch import receiver
+
 import django_redis
 import structlog
+from django_asgi_lifespan.signals import asgi_shutdown
 from django_redis.client.default import Redis
 from redis.exceptions import ConnectionError
 
+from api.utils import async_redis
+
 
 logger = structlog.get_logger(__name__)
 
@@ -23,26 +31,183 @@ def get_monthly_timestamp() -> str:
     return now.strftime("%Y-%m")
 
 
-def count_provider_occurrences(results: list[dict], index: str) -> None:
-    # Use ``get_redis_connection`` rather than Django's caches
-    # so that we can open a pipeline rather than sending off ``n``
-    # writes and because the RedisPy client's ``incr`` method
-    # is safe by default rather than Django's handspun method which:
-    # 1. Takes two requests to execute; and
-    # 2. Raises a ``ValueError`` if the key doesn't exist rather than
-    # just initialising the key to the value like Redis's behaviour.
-    tallies: Redis = django_redis.get_redis_connection("tallies")
+class TallyBuffer:
+    """
+    Accumulate increments of tallies in memory, and write them to Redis together.
+
+    Tallies are only used for analytics, so rather than sending the increments of
+    every request to Redis, each process adds them up and writes them in a single
+    pipeline every ``settings.TALLY_FLUSH_INTERVAL`` seconds or
+    ``settings.TALLY_FLUSH_INCREMENTS`` increments, whichever comes first, and on
+    shutdown. With an interval of 0, every increment is written immediately.
+
+    Besides counters, tallies can be sorted sets counting the occurrences of each of
+    their members, which are kept to a maximum number of members and expire when
+    they are no longer incremented.
+
+    The increments of the last few seconds are lost if the process crashes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._scores: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._set_limits: dict[str, tuple[int, int]] = {}
+        self._increments = 0
+        self._last_flush = time.monotonic()
+
+    def incr(self, key: str, amount: int = 1):
+        """
+        Increment a tally, flushing the buffer if it is due.
+
+        :param key: the Redis key of the tally
+        :param amount: the amount by which to increment the tally
+        """
+
+        if self._add(key, amount):
+            self.flush()
+
+    async def aincr(self, key: str, amount: int = 1):
+        """
+        Increment a tally, flushing the buffer with the asyncio Redis client if it
+        is due.
+
+        :param key: the Redis key of the tally
+        :param amount: the amount by which to increment the tally
+        """
+
+        if self._add(key, amount):
+            await self.aflush()
+
+    def zincr(self, key: str, member: str, max_members: int, ttl: int, amount: int = 1):
+        """
+        Increment the score of a member of a sorted set tally, flushing the buffer if
+        it is due.
+
+        :param key: the Redis key of the sorted set
+        :param member: the member whose score to increment
+        :param max_members: the number of members with the highest scores to keep
+        :param ttl: the number of seconds after its last increment for which the
+        sorted set is kept
+        :param amount: the amount by which to increment the score
+        """
+
+        if self._add(key, amount, member=member, limits=(max_members, ttl)):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered increments to Redis in a single pipeline."""
 
+        counts, scores, increments = self._take()
+        if not counts and not scores:
+            return
+
+        # Use ``get_redis_connection`` rather than Django's caches so that we can
+        # open a pipeline, and because the RedisPy client's ``incr`` initialises
+        # missing keys like Redis does, rather than raising a ``ValueError``.
+        tallies: Redis = django_redis.get_redis_connection("tallies")
+        with tallies.pipeline(transaction=False) as pipe:
+            self._queue(pipe, counts, scores)
+            try:
+                pipe.execute()
+            except ConnectionError:
+                self._log_failure(increments)
+                return
+        self._log_flush(counts, scores, increments)
+
+    async def aflush(self):
+        """Write the buffered increments to Redis in a single async pipeline."""
+
+        counts, scores, increments = self._take()
+        if not counts and not scores:
+            return
+
+        tallies = async_redis.get_redis_connection("tallies")
+        async with tallies.pipeline(transaction=False) as pipe:
+            self._queue(pipe, counts, scores)
+            try:
+                await pipe.execute()
+            except ConnectionError:
+                self._log_failure(increments)
+                return
+        self._log_flush(counts, scores, increments)
+
+    def _add(
+        self,
+        key: str,
+        amount: int,
+        member: str | None = None,
+        limits: tuple[int, int] | None = None,
+    ) -> bool:
+        with self._lock:
+            if member is None:
+                self._counts[key] += amount
+            else:
+                self._scores[key][member] += amount
+                self._set_limits[key] = limits
+            self._increments += 1
+            return (
+                not settings.TALLY_FLUSH_INTERVAL
+                or self._increments >= settings.TALLY_FLUSH_INCREMENTS
+                or time.monotonic() - self._last_flush >= settings.TALLY_FLUSH_INTERVAL
+            )
+
+    def _take(self) -> tuple[Counter[str], dict[str, Counter[str]], int]:
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            scores, self._scores = self._scores, defaultdict(Counter)
+            increments, self._increments = self._increments, 0
+            self._last_flush = time.monotonic()
+        return counts, scores, increments
+
+    def _queue(self, pipe, counts: Counter[str], scores: dict[str, Counter[str]]):
+        for key, amount in counts.items():
+            pipe.incr(key, amount)
+        for key, member_scores in scores.items():
+            for member, amount in member_scores.items():
+                pipe.zincrby(key, amount, member)
+            max_members, ttl = self._set_limits[key]
+            # Remove all but the members with the highest scores
+            pipe.zremrangebyrank(key, 0, -max_members - 1)
+            pipe.expire(key, ttl)
+
+    @staticmethod
+    def _log_failure(increments: int):
+        logger.warning(
+            "Redis connect failed, cannot flush tallies.", increments=increments
+        )
+
+    @staticmethod
+    def _log_flush(
+        counts: Counter[str], scores: dict[str, Counter[str]], increments: int
+    ):
+        # Each flush replaces ``increments`` commands with one command per key or
+        # sorted set member, sent in a single round trip
+        logger.debug(
+            "Flushed tallies.",
+            increments=increments,
+            keys=len(counts)
+            + sum(len(member_scores) for member_scores in scores.values()),
+        )
+
+
+tally_buffer = TallyBuffer()
+
+
+@receiver(asgi_shutdown)
+async def _flush_on_shutdown(sender, **kwargs):
+    logger.debug("Flushing tallies on application shutdown")
+    await tally_buffer.aflush()
+
+
+def count_provider_occurrences(results: list[dict], index: str) -> None:
     provider_occurrences = defaultdict(int)
     for result in results:
         provider_occurrences[result["provider"]] += 1
 
     week = get_weekly_timestamp()
-    with tallies.pipeline() as pipe:
-        for provider, occurrences in provider_occurrences.items():
-            pipe.incr(f"provider_occurrences:{index}:{week}:{provider}", occurrences)
-            pipe.incr(f"provider_appeared_in_searches:{index}:{week}:{provider}", 1)
-        try:
-            pipe.execute()
-        except ConnectionError:
-            logger.warning("Redis connect failed, cannot increment provider tallies.")
+    for provider, occurrences in provider_occurrences.items():
+        tally_buffer.incr(
+            f"provider_occurrences:{index}:{week}:{provider}", occurrences
+        )
+        tally_buffer.incr(f"provider_appeared_in_searches:{index}:{week}:{provider}")
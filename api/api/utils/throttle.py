@@ -5,6 +5,8 @@ from rest_framework.throttling import SimpleRateThrottle as BaseSimpleRateThrott
 import structlog
 from redis.exceptions import ConnectionError
 
+from api.utils import search_cursor
+
 
 logger = structlog.get_logger(__name__)
 
@@ -183,6 +185,25 @@ class EnhancedOAuth2IdBurstRateThrottle(AbstractOAuth2IdRateThrottle):
     scope = "enhanced_oauth2_client_credentials_burst"
 
 
+class OAuth2IdCursorRateThrottle(AbstractOAuth2IdRateThrottle):
+    """
+    Limits how often a client can start a new search cursor.
+
+    Each new cursor opens a point in time in Elasticsearch, which holds on to the
+    segments of the index until the last page or until it expires, so the number of
+    cursors that a client starts is limited separately from its other requests.
+    """
+
+    applies_to_rate_limit_model = {"standard", "enhanced"}
+    scope = "oauth2_client_credentials_cursor"
+
+    def get_cache_key(self, request, view):
+        if request.query_params.get("cursor") != search_cursor.START:
+            return None
+
+        return super().get_cache_key(request, view)
+
+
 class ExemptOAuth2IdRateThrottle(AbstractOAuth2IdRateThrottle):
     applies_to_rate_limit_model = {"exempt"}
     scope = "exempt_oauth2_client_credentials"
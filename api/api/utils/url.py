@@ -13,6 +13,10 @@ def add_protocol(url: str) -> str:
     :return: the URL with the existing scheme, or ``https`` if one did not exist
     """
 
+    # Most URLs have a scheme, in which case parsing them is unnecessary
+    if isinstance(url, str) and url.startswith(("https://", "http://")):
+        return url
+
     parsed = urlparse(url)
     if parsed.scheme == "":
         return f"https://{url}"
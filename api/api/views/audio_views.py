@@ -7,6 +7,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from api.constants.media_types import AUDIO_TYPE
 from api.docs.audio_docs import (
+    bulk,
     detail,
     related,
     report,
@@ -34,6 +35,7 @@ from api.views.media_views import MediaViewSet
     stats=stats,
     retrieve=detail,
     related=related,
+    bulk=bulk,
 )
 class AudioViewSet(MediaViewSet):
     """Viewset for all endpoints pertaining to audio."""
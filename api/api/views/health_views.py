@@ -7,6 +7,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from elasticsearch import ApiError, TransportError
+
 from api.utils.throttle import ExemptOAuth2IdRateThrottle, HealthcheckAnonRateThrottle
 
 
@@ -45,7 +47,10 @@ class HealthCheck(APIView):
 
         Raises an exception if ES is not healthy.
         """
-        es_health = settings.ES.cluster.health(timeout="5s")
+        try:
+            es_health = settings.ES.cluster.health(timeout="5s")
+        except (ApiError, TransportError) as err:
+            raise HealthCheckException(f"elasticsearch: {err}")
 
         if es_health["timed_out"]:
             raise HealthCheckException("elasticsearch: es_timed_out")
@@ -6,10 +6,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from PIL import Image as PILImage
 
 from api.constants.media_types import IMAGE_TYPE
 from api.docs.image_docs import (
+    bulk,
     detail,
     oembed,
     related,
@@ -26,7 +26,7 @@ from api.serializers.image_serializers import (
     OembedRequestSerializer,
     OembedSerializer,
 )
-from api.utils import image_proxy
+from api.utils import conditional_get, image_proxy
 from api.utils.aiohttp import get_aiohttp_session
 from api.views.media_views import MediaViewSet
 
@@ -37,6 +37,7 @@ from api.views.media_views import MediaViewSet
     stats=stats,
     retrieve=detail,
     related=related,
+    bulk=bulk,
 )
 class ImageViewSet(MediaViewSet):
     """Viewset for all endpoints pertaining to images."""
@@ -80,6 +81,10 @@ class ImageViewSet(MediaViewSet):
 
         image = await aget_object_or_404(Image, identifier=identifier)
 
+        etag = conditional_get.get_etag(request, image.identifier, image.updated_on)
+        if response := conditional_get.not_modified(request, etag):
+            return response
+
         if not (image.height and image.width):
             session = await get_aiohttp_session()
 
@@ -88,6 +93,9 @@ class ImageViewSet(MediaViewSet):
             ) as image_file:
                 image_content = await image_file.content.read()
 
+            # Pillow is slow to import, and only needed by this fallback
+            from PIL import Image as PILImage
+
             with PILImage.open(io.BytesIO(image_content)) as image_file:
                 width, height = image_file.size
 
@@ -97,7 +105,7 @@ class ImageViewSet(MediaViewSet):
             }
 
         serializer = self.get_serializer(image, context=context)
-        return Response(data=await serializer.adata)
+        return conditional_get.add_headers(Response(data=await serializer.adata), etag)
 
     async def get_image_proxy_media_info(self) -> image_proxy.MediaInfo:
         image = await self.aget_object()
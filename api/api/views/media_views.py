@@ -1,8 +1,10 @@
 from typing import Union
 
+from django.conf import settings
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import APIException, NotFound
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
@@ -12,13 +14,19 @@ from adrf.viewsets import ViewSetMixin as AsyncViewSetMixin
 
 from api.constants.media_types import MediaType
 from api.controllers import search_controller
-from api.controllers.elasticsearch.related import related_media
+from api.controllers.elasticsearch.related import RelatedItem
 from api.models import ContentSource
 from api.models.base import OpenLedgerModel
 from api.models.media import AbstractMedia
 from api.serializers import media_serializers
 from api.serializers.source_serializers import SourceSerializer
-from api.utils import image_proxy
+from api.utils import (
+    conditional_get,
+    image_proxy,
+    related_cache,
+    request_timing,
+    search_cache,
+)
 from api.utils.pagination import StandardPagination
 from api.utils.search_context import SearchContext
 from api.utils.throttle import (
@@ -135,17 +143,33 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
 
         return (results, addons)
 
+    def check_throttles(self, request):
+        with request_timing.timed("throttle"):
+            super().check_throttles(request)
+
     # Standard actions
 
     def retrieve(self, request, *_, **__):
         instance = self.get_object()
-        search_context = SearchContext.build(
-            [str(instance.identifier)], self.default_index
-        ).asdict()
+        with request_timing.timed("search_context"):
+            search_context = SearchContext.build(
+                [str(instance.identifier)], self.default_index
+            ).asdict()
+
+        etag = conditional_get.get_etag(
+            request,
+            instance.identifier,
+            instance.updated_on,
+            instance.sensitive,
+            sorted(search_context["sensitive_text_result_identifiers"]),
+        )
+        if response := conditional_get.not_modified(request, etag):
+            return response
+
         serializer_context = search_context | self.get_serializer_context()
         serializer = self.get_serializer(instance, context=serializer_context)
 
-        return Response(serializer.data)
+        return conditional_get.add_headers(Response(serializer.data), etag)
 
     def list(self, request, *_, **__):
         params = self._get_request_serializer(request)
@@ -182,9 +206,6 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
         page = self.paginator.page = params.data["page"]
         self.paginator.warnings = params.context["warnings"]
 
-        hashed_ip = hash(self._get_user_ip(request))
-        filter_dead = params.validated_data.get("filter_dead", True)
-
         if pref_index := params.validated_data.get("index"):
             logger.info(f"Using preferred index {pref_index} for media.")
             search_index = pref_index
@@ -194,28 +215,106 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
             search_index = self.default_index
             exact_index = False
 
-        try:
-            (
-                results,
-                num_pages,
-                num_results,
-                search_context,
-            ) = search_controller.query_media(
-                params,
-                search_index,
-                exact_index,
-                page_size,
-                hashed_ip,
-                filter_dead,
+        if (
+            not settings.SEARCH_RESPONSE_CACHE_TTL
+            or request.accepted_renderer.format != "json"
+            # Cursors are specific to the point in time opened for the request
+            or "cursor" in params.validated_data
+        ):
+            response, _ = self._search(request, params, search_index, exact_index)
+            return response
+
+        def compute():
+            response, hits = self._search(request, params, search_index, exact_index)
+            body = request.accepted_renderer.render(
+                response.data,
+                request.accepted_media_type,
+                self.get_renderer_context(),
+            )
+            return search_cache.CachedSearch(
+                body=body, providers=[hit.provider for hit in hits]
+            )
+
+        key = search_cache.get_cache_key(
+            self.media_type, request, params.validated_data, params.context["warnings"]
+        )
+        cached, outcome = search_cache.get_or_compute(self.media_type, key, compute)
+        if outcome != search_cache.MISS:
+            # Tally the cached results, as the search would have
+            search_controller.tally_results(
+                search_controller.get_index(exact_index, search_index, params),
+                [{"provider": provider} for provider in cached.providers],
                 page,
+                page_size,
             )
-            self.paginator.page_count = params.clamp_page_count(num_pages)
-            self.paginator.result_count = params.clamp_result_count(num_results)
+
+        content_type = request.accepted_media_type
+        if charset := request.accepted_renderer.charset:
+            content_type = f"{content_type}; charset={charset}"
+        return HttpResponse(cached.body, content_type=content_type)
+
+    def _search(
+        self,
+        request,
+        params: MediaListRequestSerializer,
+        search_index: str,
+        exact_index: bool,
+    ) -> tuple[Response, list]:
+        """
+        Run the search and serialize its results.
+
+        :return: the paginated response, and the Elasticsearch hits of the results
+        """
+
+        hashed_ip = hash(self._get_user_ip(request))
+        filter_dead = params.validated_data.get("filter_dead", True)
+
+        try:
+            if "cursor" in params.validated_data:
+                cursor = params.validated_data["cursor"]
+                (
+                    hits,
+                    num_pages,
+                    num_results,
+                    search_context,
+                    next_cursor,
+                ) = search_controller.query_media_by_cursor(
+                    params,
+                    search_index,
+                    exact_index,
+                    self.paginator.page_size,
+                    filter_dead,
+                    cursor,
+                )
+                # Cursors are not limited in depth, so neither are the counts
+                self.paginator.page = cursor.page if cursor else 1
+                self.paginator.page_count = num_pages
+                self.paginator.result_count = num_results
+                self.paginator.uses_cursor = True
+                self.paginator.next_cursor = next_cursor
+            else:
+                (
+                    hits,
+                    num_pages,
+                    num_results,
+                    search_context,
+                ) = search_controller.query_media(
+                    params,
+                    search_index,
+                    exact_index,
+                    self.paginator.page_size,
+                    hashed_ip,
+                    filter_dead,
+                    self.paginator.page,
+                )
+                self.paginator.page_count = params.clamp_page_count(num_pages)
+                self.paginator.result_count = params.clamp_result_count(num_results)
         except ValueError as e:
             raise APIException(getattr(e, "message", str(e)))
 
         include_addons = self.include_addons(params)
-        results, addons = self.get_db_results(results, include_addons)
+        with request_timing.timed("db"):
+            results, addons = self.get_db_results(hits, include_addons)
         serializer_context = (
             search_context
             | self.get_serializer_context()
@@ -223,13 +322,22 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
         )
 
         serializer = self.get_serializer(results, many=True, context=serializer_context)
-        return self.get_paginated_response(serializer.data)
+        with request_timing.timed("serialize"):
+            data = serializer.data
+        return self.get_paginated_response(data), hits
 
     # Extra actions
 
     @action(detail=False, serializer_class=SourceSerializer, pagination_class=None)
-    def stats(self, *_, **__):
+    def stats(self, request, *_, **__):
         source_counts = search_controller.get_sources(self.default_index)
+        # Changes to content sources bump the generation of the search cache
+        etag = conditional_get.get_etag(
+            request, source_counts, search_cache.get_generation()
+        )
+        if response := conditional_get.not_modified(request, etag):
+            return response
+
         context = self.get_serializer_context() | {
             "source_counts": source_counts,
         }
@@ -238,15 +346,19 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
             media_type=self.default_index, filter_content=False
         )
         serializer = self.get_serializer(sources, many=True, context=context)
-        return Response(serializer.data)
+        return conditional_get.add_headers(Response(serializer.data), etag)
 
     @action(detail=True)
     def related(self, request, identifier=None, *_, **__):
+        def get_item():
+            # Only looked up when the related media are not cached, raises
+            # ``Http404`` for unknown items
+            with request_timing.timed("db"):
+                return RelatedItem.from_media(self.get_object())
+
         try:
-            results = related_media(
-                uuid=identifier,
-                index=self.default_index,
-                filter_dead=True,
+            identifiers = related_cache.get_related(
+                self.media_type, self.default_index, str(identifier), get_item
             )
             self.paginator.page_count = 1
             # `page_size` refers to the maximum number of related images to return.
@@ -255,16 +367,82 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
             self.paginator.result_count = 10
         except ValueError as e:
             raise APIException(getattr(e, "message", str(e)))
-        # If there are no hits in the search controller
-        except IndexError:
-            raise NotFound
+
+        with request_timing.timed("db"):
+            results = list(self.get_queryset().filter(identifier__in=identifiers))
+            results.sort(key=lambda x: identifiers.index(str(x.identifier)))
+
+        # Moderation actions bump the generation of the search cache, and updates
+        # of the related media themselves change their ``updated_on``
+        etag = conditional_get.get_etag(
+            request,
+            identifiers,
+            [(str(result.identifier), result.updated_on) for result in results],
+            search_cache.get_generation(),
+        )
+        if response := conditional_get.not_modified(request, etag):
+            return response
 
         serializer_context = self.get_serializer_context()
+        serializer = self.get_serializer(results, many=True, context=serializer_context)
+        with request_timing.timed("serialize"):
+            data = serializer.data
+        return conditional_get.add_headers(self.get_paginated_response(data), etag)
+
+    @action(detail=False, pagination_class=None)
+    def bulk(self, request, *_, **__):
+        """
+        Retrieve the details of several media at once.
+
+        Unlike ``retrieve``, which runs its own DB query and filtered index query
+        for every item, this resolves all the requested identifiers with a single
+        query of each.
+        """
 
-        results, _ = self.get_db_results(results)
+        serializer = media_serializers.MediaBulkRequestSerializer(
+            data=request.query_params, context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+        identifiers = serializer.validated_data["ids"]
+
+        params = self._get_request_serializer(request)
+        with request_timing.timed("db"):
+            found = {
+                str(result.identifier): result
+                for result in self.get_queryset().filter(identifier__in=identifiers)
+            }
+            if self.include_addons(params) and self.addon_model_class:
+                addons = list(self.addon_model_class.objects.filter(pk__in=list(found)))
+            else:
+                addons = []
+        results = [
+            found[identifier] for identifier in identifiers if identifier in found
+        ]
+
+        with request_timing.timed("search_context"):
+            search_context = SearchContext.build(
+                [str(result.identifier) for result in results], self.default_index
+            ).asdict()
+        serializer_context = (
+            search_context
+            | self.get_serializer_context()
+            | {"addons": {addon.audio_identifier: addon for addon in addons}}
+        )
 
         serializer = self.get_serializer(results, many=True, context=serializer_context)
-        return self.get_paginated_response(serializer.data)
+        with request_timing.timed("serialize"):
+            data = iter(serializer.data)
+        return Response(
+            {
+                "results": [
+                    next(data) if identifier in found else None
+                    for identifier in identifiers
+                ],
+                "not_found": [
+                    identifier for identifier in identifiers if identifier not in found
+                ],
+            }
+        )
 
     def report(self, request, identifier):
         serializer = self.get_serializer(data=request.data | {"identifier": identifier})
@@ -294,7 +472,8 @@ class MediaViewSet(AsyncViewSetMixin, AsyncAPIView, ReadOnlyModelViewSet):
         serializer = self.get_serializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
 
-        media_info = await self.get_image_proxy_media_info()
+        with request_timing.timed("db"):
+            media_info = await self.get_image_proxy_media_info()
 
         return await image_proxy.get(
             media_info,
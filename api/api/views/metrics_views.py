@@ -0,0 +1,11 @@
+from django.http import HttpRequest, HttpResponse
+
+from api.utils.request_timing import histograms
+
+
+def metrics(request: HttpRequest) -> HttpResponse:
+    """Serve the request stage duration histograms in the Prometheus text format."""
+
+    return HttpResponse(
+        histograms.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
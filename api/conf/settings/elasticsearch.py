@@ -9,7 +9,11 @@ from api.constants.media_types import MEDIA_TYPES
 
 def _elasticsearch_connect() -> tuple[Elasticsearch, str]:
     """
-    Connect to configured Elasticsearch domain.
+    Create the client of the configured Elasticsearch domain.
+
+    The client only connects on its first request, and is safe to share across
+    threads, so creating it does not wait for Elasticsearch. The health of the
+    cluster is checked by the ``/healthcheck`` view instead, with ``check_es``.
 
     :return: An Elasticsearch connection object.
     """
@@ -28,8 +32,6 @@ def _elasticsearch_connect() -> tuple[Elasticsearch, str]:
         max_retries=3,
         retry_on_timeout=True,
     )
-    _es.info()
-    _es.cluster.health(wait_for_status="yellow")
     return _es, es_endpoint
 
 
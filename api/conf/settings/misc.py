@@ -29,3 +29,28 @@ OUTBOUND_USER_AGENT_TEMPLATE = config(
     "OUTBOUND_USER_AGENT_TEMPLATE",
     default=f"Openverse{{purpose}}/{API_VERSION} (https://wordpress.org/openverse)",
 )
+
+# Tallies are buffered in memory and written to Redis every ``TALLY_FLUSH_INTERVAL``
+# seconds or ``TALLY_FLUSH_INCREMENTS`` increments, see ``api.utils.tallies``
+TALLY_FLUSH_INTERVAL = config("TALLY_FLUSH_INTERVAL", default=10, cast=float)
+TALLY_FLUSH_INCREMENTS = config("TALLY_FLUSH_INCREMENTS", default=1000, cast=int)
+
+# Number of seconds for which rendered search responses are cached, 0 to disable
+SEARCH_RESPONSE_CACHE_TTL = config("SEARCH_RESPONSE_CACHE_TTL", default=60, cast=int)
+
+# Number of seconds for which clients and the CDN may cache the responses of the
+# detail, stats, related and oEmbed endpoints before revalidating them
+CACHE_CONTROL_MAX_AGE = config("CACHE_CONTROL_MAX_AGE", default=60, cast=int)
+CACHE_CONTROL_S_MAXAGE = config("CACHE_CONTROL_S_MAXAGE", default=600, cast=int)
+
+# Number of seconds for which the cached related media of an item are fresh, 0 to
+# disable the cache. Stale related media are refreshed in the background.
+RELATED_CACHE_TTL = config("RELATED_CACHE_TTL", default=60 * 60 * 24, cast=int)
+# Number of seconds after which cached related media expire, fresh or not
+RELATED_CACHE_MAX_AGE = config(
+    "RELATED_CACHE_MAX_AGE", default=60 * 60 * 24 * 7, cast=int
+)
+
+# Whether to record the durations of the stages of requests in histograms, served
+# at ``/metrics``. Each worker process records and serves its own histograms.
+REQUEST_TIMING_METRICS = config("REQUEST_TIMING_METRICS", default=False, cast=bool)
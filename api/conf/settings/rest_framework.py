@@ -12,6 +12,8 @@ THROTTLE_ANON_SUSTAINED = config("THROTTLE_ANON_SUSTAINED", default="100/day")
 THROTTLE_ANON_THUMBS = config("THROTTLE_ANON_THUMBS", default="150/minute")
 THROTTLE_OAUTH2_THUMBS = config("THROTTLE_OAUTH2_THUMBS", default="500/minute")
 THROTTLE_ANON_HEALTHCHECK = config("THROTTLE_ANON_HEALTHCHECK", default="3/minute")
+# Each search cursor holds a point in time open in Elasticsearch for five minutes
+THROTTLE_OAUTH2_CURSOR = config("THROTTLE_OAUTH2_CURSOR", default="10/minute")
 
 THROTTLE_OV_REFERRER_BURST = config(
     "THROTTLE_OV_REFERRER_BURST", default=THROTTLE_ANON_BURST
@@ -32,6 +34,7 @@ DEFAULT_THROTTLE_RATES = {
     "ov_referrer_sustained": THROTTLE_OV_REFERRER_SUSTAINED,
     "ov_referrer_thumbnail": THROTTLE_OV_REFERRER_THUMBS,
     "oauth2_client_credentials_thumbnail": THROTTLE_OAUTH2_THUMBS,
+    "oauth2_client_credentials_cursor": THROTTLE_OAUTH2_CURSOR,
     "oauth2_client_credentials_sustained": "10000/day",
     "oauth2_client_credentials_burst": "100/min",
     "enhanced_oauth2_client_credentials_sustained": "20000/day",
@@ -50,13 +53,14 @@ DEFAULT_THROTTLE_CLASSES = (
     "api.utils.throttle.EnhancedOAuth2IdBurstRateThrottle",
     "api.utils.throttle.EnhancedOAuth2IdSustainedRateThrottle",
     "api.utils.throttle.ExemptOAuth2IdRateThrottle",
+    "api.utils.throttle.OAuth2IdCursorRateThrottle",
 )
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": ("conf.oauth2_extensions.OAuth2Authentication",),
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
+        "api.utils.drf_renderer.ORJSONRenderer",
         "api.utils.drf_renderer.BrowsableAPIRendererWithoutForms",
     ),
     "DEFAULT_THROTTLE_CLASSES": DEFAULT_THROTTLE_CLASSES,
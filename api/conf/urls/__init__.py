@@ -5,6 +5,7 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.2/topics/http/urls/
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import RedirectView, TemplateView
@@ -13,6 +14,7 @@ from rest_framework.routers import SimpleRouter
 from api.views.audio_views import AudioViewSet
 from api.views.health_views import HealthCheck
 from api.views.image_views import ImageViewSet
+from api.views.metrics_views import metrics
 from conf.urls.auth_tokens import urlpatterns as auth_tokens_urlpatterns
 from conf.urls.deprecations import urlpatterns as deprecations_urlpatterns
 from conf.urls.openapi import urlpatterns as openapi_urlpatterns
@@ -44,3 +46,6 @@ urlpatterns = [
     )
     for file in ["robots.txt", "ai.txt"]
 ]
+
+if settings.REQUEST_TIMING_METRICS:
+    urlpatterns.append(path("metrics", metrics, name="metrics"))
@@ -4,6 +4,7 @@ from test.fixtures.asynchronous import ensure_asgi_lifecycle, get_new_loop, sess
 from test.fixtures.cache import (
     django_cache,
     redis,
+    unbuffered_tallies,
     unreachable_django_cache,
     unreachable_redis,
 )
@@ -28,6 +29,7 @@ __all__ = [
     "session_loop",
     "django_cache",
     "redis",
+    "unbuffered_tallies",
     "unreachable_django_cache",
     "unreachable_redis",
     "api_client",
@@ -2,19 +2,37 @@ from django.core.cache import caches
 
 import pytest
 from django_redis.cache import RedisCache
-from fakeredis import FakeRedis, FakeServer
+from fakeredis import FakeAsyncRedis, FakeRedis, FakeServer
+
+
+def _patch_get_async_redis_connection(monkeypatch, fake_server: FakeServer):
+    def get_redis_connection(*args, **kwargs):
+        # Async clients are bound to the event loop, and each ``async_to_sync``
+        # call runs a new one
+        return FakeAsyncRedis(server=fake_server)
+
+    monkeypatch.setattr(
+        "api.utils.async_redis.get_redis_connection", get_redis_connection
+    )
 
 
 @pytest.fixture(autouse=True)
 def redis(monkeypatch) -> FakeRedis:
-    """Emulate a Redis connection that does not affect the real cache."""
+    """
+    Emulate a Redis connection that does not affect the real cache.
 
-    fake_redis = FakeRedis()
+    The async clients of ``api.utils.async_redis`` share the data of this
+    connection.
+    """
+
+    fake_server = FakeServer()
+    fake_redis = FakeRedis(server=fake_server)
 
     def get_redis_connection(*args, **kwargs):
         return fake_redis
 
     monkeypatch.setattr("django_redis.get_redis_connection", get_redis_connection)
+    _patch_get_async_redis_connection(monkeypatch, fake_server)
     yield fake_redis
     fake_redis.client().close()
 
@@ -37,6 +55,7 @@ def unreachable_redis(monkeypatch) -> FakeRedis:
         return fake_redis
 
     monkeypatch.setattr("django_redis.get_redis_connection", get_redis_connection)
+    _patch_get_async_redis_connection(monkeypatch, fake_server)
     yield fake_redis
     fake_server.connected = True
     fake_redis.client().close()
@@ -72,3 +91,10 @@ def unreachable_django_cache(unreachable_redis) -> RedisCache:
     caches["default"] = unreachable_redis
     yield cache
     caches["default"] = original_default_cache
+
+
+@pytest.fixture(autouse=True)
+def unbuffered_tallies(settings):
+    """Write tallies to Redis immediately, so that tests can assert them."""
+
+    settings.TALLY_FLUSH_INTERVAL = 0
@@ -113,3 +113,15 @@ def test_related_media(
     assert len(results) == 10
     assert wrapped_related_results.call_count == 1
     assert mock_related.total_matches == 1
+
+
+def test_related_item_from_media():
+    image = ImageFactory.build(
+        title="Bird",
+        tags=[{"name": "bird", "accuracy": 0.9}, {"accuracy": 0.5}],
+        creator="Jane Doe",
+    )
+
+    assert related.RelatedItem.from_media(image) == related.RelatedItem(
+        title="Bird", tags=["bird"], creator="Jane Doe"
+    )
@@ -0,0 +1,227 @@
+from unittest import mock
+
+import pytest
+from elasticsearch import NotFoundError
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.response import Response
+
+from api.controllers import search_controller
+from api.utils import search_cursor
+from api.utils.dead_link_mask import get_query_hash
+
+
+INDEX = "image"
+
+
+@pytest.fixture
+def search():
+    return Search(index=INDEX).query("match", title="bird")
+
+
+@pytest.fixture
+def es(settings):
+    es = mock.MagicMock()
+    es.open_point_in_time.return_value = {"id": "pit-1"}
+    settings.ES = es
+    return es
+
+
+@pytest.fixture(autouse=True)
+def tally_results():
+    with mock.patch.object(search_controller, "tally_results") as tally_results:
+        yield tally_results
+
+
+@pytest.fixture
+def dead_ids():
+    # The IDs of the hits with dead links, removed by ``check_dead_links``
+    return set()
+
+
+@pytest.fixture
+def check_dead_links(dead_ids):
+    def remove_dead(query_hash, start, results):
+        results[:] = [hit for hit in results if int(hit.meta.id) not in dead_ids]
+
+    with mock.patch.object(
+        search_controller, "check_dead_links", side_effect=remove_dead
+    ) as check_dead_links:
+        yield check_dead_links
+
+
+def _es_response(ids, total=100):
+    return Response(
+        Search(),
+        {
+            "took": 1,
+            "pit_id": f"pit-{ids[-1] if ids else 'end'}",
+            "hits": {
+                "total": {"value": total, "relation": "eq"},
+                "hits": [
+                    {
+                        "_id": str(i),
+                        "_source": {"identifier": f"identifier-{i}"},
+                        "sort": [1.5, i],
+                    }
+                    for i in ids
+                ],
+            },
+        },
+    )
+
+
+@pytest.fixture
+def get_es_response():
+    with mock.patch.object(search_controller, "get_es_response") as get_es_response:
+        yield get_es_response
+
+
+def _execute(search, cursor, page_size=2, filter_dead=True):
+    return search_controller.execute_cursor_search(
+        search, cursor, page_size, filter_dead, INDEX, es_query="search_cursor"
+    )
+
+
+def _cursor(search, **kwargs):
+    return search_cursor.Cursor(
+        **{
+            "query_hash": get_query_hash(search),
+            "pit_id": "pit-1",
+            "search_after": [1.5, 1],
+            "offset": 2,
+            "page": 2,
+        }
+        | kwargs
+    )
+
+
+def test_first_page_opens_point_in_time(search, es, get_es_response, check_dead_links):
+    get_es_response.side_effect = [_es_response([0, 1, 2, 3])]
+
+    page_count, result_count, results, next_cursor = _execute(search, None)
+
+    es.open_point_in_time.assert_called_once_with(
+        index=INDEX, keep_alive=search_cursor.KEEP_ALIVE
+    )
+    body = get_es_response.call_args.args[0].to_dict()
+    assert get_es_response.call_args.args[0]._index is None
+    assert body["pit"] == {"id": "pit-1", "keep_alive": search_cursor.KEEP_ALIVE}
+    assert body["sort"] == ["_score", "_shard_doc"]
+    assert "search_after" not in body
+    # ``DEAD_LINK_RATIO`` doubles the number of hits fetched
+    assert body["size"] == 4
+
+    assert [hit.meta.id for hit in results] == ["0", "1"]
+    assert (page_count, result_count) == (50, 100)
+    # The page resumes after the last result, and the live results left out
+    # are fetched again
+    assert search_cursor.decode(next_cursor) == search_cursor.Cursor(
+        query_hash=get_query_hash(search),
+        pit_id="pit-3",
+        search_after=[1.5, 1],
+        offset=2,
+        page=2,
+    )
+
+
+def test_next_page_searches_after_cursor(search, es, get_es_response):
+    search = search.sort({"created_on": {"order": "desc"}})
+    get_es_response.side_effect = [_es_response([2, 3])]
+
+    _, _, results, next_cursor = _execute(search, _cursor(search), filter_dead=False)
+
+    es.open_point_in_time.assert_not_called()
+    body = get_es_response.call_args.args[0].to_dict()
+    assert body["pit"]["id"] == "pit-1"
+    assert body["sort"] == [{"created_on": {"order": "desc"}}, "_shard_doc"]
+    assert body["search_after"] == [1.5, 1]
+    assert body["size"] == 2
+
+    assert [hit.meta.id for hit in results] == ["2", "3"]
+    next_cursor = search_cursor.decode(next_cursor)
+    assert (next_cursor.search_after, next_cursor.offset, next_cursor.page) == (
+        [1.5, 3],
+        4,
+        3,
+    )
+
+
+def test_dead_links_are_backfilled(
+    search, es, get_es_response, check_dead_links, dead_ids
+):
+    dead_ids.update({2, 3, 4})
+    get_es_response.side_effect = [_es_response([2, 3, 4, 5]), _es_response([6, 7])]
+
+    _, _, results, next_cursor = _execute(search, _cursor(search))
+
+    assert [hit.meta.id for hit in results] == ["5", "6"]
+    # Dead links are checked at the position of the hits in the query
+    assert [call.args[1] for call in check_dead_links.call_args_list] == [2, 6]
+    # The second query only fetches enough hits for the missing result
+    second_body = get_es_response.call_args_list[1].args[0].to_dict()
+    assert second_body["search_after"] == [1.5, 5]
+    assert second_body["size"] == 2
+    next_cursor = search_cursor.decode(next_cursor)
+    assert (next_cursor.search_after, next_cursor.offset) == ([1.5, 6], 7)
+
+
+def test_dead_link_mask_sizes_queries(search, es, get_es_response, redis):
+    query_hash = get_query_hash(search)
+    redis.rpush(f"{query_hash}:dead_link_mask", *[1, 1, 1, 0, 1, 0, 0])
+    get_es_response.side_effect = [_es_response([2, 3, 4])]
+
+    with mock.patch.object(search_controller, "check_dead_links"):
+        _execute(search, _cursor(search))
+
+    # Hits 2 and 4 are enough to fill the page
+    assert get_es_response.call_args.args[0].to_dict()["size"] == 3
+
+
+def test_last_page_closes_point_in_time(search, es, get_es_response):
+    get_es_response.side_effect = [_es_response([2], total=3)]
+
+    page_count, result_count, results, next_cursor = _execute(
+        search, _cursor(search), filter_dead=False
+    )
+
+    assert [hit.meta.id for hit in results] == ["2"]
+    assert next_cursor is None
+    assert page_count == 2
+    es.close_point_in_time.assert_called_once_with(id="pit-2")
+
+
+def test_failed_first_page_closes_point_in_time(search, es, get_es_response):
+    get_es_response.side_effect = ValueError("Search failed")
+
+    with pytest.raises(ValueError):
+        _execute(search, None)
+
+    es.close_point_in_time.assert_called_once_with(id="pit-1")
+
+
+def test_failed_next_page_keeps_point_in_time(search, es, get_es_response):
+    get_es_response.side_effect = ValueError("Search failed")
+
+    with pytest.raises(ValueError):
+        _execute(search, _cursor(search))
+
+    # The client can retry the page with the same cursor
+    es.close_point_in_time.assert_not_called()
+
+
+def test_cursor_of_another_query_is_rejected(search, es, get_es_response):
+    cursor = _cursor(search.query("match", title="cat"))
+
+    with pytest.raises(search_cursor.InvalidCursor):
+        _execute(search, cursor)
+
+    get_es_response.assert_not_called()
+
+
+def test_expired_cursor_is_rejected(search, es, get_es_response):
+    get_es_response.side_effect = ValueError(
+        NotFoundError("search_context_missing_exception", mock.MagicMock(), {})
+    )
+
+    with pytest.raises(search_cursor.InvalidCursor, match="expired"):
+        _execute(search, _cursor(search))
@@ -0,0 +1,40 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+
+import pytest
+from elasticsearch import ConnectionError
+
+from api.controllers.elasticsearch.related import RelatedItem
+from api.utils import related_cache
+
+
+ITEM = RelatedItem(title="Bird", tags=["bird"], creator="Jane Doe")
+
+
+@pytest.fixture
+def refresh():
+    def refresh(media_type, index, identifier, item):
+        if identifier == "b":
+            raise ConnectionError("Connection timed out")
+        return []
+
+    with (
+        mock.patch.object(
+            related_cache, "pop_most_requested", return_value=["a", "b", "c"]
+        ),
+        mock.patch.object(related_cache, "get_cached_item", return_value=ITEM),
+        mock.patch.object(related_cache, "refresh", side_effect=refresh) as refresh,
+    ):
+        yield refresh
+
+
+def test_precomputerelated_skips_failed_items(refresh):
+    out = StringIO()
+    err = StringIO()
+    call_command("precomputerelated", media_types=["image"], stdout=out, stderr=err)
+
+    assert [call.args[2] for call in refresh.call_args_list] == ["a", "b", "c"]
+    assert "image b: ConnectionError" in err.getvalue()
+    assert "image: precomputed the related media of 2 items" in out.getvalue()
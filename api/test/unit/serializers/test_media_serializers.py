@@ -2,12 +2,18 @@ import random
 import uuid
 from unittest.mock import MagicMock, patch
 
+from rest_framework.exceptions import NotAuthenticated
+
 import pytest
 
 from api.constants import sensitivity
 from api.serializers.audio_serializers import AudioSearchRequestSerializer
 from api.serializers.image_serializers import ImageSearchRequestSerializer
-from api.serializers.media_serializers import MediaSearchRequestSerializer
+from api.serializers.media_serializers import (
+    MediaBulkRequestSerializer,
+    MediaSearchRequestSerializer,
+)
+from api.utils import search_cursor
 
 
 @pytest.fixture
@@ -49,6 +55,22 @@ def test_media_serializer_recovers_invalid_or_duplicate_source(
     )
 
 
+def test_media_serializer_sorts_sources(media_type_config, anon_request):
+    sources = {
+        "image": ("stocksnap,flickr", "flickr,stocksnap"),
+        "audio": ("jamendo,freesound", "freesound,jamendo"),
+    }
+    serializer_class = media_type_config.search_request_serializer(
+        context={"media_type": media_type_config.media_type, "request": anon_request},
+        data={"source": sources[media_type_config.media_type][0]},
+    )
+    assert serializer_class.is_valid()
+    assert (
+        serializer_class.validated_data["source"]
+        == sources[media_type_config.media_type][1]
+    )
+
+
 @pytest.mark.parametrize(
     "has_sensitive_text",
     (True, False),
@@ -240,3 +262,90 @@ def test_report_serializer_accepts_mature_reason(media_type_config):
     serializer.is_valid(raise_exception=True)
 
     assert serializer.validated_data["reason"] == "mature"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("authenticated", (True, False))
+def test_cursor_is_only_accepted_if_authenticated(
+    authenticated, anon_request, authed_request
+):
+    request = authed_request if authenticated else anon_request
+    serializer = ImageSearchRequestSerializer(
+        data={"cursor": search_cursor.START},
+        context={"request": request, "media_type": "image"},
+    )
+
+    if authenticated:
+        assert serializer.is_valid()
+        # The first page has no cursor to resume from
+        assert serializer.validated_data["cursor"] is None
+    else:
+        with pytest.raises(NotAuthenticated):
+            serializer.is_valid()
+
+
+@pytest.mark.django_db
+def test_cursor_is_decoded(authed_request):
+    cursor = search_cursor.Cursor(
+        query_hash="hash", pit_id="pit", search_after=[1.5, 3], offset=4, page=3
+    )
+    serializer = ImageSearchRequestSerializer(
+        data={"cursor": search_cursor.encode(cursor)},
+        context={"request": authed_request, "media_type": "image"},
+    )
+
+    assert serializer.is_valid()
+    assert serializer.validated_data["cursor"] == cursor
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param({"cursor": "not-a-cursor"}, id="forged_cursor"),
+        pytest.param({"cursor": search_cursor.START, "page": 2}, id="cursor_and_page"),
+    ),
+)
+def test_cursor_is_validated(data, authed_request):
+    serializer = ImageSearchRequestSerializer(
+        data=data,
+        context={"request": authed_request, "media_type": "image"},
+    )
+
+    assert not serializer.is_valid()
+
+
+def test_bulk_serializer_parses_ids(anon_request):
+    first, second = uuid.uuid4(), uuid.uuid4()
+    serializer = MediaBulkRequestSerializer(
+        data={"ids": f"{second}, {first},{str(second).upper()}"},
+        context={"request": anon_request},
+    )
+
+    assert serializer.is_valid()
+    # Duplicates are dropped, keeping the order of the request
+    assert serializer.validated_data["ids"] == [str(second), str(first)]
+
+
+@pytest.mark.parametrize("ids", ("", "not-a-uuid", f"{uuid.uuid4()},,"))
+def test_bulk_serializer_rejects_invalid_ids(ids, anon_request):
+    serializer = MediaBulkRequestSerializer(
+        data={"ids": ids}, context={"request": anon_request}
+    )
+
+    assert not serializer.is_valid()
+    assert "ids" in serializer.errors
+
+
+@pytest.mark.parametrize("count, is_valid", ((20, True), (21, False)))
+def test_bulk_serializer_limits_ids_like_page_size(count, is_valid, anon_request):
+    serializer = MediaBulkRequestSerializer(
+        data={"ids": ",".join(str(uuid.uuid4()) for _ in range(count))},
+        context={"request": anon_request},
+    )
+
+    if is_valid:
+        assert serializer.is_valid()
+    else:
+        with pytest.raises(NotAuthenticated):
+            serializer.is_valid()
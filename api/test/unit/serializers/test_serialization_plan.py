@@ -0,0 +1,83 @@
+import uuid
+from unittest.mock import MagicMock
+
+from rest_framework import serializers
+
+import pytest
+from elasticsearch_dsl.response import Hit
+
+from api.serializers import serialization_plan
+
+
+def _drf_representation(serializer, instance):
+    return serializers.Serializer.to_representation(serializer, instance)
+
+
+@pytest.fixture
+def serializer(media_type_config, anon_request):
+    return media_type_config.model_serializer(
+        context={"request": anon_request, "validated_data": {"peaks": True}}
+    )
+
+
+@pytest.fixture
+def plan(serializer):
+    return serialization_plan.compile_plan(serializer._readable_fields)
+
+
+def test_plan_matches_drf_for_models(media_type_config, serializer, plan):
+    # Without a primary key, the sensitivity is known without querying the database
+    media = media_type_config.model_factory.build(
+        id=None, creator=None, filesize=1234, meta_data={"description": "A description"}
+    )
+
+    # Compare the items to also compare the order of the fields
+    assert list(serialization_plan.serialize(plan, media).items()) == list(
+        _drf_representation(serializer, media).items()
+    )
+
+
+def test_plan_matches_drf_for_hits(media_type_config, serializer, plan):
+    hit = Hit(
+        {
+            "_source": {
+                "identifier": str(uuid.uuid4()),
+                "created_on": "2024-01-01T00:00:00+00:00",
+                "title": "A title",
+                "license": "BY",
+                "license_version": "4.0",
+                "provider": "flickr",
+                "url": "example.com/image.jpg",
+                "tags": [{"name": "cat", "accuracy": 0.9}],
+                "mature": False,
+            }
+        }
+    )
+    hit.sensitive = hit.mature
+
+    assert list(serialization_plan.serialize(plan, hit).items()) == list(
+        _drf_representation(serializer, hit).items()
+    )
+
+
+def test_plan_falls_back_for_missing_and_callable_attributes(serializer, plan):
+    instance = MagicMock(identifier=str(uuid.uuid4()), license="cc0", filesize="12")
+    del instance.license_url
+    instance.title = lambda: "A title"
+
+    representation = serialization_plan.serialize(plan, instance)
+
+    assert "license_url" not in representation
+    assert representation["title"] == "A title"
+    assert representation["filesize"] == 12
+
+
+def test_plan_matches_drf_for_mappings(serializer, plan):
+    # Tags are mappings, and lack the optional fields
+    tags_serializer = serializer.fields["tags"].child
+    tags_plan = serialization_plan.compile_plan(tags_serializer._readable_fields)
+    tag = {"name": "cat"}
+
+    assert serialization_plan.serialize(tags_plan, tag) == _drf_representation(
+        tags_serializer, tag
+    )
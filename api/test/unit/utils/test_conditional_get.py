@@ -0,0 +1,69 @@
+from unittest import mock
+
+from rest_framework.response import Response
+
+import pytest
+
+from api.utils import conditional_get
+
+
+ETAG = '"0123456789abcdef0123456789abcdef"'
+
+
+@pytest.fixture
+def request_(anon_request):
+    anon_request.accepted_renderer = mock.MagicMock(format="json")
+    return anon_request
+
+
+def test_get_etag_depends_on_state(request_):
+    etag = conditional_get.get_etag(request_, "identifier", {"a": 1, "b": 2})
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == conditional_get.get_etag(request_, "identifier", {"b": 2, "a": 1})
+    assert etag != conditional_get.get_etag(request_, "identifier", {"a": 1})
+
+
+def test_get_etag_depends_on_format_and_version(settings, request_):
+    etag = conditional_get.get_etag(request_, "identifier")
+
+    request_.accepted_renderer.format = "api"
+    assert etag != conditional_get.get_etag(request_, "identifier")
+
+    request_.accepted_renderer.format = "json"
+    settings.API_VERSION = "v2.0.0"
+    assert etag != conditional_get.get_etag(request_, "identifier")
+
+
+def test_add_headers(settings):
+    settings.CACHE_CONTROL_MAX_AGE = 60
+    settings.CACHE_CONTROL_S_MAXAGE = 600
+    response = Response({"results": []}, headers={"Vary": "Cookie"})
+
+    assert conditional_get.add_headers(response, ETAG) is response
+    assert response["ETag"] == ETAG
+    assert response["Cache-Control"] == "public, max-age=60, s-maxage=600"
+    assert response["Vary"] == "Cookie, Accept"
+
+
+@pytest.mark.parametrize(
+    "if_none_match, is_modified",
+    (
+        pytest.param(None, True, id="no_header"),
+        pytest.param('"other"', True, id="other_etag"),
+        pytest.param(ETAG, False, id="same_etag"),
+        pytest.param(f'"other", W/{ETAG}', False, id="weak_etag_in_list"),
+        pytest.param("*", False, id="any_etag"),
+    ),
+)
+def test_not_modified(request_factory, if_none_match, is_modified):
+    headers = {"HTTP_IF_NONE_MATCH": if_none_match} if if_none_match else {}
+    request = request_factory.get("/", **headers)
+
+    response = conditional_get.not_modified(request, ETAG)
+
+    if is_modified:
+        assert response is None
+    else:
+        assert response.status_code == 304
+        assert response["ETag"] == ETAG
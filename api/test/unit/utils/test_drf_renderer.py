@@ -1,9 +1,15 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
+from rest_framework.utils.serializer_helpers import ReturnDict
 from rest_framework.views import APIView
 
 import pytest
 
-from api.utils.drf_renderer import BrowsableAPIRendererWithoutForms
+from api.utils.drf_renderer import BrowsableAPIRendererWithoutForms, ORJSONRenderer
 
 
 @pytest.fixture
@@ -62,3 +68,49 @@ def test_without_forms_renderer_get_rendered_html_form_empty(method, api_request
     data = {}
 
     assert cls.get_rendered_html_form(data, view, method, api_request) == ""
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        pytest.param(
+            ReturnDict(
+                {
+                    "result_count": 2,
+                    "results": [
+                        {
+                            "id": uuid.UUID("8b3a1d2e-4f5a-4b6c-8d7e-9f0a1b2c3d4e"),
+                            "title": "Café \u2028 line \u2029 paragraph",
+                            "tags": [{"name": "cat", "accuracy": 0.95}],
+                            "mature": False,
+                            "creator": None,
+                        },
+                    ],
+                },
+                serializer=None,
+            ),
+            id="results",
+        ),
+        pytest.param(
+            {
+                1: datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+                "decimal": Decimal("1.50"),
+                "tuple": (1, 2),
+                "bytes": b"bytes",
+            },
+            id="non_json_types",
+        ),
+        pytest.param(2**70, id="big_int"),
+    ),
+)
+def test_orjson_renderer_matches_json_renderer(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_indents_like_json_renderer():
+    data = {"results": [{"title": "Café"}]}
+    media_type = "application/json; indent=4"
+
+    assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(
+        data, media_type
+    )
@@ -21,6 +21,7 @@ from api.utils.image_proxy import (
     MediaInfo,
     RequestConfig,
     UpstreamThumbnailException,
+    _record_outcome,
     extension,
 )
 from api.utils.image_proxy import get as _photon_get
@@ -309,7 +310,7 @@ def test_get_successful_records_response_code(
             assert cache.get(key) == b"1"
     else:
         messages = [record["event"] for record in cap_logs]
-        assert "Redis connect failed, thumbnail response codes not tallied." in messages
+        assert "Redis connect failed, cannot flush tallies." in messages
 
 
 alert_count_params = pytest.mark.parametrize(
@@ -379,7 +380,7 @@ def test_get_exception_handles_error(
         assert cache.get(key) == str(count_start + 1).encode()
     else:
         messages = [record["event"] for record in cap_logs]
-        assert "Redis connect failed, thumbnail errors not tallied." in messages
+        assert "Redis connect failed, cannot flush tallies." in messages
 
 
 @cache_availability_params
@@ -424,13 +425,8 @@ def test_get_http_exception_handles_error(
         )
     else:
         messages = [record["event"] for record in cap_logs]
-        assert all(
-            message in messages
-            for message in [
-                "Redis connect failed, thumbnail HTTP errors not tallied.",
-                "Redis connect failed, thumbnail errors not tallied.",
-            ]
-        )
+        # The response code and the error are both tallied
+        assert messages.count("Redis connect failed, cannot flush tallies.") >= 2
 
 
 @pytest.mark.pook
@@ -516,6 +512,28 @@ def test_caches_failures_with_successes_extending_tolerance(
         photon_get(TEST_MEDIA_INFO)
 
 
+def test_record_outcome_does_not_decrement_below_zero(settings, redis):
+    key = FAILURE_CACHE_KEY_TEMPLATE.format(ident="abc")
+
+    async_to_sync(_record_outcome)(key, is_failure=True)
+    assert redis.get(key) == b"1"
+    assert 0 < redis.ttl(key) <= settings.THUMBNAIL_FAILURE_CACHE_WINDOW_SECONDS
+
+    async_to_sync(_record_outcome)(key, is_failure=False)
+    async_to_sync(_record_outcome)(key, is_failure=False)
+    assert redis.get(key) == b"0"
+
+
+def test_record_outcome_with_unreachable_redis(unreachable_redis):
+    key = FAILURE_CACHE_KEY_TEMPLATE.format(ident="abc")
+
+    with capture_logs() as cap_logs:
+        async_to_sync(_record_outcome)(key, is_failure=True)
+
+    messages = [record["event"] for record in cap_logs]
+    assert "Redis connect failed, thumbnail failure not incremented." in messages
+
+
 @pytest.mark.pook
 def test_get_successful_https_image_url_sends_ssl_parameter(mock_image_data):
     https_url = TEST_IMAGE_URL.replace("http://", "https://")
@@ -552,6 +570,17 @@ def test_get_unsuccessful_request_raises_custom_exception():
         photon_get(TEST_MEDIA_INFO)
 
 
+def test_get_cached_image_extension(redis):
+    media_info = replace(TEST_MEDIA_INFO, image_url=TEST_IMAGE_URL.replace(".jpg", ""))
+    get_cached_image_extension = async_to_sync(extension.get_cached_image_extension)
+
+    assert get_cached_image_extension(TEST_MEDIA_INFO) == "jpg"
+    assert get_cached_image_extension(media_info) is None
+
+    redis.set(f"media:{media_info.media_identifier}:thumb_type", "tiff")
+    assert get_cached_image_extension(media_info) == "tiff"
+
+
 @pytest.mark.parametrize(
     "image_url, expected_ext",
     [
@@ -0,0 +1,155 @@
+from unittest import mock
+
+from django.conf import settings
+
+import pytest
+from freezegun import freeze_time
+
+from api.controllers.elasticsearch.related import RelatedItem
+from api.utils import related_cache, search_cache
+
+
+MEDIA_TYPE = "image"
+INDEX = "image"
+IDENTIFIER = "4bc43a04-ef46-4544-a0c1-63c63f56e276"
+ITEM = RelatedItem(title="Bird", tags=["bird", "nature"], creator="Jane Doe")
+
+
+@pytest.fixture(autouse=True)
+def related_media():
+    with mock.patch.object(related_cache, "related_media") as related_media:
+        related_media.return_value = [
+            mock.MagicMock(identifier="first"),
+            mock.MagicMock(identifier="second"),
+        ]
+        yield related_media
+
+
+@pytest.fixture
+def get_item():
+    return mock.MagicMock(return_value=ITEM)
+
+
+@pytest.fixture
+def refresh_in_background():
+    with mock.patch.object(
+        related_cache, "_refresh_in_background"
+    ) as refresh_in_background:
+        yield refresh_in_background
+
+
+def _get_related(get_item):
+    return related_cache.get_related(MEDIA_TYPE, INDEX, IDENTIFIER, get_item)
+
+
+def test_miss_finds_and_caches_related_media(redis, get_item, related_media):
+    assert _get_related(get_item) == ["first", "second"]
+    related_media.assert_called_once_with(
+        uuid=IDENTIFIER, index=INDEX, filter_dead=True, item=ITEM
+    )
+
+    related_media.reset_mock()
+    get_item.reset_mock()
+    assert _get_related(get_item) == ["first", "second"]
+    # The item is only looked up on a miss
+    get_item.assert_not_called()
+    related_media.assert_not_called()
+    assert redis.ttl(f"related:{MEDIA_TYPE}:{IDENTIFIER}") > 0
+
+
+def test_stale_entry_is_served_and_refreshed(
+    settings, redis, get_item, related_media, refresh_in_background
+):
+    with freeze_time("2024-01-01 00:00:00"):
+        _get_related(get_item)
+    related_media.return_value = []
+
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        frozen.tick(settings.RELATED_CACHE_TTL - 1)
+        assert _get_related(get_item) == ["first", "second"]
+        refresh_in_background.assert_not_called()
+
+        frozen.tick(2)
+        assert _get_related(get_item) == ["first", "second"]
+        # The refresh uses the cached fields of the item
+        refresh_in_background.assert_called_once_with(
+            redis, MEDIA_TYPE, INDEX, IDENTIFIER, ITEM
+        )
+    get_item.assert_called_once()
+
+
+def test_refresh_in_background_only_once_at_a_time(redis):
+    with (
+        mock.patch.object(related_cache, "_get_refresh_loop"),
+        mock.patch.object(related_cache.asyncio, "run_coroutine_threadsafe") as run,
+    ):
+        for _ in range(2):
+            related_cache._refresh_in_background(
+                redis, MEDIA_TYPE, INDEX, IDENTIFIER, ITEM
+            )
+
+    run.assert_called_once()
+    run.call_args.args[0].close()
+
+
+def test_refresh_in_thread_logs_errors(related_media, redis):
+    related_media.side_effect = ValueError("Elasticsearch is down")
+
+    with mock.patch.object(related_cache.logger, "error") as error:
+        related_cache._refresh_in_thread(MEDIA_TYPE, INDEX, IDENTIFIER, ITEM)
+
+    error.assert_called_once()
+
+
+def test_invalidation_makes_entry_miss(redis, get_item, related_media):
+    _get_related(get_item)
+    search_cache.invalidate()
+    related_media.return_value = []
+
+    assert _get_related(get_item) == []
+    assert get_item.call_count == 2
+
+
+def test_disabled_cache_always_finds_related_media(settings, redis, get_item):
+    settings.RELATED_CACHE_TTL = 0
+
+    _get_related(get_item)
+    _get_related(get_item)
+
+    assert get_item.call_count == 2
+    assert not redis.exists(f"related:{MEDIA_TYPE}:{IDENTIFIER}")
+
+
+def test_unreachable_redis_finds_related_media(unreachable_redis, get_item):
+    assert _get_related(get_item) == ["first", "second"]
+
+
+def test_pop_most_requested(redis, get_item):
+    for identifier, count in (("a", 1), ("b", 3), ("c", 2)):
+        for _ in range(count):
+            related_cache.get_related(MEDIA_TYPE, INDEX, identifier, get_item)
+
+    assert related_cache.pop_most_requested(MEDIA_TYPE, 2) == ["b", "c"]
+    # The counts start over
+    assert related_cache.pop_most_requested(MEDIA_TYPE, 2) == []
+
+
+def test_requests_are_counted_for_the_most_requested_items(
+    redis, get_item, monkeypatch
+):
+    monkeypatch.setattr(related_cache, "REQUESTS_MAX_ITEMS", 2)
+    for identifier, count in (("a", 2), ("b", 3), ("c", 1)):
+        for _ in range(count):
+            related_cache.get_related(MEDIA_TYPE, INDEX, identifier, get_item)
+
+    key = related_cache._requests_key(MEDIA_TYPE)
+    assert redis.zrevrange(key, 0, -1, withscores=True) == [(b"b", 3.0), (b"a", 2.0)]
+    assert 0 < redis.ttl(key) <= settings.RELATED_CACHE_MAX_AGE
+
+
+def test_get_cached_item(redis, get_item):
+    assert related_cache.get_cached_item(MEDIA_TYPE, IDENTIFIER) is None
+
+    _get_related(get_item)
+
+    assert related_cache.get_cached_item(MEDIA_TYPE, IDENTIFIER) == ITEM
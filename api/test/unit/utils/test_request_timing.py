@@ -0,0 +1,159 @@
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+import pytest
+from asgiref.sync import async_to_sync
+from structlog.testing import capture_logs
+
+from api.middleware.request_timing_middleware import request_timing_middleware
+from api.utils import request_timing
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = mock.MagicMock(return_value=0.0)
+    monkeypatch.setattr(request_timing.time, "perf_counter", clock)
+    return clock
+
+
+@pytest.fixture
+def histograms(monkeypatch):
+    histograms = request_timing._Histograms()
+    monkeypatch.setattr(request_timing, "histograms", histograms)
+    return histograms
+
+
+@pytest.fixture
+def timed_request():
+    request = RequestFactory().get("/v1/images/")
+    request.resolver_match = mock.MagicMock(view_name="image-list")
+    return request
+
+
+def test_timed_outside_request_does_nothing(clock):
+    with request_timing.timed("es"):
+        pass
+
+    clock.assert_not_called()
+
+
+def test_timed_records_exclusive_durations(clock):
+    timing, token = request_timing.start()
+    try:
+        clock.return_value = 1.0
+        with request_timing.timed("search_context"):
+            clock.return_value = 1.5
+            with request_timing.timed("es"):
+                clock.return_value = 3.5
+            clock.return_value = 4.0
+        with request_timing.timed("es"):
+            clock.return_value = 5.0
+    finally:
+        request_timing.stop(token)
+
+    assert timing.stages == {"search_context": 1.0, "es": 3.0}
+
+
+def test_timed_records_failed_stages(clock):
+    timing, token = request_timing.start()
+    try:
+        with pytest.raises(ValueError), request_timing.timed("db"):
+            clock.return_value = 0.25
+            raise ValueError
+    finally:
+        request_timing.stop(token)
+
+    assert timing.stages == {"db": 0.25}
+
+
+@pytest.mark.parametrize("metrics_enabled", (True, False))
+def test_report(settings, clock, histograms, timed_request, metrics_enabled):
+    settings.REQUEST_TIMING_METRICS = metrics_enabled
+    timing = request_timing.RequestTiming(
+        start=0.0, stages={"serialize": 0.02, "es": 0.0123}
+    )
+    response = HttpResponse()
+    clock.return_value = 0.1
+
+    with capture_logs() as cap_logs:
+        request_timing.report(timed_request, response, timing)
+
+    # Stages are always in the same order, followed by the total
+    assert response["Server-Timing"] == (
+        "es;dur=12.3, serialize;dur=20.0, total;dur=100.0"
+    )
+    assert cap_logs == [
+        {
+            "event": "Timed request",
+            "log_level": "info",
+            "view": "image-list",
+            "status_code": 200,
+            "es_ms": 12.3,
+            "serialize_ms": 20.0,
+            "total_ms": 100.0,
+        }
+    ]
+    metrics = histograms.render()
+    assert (
+        'openverse_api_request_stage_duration_seconds_bucket{view="image-list",'
+        'stage="es",le="0.025"} 1' in metrics
+    ) is metrics_enabled
+
+
+def test_report_skips_requests_without_stages(histograms, timed_request):
+    response = HttpResponse()
+
+    with capture_logs() as cap_logs:
+        request_timing.report(timed_request, response, request_timing.RequestTiming())
+
+    assert "Server-Timing" not in response
+    assert cap_logs == []
+
+
+def test_histograms_render():
+    histograms = request_timing._Histograms()
+    histograms.observe("image-list", {"es": 0.003, "total": 0.2})
+    histograms.observe("image-list", {"es": 0.02, "total": 20})
+
+    lines = histograms.render().splitlines()
+
+    assert lines[:2] == [
+        "# HELP openverse_api_request_stage_duration_seconds Duration of each stage"
+        " of API requests.",
+        "# TYPE openverse_api_request_stage_duration_seconds histogram",
+    ]
+    es = [line for line in lines if 'stage="es"' in line]
+    assert es[0].endswith('le="0.005"} 1')
+    assert es[2].endswith('le="0.025"} 2')
+    assert es[-3].endswith('le="+Inf"} 2')
+    assert es[-2].endswith('_sum{view="image-list",stage="es"} 0.023')
+    assert es[-1].endswith('_count{view="image-list",stage="es"} 2')
+    total = [line for line in lines if 'stage="total"' in line]
+    assert total[-3].endswith('le="+Inf"} 2')
+    assert total[-4].endswith('le="10"} 1')
+
+
+def _view(request):
+    with request_timing.timed("db"):
+        pass
+    return HttpResponse()
+
+
+async def _async_view(request):
+    return _view(request)
+
+
+def test_middleware(timed_request):
+    response = request_timing_middleware(_view)(timed_request)
+
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert request_timing._current.get() is None
+
+
+def test_async_middleware(timed_request):
+    response = async_to_sync(request_timing_middleware(_async_view))(timed_request)
+
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert request_timing._current.get() is None
@@ -0,0 +1,165 @@
+from unittest import mock
+
+import pytest
+from freezegun import freeze_time
+
+from api.utils import search_cache
+
+
+MEDIA_TYPE = "image"
+WEEK = "2024-01-01"
+
+
+def get_entry(body=b'{"results": []}'):
+    return search_cache.CachedSearch(body=body, providers=["flickr", "stocksnap"])
+
+
+@pytest.fixture
+def request_(anon_request):
+    anon_request.version = "v1"
+    return anon_request
+
+
+@pytest.fixture
+def key(request_):
+    return search_cache.get_cache_key(MEDIA_TYPE, request_, {"q": "cat"}, [])
+
+
+@pytest.fixture
+def compute():
+    return mock.MagicMock(return_value=get_entry())
+
+
+def _outcome_count(redis, outcome):
+    return redis.get(f"search_response_cache:{MEDIA_TYPE}:{WEEK}:{outcome}")
+
+
+def test_get_cache_key_is_canonical(request_):
+    first = search_cache.get_cache_key(
+        MEDIA_TYPE, request_, {"q": "cat", "license": {"by", "cc0"}, "page": 1}, []
+    )
+    second = search_cache.get_cache_key(
+        MEDIA_TYPE, request_, {"page": 1, "license": {"cc0", "by"}, "q": "cat"}, []
+    )
+
+    assert first == second
+    assert first != search_cache.get_cache_key(
+        MEDIA_TYPE, request_, {"q": "cat", "license": {"by"}, "page": 1}, []
+    )
+    assert first != search_cache.get_cache_key(
+        "audio", request_, {"q": "cat", "license": {"by", "cc0"}, "page": 1}, []
+    )
+
+
+def test_get_cache_key_depends_on_access_level(request_):
+    authed_request = mock.MagicMock(
+        auth=mock.MagicMock(application=mock.MagicMock(privileges=[])),
+        version=request_.version,
+        build_absolute_uri=request_.build_absolute_uri,
+    )
+
+    assert search_cache.get_cache_key(
+        MEDIA_TYPE, request_, {"q": "cat"}, []
+    ) != search_cache.get_cache_key(MEDIA_TYPE, authed_request, {"q": "cat"}, [])
+
+
+def test_get_cache_key_depends_on_warnings(request_):
+    warning = {
+        "code": "partially invalid source parameter",
+        "invalid_sources": {"bogus", "other"},
+        "valid_sources": {"flickr"},
+    }
+    first = search_cache.get_cache_key(
+        MEDIA_TYPE, request_, {"source": "flickr"}, [warning]
+    )
+
+    assert first != search_cache.get_cache_key(
+        MEDIA_TYPE, request_, {"source": "flickr"}, []
+    )
+    assert first == search_cache.get_cache_key(
+        MEDIA_TYPE,
+        request_,
+        {"source": "flickr"},
+        [warning | {"invalid_sources": {"other", "bogus"}}],
+    )
+
+
+@freeze_time(WEEK)
+def test_get_or_compute_caches_response(redis, key, compute):
+    assert search_cache.get_or_compute(MEDIA_TYPE, key, compute) == (
+        get_entry(),
+        search_cache.MISS,
+    )
+    assert search_cache.get_or_compute(MEDIA_TYPE, key, compute) == (
+        get_entry(),
+        search_cache.HIT,
+    )
+
+    compute.assert_called_once()
+    assert 0 < redis.ttl(key) <= 60
+    assert not redis.exists(f"{key}:lock")
+    assert _outcome_count(redis, "miss") == b"1"
+    assert _outcome_count(redis, "hit") == b"1"
+
+
+def test_invalidate(redis, key, compute):
+    search_cache.get_or_compute(MEDIA_TYPE, key, compute)
+    search_cache.invalidate()
+
+    _, outcome = search_cache.get_or_compute(MEDIA_TYPE, key, compute)
+
+    assert outcome == search_cache.MISS
+    assert compute.call_count == 2
+
+
+@freeze_time(WEEK)
+def test_get_or_compute_coalesces_misses(redis, key, compute, monkeypatch):
+    redis.set(f"{key}:lock", "another request")
+
+    def sleep(_):
+        # The other request caches the response while this one waits
+        search_cache._set(redis, key, get_entry(b"cached"), b"0")
+
+    monkeypatch.setattr(search_cache.time, "sleep", sleep)
+
+    entry, outcome = search_cache.get_or_compute(MEDIA_TYPE, key, compute)
+
+    assert (entry.body, outcome) == (b"cached", search_cache.COALESCED)
+    compute.assert_not_called()
+    assert _outcome_count(redis, "coalesced") == b"1"
+
+
+@pytest.mark.parametrize("lock_released", (True, False))
+def test_get_or_compute_stops_waiting(redis, key, compute, monkeypatch, lock_released):
+    lock_key = f"{key}:lock"
+    redis.set(lock_key, "another request")
+    monkeypatch.setattr(search_cache, "COALESCE_TIMEOUT", 0.01 if lock_released else 0)
+
+    def sleep(_):
+        # The other request fails without caching the response
+        redis.delete(lock_key)
+
+    monkeypatch.setattr(search_cache.time, "sleep", sleep)
+
+    _, outcome = search_cache.get_or_compute(MEDIA_TYPE, key, compute)
+
+    assert outcome == search_cache.MISS
+    compute.assert_called_once()
+
+
+def test_get_or_compute_releases_lock_on_error(redis, key):
+    compute = mock.MagicMock(side_effect=ValueError)
+
+    with pytest.raises(ValueError):
+        search_cache.get_or_compute(MEDIA_TYPE, key, compute)
+
+    assert not redis.exists(f"{key}:lock")
+    assert not redis.exists(key)
+
+
+def test_get_or_compute_without_redis(unreachable_redis, key, compute):
+    assert search_cache.get_or_compute(MEDIA_TYPE, key, compute) == (
+        get_entry(),
+        search_cache.MISS,
+    )
+    search_cache.invalidate()
@@ -0,0 +1,33 @@
+import pytest
+
+from api.utils import search_cursor
+
+
+@pytest.fixture
+def cursor():
+    return search_cursor.Cursor(
+        query_hash="hash", pit_id="pit", search_after=[1.5, 3], offset=4, page=3
+    )
+
+
+def test_cursor_round_trip(cursor):
+    assert search_cursor.decode(search_cursor.encode(cursor)) == cursor
+
+
+def test_cursor_is_url_safe(cursor):
+    encoded = search_cursor.encode(cursor)
+
+    assert encoded.replace(":", "").replace("-", "").replace("_", "").isalnum()
+
+
+@pytest.mark.parametrize(
+    "tamper",
+    (
+        pytest.param(lambda encoded: "x" + encoded, id="modified"),
+        pytest.param(lambda encoded: encoded.rsplit(":", 1)[0], id="unsigned"),
+        pytest.param(lambda encoded: "", id="empty"),
+    ),
+)
+def test_tampered_cursor_is_rejected(cursor, tamper):
+    with pytest.raises(search_cursor.InvalidCursor):
+        search_cursor.decode(tamper(search_cursor.encode(cursor)))
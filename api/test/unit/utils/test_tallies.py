@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import pytest
+from asgiref.sync import async_to_sync
 from freezegun import freeze_time
 from structlog.testing import capture_logs
 
@@ -127,4 +128,81 @@ def test_writes_error_logs_for_redis_connection_errors(unreachable_redis):
         tallies.count_provider_occurrences(results, FAKE_MEDIA_TYPE)
 
     messages = [record["event"] for record in cap_logs]
-    assert "Redis connect failed, cannot increment provider tallies." in messages
+    assert "Redis connect failed, cannot flush tallies." in messages
+
+
+@pytest.fixture
+def tally_buffer(settings):
+    settings.TALLY_FLUSH_INTERVAL = 10
+    settings.TALLY_FLUSH_INCREMENTS = 5
+    return tallies.TallyBuffer()
+
+
+def test_tally_buffer_flushes_after_increments(tally_buffer, redis):
+    for _ in range(4):
+        tally_buffer.incr("a")
+    assert redis.get("a") is None
+
+    tally_buffer.incr("b", 3)
+    assert redis.get("a") == b"4"
+    assert redis.get("b") == b"3"
+
+
+def test_tally_buffer_flushes_after_interval(tally_buffer, redis):
+    with freeze_time() as frozen:
+        # Start the interval at the frozen time
+        tally_buffer.flush()
+        tally_buffer.incr("a")
+        assert redis.get("a") is None
+
+        frozen.tick(10)
+        tally_buffer.incr("a")
+        assert redis.get("a") == b"2"
+
+
+def test_tally_buffer_flushes_on_shutdown(monkeypatch, tally_buffer, redis):
+    monkeypatch.setattr(tallies, "tally_buffer", tally_buffer)
+    tally_buffer.incr("a")
+
+    async_to_sync(tallies._flush_on_shutdown)(sender=None)
+
+    assert redis.get("a") == b"1"
+
+
+def test_tally_buffer_drops_tallies_if_redis_is_unreachable(
+    tally_buffer, unreachable_redis
+):
+    tally_buffer.incr("a")
+
+    with capture_logs() as cap_logs:
+        tally_buffer.flush()
+
+    assert cap_logs[0]["event"] == "Redis connect failed, cannot flush tallies."
+    # Retrying would grow the buffer for as long as Redis is unreachable
+    assert tally_buffer._counts == {}
+
+
+def test_tally_buffer_flushes_with_async_client(tally_buffer, redis):
+    async def incr():
+        for _ in range(5):
+            await tally_buffer.aincr("a")
+
+    async_to_sync(incr)()
+
+    assert redis.get("a") == b"5"
+
+
+def test_tally_buffer_keeps_highest_scores_of_sorted_sets(tally_buffer, redis):
+    for member, count in (("a", 1), ("b", 2), ("c", 1)):
+        for _ in range(count):
+            tally_buffer.zincr("set", member, max_members=2, ttl=60)
+    assert redis.exists("set") == 0
+
+    tally_buffer.flush()
+
+    assert redis.zrevrange("set", 0, -1, withscores=True) == [
+        (b"b", 2.0),
+        (b"c", 1.0),
+    ]
+    assert 0 < redis.ttl("set") <= 60
+    assert tally_buffer._scores == {}
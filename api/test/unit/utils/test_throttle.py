@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.http import HttpResponse
 from rest_framework.settings import api_settings
 from rest_framework.views import APIView
@@ -294,3 +296,28 @@ def test_rate_limit_headers_when_no_scope(
             assert response.status_code == 200
             # Headers are not set if Redis cannot cache request history.
             assert not headers
+
+
+@pytest.mark.parametrize(
+    "cursor, rate_limit_model, is_throttled",
+    (
+        pytest.param("*", "standard", True, id="start_standard"),
+        pytest.param("*", "enhanced", True, id="start_enhanced"),
+        pytest.param("*", "exempt", False, id="start_exempt"),
+        pytest.param("abc", "standard", False, id="next_page"),
+        pytest.param(None, "standard", False, id="no_cursor"),
+    ),
+)
+def test_cursor_throttle_applies_to_new_cursors(cursor, rate_limit_model, is_throttled):
+    request = mock.MagicMock(
+        auth=mock.MagicMock(
+            application=mock.MagicMock(
+                client_id="client", verified=True, rate_limit_model=rate_limit_model
+            )
+        ),
+        query_params={"cursor": cursor} if cursor else {},
+    )
+
+    key = throttle.OAuth2IdCursorRateThrottle().get_cache_key(request, None)
+
+    assert (key is not None) == is_throttled
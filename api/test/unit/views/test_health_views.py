@@ -4,6 +4,7 @@ from django.db.utils import OperationalError
 
 import pook
 import pytest
+from elasticsearch import ConnectionError
 
 
 def mock_health_response(status="green", timed_out=False):
@@ -11,6 +12,7 @@ def mock_health_response(status="green", timed_out=False):
         pook.get(pook.regex(r"_cluster\/health"))
         .times(1)
         .reply(200)
+        .header("x-elastic-product", "Elasticsearch")
         .json(
             {
                 "status": status if not timed_out else None,
@@ -63,6 +65,15 @@ def test_health_check_es_status_bad(status, api_client):
     assert res.json() == {"detail": f"elasticsearch: es_status_{status}"}
 
 
+def test_health_check_es_unreachable(api_client, settings):
+    settings.ES = mock.MagicMock()
+    settings.ES.cluster.health.side_effect = ConnectionError("Connection refused")
+    res = api_client.get("/healthcheck/", data={"check_es": True})
+
+    assert res.status_code == 503
+    assert res.json() == {"detail": "elasticsearch: Connection error"}
+
+
 @pytest.mark.django_db
 def test_health_check_es_all_good(api_client):
     with pook.use():
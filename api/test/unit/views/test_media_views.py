@@ -51,6 +51,98 @@ def test_retrieve_query_count(api_client, media_type_config):
     assert res.status_code == 200
 
 
+@pytest.mark.django_db
+def test_retrieve_conditional_get(api_client, media_type_config):
+    media = media_type_config.model_factory.create()
+    url = f"/v1/{media_type_config.url_prefix}/{media.identifier}/"
+
+    res = api_client.get(url)
+    assert res.status_code == 200
+    assert "max-age" in res["Cache-Control"]
+    etag = res["ETag"]
+
+    # Only the item is loaded before the response is known not to have changed
+    with pytest_django.asserts.assertNumQueries(1):
+        res = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 304
+    assert res["ETag"] == etag
+
+    media.title = "A new title"
+    media.save()
+    res = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 200
+    assert res["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_bulk(api_client, media_type_config):
+    first, second = media_type_config.model_factory.create_batch(size=2)
+    missing = uuid4()
+
+    # A single query resolves all the identifiers
+    with pytest_django.asserts.assertNumQueries(1):
+        res = api_client.get(
+            f"/v1/{media_type_config.url_prefix}/bulk/",
+            {"ids": f"{second.identifier},{missing},{first.identifier}"},
+        )
+
+    assert res.status_code == 200
+    data = res.json()
+    assert [result and result["id"] for result in data["results"]] == [
+        str(second.identifier),
+        None,
+        str(first.identifier),
+    ]
+    assert data["not_found"] == [str(missing)]
+
+
+@pytest.mark.django_db
+def test_related_hydrates_related_identifiers(api_client, media_type_config):
+    media, first, second = media_type_config.model_factory.create_batch(size=3)
+
+    with patch(
+        "api.views.media_views.related_cache.get_related",
+        return_value=[str(second.identifier), str(first.identifier)],
+    ) as get_related:
+        res = api_client.get(
+            f"/v1/{media_type_config.url_prefix}/{media.identifier}/related/"
+        )
+
+    assert res.status_code == 200
+    assert [result["id"] for result in res.json()["results"]] == [
+        str(second.identifier),
+        str(first.identifier),
+    ]
+    # The item is only looked up when its related media are not cached
+    get_item = get_related.call_args.args[3]
+    assert get_item().title == media.title
+
+
+@pytest.mark.django_db
+def test_related_conditional_get(api_client, media_type_config):
+    media, first, second = media_type_config.model_factory.create_batch(size=3)
+    url = f"/v1/{media_type_config.url_prefix}/{media.identifier}/related/"
+
+    with patch(
+        "api.views.media_views.related_cache.get_related",
+        return_value=[str(second.identifier), str(first.identifier)],
+    ):
+        res = api_client.get(url)
+        assert res.status_code == 200
+        etag = res["ETag"]
+
+        res = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert res.status_code == 304
+        assert res["ETag"] == etag
+
+        # The related media are the same, but one of them has changed
+        first.title = "A new title"
+        first.save()
+        res = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert res.status_code == 200
+        assert res["ETag"] != etag
+
+
 @pytest.mark.parametrize(
     "filter_content", (True, False), ids=lambda x: "filtered" if x else "not_filtered"
 )
@@ -91,3 +183,69 @@ def test_get_queryset_does_not_exclude_works_without_contentsource_entry(
     res = api_client.get(f"/v1/{media_type_config.url_prefix}/{media.identifier}/")
 
     assert res.status_code == 200
+
+
+@pytest.mark.django_db
+def test_list_caches_response(api_client, media_type_config):
+    results = media_type_config.model_factory.create_batch(size=2)
+    for result in results:
+        result.meta = None
+
+    query_media = MagicMock(return_value=(results, 1, 2, {}))
+    with (
+        patch(
+            "api.views.media_views.search_controller",
+            query_media=query_media,
+        ),
+        patch(
+            "api.serializers.media_serializers.search_controller",
+            get_sources=MagicMock(return_value={}),
+        ),
+    ):
+        first = api_client.get(f"/v1/{media_type_config.url_prefix}/?q=cat")
+        second = api_client.get(f"/v1/{media_type_config.url_prefix}/?q=cat")
+        ContentSource.objects.create(
+            created_on=datetime.now(tz=timezone.utc),
+            source_identifier="example",
+            source_name="Example",
+            domain_name="https://example.com",
+            media_type=media_type_config.media_type,
+        )
+        third = api_client.get(f"/v1/{media_type_config.url_prefix}/?q=cat")
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content == third.content
+    assert first["Content-Type"] == "application/json"
+    # The second request is served from the cache, which the new source invalidates
+    assert query_media.call_count == 2
+
+
+@pytest.mark.django_db
+def test_list_paginates_with_cursor(api_client, media_type_config, access_token):
+    results = media_type_config.model_factory.create_batch(size=2)
+    for result in results:
+        result.meta = None
+
+    query_media_by_cursor = MagicMock(return_value=(results, 500, 1000, {}, "next"))
+    with (
+        patch(
+            "api.views.media_views.search_controller",
+            query_media_by_cursor=query_media_by_cursor,
+        ),
+        patch(
+            "api.serializers.media_serializers.search_controller",
+            get_sources=MagicMock(return_value={}),
+        ),
+    ):
+        res = api_client.get(
+            f"/v1/{media_type_config.url_prefix}/?q=cat&cursor=*",
+            HTTP_AUTHORIZATION=f"Bearer {access_token.token}",
+        )
+
+    assert res.status_code == 200
+    # The counts are not clamped to the pagination depth of page numbers
+    assert (res.data["result_count"], res.data["page_count"]) == (1000, 500)
+    assert res.data["page"] == 1
+    assert res.data["next_cursor"] == "next"
+    # The first page opens a new cursor
+    assert query_media_by_cursor.call_args.args[-1] is None
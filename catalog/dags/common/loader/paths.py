@@ -1,9 +1,12 @@
+import gzip
 import re
+from typing import IO
 
 from common.constants import MEDIA_TYPES
 
 
 LEGACY_TSV_VERSION = "000"
+GZIP_EXTENSION = ".gz"
 
 
 def _extract_media_type(tsv_file_name: str | None) -> str:
@@ -46,3 +49,15 @@ def get_tsv_version(tsv_file_name: str) -> str:
     if match := re.search(version_pattern, tsv_file_name):
         return match.group(1)
     return LEGACY_TSV_VERSION
+
+
+def open_tsv(tsv_file_name: str, mode: str = "r") -> IO[str]:
+    """
+    Open a local TSV file in text mode, decompressing it if it is gzipped.
+
+    Whether the file is compressed is determined by its `.gz` extension, which is
+    added by the media stores when compression is enabled.
+    """
+    if tsv_file_name.endswith(GZIP_EXTENSION):
+        return gzip.open(tsv_file_name, f"{mode}t", encoding="utf-8")
+    return open(tsv_file_name, mode, encoding="utf-8")
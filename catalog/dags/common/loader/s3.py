@@ -12,6 +12,21 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_MEDIA_PREFIX = "image"
 STAGING_PREFIX = "db_loader_staging"
+S3_URI_SCHEME = "s3://"
+
+
+def get_s3_client(aws_conn_id):
+    """
+    Get an S3 client for the given connection.
+
+    If an endpoint is defined for the hook, use the `get_client_type` method to
+    retrieve the S3 client. Otherwise, create the client from the session so that
+    Airflow doesn't override the endpoint default we want on the S3 client.
+    """
+    hook = S3Hook(aws_conn_id=aws_conn_id)
+    if hook.conn_config.endpoint_url:
+        return hook.get_client_type("s3")
+    return hook.get_session().client("s3")
 
 
 def copy_file_to_s3_staging(
@@ -50,20 +65,34 @@ def copy_file_to_s3(
     S3 key is pushed to the `s3_key` XCom.
     The TSV is removed after the upload is complete.
 
+    If the TSV was already streamed to S3 during ingestion, `tsv_file_path` is its
+    `s3://` URI, and only the XComs are pushed.
+
     ``extra_args`` refers to the S3Hook argument.
     """
     if tsv_file_path is None:
         raise FileNotFoundError("No TSV file path was provided")
+    tsv_file_path = str(tsv_file_path)
+    tsv_version = paths.get_tsv_version(tsv_file_path)
+    extra_args = {**(extra_args or {})}
+    if tsv_file_path.endswith(paths.GZIP_EXTENSION):
+        # Required for the object to be decompressed when it is imported
+        extra_args["ContentEncoding"] = "gzip"
+    s3 = S3Hook(aws_conn_id=aws_conn_id, extra_args=extra_args)
+
+    if tsv_file_path.startswith(S3_URI_SCHEME):
+        streamed_bucket, s3_key = S3Hook.parse_s3_url(tsv_file_path)
+        if not s3.check_for_key(s3_key, bucket_name=streamed_bucket):
+            raise AirflowSkipException(f"TSV object {tsv_file_path} does not exist.")
+        ti.xcom_push(key="tsv_version", value=tsv_version)
+        ti.xcom_push(key="s3_key", value=s3_key)
+        return
+
     tsv_file = Path(tsv_file_path)
     if not tsv_file.exists():
         raise AirflowSkipException(f"TSV file {tsv_file} does not exist.")
-    tsv_version = paths.get_tsv_version(tsv_file_path)
     s3_key = f"{s3_prefix}/{tsv_file.name}"
     logger.info(f"Uploading {tsv_file_path} to {s3_bucket}:{s3_key}")
-    s3 = S3Hook(
-        aws_conn_id=aws_conn_id,
-        extra_args=extra_args or {},
-    )
     s3.load_file(tsv_file_path, s3_key, bucket_name=s3_bucket)
     ti.xcom_push(key="tsv_version", value=tsv_version)
     ti.xcom_push(key="s3_key", value=s3_key)
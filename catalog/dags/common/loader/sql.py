@@ -1,4 +1,5 @@
 import logging
+from contextlib import closing
 from textwrap import dedent
 
 from airflow.models.abstractoperator import AbstractOperator
@@ -6,13 +7,15 @@ from psycopg2.errors import InvalidTextRepresentation
 
 from common.constants import IMAGE, MediaType, SQLInfo
 from common.loader import provider_details as prov
-from common.loader.paths import _extract_media_type
+from common.loader import validation
+from common.loader.paths import _extract_media_type, open_tsv
 from common.sql import RETURN_ROW_COUNT, PostgresHook
 from common.storage import columns as col
 from common.storage.columns import NULL, Column, UpsertStrategy
 from common.storage.db_columns import setup_db_columns_for_media_type
 from common.storage.tsv_columns import (
     COLUMNS,
+    CURRENT_VERSION,
     REQUIRED_COLUMNS,
     setup_tsv_columns_for_media_type,
 )
@@ -104,7 +107,17 @@ def load_local_data_to_intermediate_table(
     identifier,
     max_rows_to_skip=10,
     task: AbstractOperator = None,
-):
+) -> tuple[int, int]:
+    """
+    Copy a local TSV into the loading table, skipping malformed rows.
+
+    Every row is validated against the loading table's columns as it is copied, and
+    malformed rows are written to a quarantine file next to the TSV, so the TSV is
+    only read and copied once. If more than `max_rows_to_skip` rows are malformed,
+    nothing is loaded.
+
+    :return: the number of rows loaded and the number of malformed rows skipped
+    """
     media_type = _extract_media_type(tsv_file_name)
     load_table = _get_load_table_name(identifier, media_type=media_type)
     logger.info(f"Loading {tsv_file_name} into {load_table}")
@@ -113,24 +126,36 @@ def load_local_data_to_intermediate_table(
         postgres_conn_id=postgres_conn_id,
         default_statement_timeout=PostgresHook.get_execution_timeout(task),
     )
-    load_successful = False
-
-    while not load_successful and max_rows_to_skip >= 0:
-        try:
-            postgres.bulk_load(f"{load_table}", tsv_file_name)
-            load_successful = True
-
-        except InvalidTextRepresentation as e:
-            line_number = _get_malformed_row_in_file(str(e))
-            _delete_malformed_row_in_file(tsv_file_name, line_number)
-
-        finally:
-            max_rows_to_skip = max_rows_to_skip - 1
+    quarantine_path = f"{tsv_file_name}{validation.QUARANTINE_EXTENSION}"
+
+    with (
+        open_tsv(tsv_file_name) as tsv_file,
+        closing(
+            validation.ValidatedTsvReader(
+                tsv_file,
+                COLUMNS[media_type][CURRENT_VERSION[media_type]],
+                quarantine_path,
+                max_invalid_rows=max_rows_to_skip,
+            )
+        ) as reader,
+        closing(postgres.get_conn()) as conn,
+        closing(conn.cursor()) as cursor,
+    ):
+        cursor.copy_expert(f"COPY {load_table} FROM STDIN", reader)
+        if reader.exceeded_max_invalid_rows:
+            # Closing the connection without committing discards the copied rows
+            raise InvalidTextRepresentation(
+                "Exceeded the maximum number of allowed defective rows"
+            )
+        conn.commit()
 
-    if not load_successful:
-        raise InvalidTextRepresentation(
-            "Exceeded the maximum number of allowed defective rows"
+    if reader.invalid_rows:
+        logger.warning(
+            f"Skipped {reader.invalid_rows} malformed rows, which were written to"
+            f" {quarantine_path}"
         )
+    logger.info(f"Successfully loaded {reader.valid_rows} records from {tsv_file_name}")
+    return reader.valid_rows, reader.invalid_rows
 
 
 def _handle_s3_load_result(cursor) -> int:
@@ -351,23 +376,3 @@ def _get_load_table_name(
     load_table_name_stub: str = LOAD_TABLE_NAME_STUB,
 ) -> str:
     return f"{load_table_name_stub}{media_type}_{identifier}"
-
-
-def _get_malformed_row_in_file(error_msg):
-    error_list = error_msg.splitlines()
-    copy_error = next((line for line in error_list if line.startswith("COPY")), None)
-    assert copy_error is not None
-
-    line_number = int(copy_error.split("line ")[1].split(",")[0])
-
-    return line_number
-
-
-def _delete_malformed_row_in_file(tsv_file_name, line_number):
-    with open(tsv_file_name) as read_obj:
-        lines = read_obj.readlines()
-
-    with open(tsv_file_name, "w") as write_obj:
-        for index, line in enumerate(lines):
-            if index + 1 != line_number:
-                write_obj.write(line)
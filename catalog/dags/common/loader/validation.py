@@ -0,0 +1,207 @@
+r"""
+Validate TSV rows against the columns of the loading table before they are copied.
+
+A single malformed value makes Postgres reject an entire `COPY`. Rather than
+retrying the `COPY` once per malformed row, each row is checked against the type of
+its column as it is streamed to the database, and rows which would be rejected are
+written to a quarantine file instead, so that the TSV is read and copied only once.
+
+Values are checked in the `COPY` text format: fields are separated by tabs, `\N`
+represents `NULL`, and backslash escapes are decoded before the value is checked.
+"""
+
+import json
+import logging
+import re
+import uuid
+from collections.abc import Callable, Iterable
+from typing import IO
+
+from common.storage.columns import ArrayColumn, Column, Datatype
+
+
+logger = logging.getLogger(__name__)
+
+
+COPY_NULL = "\\N"
+QUARANTINE_EXTENSION = ".malformed"
+
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+_ESCAPE_PATTERN = re.compile(r"\\(?:x([0-9a-fA-F]{1,2})|([0-7]{1,3})|(.))", re.DOTALL)
+_INTEGER_PATTERN = re.compile(r"\s*[+-]?\d+\s*")
+_INTEGER_RANGE = range(-(2**31), 2**31)
+_BOOLEANS = {
+    *("t", "tr", "tru", "true", "y", "ye", "yes", "on", "1"),
+    *("f", "fa", "fal", "fals", "false", "n", "no", "of", "off", "0"),
+}
+
+
+def _unescape_match(match: re.Match) -> str:
+    hexadecimal, octal, char = match.groups()
+    if hexadecimal is not None:
+        return chr(int(hexadecimal, 16))
+    if octal is not None:
+        return chr(int(octal, 8))
+    return _ESCAPES.get(char, char)
+
+
+def unescape_copy_value(value: str) -> str:
+    """Decode the backslash escapes of a value in the `COPY` text format."""
+    if "\\" not in value:
+        return value
+    return _ESCAPE_PATTERN.sub(_unescape_match, value)
+
+
+def _is_integer(value: str) -> bool:
+    return bool(_INTEGER_PATTERN.fullmatch(value)) and int(value) in _INTEGER_RANGE
+
+
+def _is_double(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_boolean(value: str) -> bool:
+    return value.strip().lower() in _BOOLEANS
+
+
+def _reject_constant(constant: str):
+    raise ValueError(f"{constant} is not valid JSON")
+
+
+def _is_json(value: str) -> bool:
+    # Postgres cannot store the null character in `jsonb` values
+    if "\\u0000" in value:
+        return False
+    try:
+        json.loads(value, parse_constant=_reject_constant)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+_VALIDATORS: dict[Datatype, Callable[[str], bool]] = {
+    Datatype.int: _is_integer,
+    Datatype.double: _is_double,
+    Datatype.bool: _is_boolean,
+    Datatype.jsonb: _is_json,
+    Datatype.uuid: _is_uuid,
+}
+
+
+def validate_value(column: Column, value: str) -> bool:
+    """
+    Determine whether a value from a TSV can be copied into the given column.
+
+    :param column: the column of the loading table
+    :param value: the raw value from the TSV, in the `COPY` text format
+    :return: whether Postgres would accept the value
+    """
+    if value == COPY_NULL:
+        return True
+    value = unescape_copy_value(value)
+    if isinstance(column, ArrayColumn):
+        return value.startswith("{") and value.endswith("}")
+    if (size := getattr(column, "SIZE", None)) is not None and len(value) > size:
+        return False
+    validator = _VALIDATORS.get(column.datatype)
+    return validator is None or validator(value)
+
+
+def validate_row(columns: list[Column], row: str) -> str | None:
+    """
+    Validate a line of a TSV against the columns of the loading table.
+
+    :return: a description of the first problem found, or None if the row is valid
+    """
+    values = row.rstrip("\n").split("\t")
+    if len(values) != len(columns):
+        return f"expected {len(columns)} values but found {len(values)}"
+    for column, value in zip(columns, values):
+        if not validate_value(column, value):
+            return f"invalid value for {column.db_name}"
+    return None
+
+
+class ValidatedTsvReader:
+    """
+    A file-like object which streams only the valid rows of a TSV.
+
+    This can be passed to `cursor.copy_expert` in place of the TSV file. Invalid rows
+    are written unchanged to the quarantine file, which is only created if there is
+    at least one invalid row. Once more than `max_invalid_rows` invalid rows have been
+    found, the reader stops early and sets `exceeded_max_invalid_rows`, and the copy
+    should be rolled back.
+
+    rows:               the lines of the TSV
+    columns:            the columns of the loading table, in the order of the TSV
+    quarantine_path:    where to write invalid rows
+    max_invalid_rows:   the number of invalid rows to tolerate
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[str],
+        columns: list[Column],
+        quarantine_path: str,
+        max_invalid_rows: int,
+    ):
+        self._rows = iter(rows)
+        self.columns = columns
+        self.quarantine_path = quarantine_path
+        self.max_invalid_rows = max_invalid_rows
+        self.valid_rows = 0
+        self.invalid_rows = 0
+        self.exceeded_max_invalid_rows = False
+        self._line_number = 0
+        self._quarantine_file: IO[str] | None = None
+
+    def readline(self, size: int = -1) -> str:
+        """Return the next valid row, or an empty string once there are none left."""
+        if self.exceeded_max_invalid_rows:
+            return ""
+        for row in self._rows:
+            self._line_number += 1
+            if (problem := validate_row(self.columns, row)) is None:
+                self.valid_rows += 1
+                return row
+            self._quarantine(row, problem)
+            if self.exceeded_max_invalid_rows:
+                break
+        return ""
+
+    def read(self, size: int = -1) -> str:
+        """Return whole valid rows totalling at least `size` characters."""
+        chunks = []
+        length = 0
+        while size < 0 or length < size:
+            if not (row := self.readline()):
+                break
+            chunks.append(row)
+            length += len(row)
+        return "".join(chunks)
+
+    def _quarantine(self, row: str, problem: str):
+        self.invalid_rows += 1
+        logger.warning(f"Skipping malformed row at line {self._line_number}: {problem}")
+        if self.invalid_rows > self.max_invalid_rows:
+            self.exceeded_max_invalid_rows = True
+        if self._quarantine_file is None:
+            self._quarantine_file = open(self.quarantine_path, "w", encoding="utf-8")
+        self._quarantine_file.write(row if row.endswith("\n") else f"{row}\n")
+
+    def close(self):
+        if self._quarantine_file is not None:
+            self._quarantine_file.close()
+            self._quarantine_file = None
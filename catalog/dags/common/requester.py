@@ -1,9 +1,11 @@
 import logging
+import threading
 import time
 from collections.abc import Callable
 
 import requests
 from airflow.exceptions import AirflowException
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, JSONDecodeError
 
 import oauth2
@@ -45,6 +47,9 @@ class DelayedRequester:
         self._DELAY = delay
         self.headers = {"User-Agent": prov.UA_STRING} | headers
         self._last_request = 0
+        # Ingesters may make requests from more than one thread, see
+        # `ProviderDataIngester.pipeline_batches`
+        self._delay_lock = threading.Lock()
         self.session = requests.Session()
 
     def _make_request(
@@ -60,8 +65,9 @@ class DelayedRequester:
         **kwargs: Optional arguments that will be passed to the `requests`
                   module request.
         """
-        self._delay_processing()
-        self._last_request = time.time()
+        with self._delay_lock:
+            self._delay_processing()
+            self._last_request = time.time()
         request_kwargs = kwargs or {}
         if "headers" not in kwargs:
             request_kwargs["headers"] = self.headers
@@ -206,6 +212,85 @@ class DelayedRequester:
         return response_json
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket for rate limiting.
+
+    Tokens are added at `rate` per second, up to `capacity`, and each call to
+    `acquire` consumes one token. When no token is available, the caller reserves
+    the next one and sleeps until it would have been added, so that callers are
+    served in the order in which they called `acquire`.
+
+    rate:     number of tokens added per second
+    capacity: maximum number of tokens which can accumulate, i.e. the size of a burst
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Consume a token, waiting for one if necessary, and return the wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            logger.debug(f"Waiting {wait} second(s)")
+            time.sleep(wait)
+        return wait
+
+
+class ConcurrentDelayedRequester(DelayedRequester):
+    """
+    Requester class which can be shared by threads making concurrent requests.
+
+    Rather than waiting for a fixed delay after the previous request, which only makes
+    sense when requests are made one after another, requests are rate limited by a
+    token bucket, and the number of requests in flight at the same time is bounded.
+    Retries are made in the same way as by `DelayedRequester`, and each attempt
+    counts against both limits.
+
+    Optional Arguments:
+    requests_per_second:     the maximum average rate of requests; no limit if None
+    max_concurrent_requests: the maximum number of requests in flight at once
+    headers:                 a dict that will be passed in all requests, unless
+                             overridden by kwargs in specific calls to `get`
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        max_concurrent_requests: int = 1,
+        headers: dict | None = None,
+    ):
+        super().__init__(headers=headers)
+        self.max_concurrent_requests = max_concurrent_requests
+        self._bucket = TokenBucket(requests_per_second) if requests_per_second else None
+        self._in_flight = threading.BoundedSemaphore(max_concurrent_requests)
+        # Allow the session to keep a connection open for each concurrent request
+        adapter = HTTPAdapter(pool_maxsize=max_concurrent_requests)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _make_request(
+        self, method: Callable[..., requests.models.Response], url: str, **kwargs
+    ):
+        with self._in_flight:
+            return super()._make_request(method, url, **kwargs)
+
+    def _delay_processing(self):
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+
 class OAuth2DelayedRequester(DelayedRequester):
     def __init__(self, provider_name: str, delay: int = 0):
         super().__init__(delay)
@@ -12,6 +12,61 @@ NOW = "NOW()"
 FALSE = "'f'"
 NULL = "NULL"
 
+# Reused to serialize every JSON and array value, equivalent to
+# `json.dumps(value, ensure_ascii=False)`
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _sanitize_string(data) -> str:
+    """
+    Replace double quotes, remove backspaces, escape backslashes, and collapse
+    whitespace to single spaces.
+
+    Most values need none of this, so they are checked first and returned unchanged.
+    Every whitespace character other than the space, and the backspace, is not
+    printable, so the check only needs to look for the rest.
+    """
+    string = str(data)
+    if (
+        string.isprintable()
+        and '"' not in string
+        and "\\" not in string
+        and "  " not in string
+        and string[:1] != " "
+        and string[-1:] != " "
+    ):
+        return string
+    # We join a split string because it removes all whitespace characters
+    return " ".join(
+        string.replace('"', "'").replace("\b", "").replace("\\", "\\\\").split()
+    )
+
+
+def _sanitize_json_values(value, recursion_limit: int):
+    # Strings are by far the most common values, so they are sanitized directly
+    # rather than through another recursive call
+    input_type = type(value)
+    if input_type is str:
+        return _sanitize_string(value)
+    elif value is None:
+        return value
+    elif (input_type is not dict and input_type is not list) or recursion_limit <= 0:
+        return _sanitize_string(value)
+    elif input_type is list:
+        return [
+            _sanitize_string(item)
+            if type(item) is str
+            else _sanitize_json_values(item, recursion_limit - 1)
+            for item in value
+        ]
+    else:
+        return {
+            key: _sanitize_string(val)
+            if type(val) is str
+            else _sanitize_json_values(val, recursion_limit - 1)
+            for key, val in value.items()
+        }
+
 
 class Datatype(Enum):
     bool = "boolean"
@@ -151,6 +206,8 @@ class Column(ABC):
         UpsertStrategy.merge_array: _merge_array,
         UpsertStrategy.merge_tags: _merge_tags,
     }
+    # Whether a value has already been logged for being over the character limit
+    _logged_char_limit = False
 
     def __init__(
         self,
@@ -198,16 +255,7 @@ class Column(ABC):
     def __sanitize_string(self, data):
         if data is None:
             return None
-        else:
-            # We join a split string because it removes all whitespace
-            # characters
-            return " ".join(
-                str(data)
-                .replace('"', "'")
-                .replace("\b", "")
-                .replace("\\", "\\\\")
-                .split()
-            )
+        return _sanitize_string(data)
 
     def __enforce_char_limit(self, string, limit, truncate=True):
         if not isinstance(string, str):
@@ -217,7 +265,14 @@ class Column(ABC):
             )
             return None
         if len(string) > limit:
-            logger.warning(f"String over char limit of {limit}.  Input was {string}.")
+            # Only log the first time, since this can happen for a large share of
+            # the values of a column
+            if not self._logged_char_limit:
+                logger.warning(
+                    f"String over char limit of {limit} for {self.name}, further"
+                    f" occurrences will not be logged. Input was {string}."
+                )
+                self._logged_char_limit = True
             return string[:limit] if truncate else None
         else:
             return string
@@ -463,33 +518,14 @@ class JSONColumn(Column):
                other input will be turned into sanitized strings.
         """
         sanitized_json = self._sanitize_json_values(value)
-        return (
-            json.dumps(sanitized_json, ensure_ascii=False) if sanitized_json else None
-        )
+        return _JSON_ENCODER.encode(sanitized_json) if sanitized_json else None
 
     def _sanitize_json_values(self, value, recursion_limit=100):
         """
         Recursively sanitize the non-dict/non-list values of an input dict or list in
         preparation for dumping to a JSON string.
         """
-        input_type = type(value)
-
-        if value is None:
-            return value
-        elif input_type not in [dict, list] or recursion_limit <= 0:
-            return self._Column__sanitize_string(value)
-        elif input_type is list:
-            return [
-                self._sanitize_json_values(item, recursion_limit=recursion_limit - 1)
-                for item in value
-            ]
-        else:
-            return {
-                key: self._sanitize_json_values(
-                    val, recursion_limit=recursion_limit - 1
-                )
-                for key, val in value.items()
-            }
+        return _sanitize_json_values(value, recursion_limit)
 
 
 class StringColumn(Column):
@@ -685,7 +721,7 @@ class ArrayColumn(Column):
                 values.append(None)
             else:
                 values.append(self.base_column.prepare_string(val))
-        arr_str = json.dumps(values, ensure_ascii=False)
+        arr_str = _JSON_ENCODER.encode(values)
         return "{" + arr_str[1:-1] + "}" if arr_str else None
 
 
@@ -2,7 +2,7 @@ import logging
 from collections import namedtuple
 
 from common.licenses import LicenseInfo
-from common.storage.media import MediaStore
+from common.storage.media import DEFAULT_BUFFER_SIZE, MediaStore
 from common.storage.tsv_columns import CURRENT_IMAGE_TSV_COLUMNS
 
 
@@ -21,8 +21,12 @@ class ImageStore(MediaStore):
     output_file:    String giving a temporary .tsv filename (*not* the
                     full path) where the image info should be stored.
     output_dir:     String giving a path where `output_file` should be placed.
-    buffer_length:  Integer giving the maximum number of image information rows
-                    to store in memory before writing them to disk.
+    buffer_length:  Optional integer giving the maximum number of image information
+                    rows to store in memory before writing them to the output.
+    buffer_size:    Integer giving the approximate number of bytes of image
+                    information rows to store in memory before writing them to the
+                    output.
+    compression:    Optional compression of the output (see `MediaStore`).
     """
 
     def __init__(
@@ -31,13 +35,21 @@ class ImageStore(MediaStore):
         tsv_suffix=None,
         output_file=None,
         output_dir=None,
-        buffer_length=100,
+        buffer_length=None,
         media_type="image",
         tsv_columns=None,
         strip_url_trailing_slashes: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: str | None = None,
     ):
         super().__init__(
-            provider, tsv_suffix, buffer_length, media_type, strip_url_trailing_slashes
+            provider,
+            tsv_suffix,
+            buffer_length,
+            media_type,
+            strip_url_trailing_slashes,
+            buffer_size,
+            compression,
         )
         self.columns = CURRENT_IMAGE_TSV_COLUMNS if tsv_columns is None else tsv_columns
 
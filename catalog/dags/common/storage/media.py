@@ -2,6 +2,9 @@ import abc
 import logging
 import os
 from datetime import datetime
+from typing import IO
+
+import smart_open
 
 from common import urls
 from common.extensions import (
@@ -9,7 +12,9 @@ from common.extensions import (
     InvalidFiletypeError,
     extract_filetype,
 )
+from common.loader import paths
 from common.loader import provider_details as prov
+from common.loader.s3 import get_s3_client
 from common.storage.tsv_columns import CURRENT_VERSION
 
 
@@ -45,6 +50,13 @@ PROVIDER_API = "provider_api"
 
 PG_INTEGER_MAXIMUM = 2147483647
 
+# Approximate number of bytes to hold in the buffer before writing it to the output
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+# Supported TSV compressions, mapped to the extension added to the output file. Only
+# gzip is supported, because it is the only compression which can be imported into
+# Postgres by `aws_s3.table_import_from_s3`.
+TSV_COMPRESSION_EXTENSIONS = {"gzip": paths.GZIP_EXTENSION}
+
 
 class MediaStore(metaclass=abc.ABCMeta):
     """
@@ -54,29 +66,42 @@ class MediaStore(metaclass=abc.ABCMeta):
     provider:       String marking the provider in the `media`
                     (`image`, `audio` etc) table of the DB.
     tsv_suffix:     Optional string to append to the tsv filename.
-    buffer_length:  Integer giving the maximum number of media information rows
-                    to store in memory before writing them to disk.
+    buffer_length:  Optional integer giving the maximum number of media information
+                    rows to store in memory before writing them to the output.
     strip_url_trailing_slashes: Boolean to strip trailing slashes from URLs during
                                 validation
+    buffer_size:    Integer giving the approximate number of bytes of media
+                    information rows to store in memory before writing them to the
+                    output.
+    compression:    Optional compression of the output, one of
+                    `TSV_COMPRESSION_EXTENSIONS`.
     """
 
     def __init__(
         self,
         provider: str | None = None,
         tsv_suffix: str | None = None,
-        buffer_length: int = 100,
+        buffer_length: int | None = None,
         media_type: str | None = "generic",
         strip_url_trailing_slashes: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: str | None = None,
     ):
         logger.info(f"Initialized {media_type} MediaStore with provider {provider}")
         self.media_type = media_type
         self.provider = provider
         self.buffer_length = buffer_length
+        self.buffer_size = buffer_size
         self.strip_url_trailing_slashes = strip_url_trailing_slashes
         self.output_path = self._initialize_output_path(provider, tsv_suffix=tsv_suffix)
         self.columns = None
         self._media_buffer = []
+        self._buffered_bytes = 0
         self._total_items = 0
+        self._output_file: IO[str] | None = None
+        self._s3_transport_params: dict | None = None
+        if compression:
+            self.configure_output(compression=compression)
 
     def save_item(self, media) -> None:
         """
@@ -88,8 +113,11 @@ class MediaStore(metaclass=abc.ABCMeta):
         tsv_row = self._create_tsv_row(media)
         if tsv_row:
             self._media_buffer.append(tsv_row)
+            self._buffered_bytes += len(tsv_row)
             self._total_items += 1
-        if len(self._media_buffer) >= self.buffer_length:
+        if self._buffered_bytes >= self.buffer_size or (
+            self.buffer_length and len(self._media_buffer) >= self.buffer_length
+        ):
             self._flush_buffer()
 
     @abc.abstractmethod
@@ -172,11 +200,71 @@ class MediaStore(metaclass=abc.ABCMeta):
         ] or prov.DEFAULT_IMAGE_CATEGORY.get(self.provider)
         return media_data
 
+    def configure_output(
+        self,
+        compression: str | None = None,
+        s3_bucket: str | None = None,
+        s3_prefix: str | None = None,
+        aws_conn_id: str | None = None,
+        s3_extra_args: dict | None = None,
+    ) -> None:
+        """
+        Compress the output and/or stream it directly to S3.
+
+        This must be called before any item is written to the output. When streaming
+        to S3, the output is uploaded in parts using a multipart upload while items
+        are saved, and `output_path` becomes the `s3://` URI of the object, which is
+        complete once the store is closed.
+
+        Optional Arguments:
+        compression:    compression of the output, one of `TSV_COMPRESSION_EXTENSIONS`
+        s3_bucket:      bucket to stream the output to, instead of writing it to disk
+        s3_prefix:      prefix of the key of the streamed object
+        aws_conn_id:    connection used to stream the output to S3
+        s3_extra_args:  extra arguments for creating the multipart upload, such as
+                        the `StorageClass`
+        """
+        if self._output_file is not None:
+            raise ValueError("Cannot configure the output once it has been opened.")
+
+        if compression:
+            if compression not in TSV_COMPRESSION_EXTENSIONS:
+                raise ValueError(
+                    f"Unsupported TSV compression: {compression}. Supported"
+                    f" compressions are: {', '.join(TSV_COMPRESSION_EXTENSIONS)}"
+                )
+            self.output_path += TSV_COMPRESSION_EXTENSIONS[compression]
+
+        if s3_bucket:
+            extra_args = {**(s3_extra_args or {})}
+            if compression:
+                # Required for the object to be decompressed when it is imported
+                extra_args["ContentEncoding"] = compression
+            file_name = os.path.basename(self.output_path)
+            self.output_path = f"s3://{s3_bucket}/{s3_prefix}/{file_name}"
+            self._s3_transport_params = {
+                "client": get_s3_client(aws_conn_id),
+                "client_kwargs": {"S3.Client.create_multipart_upload": extra_args},
+            }
+        logger.info(f"Output path: {self.output_path}")
+
     def commit(self):
-        """Write all remaining media items in the buffer to disk."""
+        """
+        Write all remaining media items in the buffer to the output.
+
+        The output stays open, so that compressed output is written as a single
+        gzip member rather than one per commit. Uncompressed local output can be
+        read once committed; compressed or streamed output is only complete once
+        the store is closed.
+        """
         self._flush_buffer()
         return self.total_items
 
+    def close(self):
+        """Write all remaining media items and complete the output."""
+        self._flush_buffer()
+        self._close_output()
+
     def _initialize_output_path(
         self,
         provider: str | None,
@@ -221,31 +309,39 @@ class MediaStore(metaclass=abc.ABCMeta):
         return self._total_items
 
     def _create_tsv_row(self, item):
-        row_length = len(self.columns)
         prepared_strings = [
-            self.columns[i].prepare_string(item[i]) for i in range(row_length)
+            column.prepare_string(value) for column, value in zip(self.columns, item)
         ]
-        logger.debug(f"Prepared strings list:\n{prepared_strings}")
-        for i in range(row_length):
-            if self.columns[i].required and prepared_strings[i] is None:
-                logger.warning(f"Row missing required {self.columns[i].name}")
+        for column, prepared_string in zip(self.columns, prepared_strings):
+            if prepared_string is None and column.required:
+                logger.warning(f"Row missing required {column.name}")
                 return None
-        else:
-            return (
-                "\t".join([s if s is not None else "\\N" for s in prepared_strings])
-                + "\n"
+        return "\t".join(["\\N" if s is None else s for s in prepared_strings]) + "\n"
+
+    def _open_output(self) -> IO[str]:
+        if self._s3_transport_params is not None:
+            # The compression is inferred from the extension of the object key
+            return smart_open.open(
+                self.output_path, "w", transport_params=self._s3_transport_params
             )
+        return paths.open_tsv(self.output_path, "a")
+
+    def _close_output(self) -> None:
+        if self._output_file is not None:
+            self._output_file.close()
+            self._output_file = None
 
     def _flush_buffer(self) -> int:
         buffer_length = len(self._media_buffer)
         if buffer_length > 0:
-            logger.info(f"Writing {buffer_length} lines from buffer to disk.")
-            with open(self.output_path, "a") as f:
-                f.writelines(self._media_buffer)
-                self._media_buffer = []
-                logger.debug(
-                    f"Total Media Items Processed so far:  {self._total_items}"
-                )
+            logger.info(f"Writing {buffer_length} lines from buffer to the output.")
+            if self._output_file is None:
+                self._output_file = self._open_output()
+            self._output_file.writelines(self._media_buffer)
+            self._output_file.flush()
+            self._media_buffer = []
+            self._buffered_bytes = 0
+            logger.debug(f"Total Media Items Processed so far:  {self._total_items}")
         else:
             logger.debug("Empty buffer!  Nothing to write.")
         return buffer_length
@@ -0,0 +1,171 @@
+"""
+A persistent store of which domains support TLS.
+
+Probing a domain for TLS support takes a live HTTPS request, which can take up to
+the probe timeout for each domain. Results are kept in the `tls_support` table of the
+upstream database, where they are shared by every task and every worker, and expire
+after `TLS_SUPPORT_TTL_DAYS` days.
+
+The store is only consulted when the `TLS_SUPPORT_CONN_ID` environment variable is set
+to the ID of the connection for the database holding the table. Any error reading from
+or writing to the store is logged and otherwise ignored, so that the store can never
+prevent a URL from being validated.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterable
+from datetime import timedelta
+from functools import cache
+
+import aiohttp
+from airflow.exceptions import AirflowException
+from psycopg2 import Error as Psycopg2Error
+
+from common.sql import PostgresHook
+
+
+logger = logging.getLogger(__name__)
+
+
+TLS_SUPPORT_TABLE = "tls_support"
+TLS_SUPPORT_CONN_ID = os.getenv("TLS_SUPPORT_CONN_ID")
+TLS_SUPPORT_TTL = timedelta(days=int(os.getenv("TLS_SUPPORT_TTL_DAYS", 30)))
+# Timeout, in seconds, of the HTTPS request used to probe a domain
+PROBE_TIMEOUT = 2
+PROBE_CONCURRENCY = 50
+
+CREATE_TLS_SUPPORT_TABLE_QUERY = f"""
+CREATE TABLE IF NOT EXISTS {TLS_SUPPORT_TABLE} (
+  domain character varying(1000) PRIMARY KEY,
+  supported boolean NOT NULL,
+  tested_on timestamp with time zone NOT NULL DEFAULT now()
+);
+"""
+
+SELECT_TLS_SUPPORT_QUERY = f"""
+SELECT domain, supported FROM {TLS_SUPPORT_TABLE}
+WHERE domain = ANY(%(domains)s) AND tested_on > now() - %(ttl)s;
+"""
+
+UPSERT_TLS_SUPPORT_QUERY = f"""
+INSERT INTO {TLS_SUPPORT_TABLE} (domain, supported, tested_on)
+SELECT domain, supported, now()
+FROM unnest(%(domains)s::text[], %(supported)s::boolean[]) AS t(domain, supported)
+ON CONFLICT (domain) DO UPDATE
+SET supported = EXCLUDED.supported, tested_on = EXCLUDED.tested_on;
+"""
+
+_STORE_ERRORS = (AirflowException, Psycopg2Error)
+
+
+class TlsSupportStore:
+    """
+    Read and write TLS support results in the `tls_support` table.
+
+    postgres_conn_id: the connection to the database holding the table
+    ttl:              how long a result is considered fresh after it was tested
+    """
+
+    def __init__(self, postgres_conn_id: str, ttl: timedelta = TLS_SUPPORT_TTL):
+        self.postgres_conn_id = postgres_conn_id
+        self.ttl = ttl
+
+    def _get_hook(self) -> PostgresHook:
+        return PostgresHook(
+            postgres_conn_id=self.postgres_conn_id,
+            default_statement_timeout=60,
+            log_sql=False,
+        )
+
+    def create_table(self) -> None:
+        self._get_hook().run(CREATE_TLS_SUPPORT_TABLE_QUERY)
+
+    def get(self, domains: Iterable[str]) -> dict[str, bool]:
+        """
+        Get the fresh results for the given domains.
+
+        Domains without a fresh result are omitted from the returned mapping.
+        """
+        domains = list(domains)
+        if not domains:
+            return {}
+        try:
+            rows = self._get_hook().get_records(
+                SELECT_TLS_SUPPORT_QUERY,
+                parameters={"domains": domains, "ttl": self.ttl},
+            )
+        except _STORE_ERRORS as e:
+            logger.warning(f"Could not read TLS support from the store: {e}")
+            return {}
+        return dict(rows)
+
+    def set(self, results: dict[str, bool]) -> None:
+        """Record the given results, replacing any previous result for a domain."""
+        if not results:
+            return
+        try:
+            self._get_hook().run(
+                UPSERT_TLS_SUPPORT_QUERY,
+                parameters={
+                    "domains": list(results.keys()),
+                    "supported": list(results.values()),
+                },
+                autocommit=True,
+                handler=None,
+            )
+        except _STORE_ERRORS as e:
+            logger.warning(f"Could not write TLS support to the store: {e}")
+
+
+@cache
+def get_default_store() -> TlsSupportStore | None:
+    """Get the store configured by `TLS_SUPPORT_CONN_ID`, if there is one."""
+    if not TLS_SUPPORT_CONN_ID:
+        return None
+    return TlsSupportStore(TLS_SUPPORT_CONN_ID)
+
+
+async def _probe_domain(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, domain: str
+) -> bool:
+    async with semaphore:
+        try:
+            async with session.get(f"https://{domain}"):
+                # Like the synchronous check in `common.urls`, any response counts
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Could not verify TLS support for {domain}: {e!r}")
+            return False
+
+
+async def _probe_domains(
+    domains: list[str], concurrency: int, timeout: float
+) -> list[bool]:
+    semaphore = asyncio.Semaphore(concurrency)
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as session:
+        return await asyncio.gather(
+            *(_probe_domain(session, semaphore, domain) for domain in domains)
+        )
+
+
+def probe_tls_support(
+    domains: Iterable[str],
+    concurrency: int = PROBE_CONCURRENCY,
+    timeout: float = PROBE_TIMEOUT,
+) -> dict[str, bool]:
+    """
+    Probe the given domains for TLS support concurrently.
+
+    At most `concurrency` requests are in flight at any time, so probing `n` domains
+    takes roughly `n / concurrency` times the timeout in the worst case, rather than
+    `n` times the timeout when probing them one by one.
+    """
+    domains = list(dict.fromkeys(domains))
+    if not domains:
+        return {}
+    results = asyncio.run(_probe_domains(domains, concurrency, timeout))
+    return dict(zip(domains, results))
@@ -25,6 +25,8 @@ _image_store_dict = ImageStoreDict()
 def clean_tsv_directory(tsv_directory):
     for tsv in os.listdir(tsv_directory):
         clean_tsv(os.path.join(tsv_directory, tsv))
+    for image_store in _image_store_dict.values():
+        image_store.close()
 
 
 def clean_tsv(tsv_filename):
@@ -6,17 +6,21 @@ verifying and cleaning URLs.
 import logging
 import re
 from functools import lru_cache
-from urllib.parse import urlparse
 
 import tldextract
 
 # This import is aliased for easier test mocking
 from requests import get as requests_get
 from requests.exceptions import RequestException
+from tldextract.remote import lenient_netloc
+
+from common import tls_support
 
 
 logger = logging.getLogger(__name__)
 
+_SCHEME_PATTERN = re.compile("https*:/*")
+
 
 class SpaceInUrlError(Exception):
     pass
@@ -38,34 +42,42 @@ def validate_url_string(url_string, strip_slash: bool = True):
     strip_slash: Flag (bool) decides whether to strip slashes in URL or not,
     Default value is `True`
     """
+    return normalize_url(url_string, strip_slash)[0]
+
+
+def normalize_url(
+    url_string, strip_slash: bool = True
+) -> tuple[str | None, str | None]:
+    """
+    Validate and repair `url_string` as `validate_url_string` does, and also get the
+    key under which the TLS support of its domain is cached, see `get_domain_key`.
 
-    logger.debug(f"Validating_url {url_string}")
+    The host of the URL is only split into its domain and suffix once, and the result
+    is cached per host, since most of the URLs of a provider share a few hosts.
+
+    Returns a tuple of the validated URL, or None if it could not be repaired, and
+    the domain key, or None if `url_string` is not a non-empty string.
+    """
     if not isinstance(url_string, str) or not url_string:
-        return
+        return None, None
 
-    if url_string and " " in url_string:
+    if " " in url_string:
         raise SpaceInUrlError(f"space is present in URL: {url_string}")
 
-    upgraded_url = _add_best_scheme(url_string, strip_slash)
+    domain_key = get_domain_key(url_string)
+    scheme = "https" if _test_domain_for_tls_support(domain_key) else "http"
+    upgraded_url = add_url_scheme(url_string, scheme=scheme, strip_slash=strip_slash)
 
-    parse_result = urlparse(upgraded_url)
-    tld = tldextract.extract(upgraded_url)
+    # The scheme may have changed where the host starts, e.g. for `ftp://` URLs, so
+    # the upgraded URL is checked rather than the original one
+    tld = _extract(upgraded_url)
+    if (tld.domain and tld.suffix) or tld.ipv4:
+        return upgraded_url, domain_key
 
-    logger.debug(f"parse_result.scheme: {parse_result.scheme}")
-    logger.debug(f"tld.domain: {tld.domain}")
-    logger.debug(f"tld.suffix: {tld.suffix}")
-
-    if tld.domain and tld.suffix and parse_result.scheme:
-        return upgraded_url
-    elif tld.ipv4 and parse_result.scheme:
-        logger.debug(f"Using IP address as URL: {upgraded_url}")
-        return upgraded_url
-    else:
-        logger.info(
-            f"Invalid url {url_string}, attempted upgrade: {upgraded_url}"
-            " Returning None"
-        )
-        return None
+    logger.info(
+        f"Invalid url {url_string}, attempted upgrade: {upgraded_url} Returning None"
+    )
+    return None, domain_key
 
 
 @lru_cache(maxsize=2048)
@@ -99,10 +111,8 @@ def add_url_scheme(url_string, scheme="http", strip_slash: bool = True):
 
     Only strip the leading/trailing slash of url if flag is True.
     """
-    logger.debug(f"Adding or changing scheme of {url_string} to {scheme}")
     stripped_url = url_string.strip()
-    scheme_pattern = re.compile("https*:/*")
-    scheme_match = scheme_pattern.match(stripped_url)
+    scheme_match = _SCHEME_PATTERN.match(stripped_url)
     if scheme_match is not None:
         url_no_scheme = stripped_url[scheme_match.end() :]
     else:
@@ -110,30 +120,37 @@ def add_url_scheme(url_string, scheme="http", strip_slash: bool = True):
 
     url_no_scheme = url_no_scheme.strip("/") if strip_slash else url_no_scheme
 
-    url_with_scheme = f"{scheme}://{url_no_scheme}"
-    logger.debug(f"URL with scheme: {url_with_scheme}")
-    return url_with_scheme
+    return f"{scheme}://{url_no_scheme}"
 
 
-def _add_best_scheme(url_string, strip_slash: bool = True):
-    domain_key = tldextract.extract(url_string).fqdn
-    if not domain_key:
-        domain_key = tldextract.extract(url_string).ipv4
+def get_domain_key(url_string):
+    """
+    Get the key under which the TLS support of the URL's domain is cached.
+
+    This is the fully qualified domain name of the URL, or its IP address if it has
+    no domain name.
+    """
+    extracted = _extract(url_string)
+    return extracted.fqdn or extracted.ipv4
 
-    if _test_domain_for_tls_support(domain_key):
-        upgraded_url = add_url_scheme(
-            url_string, scheme="https", strip_slash=strip_slash
-        )
-    else:
-        upgraded_url = add_url_scheme(
-            url_string, scheme="http", strip_slash=strip_slash
-        )
 
-    return upgraded_url
+def _extract(url_string) -> tldextract.tldextract.ExtractResult:
+    return _extract_host(lenient_netloc(url_string))
+
+
+@lru_cache(maxsize=4096)
+def _extract_host(host: str) -> tldextract.tldextract.ExtractResult:
+    # Splitting a host against the public suffix list is the most expensive part of
+    # validating a URL, and depends only on the host
+    return tldextract.extract(host)
 
 
 @lru_cache(maxsize=1024)
 def _test_domain_for_tls_support(domain):
+    store = tls_support.get_default_store()
+    if store is not None and (cached := store.get([domain])):
+        return cached[domain]
+
     logger.info(f"Testing {domain} for TLS support")
     tls_supported = False
     try:
@@ -142,4 +159,7 @@ def _test_domain_for_tls_support(domain):
         tls_supported = True
     except RequestException as e:
         logger.info(f"Could not verify TLS support for {domain}. Error was\n{e}")
+
+    if store is not None:
+        store.set({domain: tls_supported})
     return tls_supported
@@ -10,9 +10,11 @@ will be promoted to the live media tables in the API.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict
 from datetime import timedelta
 from textwrap import dedent
+from uuid import UUID
 
 from airflow.decorators import task, task_group
 from airflow.models import Variable
@@ -25,7 +27,7 @@ from common.constants import (
     PRODUCTION,
     Environment,
 )
-from common.sql import PostgresHook, run_sql
+from common.sql import PostgresHook, fetch_all, run_sql, single_value
 from data_refresh import queries
 from data_refresh.data_refresh_types import DataRefreshConfig
 
@@ -145,6 +147,65 @@ def get_shared_columns(
     return list(upstream_cols.intersection(downstream_cols))
 
 
+def get_partition_conditions(partition_count: int) -> list[str]:
+    """
+    Split the upstream table into `partition_count` ranges of `identifier`, and
+    return the SQL condition selecting the rows in each range.
+
+    Identifiers are random (v4) UUIDs, so ranges of equal width in the UUID space
+    contain roughly the same number of rows. The first and last ranges are left
+    open so that no identifier can fall outside of every partition.
+    """
+    if partition_count <= 1:
+        return ["TRUE"]
+
+    boundaries = [
+        str(UUID(int=(i * 2**128) // partition_count))
+        for i in range(1, partition_count)
+    ]
+    conditions = [f"u.identifier < '{boundaries[0]}'::uuid"]
+    for lower, upper in zip(boundaries, boundaries[1:]):
+        conditions.append(
+            f"u.identifier >= '{lower}'::uuid AND u.identifier < '{upper}'::uuid"
+        )
+    conditions.append(f"u.identifier >= '{boundaries[-1]}'::uuid")
+    return conditions
+
+
+def _copy_partition(
+    postgres_conn_id: str,
+    timeout: float,
+    query: str,
+    temp_table_name: str,
+    partition: int,
+) -> int:
+    """
+    Copy a single partition over its own connection. The copied rows and the
+    record of the partition's completion are committed in the same transaction, so
+    a failed partition leaves no trace and is simply copied again on retry.
+    """
+    postgres = PostgresHook(
+        postgres_conn_id=postgres_conn_id, default_statement_timeout=timeout
+    )
+    conn = postgres.get_conn()
+    try:
+        with conn, conn.cursor() as cursor:
+            cursor.execute(postgres.get_pg_timeout_sql(timeout))
+            cursor.execute(query)
+            row_count = cursor.rowcount
+            cursor.execute(
+                queries.RECORD_COPIED_PARTITION_QUERY.format(
+                    temp_table_name=temp_table_name,
+                    partition=partition,
+                    row_count=row_count,
+                )
+            )
+    finally:
+        conn.close()
+    logger.info(f"Copied {row_count:,} records in partition {partition}.")
+    return row_count
+
+
 @task(
     # Ensure that only one table is being copied at a time.
     max_active_tis_per_dagrun=1,
@@ -159,12 +220,27 @@ def copy_data(
     upstream_table_name: str,
     deleted_table_name: str,
     columns: list[str],
+    partition_count: int = 1,
+    concurrency: int = 1,
     task: AbstractOperator = None,
 ):
-    """Copy data from the upstream table into the downstream temp table."""
+    """
+    Copy data from the upstream table into the downstream temp table.
+
+    The upstream table is split into `partition_count` ranges of `identifier`,
+    which are copied by up to `concurrency` connections at a time. Completed
+    partitions are tracked in a progress table in the downstream DB, so that a
+    retry of this task only copies the partitions that did not complete.
+    """
+    timeout = PostgresHook.get_execution_timeout(task)
+    postgres = PostgresHook(
+        postgres_conn_id=postgres_conn_id, default_statement_timeout=timeout
+    )
+
     # If a limit is configured, add the appropriate conditions onto the
-    # select/insert
+    # select/insert. A limit can only be honoured by a single partition.
     if limit:
+        partition_count = 1
         if "identifier" in columns:
             sql_template += dedent(
                 """
@@ -172,20 +248,80 @@ def copy_data(
             )
         sql_template += dedent(
             """
-        LIMIT {limit};"""
+        LIMIT {limit}"""
         )
+    elif "identifier" not in columns:
+        partition_count = 1
 
-    return run_sql.function(
-        postgres_conn_id=postgres_conn_id,
-        sql_template=sql_template,
-        task=task,
-        temp_table_name=temp_table_name,
-        columns=", ".join(columns),
-        schema_name=schema_name,
-        upstream_table_name=upstream_table_name,
-        deleted_table_name=deleted_table_name,
-        limit=limit,
+    postgres.run(
+        queries.CREATE_COPY_PROGRESS_TABLE_QUERY.format(temp_table_name=temp_table_name)
+    )
+    copied_partitions = set(
+        postgres.run(
+            queries.SELECT_COPIED_PARTITIONS_QUERY.format(
+                temp_table_name=temp_table_name
+            ),
+            handler=fetch_all,
+        )
+    )
+    if copied_partitions:
+        logger.info(f"Resuming copy, skipping partitions {sorted(copied_partitions)}")
+
+    pending = {
+        partition: sql_template.format(
+            temp_table_name=temp_table_name,
+            columns=", ".join(columns),
+            schema_name=schema_name,
+            upstream_table_name=upstream_table_name,
+            deleted_table_name=deleted_table_name,
+            partition_condition=condition,
+            limit=limit,
+        )
+        for partition, condition in enumerate(get_partition_conditions(partition_count))
+        if partition not in copied_partitions
+    }
+    logger.info(
+        f"Copying {len(pending)} of {partition_count} partition(s) with a "
+        f"concurrency of {concurrency}."
+    )
+    if pending:
+        logger.info(
+            f"Copy query for the first pending partition:\n{next(iter(pending.values()))}"
+        )
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = [
+            executor.submit(
+                _copy_partition,
+                postgres_conn_id,
+                timeout,
+                query,
+                temp_table_name,
+                partition,
+            )
+            for partition, query in pending.items()
+        ]
+        try:
+            for completed, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                logger.info(
+                    f"{completed} of {len(pending)} pending partition(s) copied."
+                )
+        except BaseException:
+            # Do not start the queued partitions once one has failed, and wait for
+            # the running ones to commit so that the retry of this task skips them.
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+    total_count = postgres.run(
+        queries.SELECT_COPIED_ROW_COUNT_QUERY.format(temp_table_name=temp_table_name),
+        handler=single_value,
+    )
+    postgres.run(
+        queries.DROP_COPY_PROGRESS_TABLE_QUERY.format(temp_table_name=temp_table_name)
     )
+    logger.info(f"Copied {total_count:,} records from {upstream_table_name}.")
+    return total_count
 
 
 @task_group(group_id="copy_upstream_table")
@@ -196,6 +332,8 @@ def copy_upstream_table(
     copy_timeout: timedelta,
     primary_key_timeout: timedelta,
     limit: int,
+    copy_partitions: int,
+    copy_concurrency: int,
     upstream_table_name: str,
     downstream_table_name: str,
     tertiary_column_query: str,
@@ -257,6 +395,8 @@ def copy_upstream_table(
         upstream_table_name=upstream_table_name,
         deleted_table_name=deleted_table_name,
         columns=shared_cols,
+        partition_count=copy_partitions,
+        concurrency=copy_concurrency,
     )
 
     add_primary_key = run_sql.override(
@@ -312,6 +452,8 @@ def copy_upstream_tables(
         copy_timeout=data_refresh_config.copy_data_timeout,
         primary_key_timeout=data_refresh_config.add_primary_key_timeout,
         limit=limit,
+        copy_partitions=data_refresh_config.copy_data_partitions,
+        copy_concurrency=data_refresh_config.copy_data_concurrency,
     ).expand_kwargs([asdict(tm) for tm in data_refresh_config.table_mappings])
 
     drop_fdw = run_sql.override(task_id="drop_fdw")(
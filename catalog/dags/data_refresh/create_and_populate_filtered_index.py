@@ -13,6 +13,7 @@ import uuid
 from datetime import timedelta
 
 from airflow.decorators import task, task_group
+from airflow.providers.elasticsearch.hooks.elasticsearch import ElasticsearchPythonHook
 from airflow.providers.http.operators.http import HttpOperator
 from airflow.utils.trigger_rule import TriggerRule
 from requests import Response
@@ -31,6 +32,44 @@ def response_filter_sensitive_terms_endpoint(response: Response) -> list[str]:
     return [term.decode("utf-8").strip() for term in response.iter_lines()]
 
 
+def get_filtered_index_query(origin_mappings: dict, sensitive_terms: list[str]) -> dict:
+    """
+    Build the query selecting the documents to copy into the filtered index.
+
+    Documents are flagged with `sensitive_text` by the indexer workers when the
+    origin index is created, so a single `term` filter on the flag excludes
+    sensitive documents. Origin indices created before the flag existed do not map
+    it, so for those the sensitive terms are matched against the text fields
+    instead.
+    """
+    has_sensitive_text_flag = all(
+        "sensitive_text" in mapping["mappings"].get("properties", {})
+        for mapping in origin_mappings.values()
+    )
+    if has_sensitive_text_flag:
+        return {"bool": {"must_not": [{"term": {"sensitive_text": True}}]}}
+
+    logger.info("Origin index does not map `sensitive_text`, matching terms.")
+    return {
+        "bool": {
+            "must_not": [
+                # Use `terms` query for exact matching against unanalyzed raw fields
+                {"terms": {f"{field}.raw": sensitive_terms}}
+                for field in ["tags.name", "title", "description"]
+            ]
+        }
+    }
+
+
+@task
+def get_filtered_index_query_for_origin(
+    es_host: str, origin_index_name: str, sensitive_terms: list[str]
+) -> dict:
+    es_conn = ElasticsearchPythonHook(hosts=[es_host]).get_conn
+    origin_mappings = es_conn.indices.get_mapping(index=origin_index_name)
+    return get_filtered_index_query(dict(origin_mappings), sensitive_terms)
+
+
 @task(trigger_rule=TriggerRule.NONE_FAILED)
 def get_filtered_index_name(media_type: str, destination_index_name: str) -> str:
     # If a destination index name is explicitly passed, use it.
@@ -55,7 +94,7 @@ def create_and_populate_filtered_index(
 ):
     """
     Create and populate a filtered index based on the given origin index, excluding
-    documents with sensitive terms.
+    documents with sensitive terms, as flagged by `sensitive_text`.
     """
     create_filtered_index = es.create_index.override(
         trigger_rule=TriggerRule.NONE_FAILED,
@@ -75,26 +114,24 @@ def create_and_populate_filtered_index(
         response_filter=response_filter_sensitive_terms_endpoint,
     )
 
+    filtered_index_query = get_filtered_index_query_for_origin(
+        es_host=es_host,
+        origin_index_name=origin_index_name,
+        sensitive_terms=sensitive_terms.output,
+    )
+
     populate_filtered_index = es.trigger_and_wait_for_reindex(
         es_host=es_host,
         destination_index=filtered_index_name,
         source_index=origin_index_name,
         timeout=timeout,
         requests_per_second="{{ var.value.get('ES_INDEX_THROTTLING_RATE', 20_000) }}",
-        query={
-            "bool": {
-                "must_not": [
-                    # Use `terms` query for exact matching against unanalyzed raw fields
-                    {"terms": {f"{field}.raw": sensitive_terms.output}}
-                    for field in ["tags.name", "title", "description"]
-                ]
-            }
-        },
+        query=filtered_index_query,
         refresh=False,
         poke_interval=poke_interval,
     )
 
     refresh_index = es.refresh_index(es_host=es_host, index_name=filtered_index_name)
 
-    # sensitive_terms >> populate_filtered_index
-    create_filtered_index >> sensitive_terms >> populate_filtered_index >> refresh_index
+    create_filtered_index >> sensitive_terms >> filtered_index_query
+    filtered_index_query >> populate_filtered_index >> refresh_index
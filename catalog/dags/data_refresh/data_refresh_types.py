@@ -77,6 +77,10 @@ class DataRefreshConfig:
                                        data refresh may take.
     copy_data_timeout:                 timedelta expressing the amount of time it may take to
                                        copy the upstream table into the downstream DB
+    copy_data_partitions:              int number of `identifier` ranges into which the
+                                       upstream table is split when copying it
+    copy_data_concurrency:             int number of partitions copied concurrently,
+                                       each over its own connection to the downstream DB
     add_primary_key_timeout:           timedelta expressing the amount of time it may take to
                                        add the primary key to the temp table
     alter_data_batch_size:             int number of records to process per batch in alter_data
@@ -106,6 +110,8 @@ class DataRefreshConfig:
     default_args: dict = field(default_factory=dict)
     dag_timeout: timedelta = timedelta(days=1)
     copy_data_timeout: timedelta = timedelta(hours=1)
+    copy_data_partitions: int = 1
+    copy_data_concurrency: int = 1
     add_primary_key_timeout: timedelta = timedelta(hours=1)
     alter_data_batch_size: int = DATA_REFRESH_ALTER_BATCH_SIZE
     indexer_worker_timeout: timedelta = timedelta(hours=12)
@@ -137,6 +143,13 @@ DATA_REFRESH_CONFIGS = {
         ),
         dag_timeout=timedelta(days=4),
         copy_data_timeout=timedelta(hours=12),
+        # Split the image table copy into partitions copied concurrently
+        copy_data_partitions=Variable.get(
+            "IMAGE_DATA_REFRESH_COPY_PARTITIONS", default_var=16, deserialize_json=True
+        ),
+        copy_data_concurrency=Variable.get(
+            "IMAGE_DATA_REFRESH_COPY_CONCURRENCY", default_var=4, deserialize_json=True
+        ),
         add_primary_key_timeout=timedelta(hours=12),
         # Larger batches for image data refresh to avoid overloading XCOMs
         alter_data_batch_size=Variable.get(
@@ -27,6 +27,7 @@ CREATE_SCHEMA_QUERY = dedent(
 CREATE_TEMP_TABLE_QUERY = dedent(
     """
     DROP TABLE IF EXISTS {temp_table_name};
+    DROP TABLE IF EXISTS {temp_table_name}_copy_progress;
     CREATE TABLE {temp_table_name} (LIKE {downstream_table_name} INCLUDING DEFAULTS
         INCLUDING CONSTRAINTS);
     """
@@ -63,7 +64,8 @@ METRIC_COLUMN_SETUP_QUERY = dedent(
 BASIC_COPY_DATA_QUERY = dedent(
     """
     INSERT INTO {temp_table_name} ({columns})
-    SELECT {columns} FROM {schema_name}.{upstream_table_name}
+    SELECT {columns} FROM {schema_name}.{upstream_table_name} AS u
+    WHERE {partition_condition}
     """
 )
 
@@ -74,9 +76,38 @@ ADVANCED_COPY_DATA_QUERY = dedent(
         WHERE NOT EXISTS(
             SELECT FROM {deleted_table_name} WHERE identifier = u.identifier
         )
+        AND {partition_condition}
     """
 )
 
+# Tracks which partitions of the upstream table have been copied, so that a retried
+# copy only needs to copy the partitions which have not yet been committed.
+CREATE_COPY_PROGRESS_TABLE_QUERY = dedent(
+    """
+    CREATE TABLE IF NOT EXISTS {temp_table_name}_copy_progress (
+        partition integer PRIMARY KEY,
+        row_count bigint NOT NULL
+    );
+    """
+)
+
+SELECT_COPIED_PARTITIONS_QUERY = (
+    "SELECT partition FROM {temp_table_name}_copy_progress;"
+)
+
+RECORD_COPIED_PARTITION_QUERY = dedent(
+    """
+    INSERT INTO {temp_table_name}_copy_progress (partition, row_count)
+        VALUES ({partition}, {row_count});
+    """
+)
+
+SELECT_COPIED_ROW_COUNT_QUERY = (
+    "SELECT coalesce(sum(row_count), 0) FROM {temp_table_name}_copy_progress;"
+)
+
+DROP_COPY_PROGRESS_TABLE_QUERY = "DROP TABLE IF EXISTS {temp_table_name}_copy_progress;"
+
 ADD_PRIMARY_KEY_QUERY = "ALTER TABLE {temp_table_name} ADD PRIMARY KEY (id);"
 
 DROP_SERVER_QUERY = "DROP SERVER {fdw_name} CASCADE;"
@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta
 
 from airflow.decorators import task
@@ -82,6 +85,187 @@ def run_sql(
     return postgres.run(query, handler=handler)
 
 
+def get_next_batch_size(
+    batch_size: int, duration: float, target_duration: float | None
+) -> int:
+    """
+    Scale the batch size towards the number of rows which would take
+    `target_duration` seconds to update, given that `batch_size` rows took `duration`
+    seconds. The size changes by at most a factor of two per batch, so that a single
+    unusually slow or fast batch does not swing it too far.
+    """
+    if not target_duration:
+        return batch_size
+    factor = target_duration / duration if duration > 0 else 2
+    factor = min(max(factor, 0.5), 2)
+    return min(max(round(batch_size * factor), 1), constants.MAX_BATCH_SIZE)
+
+
+def get_remaining_ranges(
+    checkpoint: int | list[list[int]], total_row_count: int, workers: int
+) -> list[list[int]]:
+    """
+    Get the `(start, end]` row_id ranges which are left to update, split so that
+    there is one for each worker where possible.
+
+    The checkpoint is either the list of ranges saved by a previous attempt, or the
+    row_id from which to start, which is how progress was tracked before updates ran
+    in parallel and may still be set manually.
+    """
+    if isinstance(checkpoint, list):
+        ranges = [[start, end] for start, end in checkpoint if start < end]
+    else:
+        ranges = [[checkpoint, total_row_count]] if checkpoint < total_row_count else []
+
+    while ranges and len(ranges) < workers:
+        largest = max(ranges, key=lambda r: r[1] - r[0])
+        start, end = largest
+        if end - start < 2:
+            break
+        middle = start + (end - start) // 2
+        largest[1] = middle
+        ranges.append([middle, end])
+
+    return sorted(ranges)
+
+
+class BatchProgress:
+    """
+    Track the progress of the workers of `run_batches`, and checkpoint it to an
+    Airflow variable.
+
+    The checkpoint holds the range of row_ids that each worker has left to update.
+    A range is only advanced, and the checkpoint saved, once its batch has been
+    committed, so a retry never skips any rows and only repeats a batch if the task
+    was stopped between its commit and the checkpoint.
+    """
+
+    def __init__(self, variable: str, ranges: list[list[int]], total_row_count: int):
+        self.variable = variable
+        self.ranges = ranges
+        self.total_row_count = total_row_count
+        self.affected_count = 0
+        self.stopped = threading.Event()
+        self._initial_remaining = self.remaining
+        self._lock = threading.Lock()
+        self._started = self._last_logged = time.monotonic()
+
+    @property
+    def remaining(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+    def advance(self, worker: int, batch_end: int, count: int):
+        """Record that a worker has committed the batch ending at `batch_end`."""
+        with self._lock:
+            self.ranges[worker][0] = batch_end
+            self.affected_count += count
+            self.checkpoint()
+            now = time.monotonic()
+            if (
+                now - self._last_logged
+                < constants.PROGRESS_LOG_INTERVAL.total_seconds()
+            ):
+                return
+            self._last_logged = now
+            self.log_progress()
+
+    def checkpoint(self):
+        Variable.set(self.variable, self.ranges, serialize_json=True)
+
+    def log_progress(self):
+        remaining = self.remaining
+        processed = self._initial_remaining - remaining
+        rate = processed / max(time.monotonic() - self._started, 1e-9)
+        eta = timedelta(seconds=round(remaining / rate)) if rate else "unknown"
+        percent_complete = (1 - remaining / self.total_row_count) * 100
+        logger.info(
+            f"{self.affected_count:,} rows affected. {percent_complete:.2f}% complete,"
+            f" {rate:,.0f} rows per second, ETA {eta}."
+        )
+
+
+def _run_range(
+    worker: int,
+    progress: BatchProgress,
+    batch_size: int,
+    target_batch_duration: int | None,
+    run_batch: callable,
+):
+    batch_start, range_end = progress.ranges[worker]
+    while batch_start < range_end and not progress.stopped.is_set():
+        batch_end = min(batch_start + batch_size, range_end)
+        logger.info(f"Running batch of row_ids {batch_start:,} through {batch_end:,}.")
+
+        started = time.monotonic()
+        count = run_batch(batch_start, batch_end)
+        progress.advance(worker, batch_end, count)
+
+        batch_size = get_next_batch_size(
+            batch_size, time.monotonic() - started, target_batch_duration
+        )
+        batch_start = batch_end
+
+
+def run_batches(
+    total_row_count: int,
+    batch_size: int,
+    checkpoint_var: str,
+    run_batch: callable,
+    workers: int = 1,
+    target_batch_duration: int | None = None,
+) -> int:
+    """
+    Run `run_batch(batch_start, batch_end)` over the `(batch_start, batch_end]`
+    row_id ranges of a row-numbered temp table, with `workers` batches running in
+    parallel on disjoint ranges of row_ids. When `target_batch_duration` is given,
+    each worker tunes its batch size so that its batches take about that many
+    seconds.
+
+    Progress is checkpointed to the `checkpoint_var` Airflow variable, from which
+    it is resumed. Returns the sum of the counts returned by `run_batch`.
+    """
+    # When the task run starts, we resume from the ranges saved in the variable
+    # (defaulted to starting at 0). This prevents the task from starting over at the
+    # beginning on retries.
+    checkpoint = Variable.get(checkpoint_var, 0, deserialize_json=True)
+    ranges = get_remaining_ranges(checkpoint, total_row_count, workers)
+    if not ranges:
+        logger.info("All rows have already been processed.")
+        return 0
+    logger.info(
+        f"Processing {sum(end - start for start, end in ranges):,} rows in"
+        f" {len(ranges)} parallel ranges."
+    )
+
+    progress = BatchProgress(checkpoint_var, ranges, total_row_count)
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(
+                    _run_range,
+                    worker,
+                    progress,
+                    batch_size,
+                    target_batch_duration,
+                    run_batch,
+                )
+                for worker in range(len(ranges))
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Let the other workers commit the batch they are running, then stop
+                progress.stopped.set()
+                raise
+    finally:
+        # The workers have all stopped, so this records exactly the committed batches
+        progress.checkpoint()
+
+    progress.log_progress()
+    return progress.affected_count
+
+
 @task
 def update_batches(
     total_row_count: int,
@@ -93,31 +277,27 @@ def update_batches(
     additional_where: str,
     update_timeout: int,
     batch_start_var: str,
+    update_workers: int = 1,
+    target_batch_duration: int | None = None,
     postgres_conn_id: str = POSTGRES_CONN_ID,
     task: AbstractOperator = None,
     **kwargs,
 ):
+    """Update the rows of the temp table in batches, see `run_batches`."""
     if total_row_count == 0:
         return 0
 
-    # Progress is tracked in an Airflow variable. When the task run starts, we resume
-    # from the start point set by this variable (defaulted to 0). This prevents the
-    # task from starting over at the beginning on retries.
-    initial_batch_start = Variable.get(batch_start_var, 0, deserialize_json=True)
-    logger.info(f"Starting at {initial_batch_start:,}")
-
-    updated_count = 0
-    batch_start = initial_batch_start
-    while batch_start <= total_row_count:
-        batch_end = batch_start + batch_size
+    logged_sql = threading.Event()
 
-        logger.info(f"Updating rows with id {batch_start:,} through {batch_end:,}.")
-        count = run_sql.function(
+    def update_batch(batch_start: int, batch_end: int) -> int:
+        # Only log the query the first time, so as not to spam the logs
+        log_sql = not logged_sql.is_set()
+        logged_sql.set()
+        return run_sql.function(
             dry_run=dry_run,
             sql_template=constants.UPDATE_BATCH_QUERY,
             query_id=query_id,
-            # Only log the query the first time, so as not to spam the logs
-            log_sql=batch_start == initial_batch_start,
+            log_sql=log_sql,
             postgres_conn_id=postgres_conn_id,
             task=task,
             timeout=update_timeout,
@@ -128,18 +308,16 @@ def update_batches(
             batch_end=batch_end,
         )
 
-        updated_count += count
-        batch_start = batch_end
-
-        # Update the Airflow variable to the next value of batch_start.
-        Variable.set(batch_start_var, batch_end)
-
-        percent_complete = (min(batch_end, total_row_count) / total_row_count) * 100
-        logger.info(
-            f"Updated {updated_count:,} rows. {percent_complete:.2f}% complete."
-        )
-
-    return updated_count
+    # Progress is tracked in an Airflow variable, so that retries resume from where
+    # the previous attempt left off.
+    return run_batches(
+        total_row_count,
+        batch_size,
+        batch_start_var,
+        update_batch,
+        workers=update_workers,
+        target_batch_duration=target_batch_duration,
+    )
 
 
 @task
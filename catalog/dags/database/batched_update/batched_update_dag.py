@@ -29,7 +29,13 @@ Optional params:
 
 * additional_where: a SQL `WHERE` clause to be appended to the `UPDATE`
 * dry_run: bool, whether to actually run the generated SQL. True by default.
-* batch_size: int number of records to process in each batch. By default, 10_000
+* batch_size: int number of records to process per batch, or in the first batch of
+              each worker when `target_batch_duration` is set. By default, 10_000
+* update_workers: int number of batches to update in parallel, each on a separate
+                  range of rows. By default, 1
+* target_batch_duration: int number of seconds each batch should take. The batch
+                         size is tuned towards it after each batch. By default,
+                         null, and every batch has `batch_size` rows
 * update_timeout: int number of seconds to run an individual batch update before timing
                   out. By default, 3600 (or one hour)
 * resume_update: boolean indicating whether to attempt to resume an update using an
@@ -53,9 +59,11 @@ null would look like this:
 ## Automatic Failure Recovery
 
 The `update_batches` task automatically keeps track of its progress in an Airflow
-variable suffixed with the `query_id`. If the task fails, when it retries it will
-pick up from where it left off. The DAG can still fail if the configured number of
-retries are exceeded.
+variable suffixed with the `query_id`. The variable holds the range of rows each
+worker has left to update, and is saved every minute and when the task stops. If the
+task fails, when it retries it will pick up from where it left off, possibly
+updating the rows of the last minute again. The DAG can still fail if the
+configured number of retries are exceeded.
 
 ## Manual Recovery
 
@@ -72,7 +80,8 @@ table matching the `query_id`. This option should only be used when the DagRun
 configuration needs to be changed after the table was already created:
 for example, if there was a problem with the `update_query` which caused DAG
 failures during the `update_batches` step. In this case, verify that the `BATCH_START`
-var is set appropriately for your needs.
+var is set appropriately for your needs: it may be set either to the row_id from
+which to start, or to a list of `[start, end]` row_id ranges.
 """
 
 import logging
@@ -152,6 +161,21 @@ DAG_CONFIG = dict(
             type="integer",
             description=("The number of records to update per batch."),
         ),
+        "update_workers": Param(
+            default=constants.DEFAULT_UPDATE_WORKERS,
+            type="integer",
+            minimum=1,
+            description="The number of batches to update in parallel.",
+        ),
+        "target_batch_duration": Param(
+            default=constants.DEFAULT_TARGET_BATCH_DURATION,
+            type=["null", "integer"],
+            description=(
+                "The number of seconds each batch should take to update. The batch"
+                " size is adjusted after each batch to approach it. When null, every"
+                " batch has `batch_size` records."
+            ),
+        ),
         "update_timeout": Param(
             default=constants.DEFAULT_UPDATE_BATCH_TIMEOUT,
             type="integer",
@@ -228,6 +252,8 @@ def batched_update():
     )(
         total_row_count=expected_count,
         batch_size="{{ params.batch_size }}",
+        update_workers="{{ params.update_workers }}",
+        target_batch_duration="{{ params.target_batch_duration }}",
         batch_start_var=BATCH_START_VAR,
         dry_run="{{ params.dry_run }}",
         table_name="{{ params.table_name }}",
@@ -8,6 +8,14 @@ SLACK_USERNAME = "Upstream Batched Update"
 SLACK_ICON = ":database:"
 
 DEFAULT_BATCH_SIZE = 10_000
+MAX_BATCH_SIZE = 500_000
+# The number of batches which are updated in parallel, on disjoint row_id ranges
+DEFAULT_UPDATE_WORKERS = 1
+# When set, the batch size is tuned so that each batch takes about this many seconds,
+# and the configured batch size is only used for the first batch of each worker
+DEFAULT_TARGET_BATCH_DURATION = None
+# How often the throughput and ETA of the update are logged
+PROGRESS_LOG_INTERVAL = timedelta(minutes=1)
 SELECT_TIMEOUT = timedelta(hours=24)
 UPDATE_TIMEOUT = timedelta(days=30)  # 1 month
 DAGRUN_TIMEOUT = UPDATE_TIMEOUT + SELECT_TIMEOUT
@@ -7,17 +7,39 @@ SLACK_ICON = ":database:"
 START_DATE = datetime(2023, 10, 25)
 DAGRUN_TIMEOUT = timedelta(days=31 * 3)
 CREATE_TIMEOUT = timedelta(hours=6)
-DELETE_TIMEOUT = timedelta(hours=1)
+DELETE_TIMEOUT = timedelta(days=30)
+# Timeout for deleting an individual batch
+DELETE_BATCH_TIMEOUT = timedelta(hours=1)
 
-CREATE_RECORDS_QUERY = """
-    INSERT INTO {destination_table} ({destination_cols})
-    SELECT {source_cols}
-    FROM {source_table}
-    {select_query}
-    ON CONFLICT {unique_cols}
-    DO NOTHING
+DEFAULT_BATCH_SIZE = 10_000
+# The batch size is tuned so that each batch takes about this many seconds
+DEFAULT_TARGET_BATCH_DURATION = 30
+
+TEMP_TABLE_NAME = "{table}_rows_to_delete_{ts_nodash}"
+CREATE_TEMP_TABLE_QUERY = """
+    CREATE TABLE IF NOT EXISTS {temp_table} AS
+    SELECT ROW_NUMBER() OVER() row_id, identifier
+    FROM {table}
+    {select_query};
+    CREATE INDEX IF NOT EXISTS {temp_table}_row_id_idx ON {temp_table}(row_id);
+    SELECT COUNT(*) FROM {temp_table};
     """
-DELETE_RECORDS_QUERY = """
+# The records of a batch are copied into the Deleted Media table and deleted from the
+# media table in a single statement, so that a batch is either entirely moved or not
+# at all.
+DELETE_BATCH_QUERY = """
+    WITH batch AS (
+        SELECT identifier FROM {temp_table}
+        WHERE row_id > {batch_start} AND row_id <= {batch_end}
+    ), created AS (
+        INSERT INTO {destination_table} ({destination_cols})
+        SELECT {source_cols}
+        FROM {table}
+        WHERE identifier IN (SELECT identifier FROM batch)
+        ON CONFLICT {unique_cols}
+        DO NOTHING
+    )
     DELETE FROM {table}
-    {select_query}
+    WHERE identifier IN (SELECT identifier FROM batch);
     """
+DROP_TEMP_TABLE_QUERY = "DROP TABLE IF EXISTS {temp_table};"
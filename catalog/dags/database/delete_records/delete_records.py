@@ -3,15 +3,20 @@ from datetime import timedelta
 
 from airflow.decorators import task
 from airflow.models.abstractoperator import AbstractOperator
+from airflow.models.xcom_arg import XComArg
 
 from common import slack
 from common.constants import POSTGRES_CONN_ID
-from common.sql import RETURN_ROW_COUNT, PostgresHook
+from common.sql import RETURN_ROW_COUNT, PostgresHook, single_value
 from common.storage.columns import DELETED_ON, FOREIGN_ID, PROVIDER, Column
 from common.storage.db_columns import (
     setup_db_columns_for_media_type,
     setup_deleted_db_columns_for_media_type,
 )
+from database.batched_update.batched_update import (
+    drop_temp_airflow_variable,
+    run_batches,
+)
 from database.delete_records import constants
 
 
@@ -38,24 +43,55 @@ def run_sql(
     return postgres.run(query, handler=handler)
 
 
+@task
+def select_rows_to_delete(
+    table: str,
+    select_query: str,
+    temp_table: str,
+    postgres_conn_id: str = POSTGRES_CONN_ID,
+    task: AbstractOperator = None,
+) -> int:
+    """
+    Materialize the identifiers of the records matching the select_query into a
+    row-numbered temp table, from which they are deleted in batches. If the temp
+    table already exists, because the task is being rerun, it is reused so that the
+    progress of the deletion still applies to it.
+    """
+    return run_sql(
+        sql_template=constants.CREATE_TEMP_TABLE_QUERY,
+        postgres_conn_id=postgres_conn_id,
+        task=task,
+        handler=single_value,
+        temp_table=temp_table,
+        table=table,
+        select_query=select_query,
+    )
+
+
 @task
 @setup_deleted_db_columns_for_media_type
 @setup_db_columns_for_media_type
-def create_deleted_records(
+def delete_batches(
     *,
-    select_query: str,
+    total_row_count: int,
+    temp_table: str,
     deleted_reason: str,
     media_type: str,
+    progress_var: str,
+    batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    target_batch_duration: int | None = constants.DEFAULT_TARGET_BATCH_DURATION,
     db_columns: list[Column] = None,
     deleted_db_columns: list[Column] = None,
-    task: AbstractOperator = None,
     postgres_conn_id: str = POSTGRES_CONN_ID,
 ):
     """
-    Select records from the given media table using the select query, and then for each
-    record create a corresponding record in the Deleted Media table.
-    """
+    For each batch of records in the temp table, create a corresponding record in the
+    Deleted Media table and delete the record from the given media table.
 
+    Batches are sized to take about `target_batch_duration` seconds, and progress is
+    tracked in the `progress_var` Airflow variable so that a rerun of the task resumes
+    from the last committed batches. Returns the number of deleted records.
+    """
     destination_cols = ", ".join([col.db_name for col in deleted_db_columns])
 
     # To build the source columns, we first list all columns in the main media table
@@ -74,30 +110,87 @@ def create_deleted_records(
     # record exactly as it was when it was first deleted.
     unique_cols = f"({PROVIDER.db_name}, md5({FOREIGN_ID.db_name}))"
 
-    return run_sql(
-        sql_template=constants.CREATE_RECORDS_QUERY,
-        postgres_conn_id=postgres_conn_id,
-        task=task,
-        destination_table=f"deleted_{media_type}",
-        destination_cols=destination_cols,
-        source_table=media_type,
-        source_cols=source_cols,
-        select_query=select_query,
-        unique_cols=unique_cols,
+    def delete_batch(batch_start: int, batch_end: int) -> int:
+        return run_sql(
+            sql_template=constants.DELETE_BATCH_QUERY,
+            postgres_conn_id=postgres_conn_id,
+            timeout=constants.DELETE_BATCH_TIMEOUT.total_seconds(),
+            temp_table=temp_table,
+            destination_table=f"deleted_{media_type}",
+            destination_cols=destination_cols,
+            table=media_type,
+            source_cols=source_cols,
+            unique_cols=unique_cols,
+            batch_start=batch_start,
+            batch_end=batch_end,
+        )
+
+    return run_batches(
+        total_row_count,
+        batch_size,
+        progress_var,
+        delete_batch,
+        target_batch_duration=target_batch_duration,
     )
 
 
 @task
-def delete_records_from_media_table(
-    table: str, select_query: str, postgres_conn_id: str = POSTGRES_CONN_ID
-):
-    """Delete records matching the select_query from the given media table."""
+def drop_temp_table(temp_table: str, postgres_conn_id: str = POSTGRES_CONN_ID):
     return run_sql(
-        sql_template=constants.DELETE_RECORDS_QUERY,
-        table=table,
-        select_query=select_query,
+        sql_template=constants.DROP_TEMP_TABLE_QUERY,
+        postgres_conn_id=postgres_conn_id,
+        timeout=60,
+        temp_table=temp_table,
+    )
+
+
+def create_delete_records_tasks(
+    table: str,
+    select_query: str,
+    deleted_reason: str,
+    batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    select_timeout: timedelta = constants.CREATE_TIMEOUT,
+    delete_timeout: timedelta = constants.DELETE_TIMEOUT,
+) -> XComArg:
+    """
+    Create the tasks which delete the records of the given media table matching the
+    select_query in batches, after creating a corresponding record in the Deleted
+    Media table for each of them. The temp table and Airflow variable used by the
+    deletion are unique to the DagRun, and are dropped once all records are deleted.
+
+    Returns the output of the task which deletes the records, which is the number of
+    deleted records.
+    """
+    temp_table = constants.TEMP_TABLE_NAME.format(
+        table=table, ts_nodash="{{ ts_nodash }}"
+    )
+    progress_var = f"{temp_table}_progress"
+
+    # Select the records to delete into a temp table
+    select_rows = select_rows_to_delete.override(execution_timeout=select_timeout)(
+        table=table, select_query=select_query, temp_table=temp_table
+    )
+
+    # Create the records in the Deleted Media table and delete them from the media
+    # table, in batches
+    delete_records = delete_batches.override(execution_timeout=delete_timeout)(
+        total_row_count=select_rows,
+        temp_table=temp_table,
+        deleted_reason=deleted_reason,
+        media_type=table,
+        progress_var=progress_var,
+        batch_size=batch_size,
     )
 
+    # Clean up only once all records are deleted, so that clearing a failed
+    # `delete_batches` task resumes the deletion
+    delete_records >> [
+        drop_temp_table(temp_table),
+        drop_temp_airflow_variable(airflow_var=progress_var),
+    ]
+
+    return delete_records
+
 
 @task
 def notify_slack(deleted_records_count: int, table_name: str, select_query: str) -> str:
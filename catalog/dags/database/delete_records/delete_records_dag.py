@@ -12,6 +12,11 @@ Required Dagrun Configuration parameters:
 * select_query: a SQL `WHERE` clause used to select the rows that will be deleted
 * reason:       a string explaining the reason for deleting the records. Ex ('deadlink')
 
+Optional params:
+
+* batch_size: int number of records to delete in the first batch. The size of later
+              batches is tuned so that each takes about 30 seconds. By default, 10_000
+
 
 An example dag_run configuration used to delete all records for the "foo" image provider
 due to deadlinks would look like this:
@@ -24,6 +29,18 @@ due to deadlinks would look like this:
 }
 ```
 
+## Batched deletion
+
+The identifiers of the selected records are first saved to a row-numbered temp
+table. The records are then copied to the Deleted Media table and deleted from the
+media table in batches, each in a single transaction, so that locks are only held
+briefly and a failure only rolls back the current batch. Progress, throughput and an
+estimated time to completion are logged as the batches run.
+
+Progress is saved in an Airflow variable named after the temp table. If the
+`delete_batches` task fails, clearing it resumes the deletion from the last saved
+batch. The temp table and the variable are dropped once all records are deleted.
+
 ## Multiple deletions
 
 When a record is deleted, it is added to the corresponding Deleted Media table. If the
@@ -58,8 +75,7 @@ from airflow.models.param import Param
 from common.constants import AUDIO, DAG_DEFAULT_ARGS, MEDIA_TYPES
 from database.delete_records import constants
 from database.delete_records.delete_records import (
-    create_deleted_records,
-    delete_records_from_media_table,
+    create_delete_records_tasks,
     notify_slack,
 )
 
@@ -95,30 +111,27 @@ logger = logging.getLogger(__name__)
             type="string",
             description="Short descriptor of the reason for deleting the records.",
         ),
+        "batch_size": Param(
+            default=constants.DEFAULT_BATCH_SIZE,
+            type="integer",
+            minimum=1,
+            description="The number of records to delete in the first batch.",
+        ),
     },
 )
 def delete_records():
-    # Create the records in the Deleted Media table
-    insert_into_deleted_media_table = create_deleted_records.override(
-        task_id="update_deleted_media_table", execution_timeout=constants.CREATE_TIMEOUT
-    )(
+    delete_records = create_delete_records_tasks(
+        table="{{ params.table_name }}",
         select_query="{{ params.select_query }}",
         deleted_reason="{{ params.reason }}",
-        media_type="{{ params.table_name }}",
+        batch_size="{{ params.batch_size }}",
     )
 
-    # If successful, delete the records from the media table
-    delete_records = delete_records_from_media_table.override(
-        execution_timeout=constants.DELETE_TIMEOUT
-    )(table="{{ params.table_name }}", select_query="{{ params.select_query }}")
-
-    notify_complete = notify_slack(
+    notify_slack(
         deleted_records_count=delete_records,
         table_name="{{ params.table_name }}",
         select_query="{{ params.select_query }}",
     )
 
-    insert_into_deleted_media_table >> delete_records >> notify_complete
-
 
 delete_records()
@@ -32,12 +32,15 @@ def create_and_populate_filtered_index(
     data_refresh: DataRefresh,
     origin_index_suffix: str | None,
     destination_index_suffix: str | None,
+    recheck_sensitive_terms: bool | str = False,
 ):
     create_payload = {}
     if origin_index_suffix:
         create_payload["origin_index_suffix"] = origin_index_suffix
     if destination_index_suffix:
         create_payload["destination_index_suffix"] = destination_index_suffix
+    if recheck_sensitive_terms:
+        create_payload["recheck_sensitive_terms"] = recheck_sensitive_terms
 
     return ingestion_server.trigger_and_wait_for_task(
         action="CREATE_AND_POPULATE_FILTERED_INDEX",
@@ -69,10 +72,15 @@ def create_filtered_index_creation_task_groups(
     data_refresh: DataRefresh,
     origin_index_suffix: str | None,
     destination_index_suffix: str | None,
+    recheck_sensitive_terms: bool | str = False,
 ) -> tuple[TaskGroup, TaskGroup]:
     """
     Create the TaskGroups that performs filtered index creation and promotion for
     the given DataRefresh.
+
+    By default, the ingestion server filters on the `sensitive_text` flag set on
+    documents when the origin index was created. `recheck_sensitive_terms` makes it
+    match the current sensitive terms instead.
     """
     media_type = data_refresh.media_type
     target_alias = f"{media_type}-filtered"
@@ -106,6 +114,7 @@ def create_filtered_index_creation_task_groups(
             data_refresh=data_refresh,
             origin_index_suffix=origin_index_suffix,
             destination_index_suffix=final_destination_index_suffix,
+            recheck_sensitive_terms=recheck_sensitive_terms,
         )
 
         get_current_index_if_exists >> continue_if_no_current_index >> do_create
@@ -27,6 +27,11 @@ manually. This is primarily useful in two cases: for testing changes to the filt
 index creation; and for re-running filtered index creation if an urgent change to the
 sensitive terms calls for an immediate recreation of the filtered indexes.
 
+Documents are flagged as containing sensitive text when they are indexed by the
+data refresh. Because that flag reflects the sensitive terms at the time of the
+last data refresh, these DAGs default to the `recheck_sensitive_terms` param,
+which matches the current sensitive terms instead.
+
 ## Race conditions
 
 Because filtered index creation employs the ``reindex`` Elasticsearch API
@@ -113,6 +118,15 @@ def create_filtered_index_creation_dag(data_refresh: DataRefresh):
                     "will fail."
                 ),
             ),
+            "recheck_sensitive_terms": Param(
+                default=True,
+                type="boolean",
+                description=(
+                    "Whether to filter documents using the current sensitive terms "
+                    "rather than the `sensitive_text` flag set when the origin index "
+                    "was created. Disable to reuse the flag, e.g. when testing."
+                ),
+            ),
         },
         render_template_as_native_obj=True,
     ) as dag:
@@ -132,6 +146,7 @@ def create_filtered_index_creation_dag(data_refresh: DataRefresh):
             data_refresh,
             "{{ params.origin_index_suffix }}",
             "{{ params.destination_index_suffix }}",
+            "{{ params.recheck_sensitive_terms }}",
         )
 
         prevent_concurrency >> create_filtered_index >> promote_filtered_index
@@ -0,0 +1,131 @@
+"""
+# Warm TLS support store
+
+Probe the domains of existing media URLs for TLS support and record the results in the
+TLS support store (see `common.tls_support`).
+
+URL validation during ingestion consults the store before probing a domain with a live
+HTTPS request. This DAG samples the `url` and `foreign_landing_url` of each media table,
+finds the domains which have no fresh result in the store, and probes them concurrently,
+so that ingestion rarely needs to probe domains itself.
+
+The DAG is skipped unless the store is configured with the `TLS_SUPPORT_CONN_ID`
+environment variable. It runs weekly, and results expire after `TLS_SUPPORT_TTL_DAYS`
+days.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from textwrap import dedent
+
+from airflow.decorators import dag, task
+from airflow.exceptions import AirflowSkipException
+from airflow.models.param import Param
+
+from common import tls_support, urls
+from common.constants import DAG_DEFAULT_ARGS, MEDIA_TYPES, POSTGRES_CONN_ID
+from common.sql import PostgresHook, fetch_all
+
+
+logger = logging.getLogger(__name__)
+
+
+DAG_ID = "warm_tls_support_store"
+
+SELECT_HOSTS_QUERY = dedent("""
+    SELECT DISTINCT substring(lower({column}) FROM '^(?:[a-z]+:)?/*([^/?#]+)')
+    FROM {media_type} TABLESAMPLE SYSTEM ({sample_percent});
+""")
+
+
+@task
+def create_tls_support_table():
+    store = tls_support.get_default_store()
+    if store is None:
+        raise AirflowSkipException("The TLS support store is not configured.")
+    store.create_table()
+
+
+@task
+def warm_tls_support_store(
+    media_type: str,
+    sample_percent: float,
+    concurrency: int,
+    postgres_conn_id: str = POSTGRES_CONN_ID,
+    task=None,
+) -> dict[str, int]:
+    store = tls_support.get_default_store()
+    postgres = PostgresHook(
+        postgres_conn_id=postgres_conn_id,
+        default_statement_timeout=PostgresHook.get_execution_timeout(task),
+    )
+
+    domains = set()
+    for column in ["url", "foreign_landing_url"]:
+        hosts = postgres.run(
+            SELECT_HOSTS_QUERY.format(
+                column=column, media_type=media_type, sample_percent=sample_percent
+            ),
+            handler=fetch_all,
+        )
+        domains.update(urls.get_domain_key(host) for host in hosts if host)
+    domains.discard("")
+
+    stale_domains = domains - store.get(domains).keys()
+    logger.info(
+        f"Found {len(domains)} domains in sampled {media_type} records,"
+        f" {len(stale_domains)} of which need to be probed."
+    )
+    results = tls_support.probe_tls_support(stale_domains, concurrency=concurrency)
+    store.set(results)
+
+    supported = sum(results.values())
+    logger.info(
+        f"Probed {len(results)} domains: {supported} support TLS,"
+        f" {len(results) - supported} do not."
+    )
+    return {"domains": len(domains), "probed": len(results), "supported": supported}
+
+
+@dag(
+    dag_id=DAG_ID,
+    schedule="@weekly",
+    start_date=datetime(2025, 1, 1),
+    catchup=False,
+    max_active_runs=1,
+    tags=["maintenance"],
+    doc_md=__doc__,
+    default_args={
+        **DAG_DEFAULT_ARGS,
+        "execution_timeout": timedelta(hours=2),
+    },
+    render_template_as_native_obj=True,
+    params={
+        "sample_percent": Param(
+            default=1.0,
+            type="number",
+            minimum=0,
+            maximum=100,
+            description="The percentage of each media table to sample for domains.",
+        ),
+        "concurrency": Param(
+            default=tls_support.PROBE_CONCURRENCY,
+            type="integer",
+            minimum=1,
+            description="The maximum number of domains to probe at the same time.",
+        ),
+    },
+)
+def warm_tls_support_store_dag():
+    create_table = create_tls_support_table()
+
+    for media_type in MEDIA_TYPES:
+        warm = warm_tls_support_store.override(task_id=f"warm_{media_type}_domains")(
+            media_type=media_type,
+            sample_percent="{{ params.sample_percent }}",
+            concurrency="{{ params.concurrency }}",
+        )
+        create_table >> warm
+
+
+warm_tls_support_store_dag()
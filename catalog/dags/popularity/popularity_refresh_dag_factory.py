@@ -15,6 +15,15 @@ records, using the new constant. When the updates are complete, all records have
 up-to-date popularity data. This DAG can be run concurrently with data refreshes
 and regular ingestion.
 
+Providers whose constant has changed by less than the `constant_change_threshold`
+of the popularity refresh (1% by default) since their scores were last refreshed
+are skipped, since their scores would barely change. Records which were updated
+after the constants were calculated are also skipped, since their score was
+calculated with the new constant when they were ingested. The constants used for
+each provider's last refresh are kept in the
+`{media_type}_popularity_refresh_refreshed_constants` Airflow variable; deleting it
+forces every provider to be refreshed.
+
 
 You can find more background information on this process in the following
 implementation plan:
@@ -29,6 +38,7 @@ from datetime import datetime
 from airflow import DAG
 from airflow.decorators import task
 from airflow.operators.trigger_dagrun import TriggerDagRunOperator
+from airflow.utils.trigger_rule import TriggerRule
 
 from common import slack
 from common.constants import DAG_DEFAULT_ARGS, POSTGRES_CONN_ID
@@ -164,7 +174,19 @@ def create_popularity_refresh_dag(popularity_refresh: PopularityRefresh):
             )
         )
 
-        notify_complete = slack.notify_slack(
+        # The refresh is skipped entirely when no provider's constant has changed
+        # significantly, in which case the constants are still recorded.
+        record_constants = sql.record_refreshed_constants.override(
+            trigger_rule=TriggerRule.NONE_FAILED
+        )(POSTGRES_CONN_ID, popularity_refresh)
+        record_constants.doc = (
+            "Record the constants used to refresh each provider's scores, to"
+            " compare the next constants against."
+        )
+
+        notify_complete = slack.notify_slack.override(
+            trigger_rule=TriggerRule.NONE_FAILED
+        )(
             text=(
                 f"{popularity_refresh.media_type.capitalize()} Popularity Refresh"
                 " Complete"
@@ -176,7 +198,8 @@ def create_popularity_refresh_dag(popularity_refresh: PopularityRefresh):
         # Set up task dependencies
         update_metrics >> [update_metrics_status, update_constants]
         update_constants >> [update_constants_status, get_cutoff_time]
-        get_cutoff_time >> refresh_popularity_scores >> notify_complete
+        get_cutoff_time >> refresh_popularity_scores >> record_constants
+        record_constants >> notify_complete
 
     return dag
 
@@ -47,6 +47,10 @@ class PopularityRefresh:
     poke_interval:                     int number of seconds to wait between
                                        checks to see if the batched updates have
                                        completed.
+    constant_change_threshold:         float giving the relative change in a
+                                       provider's popularity constant, since its
+                                       scores were last refreshed, below which its
+                                       scores are not refreshed.
     """
 
     dag_id: str = field(init=False)
@@ -59,10 +63,16 @@ class PopularityRefresh:
     refresh_popularity_batch_timeout: timedelta = timedelta(minutes=5)
     refresh_metrics_timeout: timedelta = timedelta(hours=1)
     poke_interval: int = REFRESH_POKE_INTERVAL
+    constant_change_threshold: float = 0.01
 
     def __post_init__(self):
         self.dag_id = f"{self.media_type}_popularity_refresh"
 
+    @property
+    def refreshed_constants_var(self) -> str:
+        """The Airflow variable holding the constants of the last refresh."""
+        return f"{self.dag_id}_refreshed_constants"
+
 
 POPULARITY_REFRESH_CONFIGS = [
     PopularityRefresh(
@@ -1,8 +1,10 @@
+import logging
 from collections import namedtuple
 from datetime import datetime, timedelta
 from textwrap import dedent
 
 from airflow.decorators import task, task_group
+from airflow.models import Variable
 from airflow.models.abstractoperator import AbstractOperator
 
 from common.constants import DAG_DEFAULT_ARGS, SQLInfo
@@ -12,6 +14,8 @@ from common.utils import setup_sql_info_for_media_type
 from popularity.popularity_refresh_types import PopularityRefresh
 
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_PERCENTILE = 0.85
 
 
@@ -308,6 +312,8 @@ def create_standardized_media_popularity_function(
 
 @setup_sql_info_for_media_type
 def format_update_standardized_popularity_query(
+    metric: str,
+    constant: float,
     *,
     media_type: str,
     sql_info: SQLInfo = None,
@@ -316,15 +322,66 @@ def format_update_standardized_popularity_query(
     Create a SQL query for updating the standardized popularity for the given
     media type. Only the `SET ...` portion of the query is returned, to be used
     by a `batched_update` DagRun.
+
+    The query computes the same score as the standardized popularity function, but
+    with the provider's metric and constant inlined so that the metrics table is not
+    looked up for every row.
     """
+    value = f"({sql_info.media_table}.{METADATA_COLUMN}->>'{metric}')::float"
     return (
         f"SET {col.UPDATED_ON.db_name} = NOW(),"
         f" {col.STANDARDIZED_POPULARITY.db_name} ="
-        f" {sql_info.standardized_popularity_fn}({sql_info.media_table}.{PARTITION},"
-        f" {sql_info.media_table}.{METADATA_COLUMN})"
+        f" {value} / ({value} + {constant})"
     )
 
 
+@setup_sql_info_for_media_type
+def get_popularity_constants(
+    postgres_conn_id: str, *, media_type: str, sql_info: SQLInfo = None
+) -> dict[str, tuple[str, float | None]]:
+    """Get the popularity metric and constant of each provider in the metrics table."""
+    postgres = PostgresHook(
+        postgres_conn_id=postgres_conn_id, default_statement_timeout=10.0
+    )
+    records = postgres.get_records(
+        f"SELECT {PARTITION}, {METRIC}, {CONSTANT} FROM public.{sql_info.metrics_table};"
+    )
+    return {provider: (metric, constant) for provider, metric, constant in records}
+
+
+def get_providers_to_refresh(
+    popularity_refresh: PopularityRefresh,
+    constants: dict[str, tuple[str, float | None]],
+    refreshed_constants: dict[str, float],
+) -> dict[str, tuple[str, float]]:
+    """
+    Get the metric and constant of the providers whose standardized popularity scores
+    need to be refreshed: those whose constant has changed by more than the
+    `constant_change_threshold` of the popularity refresh, relative to the constant
+    with which their scores were last refreshed. Providers without a constant have no
+    records with popularity data, and are skipped.
+    """
+    providers = {}
+    for provider in popularity_refresh.popularity_metrics:
+        metric, constant = constants.get(provider, (None, None))
+        if constant is None:
+            logger.info(f"Skipping {provider}, which has no popularity constant.")
+            continue
+        previous_constant = refreshed_constants.get(provider)
+        if (
+            previous_constant
+            and abs(constant - previous_constant) / previous_constant
+            < popularity_refresh.constant_change_threshold
+        ):
+            logger.info(
+                f"Skipping {provider}: its constant only changed from"
+                f" {previous_constant} to {constant}."
+            )
+            continue
+        providers[provider] = (metric, constant)
+    return providers
+
+
 @task
 def get_providers_update_confs(
     postgres_conn_id: str,
@@ -335,8 +392,21 @@ def get_providers_update_confs(
     Build a list of DagRun confs for each provider of this media type. The confs will
     be used by the `batched_update` DAG to perform a batched update of all existing
     records, to recalculate their standardized_popularity with the new popularity
-    constant. Providers that do not support popularity data are omitted.
+    constant. Providers that do not support popularity data, and providers whose
+    constant has barely changed since their scores were last refreshed, are omitted.
+
+    Records updated after `last_updated_time` are also omitted, since their score was
+    calculated with the new constant when they were ingested.
     """
+    providers = get_providers_to_refresh(
+        popularity_refresh,
+        get_popularity_constants(
+            postgres_conn_id, media_type=popularity_refresh.media_type
+        ),
+        Variable.get(
+            popularity_refresh.refreshed_constants_var, {}, deserialize_json=True
+        ),
+    )
 
     # For each provider, create a conf that will be used by the batched_update to
     # refresh standardized popularity scores.
@@ -354,7 +424,7 @@ def get_providers_update_confs(
             ),
             # Query used to update the standardized_popularity
             "update_query": format_update_standardized_popularity_query(
-                media_type=popularity_refresh.media_type
+                metric, constant, media_type=popularity_refresh.media_type
             ),
             "batch_size": 10_000,
             "update_timeout": (
@@ -363,5 +433,35 @@ def get_providers_update_confs(
             "dry_run": False,
             "resume_update": False,
         }
-        for provider in popularity_refresh.popularity_metrics.keys()
+        for provider, (metric, constant) in providers.items()
     ]
+
+
+@task
+def record_refreshed_constants(
+    postgres_conn_id: str, popularity_refresh: PopularityRefresh
+) -> dict[str, float]:
+    """
+    Record the constants with which the standardized popularity scores of each
+    provider were refreshed, so that the next refresh can skip the providers whose
+    constant has not changed significantly since.
+    """
+    refreshed_constants = Variable.get(
+        popularity_refresh.refreshed_constants_var, {}, deserialize_json=True
+    )
+    providers = get_providers_to_refresh(
+        popularity_refresh,
+        get_popularity_constants(
+            postgres_conn_id, media_type=popularity_refresh.media_type
+        ),
+        refreshed_constants,
+    )
+    refreshed_constants |= {
+        provider: constant for provider, (_, constant) in providers.items()
+    }
+    Variable.set(
+        popularity_refresh.refreshed_constants_var,
+        refreshed_constants,
+        serialize_json=True,
+    )
+    return refreshed_constants
@@ -20,10 +20,19 @@ def pull_media_wrapper(
     ti: TaskInstance,
     dag_run: DagRun,
     args: Sequence = None,
+    tsv_compression: str | None = None,
+    s3_bucket: str | None = None,
+    s3_prefixes: dict[MediaType, str] | None = None,
+    aws_conn_id: str | None = None,
+    s3_extra_args: dict | None = None,
 ):
     """
     Run the provided callable after pushing the output directories for each media
     store, which are generated when initializing the ingester class.
+
+    The media stores compress their output with `tsv_compression` if given. If
+    `s3_bucket` is given, each store streams its output directly to that bucket under
+    the prefix given for its media type in `s3_prefixes`.
     """
     args = args or []
     # Initialize the ProviderDataIngester class, which will initialize the
@@ -42,6 +51,14 @@ def pull_media_wrapper(
 
     # Push the media store output paths to XComs.
     for store in stores.values():
+        if tsv_compression or s3_bucket:
+            store.configure_output(
+                compression=tsv_compression,
+                s3_bucket=s3_bucket,
+                s3_prefix=(s3_prefixes or {}).get(store.media_type),
+                aws_conn_id=aws_conn_id,
+                s3_extra_args=s3_extra_args,
+            )
         logger.info(
             f"{store.media_type.capitalize()} store location: {store.output_path}"
         )
@@ -54,6 +71,10 @@ def pull_media_wrapper(
     try:
         data = ingester.ingest_records()
     finally:
+        # Complete the output of each store, so that everything ingested so far can
+        # be loaded even if ingestion failed.
+        for store in stores.values():
+            store.close()
         end_time = time.perf_counter()
         # Report duration
         duration = end_time - start_time
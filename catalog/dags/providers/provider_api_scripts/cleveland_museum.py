@@ -19,6 +19,10 @@ class ClevelandDataIngester(ProviderDataIngester):
     endpoint = "http://openaccess-api.clevelandart.org/api/artworks/"
     batch_limit = 1000
     delay = 5
+    # `skip` is incremented without looking at the response, so the next batch can be
+    # requested while the current one is processed. Only one request is ever in
+    # flight, and requests are still made at most once every `delay` seconds.
+    pipeline_batches = True
 
     def get_next_query_params(self, prev_query_params: dict | None):
         if not prev_query_params:
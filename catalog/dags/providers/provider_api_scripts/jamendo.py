@@ -28,10 +28,7 @@ from common import constants
 from common.licenses import get_license_info
 from common.loader import provider_details as prov
 from common.urls import rewrite_redirected_url
-from database.delete_records.delete_records import (
-    create_deleted_records,
-    delete_records_from_media_table,
-)
+from database.delete_records.delete_records import create_delete_records_tasks
 from providers.provider_api_scripts.provider_data_ingester import ProviderDataIngester
 
 
@@ -262,24 +259,16 @@ class JamendoDataIngester(ProviderDataIngester):
 
         @task_group(group_id="delete_records_with_downloads_disabled")
         def delete_download_disabled_records():
-            # Select all records with downloads disabled and copy them into
-            # the deleted_audio table
-            insert_into_deleted_media_table = create_deleted_records.override(
-                task_id="update_deleted_media_table",
-                execution_timeout=timedelta(hours=1),
-            )(
+            # Copy all records with downloads disabled into the deleted_audio table
+            # and delete them from the audio table, in batches
+            create_delete_records_tasks(
+                table=constants.AUDIO,
                 select_query=select_query,
                 deleted_reason="download_disabled",
-                media_type=constants.AUDIO,
+                select_timeout=timedelta(hours=1),
+                delete_timeout=timedelta(hours=1),
             )
 
-            # If successful, delete the records from the audio table
-            delete_records = delete_records_from_media_table.override(
-                execution_timeout=timedelta(hours=1)
-            )(table=constants.AUDIO, select_query=select_query)
-
-            insert_into_deleted_media_table >> delete_records
-
         return delete_download_disabled_records()
 
 
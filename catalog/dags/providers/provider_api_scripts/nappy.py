@@ -26,6 +26,11 @@ class NappyDataIngester(ProviderDataIngester):
     providers = {constants.IMAGE: prov.NAPPY_DEFAULT_PROVIDER}
     endpoint = "https://api.nappy.co/v1/openverse/images"
     headers = {"Accept": "application/json"}
+    # The API was written for Openverse and has no known rate limits. Pages are
+    # requested by number, so they can be requested ahead of the page being
+    # processed, still at no more than one request per `delay` seconds on average.
+    prefetch_batches = 2
+    max_concurrent_requests = 2
 
     # Hardcoded to CC0, the only license Nappy.co uses
     license_info = LicenseInfo(
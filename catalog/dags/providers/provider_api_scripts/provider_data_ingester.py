@@ -2,6 +2,8 @@ import json
 import logging
 import traceback
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import TypedDict
 
@@ -9,7 +11,7 @@ from airflow.exceptions import AirflowException
 from airflow.models import Variable
 
 from common.loader import provider_details as prov
-from common.requester import DelayedRequester
+from common.requester import ConcurrentDelayedRequester, DelayedRequester
 from common.storage.media import MediaStore
 from common.storage.util import get_media_store_class
 
@@ -78,12 +80,39 @@ class ProviderDataIngester(ABC):
     batch_limit: integer giving the number of records to get in each batch
     retries:     integer number of times to retry the request on error
     headers:     dictionary to be passed as headers to the request
+
+    Optionally, batches can be requested concurrently and ahead of the batch being
+    processed. This is only possible for APIs whose next query params can be computed
+    from the previous query params alone (for example an incremented `offset` or
+    `page`), rather than from the previous response, and requires `get_batch` to be
+    safe to call from several threads at once. Batches are still processed in order.
+
+    prefetch_batches:        integer number of batches to request ahead of the
+                             batch being processed; 0 disables prefetching
+    max_concurrent_requests: integer maximum number of requests in flight at once
+                             when prefetching
+    requests_per_second:     maximum average rate of requests when prefetching,
+                             which replaces `delay`; defaults to one request per
+                             `delay` seconds
+
+    APIs whose next query params depend on the previous response (for example a
+    cursor) cannot be prefetched, but the next batch can still be requested while
+    the current batch is processed, as soon as its query params are known.
+
+    pipeline_batches:        boolean indicating whether to request the next batch in
+                             the background while processing the current batch.
+                             This requires `get_next_query_params` to depend only
+                             on state set by `get_batch`, and not by `process_batch`.
     """
 
     delay = 1
     retries = 3
     batch_limit = 100
     headers: dict = {}
+    prefetch_batches = 0
+    max_concurrent_requests = 1
+    requests_per_second: float | None = None
+    pipeline_batches = False
 
     @property
     @abstractmethod
@@ -150,9 +179,17 @@ class ProviderDataIngester(ABC):
         self.headers = {"User-Agent": prov.UA_STRING} | self.headers
 
         # Initialize the DelayedRequester and all necessary Media Stores.
-        self.delayed_requester = DelayedRequester(
-            delay=self.delay, headers=self.headers
-        )
+        if self.prefetch_batches:
+            self.delayed_requester = ConcurrentDelayedRequester(
+                requests_per_second=self.requests_per_second
+                or (1 / self.delay if self.delay else None),
+                max_concurrent_requests=self.max_concurrent_requests,
+                headers=self.headers,
+            )
+        else:
+            self.delayed_requester = DelayedRequester(
+                delay=self.delay, headers=self.headers
+            )
         self.media_stores = self._init_media_stores(day_shift)
         self.date = date
         self.dag_id = dag_id or ""
@@ -230,7 +267,6 @@ class ProviderDataIngester(ABC):
                                  `get_next_query_params`. These should not change during this
                                  round of ingestion.
         """
-        should_continue = True
         # Use initial_query_params if provided, or get the next set of params.
         query_params = initial_query_params or self._get_query_params(
             None, fixed_query_params
@@ -249,6 +285,22 @@ class ProviderDataIngester(ABC):
 
         logger.info(f"Begin ingestion for {self.__class__.__name__}")
 
+        if self.prefetch_batches:
+            self._ingest_prefetched_batches(query_params, fixed_query_params)
+        elif self.pipeline_batches:
+            self._ingest_pipelined_batches(query_params, fixed_query_params)
+        else:
+            self._ingest_batches(query_params, fixed_query_params)
+
+        # Commit whatever records we were able to process
+        self._commit_records()
+
+    def _ingest_batches(
+        self, query_params: dict | None, fixed_query_params: dict | None
+    ) -> None:
+        """Request and process one batch at a time, starting from `query_params`."""
+        should_continue = True
+
         while should_continue:
             self._verbose_log(f"Next set of query params: {query_params}")
 
@@ -259,59 +311,178 @@ class ProviderDataIngester(ABC):
 
             try:
                 batch, should_continue = self.get_batch(query_params)
-
-                if batch and len(batch) > 0:
-                    self.record_count += self.process_batch(batch)
-                    logger.info(f"{self.record_count} records ingested so far.")
-                else:
-                    logger.info("Batch complete.")
-                    should_continue = False
-
-            except AirflowException as error:
-                # AirflowExceptions should not be caught or reraised as IngestionErrors,
-                # as execution should not continue when the task is being stopped by
-                # Airflow. However, we should still log the last query_params to be
-                # hit before the error was raised.
-                logger.info(
-                    f"Last query_params used: {json.dumps(query_params, default=str)}"
-                )
-
-                # If errors have already been caught during processing, raise them
-                # as well.
-                if error_summary := self._get_ingestion_errors():
-                    raise error_summary from error
-                raise
-
+                should_continue = self._process_fetched_batch(batch, should_continue)
             except Exception as error:
-                ingestion_error = IngestionError(
-                    error, traceback.format_exc(), query_params
-                )
+                self._handle_ingestion_error(error, query_params)
+                # The error was skipped, so continue from the next batch
+                query_params = self._get_query_params(query_params, fixed_query_params)
+                continue
+
+            # Get next query params
+            query_params = self._get_query_params(query_params, fixed_query_params)
 
-                if self._should_skip_ingestion_error(error):
-                    # Add this to the errors list but continue processing
-                    self.ingestion_errors.append(ingestion_error)
-                    logger.error(f"Skipping batch due to ingestion error: {error}")
+    def _ingest_prefetched_batches(
+        self, query_params: dict | None, fixed_query_params: dict | None
+    ) -> None:
+        """
+        Request up to `prefetch_batches` batches ahead of the batch being processed,
+        starting from `query_params`.
 
-                    # Continue from the next batch
+        Batches are requested in a thread pool of `max_concurrent_requests` threads,
+        but are processed in order, and errors are handled exactly as when batches
+        are requested one at a time. Once ingestion stops, batches which have not
+        been requested yet are cancelled, and those already requested are discarded.
+        """
+        pending: deque[tuple[dict, Future]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests,
+            thread_name_prefix=f"{self.__class__.__name__}_requests",
+        )
+        try:
+            while True:
+                while (
+                    query_params is not None and len(pending) <= self.prefetch_batches
+                ):
+                    self._verbose_log(f"Next set of query params: {query_params}")
+                    pending.append(
+                        (query_params, executor.submit(self.get_batch, query_params))
+                    )
                     query_params = self._get_query_params(
                         query_params, fixed_query_params
                     )
+
+                if not pending:
+                    # This can happen when the final `override_query_params` is
+                    # processed.
+                    break
+
+                batch_query_params, future = pending.popleft()
+                try:
+                    batch, should_continue = future.result()
+                    should_continue = self._process_fetched_batch(
+                        batch, should_continue
+                    )
+                except Exception as error:
+                    self._handle_ingestion_error(error, batch_query_params)
+                    # The error was skipped, so continue from the next batch
                     continue
 
-                # Commit whatever records we were able to process, and rethrow the
-                # exception so the taskrun fails.
-                self._commit_records()
-                raise error from ingestion_error
+                if not should_continue:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            if self.limit and self.record_count >= self.limit:
-                logger.info(f"Ingestion limit of {self.limit} has been reached.")
-                should_continue = False
+    def _ingest_pipelined_batches(
+        self, query_params: dict | None, fixed_query_params: dict | None
+    ) -> None:
+        """
+        Request each batch in a background thread while the previous batch is
+        processed, starting from `query_params`.
 
-            # Get next query params
-            query_params = self._get_query_params(query_params, fixed_query_params)
+        The next query params are computed as soon as a batch has been received,
+        before it is processed, and at most one batch is requested ahead, so no
+        more than two batches are held in memory at once. Errors are handled exactly
+        as when batches are requested one at a time.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{self.__class__.__name__}_requests"
+        )
+        try:
+            future = None
+            if query_params is not None:
+                self._verbose_log(f"Next set of query params: {query_params}")
+                future = executor.submit(self.get_batch, query_params)
+
+            while future is not None:
+                batch_query_params, batch_future = query_params, future
+                future = None
+                try:
+                    batch, should_continue = batch_future.result()
+                except Exception as error:
+                    batch, should_continue = None, True
+                    fetch_error = error
+                else:
+                    fetch_error = None
 
-        # Commit whatever records we were able to process
+                # Request the next batch before processing this one. It is discarded
+                # if it turns out that ingestion should stop.
+                query_params = self._get_query_params(
+                    batch_query_params, fixed_query_params
+                )
+                if (fetch_error or (batch and should_continue)) and (
+                    query_params is not None
+                ):
+                    self._verbose_log(f"Next set of query params: {query_params}")
+                    future = executor.submit(self.get_batch, query_params)
+
+                try:
+                    if fetch_error:
+                        raise fetch_error
+                    should_continue = self._process_fetched_batch(
+                        batch, should_continue
+                    )
+                except Exception as error:
+                    self._handle_ingestion_error(error, batch_query_params)
+                    # The error was skipped, so continue from the next batch
+                    continue
+
+                if not should_continue:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _process_fetched_batch(self, batch: list | None, should_continue: bool) -> bool:
+        """
+        Process a batch returned by `get_batch`, and return whether ingestion
+        should continue.
+        """
+        if batch and len(batch) > 0:
+            self.record_count += self.process_batch(batch)
+            logger.info(f"{self.record_count} records ingested so far.")
+        else:
+            logger.info("Batch complete.")
+            should_continue = False
+
+        if self.limit and self.record_count >= self.limit:
+            logger.info(f"Ingestion limit of {self.limit} has been reached.")
+            should_continue = False
+
+        return should_continue
+
+    def _handle_ingestion_error(self, error: Exception, query_params: dict) -> None:
+        """
+        Handle an error raised while requesting or processing a batch.
+
+        Errors which should be skipped are recorded, and the caller should continue
+        from the next batch. Any other error is raised.
+        """
+        if isinstance(error, AirflowException):
+            # AirflowExceptions should not be caught or reraised as IngestionErrors,
+            # as execution should not continue when the task is being stopped by
+            # Airflow. However, we should still log the last query_params to be
+            # hit before the error was raised.
+            logger.info(
+                f"Last query_params used: {json.dumps(query_params, default=str)}"
+            )
+
+            # If errors have already been caught during processing, raise them
+            # as well.
+            if error_summary := self._get_ingestion_errors():
+                raise error_summary from error
+            raise error
+
+        ingestion_error = IngestionError(error, traceback.format_exc(), query_params)
+
+        if self._should_skip_ingestion_error(error):
+            # Add this to the errors list but continue processing
+            self.ingestion_errors.append(ingestion_error)
+            logger.error(f"Skipping batch due to ingestion error: {error}")
+            return
+
+        # Commit whatever records we were able to process, and rethrow the
+        # exception so the taskrun fails.
         self._commit_records()
+        raise error from ingestion_error
 
     def ingest_records(self) -> None:
         """
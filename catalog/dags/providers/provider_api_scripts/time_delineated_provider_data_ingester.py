@@ -1,12 +1,31 @@
+import json
 import logging
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+from airflow.models import Variable
+from airflow.utils.session import NEW_SESSION, provide_session
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
 from providers.provider_api_scripts.provider_data_ingester import ProviderDataIngester
 
 
 logger = logging.getLogger(__name__)
 
+# Record counts which were cached longer ago than this belong to a run which failed
+# and was not retried, and are deleted by the next run of the ingester
+RECORD_COUNTS_RETENTION = timedelta(days=7)
+
+
+@provide_session
+def _get_variable_keys(prefix: str, session: Session = NEW_SESSION) -> list[str]:
+    """Get the keys of all Variables which start with the prefix."""
+    return list(
+        session.scalars(select(Variable.key).where(Variable.key.startswith(prefix)))
+    )
+
 
 class TimeDelineatedProviderDataIngester(ProviderDataIngester):
     """
@@ -26,11 +45,15 @@ class TimeDelineatedProviderDataIngester(ProviderDataIngester):
                         the division_threshold is exceeded
     should_raise_error: whether to raise an exception when more records are retrieved
                         from the API than the API reports to expect
+    max_concurrent_count_requests: integer giving the number of hourly record counts
+                        to request at once. Requests are still spaced by the `delay`
+                        of the requester, so this only overlaps their latency.
     """
 
     min_divisions = 4  # 15-minute default intervals
     max_divisions = 12  # 5-minute default intervals
     should_raise_error = True
+    max_concurrent_count_requests = 6
 
     @property
     @abstractmethod
@@ -62,6 +85,13 @@ class TimeDelineatedProviderDataIngester(ProviderDataIngester):
         # Keep track of our ts pairs
         self.timestamp_pairs = []
 
+        # Record counts are cached in a Variable until ingestion for the date has
+        # completed, so that retries of the task do not need to request them again.
+        # Variables left behind by runs which were not retried are swept after
+        # `RECORD_COUNTS_RETENTION`.
+        self.record_counts_prefix = f"{self.__class__.__name__}_record_counts_"
+        self.record_counts_variable = f"{self.record_counts_prefix}{self.date}"
+
     @staticmethod
     def format_ts(timestamp):
         return timestamp.isoformat().replace("+00:00", "Z")
@@ -115,6 +145,54 @@ class TimeDelineatedProviderDataIngester(ProviderDataIngester):
 
         return self.get_record_count_from_response(response_json)
 
+    def _get_record_counts(
+        self, intervals: list[tuple[datetime, datetime]], **kwargs
+    ) -> list[int]:
+        """
+        Get the number of records for each interval, using the cached count where
+        there is one and otherwise requesting up to `max_concurrent_count_requests`
+        counts at once.
+        """
+        cached_counts = Variable.get(
+            self.record_counts_variable, default_var={}, deserialize_json=True
+        ).get("counts", {})
+        keys = [
+            json.dumps(
+                [self.format_ts(start), self.format_ts(end), kwargs], default=str
+            )
+            for start, end in intervals
+        ]
+        missing = [
+            (key, interval)
+            for key, interval in zip(keys, intervals)
+            if key not in cached_counts
+        ]
+        if missing:
+            executor = ThreadPoolExecutor(
+                max_workers=min(self.max_concurrent_count_requests, len(missing))
+            )
+            try:
+                futures = [
+                    (key, executor.submit(self._get_record_count, *interval, **kwargs))
+                    for key, interval in missing
+                ]
+                for key, future in futures:
+                    cached_counts[key] = future.result()
+            finally:
+                # Do not wait for the remaining requests if one of them failed, but
+                # keep the counts which were received for the next attempt
+                executor.shutdown(wait=True, cancel_futures=True)
+                Variable.set(
+                    self.record_counts_variable,
+                    {
+                        "cached_at": datetime.now(timezone.utc).isoformat(),
+                        "counts": cached_counts,
+                    },
+                    serialize_json=True,
+                )
+
+        return [cached_counts[key] for key in keys]
+
     def _get_timestamp_pairs(self, **kwargs):
         """
         Determine a set of timestamp pairs.
@@ -131,14 +209,16 @@ class TimeDelineatedProviderDataIngester(ProviderDataIngester):
 
         If the interval has no/few records, this results in ONE extra request.
         If the interval has a large amount of data, this results in TWENTY FIVE extra
-        requests (one for the full day, and then one for each hour).
+        requests (one for the full day, and then one for each hour). The hourly
+        requests are made concurrently, and all counts are cached until ingestion for
+        the date has completed.
         """
         pairs_list: list[tuple[datetime, datetime]] = []
         # Get UTC timestamps for the start and end of the ingestion date
         start_ts = datetime.strptime(self.date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
         end_ts = start_ts + timedelta(days=1)
 
-        record_count = self._get_record_count(start_ts, end_ts, **kwargs)
+        (record_count,) = self._get_record_counts([(start_ts, end_ts)], **kwargs)
         if record_count == 0:
             logger.info("No data. Continuing.")
             return pairs_list
@@ -157,10 +237,10 @@ class TimeDelineatedProviderDataIngester(ProviderDataIngester):
         # contain data. Hours that contain more data get divided into a larger number of
         # portions.
         hour_slices = self._get_timestamp_query_params_list(start_ts, end_ts, 24)
+        # Get the number of records in each hour interval
+        hour_counts = self._get_record_counts(hour_slices, **kwargs)
 
-        for start_hour, end_hour in hour_slices:
-            # Get the number of records in this hour interval
-            record_count = self._get_record_count(start_hour, end_hour, **kwargs)
+        for (start_hour, end_hour), record_count in zip(hour_slices, hour_counts):
             if record_count == 0:
                 # No records for this hour, don't bother ingesting for this time period.
                 logger.info(f"No data detected for {start_hour}. Continuing.")
@@ -215,6 +295,29 @@ class TimeDelineatedProviderDataIngester(ProviderDataIngester):
             for start_ts, end_ts in self.timestamp_pairs
         ]
 
+    def _sweep_record_counts(self) -> None:
+        """
+        Delete the record counts cached for other dates more than
+        `RECORD_COUNTS_RETENTION` ago, which were left behind by runs that failed and
+        were not retried.
+        """
+        expired_before = datetime.now(timezone.utc) - RECORD_COUNTS_RETENTION
+        for key in _get_variable_keys(self.record_counts_prefix):
+            if key == self.record_counts_variable:
+                continue
+            cached = Variable.get(key, default_var={}, deserialize_json=True)
+            cached_at = cached.get("cached_at")
+            if cached_at is None or datetime.fromisoformat(cached_at) < expired_before:
+                logger.info(f"Deleting expired record counts {key}.")
+                Variable.delete(key)
+
+    def ingest_records(self) -> None:
+        self._sweep_record_counts()
+        super().ingest_records()
+        # Ingestion for this date is complete, so the record counts are not needed for
+        # any retry.
+        Variable.delete(self.record_counts_variable)
+
     def _ingest_records(
         self, initial_query_params: dict | None, fixed_query_params: dict | None
     ) -> None:
@@ -108,7 +108,6 @@ entirely and eschew the popularity data for these items.
 
 import argparse
 import logging
-from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from types import MappingProxyType
 
@@ -123,6 +122,9 @@ from providers.provider_api_scripts.provider_data_ingester import ProviderDataIn
 
 logger = logging.getLogger(__name__)
 
+# Merged pages keep only the number of their `globalusage` entries, under this key
+GLOBAL_USAGE_COUNT = "globalusagecount"
+
 
 class WikimediaCommonsDataIngester(ProviderDataIngester):
     providers = {
@@ -572,7 +574,7 @@ class WikimediaCommonsDataIngester(ProviderDataIngester):
         (if any) usage data, so we want to record and cache the highest value. Most
         items have no global usage data, so we only cache items that have a value.
         """
-        global_usage_count = len(media_data.get("globalusage", []))
+        global_usage_count = self.get_global_usage_count(media_data)
         foreign_id = media_data["pageid"]
         cached_usage_count = self.popularity_cache.get(foreign_id, 0)
         max_usage_count = max(global_usage_count, cached_usage_count)
@@ -603,10 +605,21 @@ class WikimediaCommonsDataIngester(ProviderDataIngester):
         return meta_data
 
     def merge_response_jsons(self, left_json, right_json):
+        """
+        Merge a continuation response into the batch accumulated so far.
+
+        The left json is updated in place, so that merging each continuation is
+        proportional to the size of that response rather than of the whole batch.
+        Only the number of global usage entries is kept for each page, since that is
+        all `extract_global_usage` needs.
+        """
         # Note that we will keep the continue value from the right json in
         # the merged output!  This is because we assume the right json is
         # the later one in the sequence of responses.
         if left_json is None:
+            for page in right_json.get("query", {}).get("pages", {}).values():
+                if "globalusage" in page:
+                    self.merge_media_pages(page, {})
             return right_json
 
         left_pages = self.get_media_pages(left_json)
@@ -618,30 +631,35 @@ class WikimediaCommonsDataIngester(ProviderDataIngester):
             or left_pages.keys() != right_pages.keys()
         ):
             logger.warning("Cannot merge responses with different pages!")
-            merged_json = None
-        else:
-            merged_json = deepcopy(left_json)
-            merged_json.update(right_json)
-            merged_pages = self.get_media_pages(merged_json)
-            merged_pages.update(
-                {
-                    k: self.merge_media_pages(left_pages[k], right_pages[k])
-                    for k in left_pages
-                }
-            )
+            return None
 
-        return merged_json
+        for key, page in right_pages.items():
+            self.merge_media_pages(left_pages[key], page)
+        for key, value in right_json.items():
+            if key == "query":
+                left_json[key].update({k: v for k, v in value.items() if k != "pages"})
+            else:
+                left_json[key] = value
+
+        return left_json
+
+    @classmethod
+    def merge_media_pages(cls, left_page, right_page):
+        """Merge the right page into the left one, replacing global usage by its count."""
+        left_count = cls.get_global_usage_count(left_page)
+        right_count = cls.get_global_usage_count(right_page)
+        left_page.update(right_page)
+        left_page.pop("globalusage", None)
+        left_page[GLOBAL_USAGE_COUNT] = left_count + right_count
+
+        return left_page
 
     @staticmethod
-    def merge_media_pages(left_page, right_page):
-        merged_page = deepcopy(left_page)
-        merged_globalusage = left_page.get("globalusage", []) + right_page.get(
-            "globalusage", []
+    def get_global_usage_count(media_data) -> int:
+        """Count the global usage of a page, whether or not it has been merged."""
+        return media_data.get(GLOBAL_USAGE_COUNT, 0) + len(
+            media_data.get("globalusage", [])
         )
-        merged_page.update(right_page)
-        merged_page["globalusage"] = merged_globalusage
-
-        return merged_page
 
     @staticmethod
     def derive_timestamp_pair(date):
@@ -197,6 +197,26 @@ def create_ingestion_workflow(
                 day_shift,  # Pass day_shift in as the tsv_suffix
             ]
 
+        s3_prefixes = {
+            media_type: DATE_PARTITION_ARG_TEMPLATE.substitute(
+                media_type=media_type,
+                provider_name=provider_name,
+                reingestion_date=_DATE_RANGE_INNER_TEMPLATE.format(day_shift)
+                if is_reingestion
+                else None,
+            )
+            for media_type in provider_conf.media_types
+        }
+        s3_extra_args = {"StorageClass": provider_conf.s3_tsv_storage_class}
+        ingestion_kwargs["tsv_compression"] = provider_conf.tsv_compression
+        if provider_conf.stream_tsv_to_s3:
+            ingestion_kwargs |= {
+                "s3_bucket": OPENVERSE_BUCKET,
+                "s3_prefixes": s3_prefixes,
+                "aws_conn_id": AWS_CONN_ID,
+                "s3_extra_args": s3_extra_args,
+            }
+
         pull_data = PythonOperator(
             task_id=append_day_shift(f"pull_{media_type_name}_data"),
             python_callable=pull_media_wrapper,
@@ -242,19 +262,9 @@ def create_ingestion_workflow(
                             pull_data.task_id, f"{media_type}_tsv"
                         ),
                         "s3_bucket": OPENVERSE_BUCKET,
-                        "s3_prefix": DATE_PARTITION_ARG_TEMPLATE.substitute(
-                            media_type=media_type,
-                            provider_name=provider_name,
-                            reingestion_date=_DATE_RANGE_INNER_TEMPLATE.format(
-                                day_shift
-                            )
-                            if is_reingestion
-                            else None,
-                        ),
+                        "s3_prefix": s3_prefixes[media_type],
                         "aws_conn_id": AWS_CONN_ID,
-                        "extra_args": {
-                            "StorageClass": provider_conf.s3_tsv_storage_class,
-                        },
+                        "extra_args": s3_extra_args,
                     },
                     trigger_rule=TriggerRule.NONE_SKIPPED,
                 )
@@ -65,6 +65,7 @@ PROVIDER_REINGESTION_WORKFLOWS = [
         one_month_list_length=24,
         three_month_list_length=24,
         six_month_list_length=40,
+        tsv_compression="gzip",
     ),
     ProviderReingestionWorkflow(
         # 64 total reingestion days
@@ -97,5 +98,6 @@ PROVIDER_REINGESTION_WORKFLOWS = [
         one_month_list_length=9,
         three_month_list_length=18,
         six_month_list_length=30,
+        tsv_compression="gzip",
     ),
 ]
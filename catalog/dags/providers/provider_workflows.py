@@ -147,6 +147,11 @@ class ProviderWorkflow:
                         loaded during pre-ingestion
     tags:               list of any additional tags to apply to the generated DAG
     overrides:          list of TaskOverrides to apply to the generated DAG
+    tsv_compression:    optional compression of the TSVs written during ingestion,
+                        one of `common.storage.media.TSV_COMPRESSION_EXTENSIONS`
+    stream_tsv_to_s3:   boolean giving whether the TSVs should be streamed directly to
+                        S3 in a multipart upload during ingestion, rather than written
+                        to disk and uploaded once ingestion is complete
     """
 
     ingester_class: type[ProviderDataIngester]
@@ -165,6 +170,8 @@ class ProviderWorkflow:
     create_postingestion_tasks: Callable | None = None
     tags: list[str] = field(default_factory=list)
     overrides: list[TaskOverride] = field(default_factory=list)
+    tsv_compression: str | None = None
+    stream_tsv_to_s3: bool = False
 
     # Set when the object is uploaded, even though we access the object later in
     # the DAG. IA incurs additional retrieval fees per request, unlike plain
@@ -269,6 +276,7 @@ PROVIDER_WORKFLOWS = [
         start_date=datetime(2020, 11, 1),
         schedule_string="@daily",
         dated=True,
+        tsv_compression="gzip",
     ),
     ProviderWorkflow(
         ingester_class=FreesoundDataIngester,
@@ -343,6 +351,7 @@ PROVIDER_WORKFLOWS = [
         schedule_string="@daily",
         dated=True,
         pull_timeout=timedelta(hours=12),
+        tsv_compression="gzip",
     ),
     ProviderWorkflow(
         ingester_class=WordPressDataIngester,
@@ -161,3 +161,51 @@ def test_copy_file_to_s3(tmp_path, empty_s3_bucket):
         mock.call(key="s3_key", value="fake-prefix/random_media_file.tsv"),
     ]
     assert len(list(empty_s3_bucket.objects.all())) > 0
+
+
+def test_copy_file_to_s3_sets_content_encoding_for_gzip(tmp_path):
+    tsv = tmp_path / "random_media_file.tsv.gz"
+    tsv.touch()
+    ti_mock = mock.MagicMock(spec=TaskInstance)
+    with mock.patch.object(s3, "S3Hook") as mock_s3:
+        s3.copy_file_to_s3(
+            tsv,
+            "bucket",
+            "fake-prefix",
+            AWS_CONN_ID,
+            ti_mock,
+            extra_args={"StorageClass": "STANDARD_IA"},
+        )
+    mock_s3.assert_called_once_with(
+        aws_conn_id=AWS_CONN_ID,
+        extra_args={"StorageClass": "STANDARD_IA", "ContentEncoding": "gzip"},
+    )
+    mock_s3.return_value.load_file.assert_called_once_with(
+        str(tsv), "fake-prefix/random_media_file.tsv.gz", bucket_name="bucket"
+    )
+
+
+@pytest.mark.parametrize("object_exists", [True, False])
+def test_copy_file_to_s3_streamed_object(object_exists):
+    tsv_uri = "s3://bucket/fake-prefix/random_media_v001_20230101000000.tsv.gz"
+    ti_mock = mock.MagicMock(spec=TaskInstance)
+    with mock.patch.object(s3.S3Hook, "check_for_key", return_value=object_exists):
+        with mock.patch.object(s3.S3Hook, "load_file") as mock_load_file:
+            if object_exists:
+                s3.copy_file_to_s3(
+                    tsv_uri, "bucket", "fake-prefix", AWS_CONN_ID, ti_mock
+                )
+            else:
+                with pytest.raises(AirflowSkipException):
+                    s3.copy_file_to_s3(
+                        tsv_uri, "bucket", "fake-prefix", AWS_CONN_ID, ti_mock
+                    )
+
+    mock_load_file.assert_not_called()
+    expected_calls = [
+        mock.call(key="tsv_version", value="001"),
+        mock.call(
+            key="s3_key", value="fake-prefix/random_media_v001_20230101000000.tsv.gz"
+        ),
+    ]
+    assert ti_mock.xcom_push.call_args_list == (expected_calls if object_exists else [])
@@ -179,6 +179,14 @@ def test_delete_less_than_max_malformed_rows(
     postgres_with_load_table.cursor.execute(check_query)
     num_rows = postgres_with_load_table.cursor.fetchone()[0]
     assert num_rows == 6
+    # The malformed rows are kept aside rather than discarded
+    quarantined = tmpdir.join("test.tsv.malformed").readlines()
+    assert [row.split("\t")[0] for row in quarantined] == [
+        "7789139",
+        "8033502",
+        "8033503",
+        "164511",
+    ]
 
 
 @pytest.mark.parametrize("load_function", [_load_local_tsv])
@@ -0,0 +1,152 @@
+from pathlib import Path
+
+import pytest
+
+from common.loader import validation
+from common.storage import columns as col
+from common.storage.tsv_columns import CURRENT_IMAGE_TSV_COLUMNS
+
+
+RESOURCES = Path(__file__).parent / "test_resources"
+
+VALID_ROW = "\t".join(
+    [
+        "123",
+        "https://example.com/landing",
+        "https://example.com/image.jpg",
+        "\\N",
+        "jpg",
+        "1024",
+        "by",
+        "4.0",
+        "Creator",
+        "https://example.com/creator",
+        "Title\\twith a tab",
+        '{"description": "A line\\\\nbreak"}',
+        '[{"name": "tag", "provider": "example"}]',
+        "photograph",
+        "f",
+        "example",
+        "example",
+        "provider_api",
+        "640",
+        "480",
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("plain", "plain"),
+        ("a\\tb\\nc", "a\tb\nc"),
+        ("back\\\\slash", "back\\slash"),
+        ("\\x41\\101", "AA"),
+        ("\\q", "q"),
+    ],
+)
+def test_unescape_copy_value(value, expected):
+    assert validation.unescape_copy_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    "column, value, expected",
+    [
+        (col.WIDTH, "640", True),
+        (col.WIDTH, " -3 ", True),
+        (col.WIDTH, "6.5", False),
+        (col.WIDTH, "3000000000", False),
+        (col.WIDTH, "\\N", True),
+        (col.WATERMARKED, "f", True),
+        (col.WATERMARKED, "TRUE", True),
+        (col.WATERMARKED, "maybe", False),
+        (col.META_DATA, '{"a": 1}', True),
+        (col.META_DATA, '{"a": "\\\\u0000"}', False),
+        (col.META_DATA, '{"a": NaN}', False),
+        # An escaped tab is decoded to a control character, which JSON disallows
+        (col.META_DATA, '{"a": "b\\tc"}', False),
+        (col.LICENSE, "by", True),
+        (col.LICENSE, "x" * 51, False),
+        (col.CATEGORY, "photograph", True),
+    ],
+)
+def test_validate_value(column, value, expected):
+    assert validation.validate_value(column, value) is expected
+
+
+@pytest.mark.parametrize(
+    "row, expected",
+    [
+        (VALID_ROW, None),
+        (f"{VALID_ROW}\n", None),
+        (f"{VALID_ROW}\textra", "expected 20 values but found 21"),
+        (VALID_ROW.replace("\t640\t", "\tsix\t"), "invalid value for width"),
+    ],
+)
+def test_validate_row(row, expected):
+    assert validation.validate_row(CURRENT_IMAGE_TSV_COLUMNS, row) == expected
+
+
+def _make_reader(rows, tmp_path, max_invalid_rows=10):
+    return validation.ValidatedTsvReader(
+        rows,
+        CURRENT_IMAGE_TSV_COLUMNS,
+        str(tmp_path / "test.tsv.malformed"),
+        max_invalid_rows=max_invalid_rows,
+    )
+
+
+def test_validated_tsv_reader_quarantines_invalid_rows(tmp_path):
+    invalid_row = VALID_ROW.replace("\t640\t", "\tsix\t")
+    rows = [f"{VALID_ROW}\n", f"{invalid_row}\n", f"{VALID_ROW}\n"]
+    reader = _make_reader(rows, tmp_path)
+
+    # Rows are only ever returned whole, however small the requested size
+    assert reader.read(1) == f"{VALID_ROW}\n"
+    assert reader.read() == f"{VALID_ROW}\n"
+    assert reader.read() == ""
+    reader.close()
+
+    assert (reader.valid_rows, reader.invalid_rows) == (2, 1)
+    assert not reader.exceeded_max_invalid_rows
+    assert (tmp_path / "test.tsv.malformed").read_text() == f"{invalid_row}\n"
+
+
+def test_validated_tsv_reader_does_not_create_empty_quarantine(tmp_path):
+    reader = _make_reader([f"{VALID_ROW}\n"], tmp_path)
+    assert reader.read() == f"{VALID_ROW}\n"
+    reader.close()
+
+    assert not (tmp_path / "test.tsv.malformed").exists()
+
+
+def test_validated_tsv_reader_stops_after_max_invalid_rows(tmp_path):
+    rows = ["bad\n", "bad\n", "bad\n", f"{VALID_ROW}\n"]
+    reader = _make_reader(rows, tmp_path, max_invalid_rows=2)
+
+    assert reader.read() == ""
+    reader.close()
+
+    assert reader.exceeded_max_invalid_rows
+    assert reader.invalid_rows == 3
+
+
+@pytest.mark.parametrize(
+    "tsv_file_name, expected_valid, expected_invalid",
+    [
+        ("malformed_less_than_max_rows.tsv", 6, 4),
+        ("malformed_max_rows.tsv", 3, 10),
+    ],
+)
+def test_validated_tsv_reader_matches_postgres(
+    tsv_file_name, expected_valid, expected_invalid, tmp_path
+):
+    with open(RESOURCES / tsv_file_name) as tsv_file:
+        reader = _make_reader(tsv_file, tmp_path)
+        reader.read()
+        reader.close()
+
+    assert (reader.valid_rows, reader.invalid_rows) == (
+        expected_valid,
+        expected_invalid,
+    )
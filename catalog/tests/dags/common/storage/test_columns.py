@@ -1,5 +1,6 @@
 import logging
 import string
+import sys
 
 import pytest
 import tldextract
@@ -108,6 +109,55 @@ def test_Column_sanitize_string_escapes_escaped_escapes():
     assert actual_str == expect_str
 
 
+def _reference_sanitize_string(data):
+    # The original implementation, which `_Column__sanitize_string` must match
+    return " ".join(
+        str(data).replace('"', "'").replace("\b", "").replace("\\", "\\\\").split()
+    )
+
+
+def test_Column_sanitize_string_matches_reference_for_every_character():
+    sc = SanitizeStringColumn()
+    for code_point in range(sys.maxunicode + 1):
+        char = chr(code_point)
+        for test_string in (char, f"a{char}b", f"{char}{char}"):
+            assert sc._Column__sanitize_string(
+                test_string
+            ) == _reference_sanitize_string(test_string), repr(test_string)
+
+
+@pytest.mark.parametrize(
+    "test_string",
+    [
+        "",
+        " ",
+        "plain title",
+        " leading",
+        "trailing ",
+        "two  spaces",
+        "non\u00a0breaking",
+        "ideographic\u3000space",
+        "line\u2028separator",
+        'quote " and \\ backslash',
+        "Théâtre “Odéon” — 東京",
+        "\x1c\x1d\x1e\x1f",
+        "\b\bbackspaces\b",
+    ],
+)
+def test_Column_sanitize_string_matches_reference(test_string):
+    sc = SanitizeStringColumn()
+    actual_str = sc._Column__sanitize_string(test_string)
+    assert actual_str == _reference_sanitize_string(test_string)
+
+
+def test_Column_enforce_char_limit_only_logs_once(caplog):
+    tc = TruncateColumn(5, True)
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            assert tc.prepare_string("abcdefgh") == "abcde"
+    assert len(caplog.records) == 1
+
+
 def test_IntegerColumn_prepare_string_nones_non_number_strings():
     ic = columns.IntegerColumn("test", False)
     actual_int = ic.prepare_string("abc123")
@@ -214,7 +264,7 @@ def test_JSONColumn_sanitize_json_values_handles_flat_dict(monkeypatch):
     def mock_sanitize_string(some_string):
         return some_string + " sanitized"
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     given_dict = {"key1": "val1", "key2": "val2"}
     actual_dict = jc._sanitize_json_values(given_dict)
     expect_dict = {"key1": "val1 sanitized", "key2": "val2 sanitized"}
@@ -227,7 +277,7 @@ def test_JSONColumn_sanitize_json_values_handles_nested_dict(monkeypatch):
     def mock_sanitize_string(some_string):
         return some_string + " sanitized"
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     given_dict = {"key1": "val1", "key2": {"key3": "val3"}}
     actual_dict = jc._sanitize_json_values(given_dict)
     expect_dict = {"key1": "val1 sanitized", "key2": {"key3": "val3 sanitized"}}
@@ -240,7 +290,7 @@ def test_JSONColumn_sanitize_json_values_handles_dict_with_list(monkeypatch):
     def mock_sanitize_string(some_string):
         return some_string + " sanitized"
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     given_dict = {"key1": "val1", "key2": ["item1", "item2"]}
     actual_dict = jc._sanitize_json_values(given_dict)
     expect_dict = {
@@ -256,7 +306,7 @@ def test_JSONColumn_sanitize_json_values_handles_list_of_str(monkeypatch):
     def mock_sanitize_string(some_string):
         return some_string + " sanitized"
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     given_list = ["item1", "item2"]
     actual_list = jc._sanitize_json_values(given_list)
     expect_list = ["item1 sanitized", "item2 sanitized"]
@@ -269,7 +319,7 @@ def test_JSONColumn_sanitize_json_values_handles_list_of_list(monkeypatch):
     def mock_sanitize_string(some_string):
         return some_string + " sanitized"
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     given_list = ["item1", ["item2", ["item3"], "item4"], "item5"]
     actual_list = jc._sanitize_json_values(given_list)
     expect_list = [
@@ -286,7 +336,7 @@ def test_JSONColumn_sanitize_json_values_handles_list_of_dict(monkeypatch):
     def mock_sanitize_string(some_string):
         return some_string + " sanitized"
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     given_list = [
         {"name": "valuea", "provider": "valueb"},
         {"name": "aname", "provider": "aprovider"},
@@ -305,7 +355,7 @@ def test_JSONColumn_sanitize_json_values_does_not_over_recurse(monkeypatch):
     def mock_sanitize_string(some_string):
         return str(some_string)
 
-    monkeypatch.setattr(jc, "_Column__sanitize_string", mock_sanitize_string)
+    monkeypatch.setattr(columns, "_sanitize_string", mock_sanitize_string)
     L = []
     L.extend([L])
     actual_list = jc._sanitize_json_values(L, recursion_limit=3)
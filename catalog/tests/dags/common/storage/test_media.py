@@ -3,7 +3,9 @@ MediaStore is an abstract class, so to test it we
 use one of the inheriting classes, ImageStore
 """
 
+import gzip
 import logging
+import zlib
 from unittest.mock import patch
 
 import pytest
@@ -149,6 +151,101 @@ def test_MediaStore_add_item_flushes_buffer(tmpdir):
     assert len(lines) == 4  # recall the last '\n' will create an empty line.
 
 
+def _add_test_images(image_store, count):
+    for i in range(count):
+        image_store.add_item(
+            foreign_identifier=f"{i:02}",
+            foreign_landing_url=f"https://images.org/image{i:02}",
+            url=f"https://images.org/image{i:02}.jpg",
+            license_info=PD_LICENSE_INFO,
+        )
+
+
+def test_MediaStore_add_item_flushes_buffer_by_size(monkeypatch, tmp_path):
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    image_store = image.ImageStore(provider="testing_provider", buffer_size=1)
+    _add_test_images(image_store, 2)
+    assert image_store._media_buffer == []
+    with open(image_store.output_path) as f:
+        assert len(f.readlines()) == 2
+
+
+def test_MediaStore_writes_gzip_output(monkeypatch, tmp_path):
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    image_store = image.ImageStore(
+        provider="testing_provider", buffer_length=2, compression="gzip"
+    )
+    assert image_store.output_path.endswith(".tsv.gz")
+    _add_test_images(image_store, 3)
+    image_store.commit()
+    # Items saved after a commit are appended to the same file
+    _add_test_images(image_store, 1)
+    image_store.close()
+
+    with open(image_store.output_path, "rb") as f:
+        decompressor = zlib.decompressobj(wbits=31)
+        decompressor.decompress(f.read())
+    # Committing does not start a new gzip member
+    assert decompressor.eof and decompressor.unused_data == b""
+    with gzip.open(image_store.output_path, "rt") as f:
+        lines = f.readlines()
+    assert len(lines) == 4
+    assert [line.split("\t")[0] for line in lines] == ["00", "01", "02", "00"]
+
+
+def test_MediaStore_rejects_unsupported_compression():
+    with pytest.raises(ValueError, match="Unsupported TSV compression: zstd"):
+        image.ImageStore(provider="testing_provider", compression="zstd")
+
+
+def test_MediaStore_configure_output_streams_to_s3():
+    image_store = image.ImageStore(provider="testing_provider")
+    file_name = image_store.output_path.split("/")[-1]
+    with patch.object(media, "get_s3_client") as mock_get_client:
+        image_store.configure_output(
+            compression="gzip",
+            s3_bucket="bucket",
+            s3_prefix="image/testing_provider/year=2020",
+            aws_conn_id="aws_test",
+            s3_extra_args={"StorageClass": "STANDARD_IA"},
+        )
+    mock_get_client.assert_called_once_with("aws_test")
+    assert image_store.output_path == (
+        f"s3://bucket/image/testing_provider/year=2020/{file_name}.gz"
+    )
+    assert image_store._s3_transport_params == {
+        "client": mock_get_client.return_value,
+        "client_kwargs": {
+            "S3.Client.create_multipart_upload": {
+                "StorageClass": "STANDARD_IA",
+                "ContentEncoding": "gzip",
+            }
+        },
+    }
+
+    with patch.object(media.smart_open, "open") as mock_open:
+        _add_test_images(image_store, 2)
+        image_store.commit()
+        # Output streamed to S3 is only completed when the store is closed
+        mock_open.return_value.close.assert_not_called()
+        image_store.close()
+    mock_open.assert_called_once_with(
+        image_store.output_path,
+        "w",
+        transport_params=image_store._s3_transport_params,
+    )
+    mock_open.return_value.writelines.assert_called_once()
+    mock_open.return_value.close.assert_called_once()
+
+
+def test_MediaStore_configure_output_fails_once_opened(monkeypatch, tmp_path):
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    image_store = image.ImageStore(provider="testing_provider", buffer_length=1)
+    _add_test_images(image_store, 1)
+    with pytest.raises(ValueError, match="Cannot configure the output"):
+        image_store.configure_output(compression="gzip")
+
+
 def test_MediaStore_commit_writes_nothing_if_no_lines_in_buffer():
     image_store = image.ImageStore(output_dir="/path/does/not/exist")
     image_store.commit()
@@ -1,6 +1,7 @@
 import logging
+import threading
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 import requests
@@ -217,3 +218,74 @@ def test_handles_optional_headers(
     dq.session.get.assert_called_once_with(
         url, params=params, **(expected_request_kwargs or {})
     )
+
+
+@patch("common.requester.time")
+def test_token_bucket_waits_for_tokens(mock_time):
+    mock_time.monotonic.return_value = 0
+    bucket = requester.TokenBucket(rate=2, capacity=1)
+
+    # The first token is available immediately, later tokens are reserved in turn
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire() == 1.0
+    mock_time.sleep.assert_has_calls([call(0.5), call(1.0)])
+
+
+@patch("common.requester.time")
+def test_token_bucket_refills_up_to_capacity(mock_time):
+    mock_time.monotonic.return_value = 0
+    bucket = requester.TokenBucket(rate=1, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    # Much later, only `capacity` tokens are available without waiting
+    mock_time.monotonic.return_value = 100
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 1.0
+
+
+def test_concurrent_requester_limits_requests_in_flight(monkeypatch):
+    max_concurrent_requests = 2
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def mock_requests_get(url, params, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        r = requests.Response()
+        r.status_code = 200
+        return r
+
+    dq = requester.ConcurrentDelayedRequester(
+        max_concurrent_requests=max_concurrent_requests
+    )
+    monkeypatch.setattr(dq.session, "get", mock_requests_get)
+
+    threads = [
+        threading.Thread(target=dq.get, args=("http://fake_url",)) for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_in_flight == max_concurrent_requests
+
+
+def test_concurrent_requester_retries_get_response_json():
+    dq = requester.ConcurrentDelayedRequester(requests_per_second=1000)
+    r = requests.Response()
+    r.status_code = 500
+    with patch.object(dq, "get", return_value=r) as mock_get:
+        with pytest.raises(Exception):
+            dq.get_response_json("http://fake_url", retries=2)
+
+    assert mock_get.call_count == 3
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import timedelta
+from unittest import mock
+
+import aiohttp
+import pytest
+from psycopg2 import OperationalError
+
+from common import tls_support
+
+
+class FakeResponse:
+    def __init__(self, session, domain):
+        self.session = session
+        self.domain = domain
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(
+            self.session.max_in_flight, self.session.in_flight
+        )
+        await asyncio.sleep(0.01)
+        self.session.in_flight -= 1
+        if self.domain.startswith("bad"):
+            raise aiohttp.ClientConnectionError()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeSession:
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def get(self, url):
+        return FakeResponse(self, url.removeprefix("https://"))
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    FakeSession.instances = []
+    monkeypatch.setattr(tls_support.aiohttp, "ClientSession", FakeSession)
+    return FakeSession
+
+
+def test_probe_tls_support_bounds_concurrency(fake_session):
+    domains = [f"good{i}.org" for i in range(20)] + [f"bad{i}.org" for i in range(5)]
+
+    actual = tls_support.probe_tls_support(domains + domains[:3], concurrency=4)
+
+    assert actual == {domain: domain.startswith("good") for domain in domains}
+    assert fake_session.instances[0].max_in_flight == 4
+
+
+def test_probe_tls_support_does_nothing_without_domains(fake_session):
+    assert tls_support.probe_tls_support([]) == {}
+    assert fake_session.instances == []
+
+
+@pytest.mark.parametrize(
+    "conn_id, expected_conn_id",
+    [
+        pytest.param(None, None, id="not_configured"),
+        pytest.param("upstream", "upstream", id="configured"),
+    ],
+)
+def test_get_default_store(conn_id, expected_conn_id, monkeypatch):
+    monkeypatch.setattr(tls_support, "TLS_SUPPORT_CONN_ID", conn_id)
+    tls_support.get_default_store.cache_clear()
+
+    store = tls_support.get_default_store()
+
+    tls_support.get_default_store.cache_clear()
+    assert getattr(store, "postgres_conn_id", None) == expected_conn_id
+
+
+def test_store_get():
+    store = tls_support.TlsSupportStore("upstream", ttl=timedelta(days=7))
+    with mock.patch.object(tls_support, "PostgresHook") as MockHook:
+        MockHook.return_value.get_records.return_value = [("a.org", True)]
+        actual = store.get(["a.org", "b.org"])
+
+    assert actual == {"a.org": True}
+    MockHook.return_value.get_records.assert_called_once_with(
+        tls_support.SELECT_TLS_SUPPORT_QUERY,
+        parameters={"domains": ["a.org", "b.org"], "ttl": timedelta(days=7)},
+    )
+
+
+def test_store_get_ignores_errors():
+    store = tls_support.TlsSupportStore("upstream")
+    with mock.patch.object(tls_support, "PostgresHook") as MockHook:
+        MockHook.return_value.get_records.side_effect = OperationalError()
+        assert store.get(["a.org"]) == {}
+
+
+def test_store_set():
+    store = tls_support.TlsSupportStore("upstream")
+    with mock.patch.object(tls_support, "PostgresHook") as MockHook:
+        store.set({"a.org": True, "b.org": False})
+
+    MockHook.return_value.run.assert_called_once_with(
+        tls_support.UPSERT_TLS_SUPPORT_QUERY,
+        parameters={"domains": ["a.org", "b.org"], "supported": [True, False]},
+        autocommit=True,
+        handler=None,
+    )
+
+
+def test_store_set_ignores_errors():
+    store = tls_support.TlsSupportStore("upstream")
+    with mock.patch.object(tls_support, "PostgresHook") as MockHook:
+        MockHook.return_value.run.side_effect = OperationalError()
+        store.set({"a.org": True})
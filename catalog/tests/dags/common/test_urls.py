@@ -1,4 +1,5 @@
 import logging
+from unittest import mock
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +7,7 @@ import requests
 from requests import RequestException
 
 from common import urls
+from utilities.ingestion_benchmark.urls import get_url_corpus
 
 
 logging.basicConfig(
@@ -98,6 +100,27 @@ def test_validate_url_string_caches_tls_support(clear_tls_cache, monkeypatch):
     mock_get.assert_called_once()
 
 
+def test_validate_url_string_uses_tls_support_store(clear_tls_cache, monkeypatch):
+    store = mock.Mock(get=mock.Mock(return_value={"abcd.com": False}))
+    monkeypatch.setattr(urls.tls_support, "get_default_store", lambda: store)
+    with patch.object(urls, "requests_get") as mock_get:
+        actual_validated_url = urls.validate_url_string("abcd.com")
+    assert actual_validated_url == "http://abcd.com"
+    store.get.assert_called_once_with(["abcd.com"])
+    mock_get.assert_not_called()
+    store.set.assert_not_called()
+
+
+def test_validate_url_string_records_tls_support_in_store(
+    clear_tls_cache, get_good, monkeypatch
+):
+    store = mock.Mock(get=mock.Mock(return_value={}))
+    monkeypatch.setattr(urls.tls_support, "get_default_store", lambda: store)
+    actual_validated_url = urls.validate_url_string("abcd.com")
+    assert actual_validated_url == "https://abcd.com"
+    store.set.assert_called_once_with({"abcd.com": True})
+
+
 def test_validate_url_string_keeps_trailing_slash():
     url_string = "https://wordpress.org/photos/photo/5262839486/"
     actual_validated_url = urls.validate_url_string(url_string, strip_slash=False)
@@ -194,3 +217,36 @@ def test_validate_url_string_contain_space():
     with pytest.raises(urls.SpaceInUrlError):
         url_string = "https://wordpress.org/photos/photo/526283 9486/"
         urls.validate_url_string(url_string)
+
+
+@pytest.mark.parametrize(
+    "url_string, expected",
+    [
+        pytest.param(
+            "http://abcd.com/a/b/", ("https://abcd.com/a/b", "abcd.com"), id="domain"
+        ),
+        pytest.param("//8.8.8.8/a", ("https://8.8.8.8/a", "8.8.8.8"), id="ipv4"),
+        pytest.param("https:/abcd", (None, ""), id="invalid"),
+        pytest.param("", (None, None), id="empty"),
+        pytest.param(None, (None, None), id="not_a_string"),
+    ],
+)
+def test_normalize_url(url_string, expected, clear_tls_cache, get_good):
+    assert urls.normalize_url(url_string) == expected
+
+
+def test_normalize_url_extracts_each_host_once(clear_tls_cache, get_good, monkeypatch):
+    urls._extract_host.cache_clear()
+    extract = mock.Mock(wraps=urls.tldextract.extract)
+    monkeypatch.setattr(urls.tldextract, "extract", extract)
+    for path in ("a", "b", "c"):
+        urls.normalize_url(f"http://user@abcd.com:8080/{path}")
+    extract.assert_called_once_with("abcd.com")
+    urls._extract_host.cache_clear()
+
+
+def test_get_domain_key_matches_tldextract():
+    for url_string in get_url_corpus():
+        extracted = urls.tldextract.extract(url_string)
+        expected = extracted.fqdn or extracted.ipv4
+        assert urls.get_domain_key(url_string) == expected, url_string
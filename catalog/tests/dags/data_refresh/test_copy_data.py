@@ -1,10 +1,16 @@
 import logging
+import time
 from unittest import mock
 
 import pytest
 
 from common.constants import PRODUCTION
-from data_refresh.copy_data import DEFAULT_DATA_REFRESH_LIMIT, get_record_limit
+from data_refresh.copy_data import (
+    DEFAULT_DATA_REFRESH_LIMIT,
+    copy_data,
+    get_partition_conditions,
+    get_record_limit,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -45,3 +51,114 @@ def test_get_record_limit_defaults_accoring_to_environment(environment, expected
 
         actual_limit = get_record_limit.function()
         assert actual_limit == expected_limit
+
+
+@pytest.mark.parametrize(
+    "partition_count, expected_conditions",
+    [
+        (0, ["TRUE"]),
+        (1, ["TRUE"]),
+        (
+            2,
+            [
+                "u.identifier < '80000000-0000-0000-0000-000000000000'::uuid",
+                "u.identifier >= '80000000-0000-0000-0000-000000000000'::uuid",
+            ],
+        ),
+        (
+            4,
+            [
+                "u.identifier < '40000000-0000-0000-0000-000000000000'::uuid",
+                "u.identifier >= '40000000-0000-0000-0000-000000000000'::uuid"
+                " AND u.identifier < '80000000-0000-0000-0000-000000000000'::uuid",
+                "u.identifier >= '80000000-0000-0000-0000-000000000000'::uuid"
+                " AND u.identifier < 'c0000000-0000-0000-0000-000000000000'::uuid",
+                "u.identifier >= 'c0000000-0000-0000-0000-000000000000'::uuid",
+            ],
+        ),
+    ],
+)
+def test_get_partition_conditions(partition_count, expected_conditions):
+    assert get_partition_conditions(partition_count) == expected_conditions
+
+
+@pytest.mark.parametrize(
+    "limit, columns, copied_partitions, expected_partitions",
+    [
+        # All partitions are copied on the first attempt
+        (None, ["identifier", "title"], [], [0, 1, 2, 3]),
+        # Only the partitions that did not complete are copied on retry
+        (None, ["identifier", "title"], [0, 2], [1, 3]),
+        # Nothing is copied if all partitions already completed
+        (None, ["identifier", "title"], [0, 1, 2, 3], []),
+        # A limit can only be applied to a single partition
+        (10, ["identifier", "title"], [], [0]),
+        # Tables without an identifier cannot be partitioned
+        (None, ["title"], [], [0]),
+    ],
+)
+def test_copy_data_copies_pending_partitions(
+    limit, columns, copied_partitions, expected_partitions
+):
+    with (
+        mock.patch("data_refresh.copy_data.PostgresHook") as MockHook,
+        mock.patch("data_refresh.copy_data._copy_partition") as mock_copy_partition,
+    ):
+        MockHook.get_execution_timeout.return_value = 60.0
+        MockHook.return_value.run.side_effect = [None, copied_partitions, 100, None]
+        mock_copy_partition.return_value = 25
+
+        total = copy_data.function(
+            postgres_conn_id="conn",
+            limit=limit,
+            sql_template="SELECT {columns} FROM u WHERE {partition_condition}",
+            temp_table_name="temp_import_image",
+            schema_name="upstream_image_schema",
+            upstream_table_name="image",
+            deleted_table_name="api_deletedimage",
+            columns=columns,
+            partition_count=4,
+            concurrency=2,
+        )
+
+    assert total == 100
+    copied = sorted(call.args[4] for call in mock_copy_partition.call_args_list)
+    assert copied == expected_partitions
+    for call in mock_copy_partition.call_args_list:
+        query = call.args[2]
+        assert ("LIMIT 10" in query) == bool(limit)
+
+
+def test_copy_data_stops_copying_after_a_failed_partition():
+    def copy_partition(*args):
+        if args[4] == 0:
+            raise ValueError("Partition failed")
+        # Keep the other worker busy, so that partition 3 is still queued
+        time.sleep(0.5)
+        return 25
+
+    with (
+        mock.patch("data_refresh.copy_data.PostgresHook") as MockHook,
+        mock.patch(
+            "data_refresh.copy_data._copy_partition", side_effect=copy_partition
+        ) as mock_copy_partition,
+    ):
+        MockHook.get_execution_timeout.return_value = 60.0
+        MockHook.return_value.run.side_effect = [None, []]
+
+        with pytest.raises(ValueError, match="Partition failed"):
+            copy_data.function(
+                postgres_conn_id="conn",
+                limit=None,
+                sql_template="SELECT {columns} FROM u WHERE {partition_condition}",
+                temp_table_name="temp_import_image",
+                schema_name="upstream_image_schema",
+                upstream_table_name="image",
+                deleted_table_name="api_deletedimage",
+                columns=["identifier", "title"],
+                partition_count=4,
+                concurrency=2,
+            )
+
+    copied = {call.args[4] for call in mock_copy_partition.call_args_list}
+    assert 3 not in copied
@@ -0,0 +1,44 @@
+import pytest
+
+from data_refresh.create_and_populate_filtered_index import get_filtered_index_query
+
+
+SENSITIVE_TERMS = ["running", "water", "bird"]
+
+
+def _mappings(*properties):
+    return {
+        f"image-{i}": {"mappings": {"properties": {prop: {} for prop in props}}}
+        for i, props in enumerate(properties)
+    }
+
+
+def test_get_filtered_index_query_uses_flag():
+    mappings = _mappings(["title", "sensitive_text"])
+
+    query = get_filtered_index_query(mappings, SENSITIVE_TERMS)
+
+    assert query == {"bool": {"must_not": [{"term": {"sensitive_text": True}}]}}
+
+
+@pytest.mark.parametrize(
+    "properties",
+    [
+        pytest.param([["title"]], id="unmapped"),
+        pytest.param([["title", "sensitive_text"], ["title"]], id="partly_mapped"),
+    ],
+)
+def test_get_filtered_index_query_falls_back_to_terms(properties):
+    mappings = _mappings(*properties)
+
+    query = get_filtered_index_query(mappings, SENSITIVE_TERMS)
+
+    assert query == {
+        "bool": {
+            "must_not": [
+                {"terms": {"tags.name.raw": SENSITIVE_TERMS}},
+                {"terms": {"title.raw": SENSITIVE_TERMS}},
+                {"terms": {"description.raw": SENSITIVE_TERMS}},
+            ]
+        }
+    }
@@ -1,13 +1,17 @@
+import json
 import logging
+from unittest import mock
 
 import psycopg2
 import pytest
 from airflow.models import Variable
 
 from common.storage import columns as col
-from database.batched_update import constants
+from database.batched_update import batched_update, constants
 from database.batched_update.batched_update import (
     get_expected_update_count,
+    get_next_batch_size,
+    get_remaining_ranges,
     notify_slack,
     update_batches,
 )
@@ -305,6 +309,187 @@ def test_update_batches_resuming_from_batch_start(
     assert actual_rows[2][sql.title_idx] == NEW_TITLE
 
 
+@pytest.mark.parametrize(
+    "batch_size, duration, target_duration, expected",
+    [
+        pytest.param(10_000, 10, None, 10_000, id="not_adaptive"),
+        pytest.param(10_000, 20, 30, 15_000, id="grows_towards_target"),
+        pytest.param(10_000, 60, 30, 5_000, id="shrinks_towards_target"),
+        pytest.param(10_000, 1, 30, 20_000, id="grows_at_most_twofold"),
+        pytest.param(10_000, 600, 30, 5_000, id="shrinks_at_most_twofold"),
+        pytest.param(10_000, 0, 30, 20_000, id="instant_batch"),
+        pytest.param(1, 100, 30, 1, id="at_least_one_row"),
+        pytest.param(
+            constants.MAX_BATCH_SIZE, 1, 30, constants.MAX_BATCH_SIZE, id="max_size"
+        ),
+    ],
+)
+def test_get_next_batch_size(batch_size, duration, target_duration, expected):
+    assert get_next_batch_size(batch_size, duration, target_duration) == expected
+
+
+@pytest.mark.parametrize(
+    "checkpoint, workers, expected",
+    [
+        pytest.param(0, 1, [[0, 100]], id="start"),
+        pytest.param(0, 3, [[0, 25], [25, 50], [50, 100]], id="start_parallel"),
+        pytest.param(60, 2, [[60, 80], [80, 100]], id="row_id"),
+        pytest.param(100, 2, [], id="row_id_finished"),
+        pytest.param([[10, 50], [90, 100]], 2, [[10, 50], [90, 100]], id="ranges"),
+        pytest.param(
+            [[10, 50], [100, 100]], 2, [[10, 30], [30, 50]], id="ranges_finished_one"
+        ),
+        pytest.param([[50, 100], [0, 10]], 1, [[0, 10], [50, 100]], id="ranges_sorted"),
+        pytest.param([[99, 100]], 4, [[99, 100]], id="unsplittable"),
+    ],
+)
+def test_get_remaining_ranges(checkpoint, workers, expected):
+    assert get_remaining_ranges(checkpoint, 100, workers) == expected
+
+
+@pytest.fixture
+def mock_variable():
+    with mock.patch.object(batched_update, "Variable") as variable:
+        variable.get.return_value = 0
+        yield variable
+
+
+def _update_batches(**kwargs):
+    return update_batches.function(
+        **{
+            "dry_run": False,
+            "query_id": "test",
+            "table_name": "image",
+            "total_row_count": 100,
+            "batch_size": 10,
+            "update_query": f"SET title='{NEW_TITLE}'",
+            "additional_where": None,
+            "update_timeout": 3600,
+            "batch_start_var": "test_batch_start",
+            **kwargs,
+        }
+    )
+
+
+def _get_batches(run_sql) -> list[tuple[int, int]]:
+    return sorted(
+        (call.kwargs["batch_start"], call.kwargs["batch_end"])
+        for call in run_sql.call_args_list
+    )
+
+
+def _count_rows(batch_start, batch_end, **kwargs):
+    return batch_end - batch_start
+
+
+def test_update_batches_in_parallel(mock_variable):
+    with mock.patch.object(
+        batched_update.run_sql, "function", side_effect=_count_rows
+    ) as run:
+        updated_count = _update_batches(update_workers=4)
+
+    assert updated_count == 100
+    # Every row is updated exactly once, with each worker updating a quarter
+    assert _get_batches(run) == [
+        (start + offset, min(start + offset + 10, start + 25))
+        for start in range(0, 100, 25)
+        for offset in range(0, 25, 10)
+    ]
+    # The SQL is only logged once
+    assert [call.kwargs["log_sql"] for call in run.call_args_list].count(True) == 1
+    # Progress is checkpointed after every batch, and once more at the end
+    assert mock_variable.set.call_count == len(run.call_args_list) + 1
+    assert mock_variable.set.call_args == mock.call(
+        "test_batch_start",
+        [[25, 25], [50, 50], [75, 75], [100, 100]],
+        serialize_json=True,
+    )
+
+
+def test_update_batches_resumes_from_ranges(mock_variable):
+    mock_variable.get.return_value = [[20, 50], [90, 100]]
+    with mock.patch.object(batched_update.run_sql, "function", return_value=1) as run:
+        updated_count = _update_batches(update_workers=2)
+
+    assert _get_batches(run) == [(20, 30), (30, 40), (40, 50), (90, 100)]
+    assert updated_count == 4
+
+
+def test_update_batches_uses_fixed_batch_size_by_default(mock_variable):
+    clock = [0]
+
+    def run_sql(**kwargs):
+        clock[0] += 60
+        return 0
+
+    with (
+        mock.patch.object(
+            batched_update.run_sql, "function", side_effect=run_sql
+        ) as run,
+        mock.patch.object(batched_update.time, "monotonic", lambda: clock[0]),
+    ):
+        _update_batches()
+
+    # The batches run one at a time, and are not resized however long they take
+    assert _get_batches(run) == [(start, start + 10) for start in range(0, 100, 10)]
+
+
+def test_update_batches_adapts_batch_size(mock_variable):
+    clock = [0]
+
+    def run_sql(**kwargs):
+        # Each batch takes 5 seconds, whatever its size
+        clock[0] += 5
+        return 0
+
+    with (
+        mock.patch.object(
+            batched_update.run_sql, "function", side_effect=run_sql
+        ) as run,
+        mock.patch.object(batched_update.time, "monotonic", lambda: clock[0]),
+    ):
+        _update_batches(target_batch_duration=10)
+
+    assert _get_batches(run) == [(0, 10), (10, 30), (30, 70), (70, 100)]
+
+
+def test_update_batches_checkpoints_every_batch(mock_variable):
+    checkpoints = []
+    mock_variable.set.side_effect = lambda key, value, **kwargs: checkpoints.append(
+        json.loads(json.dumps(value))
+    )
+    with mock.patch.object(batched_update.run_sql, "function", return_value=10):
+        _update_batches(batch_size=20)
+
+    # After each batch commits, and once at the end
+    assert checkpoints == [
+        [[20, 100]],
+        [[40, 100]],
+        [[60, 100]],
+        [[80, 100]],
+        [[100, 100]],
+        [[100, 100]],
+    ]
+
+
+def test_update_batches_checkpoints_committed_batches_on_failure(mock_variable):
+    def run_sql(batch_start, **kwargs):
+        if batch_start == 70:
+            raise ValueError("Statement timeout")
+        return 10
+
+    with (
+        mock.patch.object(batched_update.run_sql, "function", side_effect=run_sql),
+        pytest.raises(ValueError),
+    ):
+        _update_batches(update_workers=2)
+
+    # The first worker finished its range, and the second stopped at its failed batch
+    assert mock_variable.set.call_args == mock.call(
+        "test_batch_start", [[50, 50], [70, 100]], serialize_json=True
+    )
+
+
 @pytest.mark.parametrize(
     "text, count, expected_message",
     [
@@ -2,13 +2,14 @@ import logging
 
 import psycopg2
 import pytest
+from airflow.models import Variable
 
 from common.storage import columns as col
 from common.storage.db_columns import DELETED_IMAGE_TABLE_COLUMNS, IMAGE_TABLE_COLUMNS
 from database.delete_records.delete_records import (
-    create_deleted_records,
-    delete_records_from_media_table,
+    delete_batches,
     notify_slack,
+    select_rows_to_delete,
 )
 from tests.test_utils import sql
 
@@ -42,12 +43,25 @@ def deleted_image_table(identifier):
 
 
 @pytest.fixture
-def postgres_with_image_and_deleted_image_table(image_table, deleted_image_table):
+def temp_table(identifier):
+    return f"image_rows_to_delete_{identifier}"
+
+
+@pytest.fixture
+def progress_var(identifier):
+    return f"test_{identifier}_progress"
+
+
+@pytest.fixture
+def postgres_with_image_and_deleted_image_table(
+    image_table, deleted_image_table, temp_table, progress_var
+):
     conn = psycopg2.connect(sql.POSTGRES_TEST_URI)
     cur = conn.cursor()
     drop_table_query = f"""
     DROP TABLE IF EXISTS {image_table} CASCADE;
     DROP TABLE IF EXISTS {deleted_image_table} CASCADE;
+    DROP TABLE IF EXISTS {temp_table} CASCADE;
     """
     cur.execute(drop_table_query)
     cur.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp" WITH SCHEMA public;')
@@ -62,6 +76,7 @@ def postgres_with_image_and_deleted_image_table(image_table, deleted_image_table
     yield sql.PostgresRef(cursor=cur, connection=conn)
 
     cur.execute(drop_table_query)
+    Variable.delete(progress_var)
 
     cur.close()
     conn.commit()
@@ -101,11 +116,58 @@ def _load_sample_data_into_image_table(image_table, postgres, sample_records=Non
     )
 
 
-def test_create_deleted_records(
+def _delete_records(
+    image_table, temp_table, progress_var, select_query, deleted_reason="FOO"
+):
+    total_row_count = select_rows_to_delete.function(
+        table=image_table,
+        select_query=select_query,
+        temp_table=temp_table,
+        postgres_conn_id=sql.POSTGRES_CONN_ID,
+    )
+    return delete_batches.function(
+        total_row_count=total_row_count,
+        temp_table=temp_table,
+        deleted_reason=deleted_reason,
+        media_type=image_table,
+        progress_var=progress_var,
+        batch_size=1,
+        db_columns=IMAGE_TABLE_COLUMNS,
+        deleted_db_columns=DELETED_IMAGE_TABLE_COLUMNS,
+        postgres_conn_id=sql.POSTGRES_CONN_ID,
+    )
+
+
+def test_select_rows_to_delete_reuses_temp_table(
+    postgres_with_image_and_deleted_image_table,
+    image_table,
+    temp_table,
+):
+    _load_sample_data_into_image_table(
+        image_table,
+        postgres_with_image_and_deleted_image_table,
+    )
+
+    select_query = f"WHERE provider='{MATCHING_PROVIDER}'"
+    counts = [
+        select_rows_to_delete.function(
+            table=image_table,
+            select_query=select_query,
+            temp_table=temp_table,
+            postgres_conn_id=sql.POSTGRES_CONN_ID,
+        )
+        for _ in range(2)
+    ]
+
+    assert counts == [2, 2]
+
+
+def test_delete_batches(
     postgres_with_image_and_deleted_image_table,
     image_table,
     deleted_image_table,
-    identifier,
+    temp_table,
+    progress_var,
 ):
     # Load sample data into the image table
     _load_sample_data_into_image_table(
@@ -114,22 +176,20 @@ def test_create_deleted_records(
     )
 
     # Delete records matching the MATCHING_PROVIDER
-    select_query = f"WHERE provider='{MATCHING_PROVIDER}'"
     deleted_reason = "FOO"
-    deleted_count = create_deleted_records.function(
-        media_type=image_table,
-        select_query=select_query,
-        deleted_reason=deleted_reason,
-        db_columns=IMAGE_TABLE_COLUMNS,
-        deleted_db_columns=DELETED_IMAGE_TABLE_COLUMNS,
-        postgres_conn_id=sql.POSTGRES_CONN_ID,
+    deleted_count = _delete_records(
+        image_table,
+        temp_table,
+        progress_var,
+        f"WHERE provider='{MATCHING_PROVIDER}'",
+        deleted_reason,
     )
 
-    # Both records A and B should have been added to the deleted image table
+    # Both records A and B should have been deleted
     assert deleted_count == 2
 
     postgres_with_image_and_deleted_image_table.cursor.execute(
-        f"SELECT * FROM {deleted_image_table};"
+        f"SELECT * FROM {deleted_image_table} ORDER BY foreign_identifier;"
     )
     actual_rows = postgres_with_image_and_deleted_image_table.cursor.fetchall()
 
@@ -147,12 +207,48 @@ def test_create_deleted_records(
     assert actual_rows[1][sql.license_idx] == LICENSE
     assert actual_rows[1][sql.deleted_reason_idx] == deleted_reason
 
+    postgres_with_image_and_deleted_image_table.cursor.execute(
+        f"SELECT * FROM {image_table};"
+    )
+    actual_rows = postgres_with_image_and_deleted_image_table.cursor.fetchall()
+
+    # There is only one record left in the image table
+    assert len(actual_rows) == 1
+    assert actual_rows[0][sql.fid_idx] == FID_C
+    assert actual_rows[0][sql.title_idx] == TITLE
+    assert actual_rows[0][sql.license_idx] == LICENSE
+
 
-def test_create_deleted_records_does_not_add_duplicates(
+def test_delete_batches_resumes_from_progress(
+    postgres_with_image_and_deleted_image_table,
+    image_table,
+    temp_table,
+    progress_var,
+):
+    _load_sample_data_into_image_table(
+        image_table,
+        postgres_with_image_and_deleted_image_table,
+    )
+    # Simulate a previous attempt which deleted the first record
+    Variable.set(progress_var, [[1, 3]], serialize_json=True)
+
+    deleted_count = _delete_records(
+        image_table, temp_table, progress_var, f"WHERE title='{TITLE}'"
+    )
+
+    assert deleted_count == 2
+    postgres_with_image_and_deleted_image_table.cursor.execute(
+        f"SELECT COUNT(*) FROM {image_table};"
+    )
+    assert postgres_with_image_and_deleted_image_table.cursor.fetchone()[0] == 1
+
+
+def test_delete_batches_does_not_add_duplicates(
     postgres_with_image_and_deleted_image_table,
     image_table,
     deleted_image_table,
-    identifier,
+    temp_table,
+    progress_var,
 ):
     sample_record = {
         col.FOREIGN_ID.db_name: FID_A,
@@ -160,54 +256,38 @@ def test_create_deleted_records_does_not_add_duplicates(
         col.PROVIDER.db_name: MATCHING_PROVIDER,
         col.TITLE.db_name: "Original title",
     }
-    # Load sample data into the image table
+    select_query = f"WHERE provider='{MATCHING_PROVIDER}'"
+
+    # Load and delete the record
     _load_sample_data_into_image_table(
         image_table,
         postgres_with_image_and_deleted_image_table,
-        sample_records=[
-            sample_record,
-        ],
+        sample_records=[sample_record],
     )
-
-    # Delete the record
-    select_query = f"WHERE provider='{MATCHING_PROVIDER}'"
     original_deleted_reason = "FOO"
-    deleted_count = create_deleted_records.function(
-        media_type=image_table,
-        select_query=select_query,
-        deleted_reason=original_deleted_reason,
-        db_columns=IMAGE_TABLE_COLUMNS,
-        deleted_db_columns=DELETED_IMAGE_TABLE_COLUMNS,
-        postgres_conn_id=sql.POSTGRES_CONN_ID,
+    deleted_count = _delete_records(
+        image_table, temp_table, progress_var, select_query, original_deleted_reason
     )
-
     assert deleted_count == 1
 
     # Load a record with the same (provider, foreign_id), but a new title into
-    # the image table
+    # the image table, and delete it again as part of a new DagRun
     _load_sample_data_into_image_table(
         image_table,
         postgres_with_image_and_deleted_image_table,
-        sample_records=[
-            # Sample record, modified to have a new title
-            {**sample_record, col.TITLE.db_name: "New title"},
-        ],
+        sample_records=[{**sample_record, col.TITLE.db_name: "New title"}],
     )
-
-    # Delete the record again
-    select_query = f"WHERE provider='{MATCHING_PROVIDER}'"
-    new_deleted_reason = "BAR"
-    deleted_count = create_deleted_records.function(
-        media_type=image_table,
-        select_query=select_query,
-        deleted_reason=new_deleted_reason,
-        db_columns=IMAGE_TABLE_COLUMNS,
-        deleted_db_columns=DELETED_IMAGE_TABLE_COLUMNS,
-        postgres_conn_id=sql.POSTGRES_CONN_ID,
+    postgres_with_image_and_deleted_image_table.cursor.execute(
+        f"DROP TABLE {temp_table};"
+    )
+    postgres_with_image_and_deleted_image_table.connection.commit()
+    Variable.delete(progress_var)
+    deleted_count = _delete_records(
+        image_table, temp_table, progress_var, select_query, "BAR"
     )
 
-    # 0 records were added to the deleted_image table
-    assert deleted_count == 0
+    # The record is deleted from the image table again
+    assert deleted_count == 1
 
     # There should only be one record in the deleted image table; a duplicate
     # (provider, foreign_id) should not have been added
@@ -224,109 +304,32 @@ def test_create_deleted_records_does_not_add_duplicates(
     assert actual_rows[0][sql.deleted_reason_idx] == original_deleted_reason
 
 
-def test_create_deleted_records_with_query_matching_no_rows(
+def test_delete_batches_with_query_matching_no_rows(
     postgres_with_image_and_deleted_image_table,
     image_table,
     deleted_image_table,
-    identifier,
+    temp_table,
+    progress_var,
 ):
-    # Load sample data into the image table
     _load_sample_data_into_image_table(
         image_table,
         postgres_with_image_and_deleted_image_table,
     )
 
-    # Try to delete records matching a condition that does not exist
-    select_query = "WHERE provider='NONEXISTENT_PROVIDER'"
-    deleted_reason = "FOO"
-    deleted_count = create_deleted_records.function(
-        media_type=image_table,
-        select_query=select_query,
-        deleted_reason=deleted_reason,
-        db_columns=IMAGE_TABLE_COLUMNS,
-        deleted_db_columns=DELETED_IMAGE_TABLE_COLUMNS,
-        postgres_conn_id=sql.POSTGRES_CONN_ID,
+    deleted_count = _delete_records(
+        image_table, temp_table, progress_var, "WHERE provider='NONEXISTENT_PROVIDER'"
     )
 
-    # No records should have been added to the deleted image table
+    # No records should have been deleted or added to the deleted image table
     assert deleted_count == 0
-
     postgres_with_image_and_deleted_image_table.cursor.execute(
         f"SELECT * FROM {deleted_image_table};"
     )
-    actual_rows = postgres_with_image_and_deleted_image_table.cursor.fetchall()
-
-    assert len(actual_rows) == 0
-
-
-def test_delete_records_from_media_table(
-    postgres_with_image_and_deleted_image_table,
-    image_table,
-    deleted_image_table,
-    identifier,
-):
-    # Load sample data into the image table
-    _load_sample_data_into_image_table(
-        image_table,
-        postgres_with_image_and_deleted_image_table,
-    )
-
-    # Delete records matching the MATCHING_PROVIDER
-    select_query = f"WHERE provider='{MATCHING_PROVIDER}'"
-    deleted_count = delete_records_from_media_table.function(
-        table=image_table,
-        select_query=select_query,
-        postgres_conn_id=sql.POSTGRES_CONN_ID,
-    )
-
-    # Both records A and B should have been deleted
-    assert deleted_count == 2
-
+    assert postgres_with_image_and_deleted_image_table.cursor.fetchall() == []
     postgres_with_image_and_deleted_image_table.cursor.execute(
         f"SELECT * FROM {image_table};"
     )
-    actual_rows = postgres_with_image_and_deleted_image_table.cursor.fetchall()
-
-    # There is only one record left in the image table
-    assert len(actual_rows) == 1
-
-    # They should both retain the fields of the original record, and have
-    # the deleted_reason set appropriately.
-    assert actual_rows[0][sql.fid_idx] == FID_C
-    assert actual_rows[0][sql.title_idx] == TITLE
-    assert actual_rows[0][sql.license_idx] == LICENSE
-
-
-def test_delete_no_records_from_media_table(
-    postgres_with_image_and_deleted_image_table,
-    image_table,
-    deleted_image_table,
-    identifier,
-):
-    # Load sample data into the image table
-    _load_sample_data_into_image_table(
-        image_table,
-        postgres_with_image_and_deleted_image_table,
-    )
-
-    # Try to delete records using a query that matches nothing
-    select_query = "WHERE provider='NONEXISTENT_PROVIDER'"
-    deleted_count = delete_records_from_media_table.function(
-        table=image_table,
-        select_query=select_query,
-        postgres_conn_id=sql.POSTGRES_CONN_ID,
-    )
-
-    # No records should have been deleted
-    assert deleted_count == 0
-
-    postgres_with_image_and_deleted_image_table.cursor.execute(
-        f"SELECT * FROM {image_table};"
-    )
-    actual_rows = postgres_with_image_and_deleted_image_table.cursor.fetchall()
-
-    # All three records are left in the image table
-    assert len(actual_rows) == 3
+    assert len(postgres_with_image_and_deleted_image_table.cursor.fetchall()) == 3
 
 
 def test_notify_slack():
@@ -0,0 +1,93 @@
+import re
+from unittest import mock
+
+import pytest
+
+from maintenance import warm_tls_support_store as warm
+
+
+# The pattern of the query, which Postgres and Python interpret alike
+HOST_PATTERN = re.search(r"FROM '(.+)'\)", warm.SELECT_HOSTS_QUERY).group(1)
+
+
+@pytest.fixture
+def postgres(monkeypatch):
+    hook = mock.MagicMock()
+    monkeypatch.setattr(warm, "PostgresHook", mock.MagicMock(return_value=hook))
+    return hook
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = mock.MagicMock()
+    monkeypatch.setattr(warm.tls_support, "get_default_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    probe = mock.MagicMock(
+        side_effect=lambda domains, concurrency: {
+            domain: not domain.startswith("insecure") for domain in domains
+        }
+    )
+    monkeypatch.setattr(warm.tls_support, "probe_tls_support", probe)
+    return probe
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        pytest.param("https://example.com/a.jpg", "example.com", id="https"),
+        pytest.param("HTTP://Example.com?a=b", "example.com", id="uppercase"),
+        pytest.param("www.example.com/a.jpg", "www.example.com", id="no_scheme"),
+        pytest.param("//example.com/a.jpg", "example.com", id="protocol_relative"),
+        pytest.param("https://example.com:8080#a", "example.com:8080", id="port"),
+    ],
+)
+def test_select_hosts_query_extracts_host(url, expected):
+    assert re.match(HOST_PATTERN, url.lower()).group(1) == expected
+
+
+def test_select_hosts_query_samples_table():
+    query = warm.SELECT_HOSTS_QUERY.format(
+        column="url", media_type="image", sample_percent=1.5
+    )
+
+    assert "substring(lower(url)" in query
+    assert "FROM image TABLESAMPLE SYSTEM (1.5);" in query
+
+
+def test_warm_tls_support_store_probes_stale_domains(postgres, store, probe):
+    postgres.run.side_effect = [
+        # url
+        ["fresh.org", "stale.org", "insecure.org", None],
+        # foreign_landing_url
+        ["www.fresh.org:443", "stale.org", ""],
+    ]
+    store.get.return_value = {"fresh.org": True, "www.fresh.org": False}
+
+    actual = warm.warm_tls_support_store.function(
+        media_type="image", sample_percent=1.0, concurrency=10
+    )
+
+    assert postgres.run.call_count == 2
+    store.get.assert_called_once_with(
+        {"fresh.org", "www.fresh.org", "stale.org", "insecure.org"}
+    )
+    probe.assert_called_once_with({"stale.org", "insecure.org"}, concurrency=10)
+    store.set.assert_called_once_with({"stale.org": True, "insecure.org": False})
+    assert actual == {"domains": 4, "probed": 2, "supported": 1}
+
+
+def test_warm_tls_support_store_without_stale_domains(postgres, store, probe):
+    postgres.run.side_effect = [["fresh.org"], []]
+    store.get.return_value = {"fresh.org": True}
+
+    actual = warm.warm_tls_support_store.function(
+        media_type="audio", sample_percent=1.0, concurrency=10
+    )
+
+    probe.assert_called_once_with(set(), concurrency=10)
+    store.set.assert_called_once_with({})
+    assert actual == {"domains": 1, "probed": 0, "supported": 0}
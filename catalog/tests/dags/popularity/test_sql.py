@@ -2,6 +2,7 @@ import os
 from collections import namedtuple
 from datetime import datetime, timedelta
 from textwrap import dedent
+from unittest import mock
 
 import psycopg2
 import pytest
@@ -430,7 +431,7 @@ def test_standardized_popularity_function_calculates(
                     "query_id": "foo_provider_popularity_refresh_20230101",
                     "table_name": "image",
                     "select_query": "WHERE provider='foo_provider' AND updated_on < '2023-01-01 00:00:00'",
-                    "update_query": "SET updated_on = NOW(), standardized_popularity = standardized_image_popularity(image.provider, image.meta_data)",
+                    "update_query": "SET updated_on = NOW(), standardized_popularity = (image.meta_data->>'views')::float / ((image.meta_data->>'views')::float + 2.5)",
                     "batch_size": 10000,
                     "update_timeout": 3600.0,
                     "dry_run": False,
@@ -446,7 +447,7 @@ def test_standardized_popularity_function_calculates(
                     "query_id": "my_provider_popularity_refresh_20230101",
                     "table_name": "audio",
                     "select_query": "WHERE provider='my_provider' AND updated_on < '2023-01-01 00:00:00'",
-                    "update_query": "SET updated_on = NOW(), standardized_popularity = standardized_audio_popularity(audio.provider, audio.meta_data)",
+                    "update_query": "SET updated_on = NOW(), standardized_popularity = (audio.meta_data->>'views')::float / ((audio.meta_data->>'views')::float + 2.5)",
                     "batch_size": 10000,
                     "update_timeout": 3600.0,
                     "dry_run": False,
@@ -456,7 +457,7 @@ def test_standardized_popularity_function_calculates(
                     "query_id": "your_provider_popularity_refresh_20230101",
                     "table_name": "audio",
                     "select_query": "WHERE provider='your_provider' AND updated_on < '2023-01-01 00:00:00'",
-                    "update_query": "SET updated_on = NOW(), standardized_popularity = standardized_audio_popularity(audio.provider, audio.meta_data)",
+                    "update_query": "SET updated_on = NOW(), standardized_popularity = (audio.meta_data->>'views')::float / ((audio.meta_data->>'views')::float + 2.5)",
                     "batch_size": 10000,
                     "update_timeout": 3600.0,
                     "dry_run": False,
@@ -474,10 +475,158 @@ def test_get_providers_update_confs(providers, media_type, expected_confs):
         popularity_metrics={provider: {"metric": "views"} for provider in providers},
     )
 
-    actual_confs = sql.get_providers_update_confs.function(
-        POSTGRES_CONN_ID,
-        config,
-        TEST_DAY,
-    )
+    with (
+        mock.patch.object(
+            sql,
+            "get_popularity_constants",
+            return_value={provider: ("views", 2.5) for provider in providers},
+        ),
+        mock.patch.object(sql.Variable, "get", return_value={}),
+    ):
+        actual_confs = sql.get_providers_update_confs.function(
+            POSTGRES_CONN_ID,
+            config,
+            TEST_DAY,
+        )
 
     assert actual_confs == expected_confs
+
+
+def test_standardized_popularity_query_matches_function(
+    postgres_with_image_table, sql_info, mock_pg_hook_task
+):
+    data_query = dedent(
+        f"""
+        INSERT INTO {sql_info.media_table} (
+          created_on, updated_on, provider, foreign_identifier, url,
+          meta_data, license, removed_from_source
+        )
+        VALUES
+          (
+            NOW(), NOW(), 'my_provider', 'fid_a', 'https://test.com/a.jpg',
+            '{{"views": 150, "description": "cats"}}', 'cc0', false
+          ),
+          (
+            NOW(), NOW(), 'my_provider', 'fid_b', 'https://test.com/b.jpg',
+            '{{"views": 0}}', 'cc0', false
+          ),
+          (
+            NOW(), NOW(), 'my_provider', 'fid_c', 'https://test.com/c.jpg',
+            '{{"comments": 100}}', 'cc0', false
+          ),
+          (
+            NOW(), NOW(), 'diff_provider', 'fid_d', 'https://test.com/d.jpg',
+            '{{"comments": 50}}', 'cc0', false
+          )
+        ;
+        """
+    )
+    metrics = {
+        "my_provider": {"metric": "views", "percentile": 0.8},
+        "diff_provider": {"metric": "comments", "percentile": 0.5},
+    }
+    _set_up_std_popularity_func(
+        postgres_with_image_table, data_query, metrics, sql_info, mock_pg_hook_task
+    )
+
+    constants = sql.get_popularity_constants(
+        POSTGRES_CONN_ID, media_type="image", sql_info=sql_info
+    )
+    for provider, (metric, constant) in constants.items():
+        update_query = sql.format_update_standardized_popularity_query(
+            metric, constant, media_type="image", sql_info=sql_info
+        )
+        postgres_with_image_table.cursor.execute(
+            f"UPDATE {sql_info.media_table} {update_query}"
+            f" WHERE provider = '{provider}';"
+        )
+    postgres_with_image_table.connection.commit()
+
+    postgres_with_image_table.cursor.execute(
+        f"""
+        SELECT standardized_popularity,
+          {sql_info.standardized_popularity_fn}(provider, meta_data)
+        FROM {sql_info.media_table};
+        """
+    )
+    rows = postgres_with_image_table.cursor.fetchall()
+    assert len(rows) == 4
+    for inlined, function in rows:
+        assert inlined == pytest.approx(function)
+
+
+@pytest.mark.parametrize(
+    "constants, refreshed_constants, expected_providers",
+    [
+        pytest.param(
+            {"a": ("views", 10.0), "b": ("likes", 5.0)},
+            {},
+            ["a", "b"],
+            id="never_refreshed",
+        ),
+        pytest.param(
+            {"a": ("views", 10.05), "b": ("likes", 5.5)},
+            {"a": 10.0, "b": 5.0},
+            ["b"],
+            id="skips_small_change",
+        ),
+        pytest.param(
+            {"a": ("views", 9.0), "b": ("likes", 5.0)},
+            {"a": 10.0, "b": 5.0},
+            ["a"],
+            id="refreshes_decrease",
+        ),
+        pytest.param(
+            {"a": ("views", None), "b": ("likes", 5.0)},
+            {},
+            ["b"],
+            id="skips_missing_constant",
+        ),
+        pytest.param(
+            {"b": ("likes", 5.0)},
+            {},
+            ["b"],
+            id="skips_missing_provider",
+        ),
+        pytest.param(
+            {"a": ("views", 10.0), "b": ("likes", 5.0)},
+            {"a": 0.0},
+            ["a", "b"],
+            id="refreshes_zero_constant",
+        ),
+    ],
+)
+def test_get_providers_to_refresh(constants, refreshed_constants, expected_providers):
+    config = PopularityRefresh(
+        media_type="image",
+        popularity_metrics={"a": {"metric": "views"}, "b": {"metric": "likes"}},
+    )
+
+    providers = sql.get_providers_to_refresh(config, constants, refreshed_constants)
+
+    assert list(providers) == expected_providers
+    assert all(providers[provider] == constants[provider] for provider in providers)
+
+
+def test_record_refreshed_constants():
+    config = PopularityRefresh(
+        media_type="image",
+        popularity_metrics={"a": {"metric": "views"}, "b": {"metric": "likes"}},
+    )
+    with (
+        mock.patch.object(
+            sql,
+            "get_popularity_constants",
+            return_value={"a": ("views", 10.05), "b": ("likes", 6.0)},
+        ),
+        mock.patch.object(sql, "Variable") as variable,
+    ):
+        variable.get.return_value = {"a": 10.0, "b": 5.0}
+        sql.record_refreshed_constants.function(POSTGRES_CONN_ID, config)
+
+    # The constant of `a` is kept, since its scores were not refreshed
+    variable.set.assert_called_once_with(
+        "image_popularity_refresh_refreshed_constants",
+        {"a": 10.0, "b": 6.0},
+        serialize_json=True,
+    )
@@ -62,6 +62,16 @@ class MockProviderDataIngester(MockProviderDataIngesterMixin, ProviderDataIngest
         return record["media_type"]
 
 
+class MockPrefetchingProviderDataIngester(MockProviderDataIngester):
+    prefetch_batches = 2
+    max_concurrent_requests = 3
+    requests_per_second = 100
+
+
+class MockPipeliningProviderDataIngester(MockProviderDataIngester):
+    pipeline_batches = True
+
+
 class MockImageOnlyProviderDataIngester(
     MockProviderDataIngesterMixin, ProviderDataIngester
 ):
@@ -1,4 +1,5 @@
 import logging
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -205,3 +206,35 @@ def test_handle_single_response():
     actual_image = mock_save_item.call_args[0][0]
     for key, value in expected_image.items():
         assert getattr(actual_image, key) == value
+
+
+def test_ingest_records_requests_next_batch_while_processing():
+    pipelining_ingester = ClevelandDataIngester()
+    last_skip = 2 * pipelining_ingester.batch_limit
+    next_batch_requested = threading.Event()
+    processed_skips = []
+
+    def get_response_json(query_params):
+        if query_params["skip"] == pipelining_ingester.batch_limit:
+            next_batch_requested.set()
+        if query_params["skip"] > last_skip:
+            return {"data": []}
+        return {"data": [{"skip": query_params["skip"]}] * 5}
+
+    def process_batch(batch):
+        if batch[0]["skip"] == 0:
+            # The second batch is requested before the first is done processing
+            assert next_batch_requested.wait(timeout=5)
+        processed_skips.append(batch[0]["skip"])
+        return len(batch)
+
+    with (
+        patch.object(
+            pipelining_ingester, "get_response_json", side_effect=get_response_json
+        ),
+        patch.object(pipelining_ingester, "process_batch", side_effect=process_batch),
+    ):
+        pipelining_ingester.ingest_records()
+
+    assert processed_skips == [0, 1000, 2000]
+    assert pipelining_ingester.record_count == 15
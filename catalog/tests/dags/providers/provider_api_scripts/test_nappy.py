@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from tests.dags.providers.provider_api_scripts.resources.json_load import (
     make_resource_json_func,
@@ -5,6 +7,7 @@ from tests.dags.providers.provider_api_scripts.resources.json_load import (
 
 from common.constants import IMAGE
 from common.licenses import LicenseInfo
+from common.requester import ConcurrentDelayedRequester
 from providers.provider_api_scripts.nappy import NappyDataIngester
 
 
@@ -169,3 +172,42 @@ def test_convert_filesize(raw_filesize_string, expected_result):
     # this is a static method, so not using the instance for testing
     actual_result = NappyDataIngester._convert_filesize(raw_filesize_string)
     assert actual_result == expected_result
+
+
+def test_ingest_records_prefetches_pages():
+    prefetching_ingester = NappyDataIngester()
+    last_page = 3
+
+    def get_response_json(query_params):
+        page = query_params["page"]
+        if page > last_page:
+            return {"images": [], "next_page": None}
+        return {
+            "images": [{"page": page}] * 10,
+            "next_page": f"{NappyDataIngester.endpoint}?page={page + 1}"
+            if page < last_page
+            else None,
+        }
+
+    processed_pages = []
+
+    def process_batch(batch):
+        processed_pages.append(batch[0]["page"])
+        return len(batch)
+
+    with (
+        mock.patch.object(
+            prefetching_ingester, "get_response_json", side_effect=get_response_json
+        ),
+        mock.patch.object(
+            prefetching_ingester, "process_batch", side_effect=process_batch
+        ),
+    ):
+        prefetching_ingester.ingest_records()
+
+    assert isinstance(
+        prefetching_ingester.delayed_requester, ConcurrentDelayedRequester
+    )
+    # Pages are processed in order, however many were requested ahead
+    assert processed_pages == [1, 2, 3]
+    assert prefetching_ingester.record_count == 30
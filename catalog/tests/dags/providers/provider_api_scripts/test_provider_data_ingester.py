@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -15,10 +17,13 @@ from tests.dags.providers.provider_api_scripts.resources.provider_data_ingester.
     IncorrectlyConfiguredMockProviderDataIngester,
     MockAudioOnlyProviderDataIngester,
     MockImageOnlyProviderDataIngester,
+    MockPipeliningProviderDataIngester,
+    MockPrefetchingProviderDataIngester,
     MockProviderDataIngester,
 )
 
 from common.loader import provider_details as prov
+from common.requester import ConcurrentDelayedRequester, DelayedRequester
 from common.storage.audio import AudioStore, MockAudioStore
 from common.storage.image import ImageStore, MockImageStore
 from providers.provider_api_scripts.provider_data_ingester import (
@@ -584,6 +589,268 @@ def test_ingest_records_handles_skipped_ingestion_errors(
         assert get_batch_mock.call_count == expected_call_count
 
 
+@pytest.mark.parametrize(
+    "ingester_class, expected_requester_class",
+    [
+        (MockProviderDataIngester, DelayedRequester),
+        (MockPrefetchingProviderDataIngester, ConcurrentDelayedRequester),
+    ],
+)
+def test_init_requester(ingester_class, expected_requester_class):
+    ingester = ingester_class()
+    assert type(ingester.delayed_requester) is expected_requester_class
+
+
+def _delayed_batches(batches_by_page: dict):
+    """
+    Mock `get_batch` so that earlier pages take longer to return, in order to check
+    that prefetched batches are nevertheless processed in order.
+    """
+
+    def get_batch(query_params):
+        page = query_params["page"]
+        time.sleep(0.01 * max(len(batches_by_page) - page, 0))
+        result = batches_by_page.get(page, ([], True))
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return get_batch
+
+
+def test_ingest_records_with_prefetching_processes_batches_in_order():
+    ingester = MockPrefetchingProviderDataIngester()
+    batches_by_page = {page: ([{"page": page}], True) for page in range(1, 6)}
+    processed_pages = []
+
+    with (
+        patch.object(
+            ingester, "get_batch", side_effect=_delayed_batches(batches_by_page)
+        ) as get_batch_mock,
+        patch.object(
+            ingester,
+            "process_batch",
+            side_effect=lambda batch: processed_pages.append(batch[0]["page"]) or 1,
+        ),
+        patch.object(ingester, "_commit_records") as commit_mock,
+    ):
+        ingester.ingest_records()
+
+    assert processed_pages == [1, 2, 3, 4, 5]
+    assert ingester.record_count == 5
+    assert commit_mock.called
+    # Requests are never made more than `prefetch_batches` beyond the empty page
+    assert get_batch_mock.call_count <= 6 + ingester.prefetch_batches
+
+
+def test_ingest_records_with_prefetching_limits_requests_in_flight():
+    ingester = MockPrefetchingProviderDataIngester()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def get_batch(query_params):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return [{}], query_params["page"] < 10
+
+    with (
+        patch.object(ingester, "get_batch", side_effect=get_batch),
+        patch.object(ingester, "process_batch", return_value=1),
+        patch.object(ingester, "_commit_records"),
+    ):
+        ingester.ingest_records()
+
+    assert ingester.record_count == 10
+    # At most the batch being processed and `prefetch_batches` more are requested
+    assert max_in_flight <= ingester.prefetch_batches + 1
+
+
+def test_ingest_records_with_prefetching_handles_skipped_ingestion_errors():
+    ingester = MockPrefetchingProviderDataIngester()
+    batches_by_page = {
+        1: (EXPECTED_BATCH_DATA, True),
+        2: ValueError("Whoops :C"),
+        3: (EXPECTED_BATCH_DATA, True),
+    }
+
+    with (
+        patch.object(
+            ingester, "get_batch", side_effect=_delayed_batches(batches_by_page)
+        ),
+        patch.object(ingester, "process_batch", return_value=3) as process_batch_mock,
+        patch.object(ingester, "_should_skip_ingestion_error", return_value=True),
+    ):
+        with pytest.raises(AggregateIngestionError):
+            ingester.ingest_records()
+
+    assert process_batch_mock.call_count == 2
+    assert len(ingester.ingestion_errors) == 1
+    assert '"page": 2' in ingester.ingestion_errors[0].query_params
+
+
+def test_ingest_records_with_prefetching_raises_unskipped_errors():
+    ingester = MockPrefetchingProviderDataIngester()
+    batches_by_page = {
+        1: (EXPECTED_BATCH_DATA, True),
+        2: ValueError("Whoops :C"),
+        3: (EXPECTED_BATCH_DATA, True),
+    }
+
+    with (
+        patch.object(
+            ingester, "get_batch", side_effect=_delayed_batches(batches_by_page)
+        ),
+        patch.object(ingester, "process_batch", return_value=3) as process_batch_mock,
+        patch.object(ingester, "_commit_records") as commit_mock,
+    ):
+        with pytest.raises(ValueError, match="Whoops :C"):
+            ingester.ingest_records()
+
+    # Records from the batch before the error are committed, and later batches
+    # are discarded
+    process_batch_mock.assert_called_once_with(EXPECTED_BATCH_DATA)
+    assert commit_mock.called
+
+
+def test_ingest_records_with_pipelining_overlaps_requests_and_processing():
+    ingester = MockPipeliningProviderDataIngester()
+    events = []
+
+    def get_batch(query_params):
+        page = query_params["page"]
+        events.append(f"get {page}")
+        return [{"page": page}], page < 3
+
+    def process_batch(batch):
+        # Give the background request time to start
+        time.sleep(0.05)
+        events.append(f"process {batch[0]['page']}")
+        return 1
+
+    with (
+        patch.object(ingester, "get_batch", side_effect=get_batch),
+        patch.object(ingester, "process_batch", side_effect=process_batch),
+        patch.object(ingester, "_commit_records") as commit_mock,
+    ):
+        ingester.ingest_records()
+
+    # Each batch is requested while the previous one is processed, and no batch is
+    # requested once `should_continue` is False
+    assert events == [
+        "get 1",
+        "get 2",
+        "process 1",
+        "get 3",
+        "process 2",
+        "process 3",
+    ]
+    assert ingester.record_count == 3
+    assert commit_mock.called
+
+
+def test_ingest_records_with_pipelining_uses_state_from_get_batch():
+    ingester = MockPipeliningProviderDataIngester()
+    cursors = iter(["a", "b", None])
+    requested_cursors = []
+
+    def get_next_query_params(prev_query_params):
+        return {"cursor": getattr(ingester, "cursor", None)}
+
+    def get_batch(query_params):
+        requested_cursors.append(query_params["cursor"])
+        ingester.cursor = next(cursors)
+        return [{}], ingester.cursor is not None
+
+    with (
+        patch.object(ingester, "get_next_query_params", get_next_query_params),
+        patch.object(ingester, "get_batch", side_effect=get_batch),
+        patch.object(ingester, "process_batch", return_value=1),
+        patch.object(ingester, "_commit_records"),
+    ):
+        ingester.ingest_records()
+
+    assert requested_cursors == [None, "a", "b"]
+    assert ingester.record_count == 3
+
+
+@pytest.mark.parametrize(
+    "batches, expected_process_batch_calls",
+    [
+        # An error when requesting a batch is skipped
+        (
+            [
+                (EXPECTED_BATCH_DATA, True),
+                ValueError("Whoops :C"),
+                (EXPECTED_BATCH_DATA, True),
+                (None, True),
+            ],
+            2,
+        ),
+        # An error when processing a batch is skipped
+        (
+            [
+                (EXPECTED_BATCH_DATA, True),
+                ([{"raise": True}], True),
+                (EXPECTED_BATCH_DATA, True),
+                (None, True),
+            ],
+            3,
+        ),
+    ],
+)
+def test_ingest_records_with_pipelining_handles_skipped_ingestion_errors(
+    batches, expected_process_batch_calls
+):
+    ingester = MockPipeliningProviderDataIngester()
+
+    def process_batch(batch):
+        if batch[0].get("raise"):
+            raise ValueError("Whoops :C")
+        return 3
+
+    with (
+        patch.object(ingester, "get_batch", side_effect=batches),
+        patch.object(
+            ingester, "process_batch", side_effect=process_batch
+        ) as process_batch_mock,
+        patch.object(ingester, "_should_skip_ingestion_error", return_value=True),
+    ):
+        with pytest.raises(AggregateIngestionError):
+            ingester.ingest_records()
+
+    assert process_batch_mock.call_count == expected_process_batch_calls
+    # Only the batches before and after the error were ingested
+    assert ingester.record_count == 6
+    assert len(ingester.ingestion_errors) == 1
+    assert '"page": 2' in ingester.ingestion_errors[0].query_params
+
+
+def test_ingest_records_with_pipelining_raises_unskipped_errors():
+    ingester = MockPipeliningProviderDataIngester()
+
+    with (
+        patch.object(ingester, "get_batch") as get_batch_mock,
+        patch.object(ingester, "process_batch", return_value=3) as process_batch_mock,
+        patch.object(ingester, "_commit_records") as commit_mock,
+    ):
+        get_batch_mock.side_effect = [
+            (EXPECTED_BATCH_DATA, True),
+            ValueError("Whoops :C"),
+            (EXPECTED_BATCH_DATA, True),
+        ]
+        with pytest.raises(ValueError, match="Whoops :C"):
+            ingester.ingest_records()
+
+    process_batch_mock.assert_called_once_with(EXPECTED_BATCH_DATA)
+    assert commit_mock.called
+
+
 @pytest.mark.parametrize(
     "skip_all_ingestion_errors, skipped_ingestion_errors, error, should_skip",
     [
@@ -1,5 +1,6 @@
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from itertools import repeat
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -13,6 +14,31 @@ FROZEN_DATE = "2020-04-01"
 ingester = MockTimeDelineatedProviderDataIngester(date=FROZEN_DATE)
 
 
+@pytest.fixture(autouse=True)
+def record_counts_variable():
+    variables = {}
+
+    def get(key, default_var=None, deserialize_json=False):
+        return variables.get(key, default_var)
+
+    def set_(key, value, serialize_json=False):
+        variables[key] = value
+
+    with (
+        patch(
+            "providers.provider_api_scripts.time_delineated_provider_data_ingester.Variable"
+        ) as variable_mock,
+        patch(
+            "providers.provider_api_scripts.time_delineated_provider_data_ingester._get_variable_keys",
+            side_effect=lambda prefix: [k for k in variables if k.startswith(prefix)],
+        ),
+    ):
+        variable_mock.get.side_effect = get
+        variable_mock.set.side_effect = set_
+        variable_mock.delete.side_effect = lambda key: variables.pop(key, None)
+        yield variables
+
+
 def test_raises_error_when_date_is_undefined():
     expected_error = (
         "TimeDelineatedProviderDataIngester should only be used for dated DAGs."
@@ -88,19 +114,21 @@ def test_get_timestamp_pairs_returns_full_day_when_few_records_found():
 
 
 def test_get_timestamp_pairs_with_large_record_counts():
-    with patch.object(ingester, "_get_record_count") as mock_count:
-        # Mock the calls to _get_record_count in order
-        mock_count.side_effect = (
-            [
-                150_000,  # Getting total count for the entire day
-                0,  # Get count for first hour, count == 0
-                10,  # Get count for second hour, count < max_records
-                101_000,  # Get count for third hour, count > division_threshold
-                49_090,  # Get count for fourth hour, max_records < count < division_threshold
-            ]
-            + list(repeat(0, 20))
-        )  # Fill list with count == 0 for the remaining hours
-
+    # The counts for the hours are requested concurrently, so they are mocked by
+    # interval rather than in order
+    hour_counts = {
+        1: 10,  # Get count for second hour, count < max_records
+        2: 101_000,  # Get count for third hour, count > division_threshold
+        3: 49_090,  # Get count for fourth hour, max_records < count < division_threshold
+    }
+
+    def get_record_count(start, end):
+        if end - start == timedelta(days=1):
+            return 150_000  # Getting total count for the entire day
+        # Count == 0 for the remaining hours
+        return hour_counts.get(start.hour, 0)
+
+    with patch.object(ingester, "_get_record_count", side_effect=get_record_count):
         # We only get timestamp pairs for the hours that had records. For the
         # hour with > 100k records, we get 20 3-min pairs. For the hour with
         # < 100k records, we get 12 5-min pairs.
@@ -151,6 +179,99 @@ def test_get_timestamp_pairs_with_large_record_counts():
         assert formatted_actual_pairs_list == expected_pairs_list
 
 
+def test_get_timestamp_pairs_requests_hour_counts_concurrently():
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def get_record_count(start, end):
+        nonlocal in_flight, max_in_flight
+        if end - start == timedelta(days=1):
+            return MAX_RECORDS
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return 0
+
+    with patch.object(ingester, "_get_record_count", side_effect=get_record_count):
+        assert ingester._get_timestamp_pairs() == []
+
+    assert max_in_flight == ingester.max_concurrent_count_requests
+
+
+def test_get_timestamp_pairs_uses_cached_counts(record_counts_variable):
+    with patch.object(
+        ingester, "_get_record_count", return_value=MAX_RECORDS
+    ) as count_mock:
+        first_pairs = ingester._get_timestamp_pairs()
+        assert count_mock.call_count == 25
+
+        count_mock.reset_mock()
+        assert ingester._get_timestamp_pairs() == first_pairs
+        count_mock.assert_not_called()
+
+    assert len(record_counts_variable[ingester.record_counts_variable]["counts"]) == 25
+
+
+def test_get_timestamp_pairs_caches_counts_received_before_an_error(
+    record_counts_variable,
+):
+    def get_record_count(start, end):
+        if start.hour == 12:
+            raise ValueError("Whoops :C")
+        return MAX_RECORDS
+
+    ingester.max_concurrent_count_requests = 1
+    try:
+        with patch.object(ingester, "_get_record_count", side_effect=get_record_count):
+            with pytest.raises(ValueError, match="Whoops"):
+                ingester._get_timestamp_pairs()
+    finally:
+        del ingester.max_concurrent_count_requests
+
+    # The count for the day and the first 12 hours were received
+    cached = record_counts_variable[ingester.record_counts_variable]
+    assert len(cached["counts"]) == 13
+
+
+def test_ingest_records_clears_cached_counts(record_counts_variable):
+    with (
+        patch(
+            "providers.provider_api_scripts.provider_data_ingester.ProviderDataIngester._ingest_records"
+        ),
+        patch.object(ingester, "_get_record_count", return_value=0),
+    ):
+        ingester.ingest_records()
+
+    assert ingester.record_counts_variable not in record_counts_variable
+
+
+def test_ingest_records_sweeps_expired_cached_counts(record_counts_variable):
+    now = datetime.now(timezone.utc)
+    prefix = ingester.record_counts_prefix
+    record_counts_variable |= {
+        f"{prefix}2020-03-01": {"cached_at": (now - timedelta(days=8)).isoformat()},
+        f"{prefix}2020-03-02": {"cached_at": (now - timedelta(days=1)).isoformat()},
+        f"{prefix}2020-03-03": {},
+        "OtherDataIngester_record_counts_2020-03-01": {},
+    }
+    with (
+        patch(
+            "providers.provider_api_scripts.provider_data_ingester.ProviderDataIngester._ingest_records"
+        ),
+        patch.object(ingester, "_get_record_count", return_value=0),
+    ):
+        ingester.ingest_records()
+
+    assert set(record_counts_variable) == {
+        f"{prefix}2020-03-02",
+        "OtherDataIngester_record_counts_2020-03-01",
+    }
+
+
 def test_ingest_records_calls_super_for_each_ts_pair():
     with (
         patch(
@@ -9,6 +9,7 @@ from tests.dags.providers.provider_api_scripts.resources.json_load import (
 from common.constants import IMAGE
 from common.licenses import get_license_info
 from providers.provider_api_scripts.wikimedia_commons import (
+    GLOBAL_USAGE_COUNT,
     WikimediaCommonsDataIngester,
 )
 
@@ -22,6 +23,19 @@ logging.basicConfig(
 _get_resource_json = make_resource_json_func("wikimedia")
 
 
+def _count_global_usage(page: dict) -> dict:
+    """Replace the global usage entries of a page by their count, as when merged."""
+    page[GLOBAL_USAGE_COUNT] = len(page.pop("globalusage", []))
+    return page
+
+
+def _get_merged_resource_json(resource: str) -> dict:
+    response = _get_resource_json(resource)
+    for page in response["query"]["pages"].values():
+        _count_global_usage(page)
+    return response
+
+
 @pytest.fixture
 def wmc() -> WikimediaCommonsDataIngester:
     return WikimediaCommonsDataIngester(date="2018-01-15")
@@ -116,7 +130,7 @@ def test_get_response_json(monkeypatch, wmc):
         else:
             return None
 
-    expect_image_batch = _get_resource_json("continuation/wmc_pretty123.json")
+    expect_image_batch = _get_merged_resource_json("continuation/wmc_pretty123.json")
     expect_continue_token = expect_image_batch.pop("continue")
 
     monkeypatch.setattr(
@@ -192,7 +206,9 @@ def test_get_response_json_props_reset_on_batchcomplete(monkeypatch, wmc):
 def test_merge_response_jsons(wmc):
     left_response = _get_resource_json("continuation/wmc_pretty1.json")
     right_response = _get_resource_json("continuation/wmc_pretty2.json")
-    expect_merged_response = _get_resource_json("continuation/wmc_pretty1plus2.json")
+    expect_merged_response = _get_merged_resource_json(
+        "continuation/wmc_pretty1plus2.json"
+    )
 
     actual_merged_response = wmc.merge_response_jsons(
         left_response,
@@ -204,39 +220,69 @@ def test_merge_response_jsons(wmc):
 def test_merge_media_pages_left_only_with_gu(wmc):
     left_page = _get_resource_json("continuation/page_44672185_left.json")
     right_page = _get_resource_json("continuation/page_44672185_right.json")
+    expect_merged_page = _count_global_usage(left_page.copy())
     actual_merged_page = wmc.merge_media_pages(left_page, right_page)
-    assert actual_merged_page == left_page
+    assert actual_merged_page == expect_merged_page
 
 
 def test_merge_media_pages_left_only_with_gu_backwards(wmc):
     left_page = _get_resource_json("continuation/page_44672185_left.json")
     right_page = _get_resource_json("continuation/page_44672185_right.json")
+    expect_merged_page = _count_global_usage(left_page.copy())
     actual_merged_page = wmc.merge_media_pages(right_page, left_page)
-    assert actual_merged_page == left_page
+    assert actual_merged_page == expect_merged_page
 
 
 def test_merge_media_pages_neither_have_gu(wmc):
     left_page = _get_resource_json("continuation/page_44672210_left.json")
     right_page = _get_resource_json("continuation/page_44672210_right.json")
+    expect_merged_page = _count_global_usage(left_page.copy())
     actual_merged_page = wmc.merge_media_pages(left_page, right_page)
-    assert actual_merged_page == left_page
+    assert actual_merged_page == expect_merged_page
 
 
 def test_merge_media_pages_neigher_have_gu_backwards(wmc):
     left_page = _get_resource_json("continuation/page_44672210_left.json")
     right_page = _get_resource_json("continuation/page_44672210_right.json")
+    expect_merged_page = _count_global_usage(left_page.copy())
     actual_merged_page = wmc.merge_media_pages(right_page, left_page)
-    assert actual_merged_page == left_page
+    assert actual_merged_page == expect_merged_page
 
 
 def test_merge_media_pages_both_have_gu(wmc):
     left_page = _get_resource_json("continuation/page_44672212_left.json")
     right_page = _get_resource_json("continuation/page_44672212_right.json")
-    expect_merged_page = _get_resource_json("continuation/page_44672212_merged.json")
+    expect_merged_page = _count_global_usage(
+        _get_resource_json("continuation/page_44672212_merged.json")
+    )
     actual_merged_page = wmc.merge_media_pages(left_page, right_page)
     assert actual_merged_page == expect_merged_page
 
 
+def test_merge_response_jsons_many_continuations(wmc):
+    first_response = _get_resource_json("continuation/wmc_pretty1.json")
+    continuations = [
+        _get_resource_json("continuation/wmc_pretty2.json") for _ in range(500)
+    ]
+    expect_counts = {
+        page_id: len(page.get("globalusage", []))
+        + 500 * len(continuations[0]["query"]["pages"][page_id].get("globalusage", []))
+        for page_id, page in first_response["query"]["pages"].items()
+    }
+
+    merged_response = wmc.merge_response_jsons(None, first_response)
+    for response in continuations:
+        merged_response = wmc.merge_response_jsons(merged_response, response)
+
+    merged_pages = merged_response["query"]["pages"]
+    assert merged_response is first_response
+    assert merged_response["continue"] == continuations[-1]["continue"]
+    assert not any("globalusage" in page for page in merged_pages.values())
+    assert {
+        page_id: page[GLOBAL_USAGE_COUNT] for page_id, page in merged_pages.items()
+    } == expect_counts
+
+
 def test_extract_title_gets_cleaned_title(wmc):
     image_info = {"extmetadata": {"ObjectName": {"value": "File:filename.jpg"}}}
     actual_title = wmc.extract_title(image_info)
@@ -438,6 +484,15 @@ def test_create_meta_data_tallies_global_usage_count_keeps_higher_value(wmc):
     assert actual_gu == expect_gu
 
 
+def test_create_meta_data_tallies_merged_global_usage_count(wmc):
+    media_data = _get_resource_json("continuation/page_44672212_left.json")
+    media_data = wmc.merge_media_pages(
+        media_data, _get_resource_json("continuation/page_44672212_right.json")
+    )
+    actual_gu = wmc.create_meta_data_dict(media_data)["global_usage_count"]
+    assert actual_gu == 16
+
+
 def test_create_meta_data_tallies_zero_global_usage_count(wmc):
     media_data = _get_resource_json("continuation/page_44672185_right.json")
     actual_gu = wmc.create_meta_data_dict(media_data)["global_usage_count"]
@@ -7,6 +7,7 @@ from tests.dags.common.test_resources.fake_provider_data_ingester import (
     FakeDataIngester,
 )
 
+from common.storage.media import MediaStore
 from providers import factory_utils
 
 
@@ -170,3 +171,37 @@ def test_date_partition_for_prefix(
         schedule, datetime(2022, 2, 3), reingestion_date
     )
     assert actual == expected_schedule_prefix + expected_reingestion_prefix
+
+
+def test_pull_media_wrapper_configures_and_closes_stores(
+    ti_mock, dagrun_mock, internal_func_mock
+):
+    stores = fdi.media_stores.values()
+    with (
+        mock.patch.object(MediaStore, "configure_output") as mock_configure,
+        mock.patch.object(MediaStore, "close") as mock_close,
+    ):
+        factory_utils.pull_media_wrapper(
+            FakeDataIngesterClass,
+            ["image", "audio"],
+            ti_mock,
+            dagrun_mock,
+            args=[internal_func_mock, 42],
+            tsv_compression="gzip",
+            s3_bucket="bucket",
+            s3_prefixes={"image": "image/fake", "audio": "audio/fake"},
+            aws_conn_id="aws_test",
+            s3_extra_args={"StorageClass": "STANDARD_IA"},
+        )
+
+    assert mock_configure.call_args_list == [
+        mock.call(
+            compression="gzip",
+            s3_bucket="bucket",
+            s3_prefix=f"{store.media_type}/fake",
+            aws_conn_id="aws_test",
+            s3_extra_args={"StorageClass": "STANDARD_IA"},
+        )
+        for store in stores
+    ]
+    assert mock_close.call_count == len(stores)
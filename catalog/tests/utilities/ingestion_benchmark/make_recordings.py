@@ -0,0 +1,89 @@
+"""
+Make the recordings replayed by the ingestion benchmark tests.
+
+The recordings are made with `benchmark.record`, exactly like recordings of the live
+APIs, but the APIs are stood in for by the sample responses which the provider tests
+already use, so that they can be remade offline and are small enough to commit:
+
+    python -m tests.utilities.ingestion_benchmark.make_recordings
+
+Each provider serves its sample pages in order, followed by an empty page, and any
+other request (e.g. a `HEAD` request for a file size) receives an empty 200 response
+with a `Content-Length`.
+"""
+
+import json
+from pathlib import Path
+from unittest import mock
+
+import requests
+from tests.dags.providers.provider_api_scripts.resources.json_load import (
+    make_resource_json_func,
+)
+
+from common.requester import DelayedRequester
+from utilities.ingestion_benchmark import benchmark
+
+
+RECORDINGS = Path(__file__).parent / "recordings"
+
+# The sample pages served for each provider, in order, by resources folder and
+# followed by the empty page which ends ingestion
+SAMPLE_PAGES = {
+    "cleveland_museum": (
+        "clevelandmuseum",
+        ["handle_response_data.json"],
+        {"data": []},
+    ),
+    "nappy": ("nappy", ["images.json"], {"images": [], "next_page": None}),
+    "stocksnap": (
+        "stocksnap",
+        ["full_response.json", "last_full_response.json"],
+        {"results": [], "nextPage": False},
+    ),
+}
+
+
+def _response(url: str, content: bytes, headers: dict | None = None):
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
+
+def make_recording(provider: str, output: Path = RECORDINGS) -> Path:
+    """Record an ingestion of the provider's sample pages."""
+    folder, page_names, empty_page = SAMPLE_PAGES[provider]
+    get_resource_json = make_resource_json_func(folder)
+    pages = [get_resource_json(name) for name in page_names]
+    served_urls = {}
+
+    def get(session, url, params=None, **kwargs):
+        # Pages are served by their order of first request, which is the order of
+        # the query params even when they are requested concurrently
+        key = (url, json.dumps(params, sort_keys=True))
+        index = served_urls.setdefault(key, len(served_urls))
+        page = pages[index] if index < len(pages) else empty_page
+        return _response(url, json.dumps(page).encode())
+
+    def head(session, url, **kwargs):
+        return _response(url, b"", {"Content-Length": "123456"})
+
+    with (
+        mock.patch.object(requests.Session, "get", get),
+        mock.patch.object(requests.Session, "head", head),
+        mock.patch.object(DelayedRequester, "_delay_processing"),
+        mock.patch("common.urls._test_domain_for_tls_support", return_value=True),
+    ):
+        return benchmark.record(
+            provider, benchmark.get_ingester_classes()[provider], output
+        )
+
+
+if __name__ == "__main__":
+    for provider in SAMPLE_PAGES:
+        print(make_recording(provider))
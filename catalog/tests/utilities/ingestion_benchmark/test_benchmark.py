@@ -0,0 +1,216 @@
+import base64
+import json
+import time
+from unittest import mock
+
+import pytest
+import requests
+from tests.dags.providers.provider_api_scripts.resources.provider_data_ingester.mock_provider_data_ingester import (
+    MockImageOnlyProviderDataIngester,
+)
+from tests.utilities.ingestion_benchmark import make_recordings
+
+from common.requester import DelayedRequester
+from utilities.ingestion_benchmark import benchmark
+from utilities.ingestion_benchmark.recording import (
+    Recorder,
+    Replayer,
+    get_request_key,
+    load_recording,
+)
+
+
+ENDPOINT = "http://mock-api/endpoint"
+PAGE = json.dumps(
+    {
+        "data": [
+            {
+                "id": i,
+                "url": f"https://example.com/{i}.jpg",
+                "media_type": "image",
+                "foreign_landing_url": f"https://example.com/{i}",
+            }
+            for i in range(10)
+        ]
+    }
+)
+
+
+def _response(url: str, content: str, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = content.encode()
+    return response
+
+
+def _serialized(content: str) -> dict:
+    return {
+        "status_code": 200,
+        "reason": "OK",
+        "url": ENDPOINT,
+        "encoding": "utf-8",
+        "headers": {},
+        "content": base64.b64encode(content.encode()).decode(),
+    }
+
+
+def get(self, url, params=None, **kwargs):
+    # Return a full page of records for the first page, then an empty page
+    if params and params.get("page") == 1:
+        return _response(url, PAGE)
+    return _response(url, json.dumps({"data": []}))
+
+
+@pytest.fixture
+def recording(tmp_path):
+    with (
+        mock.patch.object(requests.Session, "get", get),
+        mock.patch("common.urls._test_domain_for_tls_support", return_value=True),
+    ):
+        path = benchmark.record(
+            "mock_provider", MockImageOnlyProviderDataIngester, tmp_path, limit=100
+        )
+    return path
+
+
+def test_get_request_key_ignores_param_order():
+    first = get_request_key("get", ENDPOINT, {"params": {"a": 1, "b": 2}})
+    second = get_request_key("GET", ENDPOINT, {"params": {"b": 2, "a": 1}})
+
+    assert first == second
+    assert first != get_request_key("get", ENDPOINT, {"params": {"a": 2, "b": 2}})
+
+
+def test_record(recording):
+    metadata, records = load_recording(recording)
+
+    assert metadata == {"provider": "mock_provider", "date": None, "limit": 100}
+    assert len(records) == 2
+    assert records[0]["key"] == get_request_key(
+        "get", ENDPOINT, {"params": {"has_image": 1, "page": 1}}
+    )
+
+
+def test_record_keeps_error_responses(tmp_path):
+    def not_found(self, url, **kwargs):
+        return _response(url, "", status_code=404)
+
+    path = tmp_path / "errors.jsonl.gz"
+    with mock.patch.object(requests.Session, "get", not_found), Recorder(path):
+        with pytest.raises(requests.HTTPError):
+            DelayedRequester().get(ENDPOINT)
+
+    _, records = load_recording(path)
+    assert records[0]["response"]["status_code"] == 404
+
+
+def test_replay(recording):
+    def get(self, url, **kwargs):
+        raise AssertionError("Replaying should not make requests")
+
+    with mock.patch.object(requests.Session, "get", get):
+        result = benchmark.replay(
+            "mock_provider", MockImageOnlyProviderDataIngester, recording
+        )
+
+    assert result.records == 10
+    assert result.misses == 0
+    assert set(result.sections) <= set(benchmark.SECTIONS)
+    assert sum(result.sections.values()) == pytest.approx(result.seconds, rel=0.1)
+
+
+def test_replay_repeats_last_response():
+    records = [
+        {"key": get_request_key("get", ENDPOINT, {}), "response": _serialized(content)}
+        for content in ("first", "second")
+    ]
+    requester = DelayedRequester()
+
+    with Replayer(records):
+        contents = [requester.get(ENDPOINT).text for _ in range(3)]
+
+    assert contents == ["first", "second", "second"]
+
+
+def test_replay_missing_request():
+    requester = DelayedRequester()
+
+    with Replayer([]) as replayer, pytest.raises(requests.HTTPError):
+        requester.get(ENDPOINT)
+
+    assert replayer.misses == 1
+
+
+def test_replay_latency():
+    records = [
+        {"key": get_request_key("get", ENDPOINT, {}), "response": _serialized("ok")}
+    ]
+
+    with Replayer(records, latency=0.05):
+        start = time.perf_counter()
+        DelayedRequester().get(ENDPOINT)
+
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_section_timer_attributes_time_to_innermost_section():
+    timer = benchmark.SectionTimer()
+
+    with timer.section("outer"):
+        time.sleep(0.02)
+        with timer.section("inner"):
+            time.sleep(0.05)
+
+    assert timer.totals["inner"] >= 0.05
+    assert 0.02 <= timer.totals["outer"] < 0.05
+
+
+def test_get_ingester_classes():
+    ingester_classes = benchmark.get_ingester_classes()
+
+    assert ingester_classes["cleveland_museum"].__name__ == "ClevelandDataIngester"
+    assert "provider_data_ingester" not in ingester_classes
+    assert "time_delineated_provider_data_ingester" not in ingester_classes
+
+
+@pytest.mark.parametrize(
+    "provider, expected_records",
+    [
+        ("cleveland_museum", 100),
+        ("nappy", 10),
+        ("stocksnap", 65),
+    ],
+)
+def test_replay_committed_recording(provider, expected_records):
+    def get(self, url, **kwargs):
+        raise AssertionError("Replaying should not make requests")
+
+    def head(self, url, **kwargs):
+        raise AssertionError("Replaying should not make requests")
+
+    with (
+        mock.patch.object(requests.Session, "get", get),
+        mock.patch.object(requests.Session, "head", head),
+    ):
+        result = benchmark.replay(
+            provider,
+            benchmark.get_ingester_classes()[provider],
+            make_recordings.RECORDINGS / f"{provider}.jsonl.gz",
+        )
+
+    assert result.misses == 0
+    assert result.records == expected_records
+
+
+@pytest.mark.parametrize("provider", make_recordings.SAMPLE_PAGES)
+def test_committed_recording_is_up_to_date(provider, tmp_path):
+    # Remake the recording with `make_recordings` if this fails after an ingester
+    # changes the requests it makes
+    _, committed = load_recording(make_recordings.RECORDINGS / f"{provider}.jsonl.gz")
+    _, remade = load_recording(make_recordings.make_recording(provider, tmp_path))
+
+    assert sorted(record["key"] for record in remade) == sorted(
+        record["key"] for record in committed
+    )
@@ -0,0 +1,285 @@
+"""
+Measure the throughput of provider ingesters against recorded API responses.
+
+Responses are first recorded from the live provider APIs:
+
+    python -m utilities.ingestion_benchmark.benchmark record cleveland_museum
+
+and are then replayed, with a configurable latency standing in for the round trip
+to the provider, to measure how many records each ingester processes per second and
+how that time is split between requesting data, `get_record_data`,
+`MediaStore.add_item` and flushing the TSV:
+
+    python -m utilities.ingestion_benchmark.benchmark replay all --latency 0.1
+
+Replaying does not make any network requests, so its results are reproducible and
+can be compared before and after a change. Providers which require an API key still
+need it to be set, e.g. as an `AIRFLOW_VAR_` environment variable, because the
+ingesters read it when they are initialized.
+
+Recordings of the live APIs are written to `recordings/` next to this module by
+default. Small recordings of some providers, made from the sample responses
+used by their tests, are committed in `tests/utilities/ingestion_benchmark/recordings`
+and can be replayed without recording anything first:
+
+    python -m utilities.ingestion_benchmark.benchmark replay all \
+        --recordings tests/utilities/ingestion_benchmark/recordings
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import logging
+import os
+import pkgutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from unittest import mock
+
+import providers.provider_api_scripts as provider_api_scripts
+from common.storage.media import MediaStore
+from providers.provider_api_scripts.provider_data_ingester import ProviderDataIngester
+from utilities.ingestion_benchmark.recording import (
+    RECORDING_EXTENSION,
+    Recorder,
+    Replayer,
+    load_recording,
+)
+
+
+logger = logging.getLogger(__name__)
+
+RECORDINGS = Path(__file__).parent / "recordings"
+DEFAULT_LIMIT = 1_000
+SECTIONS = ("request", "get_record_data", "add_item", "flush", "other")
+
+
+class SectionTimer:
+    """
+    Accumulate the time spent in each section of the ingestion.
+
+    Sections may be nested, e.g. an ingester may make a request from within
+    `get_record_data`, in which case the time is only attributed to the innermost
+    section so that the sections add up to the total. Sections in different threads
+    are timed independently, so when batches are pipelined the requests overlap the
+    other sections and the sections add up to more than the total.
+    """
+
+    def __init__(self):
+        self.totals: dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def section(self, name: str):
+        stack = self._local.__dict__.setdefault("stack", [])
+        now = time.perf_counter()
+        if stack:
+            self._add(stack[-1][0], now - stack[-1][1])
+        stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._add(name, now - stack.pop()[1])
+            if stack:
+                stack[-1][1] = now
+
+    def wrap(self, name: str, function):
+        def timed(*args, **kwargs):
+            with self.section(name):
+                return function(*args, **kwargs)
+
+        return timed
+
+    def _add(self, name: str, elapsed: float):
+        with self._lock:
+            self.totals[name] += elapsed
+
+
+@dataclass
+class BenchmarkResult:
+    provider: str
+    records: int
+    seconds: float
+    sections: dict[str, float] = field(default_factory=dict)
+    misses: int = 0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0
+
+    def __str__(self):
+        split = ", ".join(
+            f"{name} {self.sections.get(name, 0) / self.seconds:.0%}"
+            for name in SECTIONS
+        )
+        message = (
+            f"{self.provider}: {self.records} records in {self.seconds:.2f}s"
+            f" ({self.records_per_second:.1f} records/s; {split})"
+        )
+        if self.misses:
+            message += f", {self.misses} requests not recorded"
+        return message
+
+
+def get_ingester_classes() -> dict[str, type[ProviderDataIngester]]:
+    """Get the ingester class of each provider API script, keyed by module name."""
+    ingester_classes = {}
+    for module_info in pkgutil.iter_modules(provider_api_scripts.__path__):
+        module = importlib.import_module(
+            f"{provider_api_scripts.__name__}.{module_info.name}"
+        )
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(cls, ProviderDataIngester)
+                and cls.__module__ == module.__name__
+                and not inspect.isabstract(cls)
+            ):
+                ingester_classes[module_info.name] = cls
+    return ingester_classes
+
+
+def _get_ingester(
+    ingester_class: type[ProviderDataIngester], date: str | None, limit: int
+) -> ProviderDataIngester:
+    with mock.patch.dict(os.environ, {"AIRFLOW_VAR_INGESTION_LIMIT": str(limit)}):
+        return ingester_class(date=date)
+
+
+def _close_stores(ingester: ProviderDataIngester):
+    for store in ingester.media_stores.values():
+        store.close()
+
+
+def record(
+    provider: str,
+    ingester_class: type[ProviderDataIngester],
+    output: Path,
+    date: str | None = None,
+    limit: int = DEFAULT_LIMIT,
+) -> Path:
+    """Ingest up to `limit` records from the live API and record the responses."""
+    path = output / f"{provider}{RECORDING_EXTENSION}"
+    metadata = {"provider": provider, "date": date, "limit": limit}
+    with (
+        tempfile.TemporaryDirectory() as output_dir,
+        mock.patch.dict(os.environ, {"OUTPUT_DIR": output_dir}),
+    ):
+        ingester = _get_ingester(ingester_class, date, limit)
+        with Recorder(path, metadata):
+            try:
+                ingester.ingest_records()
+            finally:
+                _close_stores(ingester)
+    return path
+
+
+def replay(
+    provider: str,
+    ingester_class: type[ProviderDataIngester],
+    recording: Path,
+    latency: float = 0,
+    pipeline: bool = False,
+) -> BenchmarkResult:
+    """Ingest the records of a recording and measure where the time is spent."""
+    metadata, records = load_recording(recording)
+    timer = SectionTimer()
+    replayer = Replayer(
+        records, latency=latency, on_request=lambda: timer.section("request")
+    )
+    with (
+        tempfile.TemporaryDirectory() as output_dir,
+        mock.patch.dict(os.environ, {"OUTPUT_DIR": output_dir}),
+        # The TLS support of domains is probed outside of the requester
+        mock.patch("common.urls._test_domain_for_tls_support", return_value=True),
+        mock.patch.object(
+            MediaStore, "_flush_buffer", timer.wrap("flush", MediaStore._flush_buffer)
+        ),
+    ):
+        ingester = _get_ingester(ingester_class, metadata["date"], metadata["limit"])
+        ingester.pipeline_batches = pipeline
+        ingester.get_record_data = timer.wrap(
+            "get_record_data", ingester.get_record_data
+        )
+        for store in ingester.media_stores.values():
+            store.add_item = timer.wrap("add_item", store.add_item)
+
+        with replayer, timer.section("other"):
+            start = time.perf_counter()
+            try:
+                ingester.ingest_records()
+            finally:
+                _close_stores(ingester)
+            seconds = time.perf_counter() - start
+
+    return BenchmarkResult(
+        provider=provider,
+        records=ingester.record_count,
+        seconds=seconds,
+        sections=dict(timer.totals),
+        misses=replayer.misses,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record API responses")
+    record_parser.add_argument("provider")
+    record_parser.add_argument("--date", help="Date to ingest, as YYYY-MM-DD")
+    record_parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    record_parser.add_argument("--output", type=Path, default=RECORDINGS)
+
+    replay_parser = subparsers.add_parser("replay", help="Replay API responses")
+    replay_parser.add_argument("provider", help="Provider to replay, or 'all'")
+    replay_parser.add_argument("--recordings", type=Path, default=RECORDINGS)
+    replay_parser.add_argument(
+        "--latency", type=float, default=0, help="Seconds each request takes"
+    )
+    replay_parser.add_argument(
+        "--pipeline", action="store_true", help="Enable batch pipelining"
+    )
+
+    args = parser.parse_args()
+    ingester_classes = get_ingester_classes()
+
+    if args.command == "record":
+        path = record(
+            args.provider,
+            ingester_classes[args.provider],
+            args.output,
+            args.date,
+            args.limit,
+        )
+        logger.info(f"Recording saved to {path}")
+        return
+
+    providers = list(ingester_classes) if args.provider == "all" else [args.provider]
+    for provider in providers:
+        recording = args.recordings / f"{provider}{RECORDING_EXTENSION}"
+        if not recording.exists():
+            logger.info(f"{provider}: no recording found, skipping")
+            continue
+        result = replay(
+            provider,
+            ingester_classes[provider],
+            recording,
+            args.latency,
+            args.pipeline,
+        )
+        logger.info(result)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    # Silence the per-record logging of the ingesters and media stores
+    logging.getLogger("providers").setLevel(logging.WARNING)
+    logging.getLogger("common").setLevel(logging.WARNING)
+    main()
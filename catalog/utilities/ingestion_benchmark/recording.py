@@ -0,0 +1,222 @@
+"""
+Record and replay the responses received by provider ingesters.
+
+Requests are intercepted at the level of `DelayedRequester._make_request`, through
+which every request made by a `ProviderDataIngester` passes, whichever requester
+subclass or session it uses. Recordings are gzipped JSON lines files: the first line
+holds metadata about the recording, and each following line holds a request and the
+response that was received for it.
+
+When replaying, responses are matched to requests by their method, URL and
+parameters. Identical requests receive the recorded responses in the order in which
+they were recorded, and the last one is repeated once they are exhausted. Requests
+which were never recorded receive a 404 response, and are counted as misses.
+"""
+
+import base64
+import contextlib
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from common.requester import DelayedRequester
+
+
+logger = logging.getLogger(__name__)
+
+
+RECORDING_EXTENSION = ".jsonl.gz"
+# The request arguments which identify a request, as opposed to e.g. its headers
+KEY_ARGUMENTS = ("params", "data", "json")
+
+
+def get_request_key(method: str, url: str, request_kwargs: dict) -> str:
+    """Get the key used to match a request to its recorded responses."""
+    return json.dumps(
+        [
+            method.lower(),
+            url,
+            {arg: request_kwargs.get(arg) for arg in KEY_ARGUMENTS},
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _serialize_response(response: requests.Response) -> dict:
+    try:
+        # Text compresses far better than its base64 encoding
+        body = {"text": response.content.decode("utf-8")}
+    except UnicodeDecodeError:
+        body = {"content": base64.b64encode(response.content).decode("ascii")}
+    return {
+        "status_code": response.status_code,
+        "reason": response.reason,
+        "url": response.url,
+        "encoding": response.encoding,
+        "headers": dict(response.headers),
+        **body,
+    }
+
+
+def _deserialize_response(record: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = record["status_code"]
+    response.reason = record["reason"]
+    response.url = record["url"]
+    response.encoding = record["encoding"]
+    response.headers = CaseInsensitiveDict(record["headers"])
+    if "text" in record:
+        response._content = record["text"].encode("utf-8")
+    else:
+        response._content = base64.b64decode(record["content"])
+    return response
+
+
+def _not_found(url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 404
+    response.reason = "Not Recorded"
+    response.url = url
+    response._content = b""
+    return response
+
+
+class Recorder:
+    """
+    Context manager which records every response received by a `DelayedRequester`.
+
+    path:     where to write the recording
+    metadata: information needed to replay the recording, e.g. the ingestion date
+    """
+
+    def __init__(self, path: Path, metadata: dict | None = None):
+        self.path = Path(path)
+        self.metadata = metadata or {}
+        self.records = []
+        self._lock = threading.Lock()
+        self._patch = mock.patch.object(
+            DelayedRequester, "_make_request", self._make_request_factory()
+        )
+
+    def _make_request_factory(self) -> Callable:
+        recorder = self
+        original = DelayedRequester._make_request
+
+        def _make_request(requester, method, url, **kwargs):
+            def recording_method(request_url, **request_kwargs):
+                response = method(request_url, **request_kwargs)
+                recorder.record(method.__name__, request_url, request_kwargs, response)
+                return response
+
+            # Record the response before `_make_request` raises for its status
+            recording_method.__name__ = method.__name__
+            return original(requester, recording_method, url, **kwargs)
+
+        return _make_request
+
+    def record(
+        self, method: str, url: str, request_kwargs: dict, response: requests.Response
+    ):
+        with self._lock:
+            self.records.append(
+                {
+                    "key": get_request_key(method, url, request_kwargs),
+                    "response": _serialize_response(response),
+                }
+            )
+
+    def __enter__(self):
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._patch.stop()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps(self.metadata) + "\n")
+            for record in self.records:
+                file.write(json.dumps(record) + "\n")
+        logger.info(f"Recorded {len(self.records)} responses to {self.path}")
+
+
+def load_recording(path: Path) -> tuple[dict, list[dict]]:
+    """Load the metadata and the records of a recording."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        metadata = json.loads(file.readline())
+        records = [json.loads(line) for line in file]
+    return metadata, records
+
+
+class Replayer:
+    """
+    Context manager which replays recorded responses to every `DelayedRequester`.
+
+    Replaying replaces the requesters' delays: each request instead takes `latency`
+    seconds, which simulates the round trip to the provider's API.
+
+    records:    the records of a recording, see `load_recording`
+    latency:    number of seconds each request takes
+    on_request: optional context manager factory wrapped around each request, e.g.
+                to time it
+    """
+
+    def __init__(
+        self,
+        records: list[dict],
+        latency: float = 0,
+        on_request: Callable | None = None,
+    ):
+        self.latency = latency
+        self.on_request = on_request
+        self.misses = 0
+        self._responses: dict[str, deque[dict]] = defaultdict(deque)
+        for record in records:
+            self._responses[record["key"]].append(record["response"])
+        self._lock = threading.Lock()
+        self._patch = mock.patch.object(
+            DelayedRequester, "_make_request", self._make_request_factory()
+        )
+
+    def _next_response(self, method: str, url: str, request_kwargs: dict):
+        key = get_request_key(method, url, request_kwargs)
+        with self._lock:
+            if not (responses := self._responses.get(key)):
+                self.misses += 1
+                logger.warning(f"No recorded response for {key}")
+                return _not_found(url)
+            record = responses.popleft() if len(responses) > 1 else responses[0]
+        return _deserialize_response(record)
+
+    def _make_request_factory(self) -> Callable:
+        replayer = self
+
+        def _make_request(requester, method, url, **kwargs):
+            with (
+                replayer.on_request()
+                if replayer.on_request
+                else contextlib.nullcontext()
+            ):
+                if replayer.latency:
+                    time.sleep(replayer.latency)
+                response = replayer._next_response(method.__name__, url, kwargs)
+            response.raise_for_status()
+            return response
+
+        return _make_request
+
+    def __enter__(self):
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._patch.stop()
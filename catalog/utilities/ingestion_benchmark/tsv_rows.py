@@ -0,0 +1,84 @@
+"""
+Measure how long `MediaStore._create_tsv_row` takes to format media items.
+
+    python -m utilities.ingestion_benchmark.tsv_rows --rows 100000
+
+The items are synthetic but shaped like those of the larger providers: a long title,
+a metadata dictionary with a nested description, and a few dozen tags.
+"""
+
+import argparse
+import logging
+import timeit
+
+from common.storage.image import Image, ImageStore
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROWS = 100_000
+
+
+def get_image(index: int) -> Image:
+    """Get a synthetic image, with some values needing sanitizing."""
+    values = dict.fromkeys(Image._fields)
+    return Image(
+        **values
+        | {
+            "foreign_identifier": f"photo-{index}",
+            "foreign_landing_url": f"https://example.com/photos/{index}",
+            "url": f"https://example.com/photos/{index}/large.jpg",
+            "thumbnail_url": f"https://example.com/photos/{index}/thumb.jpg",
+            "filetype": "jpg",
+            "filesize": 1_234_567,
+            "license_": "by-sa",
+            "license_version": "4.0",
+            "creator": 'Jane "JD" Doe\t(photographer)',
+            "creator_url": "https://example.com/people/jane",
+            "title": "A view of the old harbour at dusk, with fishing boats moored",
+            "meta_data": {
+                "license_url": "https://creativecommons.org/licenses/by-sa/4.0/",
+                "description": "Taken from the pier.\n\nThe lighthouse is at the left "
+                "of the frame, and the old \\ new town behind it.",
+                "views": index,
+                "camera": {"make": "Example", "model": "X100", "iso": 200},
+            },
+            "tags": [
+                {"name": f"tag {tag}", "provider": "example_provider"}
+                for tag in range(30)
+            ],
+            "category": "photograph",
+            "watermarked": False,
+            "provider": "example_provider",
+            "source": "example_provider",
+            "ingestion_type": "provider_api",
+            "width": 4000,
+            "height": 3000,
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    store = ImageStore(provider="example_provider")
+    images = [get_image(index) for index in range(args.rows)]
+
+    timings = timeit.repeat(
+        lambda: [store._create_tsv_row(image) for image in images],
+        number=1,
+        repeat=args.repeat,
+    )
+    best = min(timings)
+    logger.info(
+        f"{args.rows} rows: best of {args.repeat} {best:.3f}s,"
+        f" {best / args.rows * 1e6:.2f}us per row"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
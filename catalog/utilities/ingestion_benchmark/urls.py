@@ -0,0 +1,70 @@
+"""
+Measure how long `urls.validate_url_string` takes over the URLs of the provider
+fixtures.
+
+    python -m utilities.ingestion_benchmark.urls --repeat 5
+
+The corpus is every URL found in the JSON responses under
+`tests/dags/providers/provider_api_scripts/resources`, so it has the mix of hosts,
+schemes and paths that the ingesters actually see. TLS support is assumed for every
+domain so that no requests are made. The first pass is timed separately because it
+fills the per-host caches, as the first records of an ingestion would.
+"""
+
+import argparse
+import logging
+import re
+import time
+import timeit
+from pathlib import Path
+from unittest import mock
+
+from common import urls
+
+
+logger = logging.getLogger(__name__)
+
+FIXTURES = (
+    Path(__file__).parents[2] / "tests/dags/providers/provider_api_scripts/resources"
+)
+# URLs as they appear in JSON strings, including those without a scheme
+_URL_PATTERN = re.compile(r'"((?:https?:)?//[^"\s\\]+)"')
+
+
+def get_url_corpus(fixtures: Path = FIXTURES) -> list[str]:
+    """Get every URL in the JSON fixtures, in the order in which they appear."""
+    corpus = []
+    for path in sorted(fixtures.rglob("*.json")):
+        corpus.extend(_URL_PATTERN.findall(path.read_text(encoding="utf-8")))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = get_url_corpus()
+    hosts = {urls.get_domain_key(url) for url in corpus}
+    logger.info(f"{len(corpus)} URLs from {len(hosts)} hosts")
+
+    def validate_all():
+        for url in corpus:
+            urls.validate_url_string(url)
+
+    with mock.patch.object(urls, "_test_domain_for_tls_support", return_value=True):
+        urls._extract_host.cache_clear()
+        start = time.perf_counter()
+        validate_all()
+        first = time.perf_counter() - start
+        best = min(timeit.repeat(validate_all, number=1, repeat=args.repeat))
+
+    logger.info(f"First pass: {first / len(corpus) * 1e6:.2f}us per URL")
+    logger.info(
+        f"Best of {args.repeat} passes: {best / len(corpus) * 1e6:.2f}us per URL"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,90 @@
+"""
+Measure how long matching documents against the sensitive terms list takes.
+
+Documents are synthetic, with a title, a description and tags of typical lengths.
+They are generated from a pool of random words which does not overlap the random
+sensitive terms, so that no document matches and every token of every document is
+checked, which is the worst case for the matcher. A fraction of the documents can be
+made to match with ``--match-rate``.
+
+Run with::
+
+    python -m indexer_worker.benchmark_sensitive_terms --documents 1000000
+"""
+
+import argparse
+import itertools
+import random
+import string
+import time
+
+from indexer_worker.sensitive_terms import SensitiveTermsMatcher
+
+
+# The number of distinct documents to generate, which are cycled through to reach
+# the requested number of documents without holding them all in memory
+DISTINCT_DOCUMENTS = 10_000
+
+
+def _random_words(rng: random.Random, count: int) -> list[str]:
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+        for _ in range(count)
+    ]
+
+
+def get_documents(
+    rng: random.Random, terms: list[str], words: list[str], match_rate: float
+) -> list[tuple[str, str, str]]:
+    """
+    Generate distinct documents as ``(title, description, tags)`` texts.
+
+    :param rng: the random number generator to use
+    :param terms: the sensitive terms, one of which is added to matching documents
+    :param words: the words which the documents are made of
+    :param match_rate: the fraction of documents which contain a sensitive term
+    :return: the documents
+    """
+
+    documents = []
+    for _ in range(DISTINCT_DOCUMENTS):
+        title = rng.choices(words, k=8)
+        description = rng.choices(words, k=40)
+        tags = rng.choices(words, k=15)
+        if rng.random() < match_rate:
+            # The end of the description is the last text the matcher checks
+            description[-1] = rng.choice(terms)
+        documents.append((" ".join(title), " ".join(description), " ".join(tags)))
+    return documents
+
+
+def main(args: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--documents", type=int, default=1_000_000)
+    parser.add_argument("--terms", type=int, default=2_000)
+    parser.add_argument("--match-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(args)
+
+    rng = random.Random(options.seed)
+    terms = _random_words(rng, options.terms)
+    words = sorted(set(_random_words(rng, 20_000)) - set(terms))
+    documents = get_documents(rng, terms, words, options.match_rate)
+    matcher = SensitiveTermsMatcher(terms)
+
+    start = time.perf_counter()
+    matches = sum(
+        matcher.matches(*document)
+        for document in itertools.islice(itertools.cycle(documents), options.documents)
+    )
+    duration = time.perf_counter() - start
+
+    print(
+        f"Matched {options.documents:,} documents against {options.terms:,} terms"
+        f" in {duration:.2f}s ({duration / options.documents * 1e6:.1f}us per"
+        f" document), {matches:,} of which contain a sensitive term."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from enum import Enum, auto
 from elasticsearch_dsl import Document, Field, Integer
 
 from indexer_worker.authority import get_authority_boost
+from indexer_worker.sensitive_terms import get_sensitive_terms_matcher
 
 
 class RankFeature(Field):
@@ -95,12 +96,17 @@ class Media(SyncableDocType):
         provider = row[schema["provider"]]
         authority_boost = Media.get_authority_boost(meta, provider)
 
+        title = row[schema["title"]]
+        description = Media.parse_description(meta)
+        tags = Media.parse_detailed_tags(row[schema["tags"]])
+
         # This matches the order of fields defined in the schema.
         return {
             "_id": row[schema["id"]],
             "id": row[schema["id"]],
             "created_on": row[schema["created_on"]],
             "mature": Media.get_maturity(meta, row[schema["mature"]]),
+            "sensitive_text": Media.has_sensitive_text(title, description, tags),
             # Keyword fields
             "identifier": row[schema["identifier"]],
             "license": row[schema["license"]].lower(),
@@ -108,8 +114,8 @@ class Media(SyncableDocType):
             "source": row[schema["source"]],
             "category": category,
             # Text-based fields
-            "title": row[schema["title"]],
-            "description": Media.parse_description(meta),
+            "title": title,
+            "description": description,
             "creator": row[schema["creator"]],
             # Rank feature fields
             "standardized_popularity": popularity,
@@ -117,7 +123,7 @@ class Media(SyncableDocType):
             "max_boost": max(popularity or 1, authority_boost or 1),
             "min_boost": min(popularity or 1, authority_boost or 1),
             # Nested fields
-            "tags": Media.parse_detailed_tags(row[schema["tags"]]),
+            "tags": tags,
             # Extra fields, not indexed
             "url": row[schema["url"]],
         }
@@ -167,6 +173,22 @@ class Media(SyncableDocType):
             _mature = True
         return _mature
 
+    @staticmethod
+    def has_sensitive_text(title, description, tags):
+        """
+        Determine whether the title, description or any tag has a sensitive term.
+
+        This is computed once per document when indexing, so that the filtered
+        index can exclude sensitive documents with a single ``term`` filter.
+
+        :param title: the title of the work
+        :param description: the parsed description of the work
+        :param tags: the parsed tags of the work
+        :return: whether the textual content contains a sensitive term
+        """
+        matcher = get_sensitive_terms_matcher()
+        return matcher.matches(title, description, *(tag["name"] for tag in tags))
+
     @staticmethod
     def get_authority_boost(meta_data, source):
         authority_boost = None
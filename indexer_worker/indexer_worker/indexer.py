@@ -12,6 +12,7 @@ from indexer_worker.elasticsearch_models import (
 )
 from indexer_worker.es_helpers import elasticsearch_connect
 from indexer_worker.queries import get_reindex_query
+from indexer_worker.sensitive_terms import get_sensitive_terms_matcher
 
 
 # The number of database records to load in memory at once.
@@ -61,6 +62,9 @@ def reindex(
     end_id: int,
     progress: float,
 ):
+    # Fail before reading any rows if the sensitive terms cannot be fetched
+    get_sensitive_terms_matcher()
+
     # Enable writing to Postgres so we can create a server-side cursor.
     pg_conn = database_connect()
     es_conn = elasticsearch_connect()
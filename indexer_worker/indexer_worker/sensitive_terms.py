@@ -0,0 +1,72 @@
+import re
+from functools import cache
+from http.client import HTTPResponse
+from urllib.request import urlopen
+
+from decouple import config
+
+
+# Approximates the ``standard`` tokenizer used by the ``.raw`` subfields in the
+# Elasticsearch mapping: runs of word characters, which may be joined by single
+# apostrophes or periods (e.g. "don't", "u.s.a").
+TOKEN_PATTERN = re.compile(r"\w+(?:['.]\w+)*")
+
+
+def get_sensitive_terms() -> list[str]:
+    """
+    Fetch the sensitive terms list from ``SENSITIVE_TERMS_URL``.
+
+    The URL has no default, and an unreachable or empty list raises, so that
+    documents are never flagged against the wrong list, or none at all.
+
+    :return: the sensitive terms
+    """
+
+    sensitive_terms_url = config("SENSITIVE_TERMS_URL")
+    response: HTTPResponse = urlopen(sensitive_terms_url)
+    terms = [line.decode("utf-8").strip() for line in response.readlines()]
+    if not any(terms):
+        raise ValueError(f"The sensitive terms list at {sensitive_terms_url} is empty.")
+    return terms
+
+
+class SensitiveTermsMatcher:
+    """
+    Match text against the sensitive terms list.
+
+    This mirrors the ``terms`` queries against the ``.raw`` fields that were used to
+    filter the filtered index: a text matches if any of its lowercased tokens is
+    exactly one of the sensitive terms. Matching is therefore a set lookup per
+    token, and is linear in the length of the text regardless of the number of
+    terms.
+    """
+
+    def __init__(self, terms: list[str]):
+        self.terms = frozenset(term.lower() for term in terms if term)
+
+    def matches(self, *texts: str | None) -> bool:
+        """
+        Determine whether any of the given texts contains a sensitive term.
+
+        :param texts: the texts to check; empty and non-string values are skipped
+        :return: whether any text contains a sensitive term
+        """
+
+        for text in texts:
+            if isinstance(text, str) and not self.terms.isdisjoint(
+                TOKEN_PATTERN.findall(text.lower())
+            ):
+                return True
+        return False
+
+
+@cache
+def get_sensitive_terms_matcher() -> SensitiveTermsMatcher:
+    """
+    Get a matcher for the sensitive terms list.
+
+    The list is fetched only once per process, so that it is not requested again
+    for every document converted during a reindex.
+    """
+
+    return SensitiveTermsMatcher(get_sensitive_terms())
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from indexer_worker import elasticsearch_models
+from indexer_worker.sensitive_terms import SensitiveTermsMatcher
+
+
+MOCK_SENSITIVE_TERMS = (
+    (Path(__file__).parents[1] / "indexer_worker/static/mock_sensitive_terms.txt")
+    .read_text()
+    .split()
+)
+
+
+@pytest.fixture(autouse=True)
+def sensitive_terms_matcher(monkeypatch):
+    """Use the mock sensitive terms instead of fetching them over HTTP."""
+
+    matcher = SensitiveTermsMatcher(MOCK_SENSITIVE_TERMS)
+    monkeypatch.setattr(
+        elasticsearch_models, "get_sensitive_terms_matcher", lambda: matcher
+    )
+    return matcher
@@ -133,6 +133,8 @@ class TaskResource(BaseTaskResource):
                 "force_delete": {"type": "boolean"},
                 "origin_index_suffix": {"type": "string"},
                 "destination_index_suffix": {"type": "string"},
+                # Also accepts "true"/"false", as sent by form-encoded requests
+                "recheck_sensitive_terms": {"type": ["boolean", "string"]},
             },
             "required": ["model", "action"],
             "allOf": [
@@ -193,6 +195,9 @@ class TaskResource(BaseTaskResource):
         destination_index_suffix = body.get("destination_index_suffix")
         alias = body.get("alias")
         force_delete = body.get("force_delete", False)
+        recheck_sensitive_terms = (
+            str(body.get("recheck_sensitive_terms", False)).lower() == "true"
+        )
 
         # Shared memory
         progress = Value("d", 0.0)
@@ -219,6 +224,7 @@ class TaskResource(BaseTaskResource):
                 "destination_index_suffix": destination_index_suffix,
                 "alias": alias,
                 "force_delete": force_delete,
+                "recheck_sensitive_terms": recheck_sensitive_terms,
                 "sentry_hub": task_sentry_hub,
             },
         )
@@ -11,6 +11,7 @@ import pathlib
 import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import boto3
@@ -21,6 +22,7 @@ from psycopg2.extras import DictCursor, Json
 
 from ingestion_server.db_helpers import database_connect
 from ingestion_server.indexer import DB_BUFFER_SIZE
+from ingestion_server.utils.tls_support import load_tls_support, save_tls_support
 
 
 # Number of records to buffer in memory at once
@@ -59,23 +61,35 @@ TAG_MIN_CONFIDENCE = 0.90
 # been vetted or because they are known to be low-quality).
 FILTERED_TAG_PROVIDERS = {"rekognition"}
 
-# We know that flickr and wikimedia support TLS, so we can add them here
+# We know that flickr and wikimedia support TLS, so we can add them here. Domains are
+# keyed by their fully qualified domain name, like in the persistent TLS support store,
+# which is loaded into this cache before cleaning.
 TLS_CACHE = {
     "www.flickr.com": True,
     "commons.wikimedia.org": True,
-    ".geograph.org.uk": True,
+    "geograph.org.uk": True,
     "www.geograph.org.uk": True,
-    ".eol.org": True,
+    "eol.org": True,
     "www.eol.org": True,
-    ".digitaltmuseum.org": True,
+    "digitaltmuseum.org": True,
     "collections.musee-mccord.qc.ca": False,
-    ".stocksnap.io": True,
+    "stocksnap.io": True,
     "cdn.stocksnap.io": True,
 }
 
+# The maximum number of domains to test for TLS support at the same time
+TLS_TEST_CONCURRENCY = config("TLS_TEST_CONCURRENCY", default=50, cast=int)
+
 TMP_DIR = pathlib.Path("/tmp/cleaned_data").resolve()
 
 
+def _get_domain_key(url):
+    """Get the fully qualified domain name of the URL, or its IP address."""
+
+    extracted = tldextract.extract(url)
+    return extracted.fqdn or extracted.ipv4
+
+
 def _tag_denylisted(tag):
     """Check if a tag is banned or contains a banned substring."""
 
@@ -107,8 +121,7 @@ class CleanupFunctions:
 
         parsed = urlparse(url)
         if parsed.scheme == "":
-            _tld = tldextract.extract(url)
-            _tld = f"{_tld.subdomain}.{_tld.domain}.{_tld.suffix}"
+            _tld = _get_domain_key(url)
             try:
                 tls_supported = tls_support[_tld]
             except KeyError:
@@ -219,6 +232,62 @@ class TlsTest:
         # supported.
         return True
 
+    @classmethod
+    def test_domains_tls_supported(
+        cls, urls: dict[str, str], concurrency: int = TLS_TEST_CONCURRENCY
+    ) -> dict[str, bool]:
+        """
+        Test many domains for TLS support concurrently.
+
+        At most ``concurrency`` domains are tested at the same time, so testing ``n``
+        domains takes roughly ``n / concurrency`` times the timeout in the worst
+        case, rather than ``n`` times the timeout when testing them one by one.
+
+        :param urls: a mapping of each domain to one of its URLs, which is tested
+        :param concurrency: the maximum number of domains to test at the same time
+        :return: a mapping of each domain to whether it supports TLS
+        """
+
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+            return dict(zip(urls, executor.map(cls.test_tls_supported, urls.values())))
+
+
+def _test_tls_support(rows, sources_config, tls_support: dict[str, bool]):
+    """
+    Test the domains of the URLs without a protocol in the rows, which are not
+    already in ``tls_support``, concurrently.
+
+    This is done for each batch of rows before they are cleaned, so that
+    ``CleanupFunctions.cleanup_url`` finds every domain in ``tls_support``.
+    """
+
+    url_fields = {
+        source: [
+            field
+            for field, func in source_config["fields"].items()
+            if func == CleanupFunctions.cleanup_url
+        ]
+        for source, source_config in sources_config.items()
+    }
+    urls = {}
+    for row in rows:
+        fields = url_fields["*"] + url_fields.get(row["source"], [])
+        for field in fields:
+            url = row[field]
+            if not url or urlparse(url).scheme:
+                continue
+            domain = _get_domain_key(url)
+            if domain not in tls_support:
+                urls.setdefault(domain, url)
+
+    if urls:
+        log.info(f"Testing {len(urls)} domains for TLS support")
+        tls_support.update(
+            TlsTest.test_domains_tls_supported(urls, concurrency=TLS_TEST_CONCURRENCY)
+        )
+
 
 def _clean_data_worker(rows, temp_table, sources_config, all_fields: list[str]):
     log.info("Starting data cleaning worker")
@@ -227,6 +296,8 @@ def _clean_data_worker(rows, temp_table, sources_config, all_fields: list[str]):
     log.info("Data cleaning worker connected to database")
     write_cur = worker_conn.cursor(cursor_factory=DictCursor)
     log.info(f"Cleaning {len(rows)} rows")
+    known_domains = set(TLS_CACHE)
+    _test_tls_support(rows, sources_config, TLS_CACHE)
 
     start_time = time.perf_counter()
     cleaned_values = {field: [] for field in all_fields}
@@ -277,6 +348,9 @@ def _clean_data_worker(rows, temp_table, sources_config, all_fields: list[str]):
             log.debug(f"Executing update query: \n\t{update_query}")
             write_cur.execute(update_query)
     log.info(f"TLS cache: {TLS_CACHE}")
+    save_tls_support(
+        {domain: TLS_CACHE[domain] for domain in TLS_CACHE.keys() - known_domains}
+    )
     log.info("Worker committing changes...")
     worker_conn.commit()
     write_cur.close()
@@ -358,6 +432,10 @@ def clean_image_data(table):
     shutil.rmtree(TMP_DIR, ignore_errors=True)
     TMP_DIR.mkdir(parents=True)
 
+    # Load the domains tested by previous runs and by the catalog, before the workers
+    # are forked, so that they do not need to be tested again.
+    TLS_CACHE.update(load_tls_support())
+
     # Map each table to the fields that need to be cleaned up. Then, map each
     # field to its cleanup function.
     log.info("Cleaning up data...")
@@ -65,6 +65,7 @@ def index_settings(media_type: MediaType):
             "id": {"type": "long"},
             "created_on": {"type": "date"},
             "mature": {"type": "boolean"},
+            "sensitive_text": {"type": "boolean"},
             # Keyword fields
             "identifier": {"type": "keyword"},
             "extension": {"type": "keyword"},
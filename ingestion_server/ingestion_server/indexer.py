@@ -37,7 +37,10 @@ from ingestion_server.elasticsearch_models import media_type_to_elasticsearch_mo
 from ingestion_server.es_helpers import get_stat
 from ingestion_server.es_mapping import index_settings
 from ingestion_server.queries import get_existence_queries
-from ingestion_server.utils.sensitive_terms import get_sensitive_terms
+from ingestion_server.utils.sensitive_terms import (
+    get_sensitive_terms,
+    get_sensitive_terms_matcher,
+)
 
 
 # The number of database records to load in memory at once.
@@ -157,6 +160,9 @@ class TableIndexer:
         :param query: the SQL query to use to select rows from the table
         """
 
+        # Fail before reading any rows if the sensitive terms cannot be fetched
+        get_sensitive_terms_matcher()
+
         cursor_name = f"{table_name}_indexing_cursor"
         # Enable writing to Postgres so we can create a server-side cursor.
         pg_conn = database_connect()
@@ -427,16 +433,37 @@ class TableIndexer:
             self.progress.value = 100
         self.ping_callback()
 
+    def _has_sensitive_text_flag(self, index: str) -> bool:
+        """
+        Determine whether the documents of the given index carry the
+        ``sensitive_text`` flag.
+
+        :param index: the name of the index or alias to check
+        :return: whether the flag is mapped in every index behind the name
+        """
+
+        mappings = self.es.indices.get_mapping(index=index)
+        return all(
+            "sensitive_text" in mapping["mappings"].get("properties", {})
+            for mapping in mappings.values()
+        )
+
     def create_and_populate_filtered_index(
         self,
         model_name: str,
         origin_index_suffix: str | None = None,
         destination_index_suffix: str | None = None,
+        recheck_sensitive_terms: bool = False,
         **_,
     ):
         """
         Create and populate a filtered index without documents with sensitive terms.
 
+        Documents are flagged with ``sensitive_text`` when they are indexed, so the
+        filtered index is populated with a single ``term`` filter on that flag. If
+        the origin index predates the flag, or ``recheck_sensitive_terms`` is set,
+        the current sensitive terms are instead matched against the text fields.
+
         :param model_name: The model/media type the filtered index is for.
         :param origin_index_suffix: The suffix of the origin index on which the
         filtered index should be based. If not supplied, the filtered index will be
@@ -448,6 +475,9 @@ class TableIndexer:
         origin index and we wish to update the filtered index immediately. If not
         supplied, a UUID based suffix will be generated. This does not affect the
         final alias used.
+        :param recheck_sensitive_terms: Whether to match the current sensitive terms
+        instead of relying on the ``sensitive_text`` flag set at indexing time, e.g.
+        when the sensitive terms have changed since the origin index was created.
         """
         # Allow relying on the model-name-based alias by
         # not supplying `origin_index_suffix`
@@ -466,22 +496,24 @@ class TableIndexer:
             body=index_settings(model_name),
         )
 
-        sensitive_terms = get_sensitive_terms()
+        if recheck_sensitive_terms or not self._has_sensitive_text_flag(source_index):
+            log.info("Filtering documents against the current sensitive terms.")
+            sensitive_terms = get_sensitive_terms()
+            must_not = [
+                # Use `terms` query for exact matching against
+                # unanalyzed raw fields
+                {"terms": {f"{field}.raw": sensitive_terms}}
+                for field in ["tags.name", "title", "description"]
+            ]
+        else:
+            log.info("Filtering documents on the `sensitive_text` flag.")
+            must_not = [{"term": {"sensitive_text": True}}]
 
         self.es.reindex(
             body={
                 "source": {
                     "index": source_index,
-                    "query": {
-                        "bool": {
-                            "must_not": [
-                                # Use `terms` query for exact matching against
-                                # unanalyzed raw fields
-                                {"terms": {f"{field}.raw": sensitive_terms}}
-                                for field in ["tags.name", "title", "description"]
-                            ]
-                        }
-                    },
+                    "query": {"bool": {"must_not": must_not}},
                 },
                 "dest": {"index": destination_index},
             },
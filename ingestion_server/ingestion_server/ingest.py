@@ -17,6 +17,8 @@ data in place.
 
 import logging as log
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from uuid import UUID
 
 import psycopg2
 from decouple import config
@@ -28,7 +30,9 @@ from ingestion_server.cleanup import clean_image_data
 from ingestion_server.constants.internal_types import ApproachType
 from ingestion_server.db_helpers import DB_UPSTREAM_CONFIG, database_connect
 from ingestion_server.queries import (
-    get_copy_data_query,
+    get_copy_conclusion_query,
+    get_copy_partition_query,
+    get_copy_setup_query,
     get_create_ext_query,
     get_fdw_query,
     get_go_live_query,
@@ -49,6 +53,15 @@ RELATIVE_UPSTREAM_DB_PORT = config(
 )
 #: the port of the upstream DB from the POV of the downstream DB
 
+COPY_PARTITIONS = config("COPY_PARTITIONS", default=1, cast=int)
+#: the number of ``identifier`` ranges into which the upstream table is split
+
+COPY_CONCURRENCY = config("COPY_CONCURRENCY", default=4, cast=int)
+#: the number of partitions copied at the same time, each over its own connection
+
+COPY_PARTITION_RETRIES = config("COPY_PARTITION_RETRIES", default=2, cast=int)
+#: the number of times a failed partition is retried before the copy is aborted
+
 
 def _get_shared_cols(downstream, upstream, upstream_table: str, downstream_table: str):
     """
@@ -240,6 +253,88 @@ def _generate_constraints(conn, table: str) -> list[SQL]:
     return constraint_statements
 
 
+def _get_partition_bounds(count: int) -> list[tuple[str | None, str | None]]:
+    """
+    Split the UUID space into ``count`` contiguous ``identifier`` ranges.
+
+    Identifiers are random (v4) UUIDs, so ranges of equal width in the UUID space
+    contain roughly the same number of rows. The first and last ranges are left
+    open so that no identifier can fall outside of every partition.
+
+    :param count: the number of partitions to produce
+    :return: a list of ``(lower, upper)`` bounds, with ``None`` for an open side
+    """
+
+    if count <= 1:
+        return [(None, None)]
+
+    boundaries = [str(UUID(int=(i * 2**128) // count)) for i in range(1, count)]
+    lowers = [None] + boundaries
+    uppers = boundaries + [None]
+    return list(zip(lowers, uppers))
+
+
+def _copy_partition(query, partition: int) -> int:
+    """
+    Run the copy query for a single partition in its own connection and transaction.
+
+    As each partition is committed independently, a failed partition is rolled back
+    without affecting the partitions that have already been copied, and can be
+    retried on its own.
+
+    :param query: the SQL query that copies the partition
+    :param partition: the index of the partition, for logging
+    :return: the number of rows copied
+    """
+
+    for attempt in range(COPY_PARTITION_RETRIES + 1):
+        conn = database_connect()
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(query)
+                count = cur.rowcount
+            log.info(f"Copied {count} rows in partition {partition}.")
+            return count
+        except psycopg2.Error as err:
+            if attempt == COPY_PARTITION_RETRIES:
+                raise
+            log.warning(
+                f"Copying partition {partition} failed on attempt {attempt + 1}, "
+                f"retrying: {err}"
+            )
+        finally:
+            conn.close()
+
+
+def _copy_partitions(queries: list, progress: multiprocessing.Value = None) -> int:
+    """
+    Copy the given partitions concurrently over ``COPY_CONCURRENCY`` connections.
+
+    :param queries: the SQL queries that copy each partition
+    :param progress: multiprocessing.Value float for sharing task progress
+    :return: the total number of rows copied
+    """
+
+    total = 0
+    with ThreadPoolExecutor(max_workers=COPY_CONCURRENCY) as executor:
+        futures = [
+            executor.submit(_copy_partition, query, idx)
+            for idx, query in enumerate(queries)
+        ]
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                total += future.result()
+                log.info(f"Copied {done} of {len(queries)} partitions.")
+                # Stop short of 100, which marks the whole task as complete.
+                _update_progress(progress, 99.0 * done / len(queries))
+        except BaseException:
+            # Do not start the queued partitions once one has failed for good,
+            # and wait for the running ones before the error propagates.
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+    return total
+
+
 def _update_progress(progress, new_value):
     if progress:
         progress.value = new_value
@@ -259,7 +354,9 @@ def refresh_api_table(
     1. Get the list of overlapping columns: ``_get_shared_cols``
     2. Create the FDW extension if it does not exist
     3. Create FDW for the data transfer: ``get_fdw_query``
-    4. Import data into a temporary table: ``get_copy_data_query``
+    4. Import data into a temporary table, in concurrently copied partitions:
+       ``get_copy_setup_query``, ``get_copy_partition_query`` and
+       ``get_copy_conclusion_query``
     5. Clean the data: ``clean_image_data``
 
     This is the main function of this module.
@@ -303,18 +400,40 @@ def refresh_api_table(
         )
         downstream_cur.execute(init_fdw)
 
-        # Step 4: Import data into a temporary table
-        log.info("Copying upstream data...")
-        limit = get_record_limit()
-        copy_data = get_copy_data_query(
+        # Step 4a: Set up the temporary table
+        log.info("Creating temporary table...")
+        downstream_cur.execute(get_copy_setup_query(downstream_table, approach))
+
+    # Step 4b: Import data into the temporary table. Unless a limit is in place,
+    # the upstream table is split on ``identifier`` into partitions that are
+    # copied concurrently.
+    log.info("Copying upstream data...")
+    limit = get_record_limit()
+    partition_count = COPY_PARTITIONS
+    if limit or "identifier" not in shared_cols:
+        partition_count = 1
+    copy_partitions = [
+        get_copy_partition_query(
             upstream_table,
             downstream_table,
             shared_cols,
             approach=approach,
             limit=limit,
+            identifier_range=bounds,
         )
-        log.info(f"Running copy-data query: \n{copy_data.as_string(downstream_cur)}")
-        downstream_cur.execute(copy_data)
+        for bounds in _get_partition_bounds(partition_count)
+    ]
+    with downstream_db.cursor() as downstream_cur:
+        log.info(
+            f"Running copy-data query in {partition_count} partition(s): \n"
+            f"{copy_partitions[0].as_string(downstream_cur)}"
+        )
+    copied = _copy_partitions(copy_partitions, progress)
+    log.info(f"Copied {copied} rows from upstream.")
+
+    with downstream_db, downstream_db.cursor() as downstream_cur:
+        # Step 4c: Add the primary key and close the FDW
+        downstream_cur.execute(get_copy_conclusion_query(downstream_table))
 
     next_step = (
         "image data cleaning"
@@ -91,31 +91,22 @@ def get_fdw_query(
     )
 
 
-def get_copy_data_query(
-    upstream_table: str,
-    downstream_table: str,
-    columns: list[str],
-    approach: ApproachType,
-    limit: int | None = 100_000,
-):
+def get_copy_setup_query(downstream_table: str, approach: ApproachType):
     """
-    Get the query for copying data from an upstream table to a temp downstream table.
+    Get the query for creating the temp downstream table that receives the copied data.
 
-    This temporary table in the downstream DB will eventually replace the permanent one.
-    This query uses the "temp_import_" prefix on the temporary table and avoids entries
-    from the deleted table with the "api_deleted" prefix. After the copying process,
-    the "upstream" schema is dropped and the FDW is closed.
+    The table is created with the "temp_import_" prefix and mirrors the structure of
+    the downstream table. Its ``id`` column is backed by a regular (non-temporary)
+    sequence so that several connections can insert into it concurrently.
 
-    When running this on a non-production environment, the results will be ordered
-    by `identifier` to simulate a random sample and only the first 100k records
-    will be pulled from the upstream database.
+    The sequence is owned by the ``id`` column of the temp table, so that it is
+    dropped along with the table. The live table copied on the next refresh
+    shares the sequence, whose ownership then moves to the new temp table before
+    the live table is dropped.
 
-    :param upstream_table: the name of the upstream table being copied
     :param downstream_table: the name of the downstream table being replaced
-    :param columns: the names of the columns to copy from upstream
     :param approach: whether to use advanced logic specific to media ingestion
-    :param limit: number of rows to copy when
-    :return: the SQL query for copying the data
+    :return: the SQL query for setting up the temp table
     """
 
     table_creation = dedent(
@@ -130,9 +121,11 @@ def get_copy_data_query(
         """
     ALTER TABLE {temp_table} ADD COLUMN IF NOT EXISTS
         id serial;
-    CREATE TEMP SEQUENCE IF NOT EXISTS id_temp_seq;
+    CREATE SEQUENCE IF NOT EXISTS {id_sequence};
+    ALTER SEQUENCE {id_sequence} RESTART;
     ALTER TABLE {temp_table} ALTER COLUMN
-        id SET DEFAULT nextval('id_temp_seq'::regclass);
+        id SET DEFAULT nextval({id_sequence_name}::regclass);
+    ALTER SEQUENCE {id_sequence} OWNED BY {temp_table}.id;
     """
     )
 
@@ -154,22 +147,55 @@ def get_copy_data_query(
     """
     )
 
-    conclusion = dedent(
-        """
-    ALTER TABLE {temp_table} ADD PRIMARY KEY (id);
-    DROP SERVER upstream CASCADE;
-    """
+    if approach == "basic":
+        tertiary_column_setup = timestamp_column_setup
+    else:  # approach == 'advanced'
+        tertiary_column_setup = metric_column_setup
+
+    steps = [table_creation, id_column_setup, tertiary_column_setup]
+
+    id_sequence = f"id_temp_import_{downstream_table}_seq"
+    return SQL("".join(steps)).format(
+        downstream_table=Identifier(downstream_table),
+        temp_table=Identifier(f"temp_import_{downstream_table}"),
+        id_sequence=Identifier(id_sequence),
+        id_sequence_name=PgLiteral(id_sequence),
     )
 
+
+def get_copy_partition_query(
+    upstream_table: str,
+    downstream_table: str,
+    columns: list[str],
+    approach: ApproachType,
+    limit: int | None = None,
+    identifier_range: tuple[str | None, str | None] | None = None,
+):
+    """
+    Get the query for copying (a partition of) the upstream table into the temp table.
+
+    Entries from the deleted table with the "api_deleted" prefix are skipped when
+    using the advanced approach. When an ``identifier_range`` is given, only the
+    rows whose ``identifier`` falls in the half-open range ``[lower, upper)`` are
+    copied; a ``None`` bound leaves that side of the range open.
+
+    :param upstream_table: the name of the upstream table being copied
+    :param downstream_table: the name of the downstream table being replaced
+    :param columns: the names of the columns to copy from upstream
+    :param approach: whether to use advanced logic specific to media ingestion
+    :param limit: number of rows to copy, if any
+    :param identifier_range: the lower and upper ``identifier`` bounds to copy
+    :return: the SQL query for copying the data
+    """
+
     if approach == "basic":
-        tertiary_column_setup = timestamp_column_setup
         select_insert = dedent(
             """
-        INSERT INTO {temp_table} ({columns}) SELECT {columns} FROM {upstream_table}
+        INSERT INTO {temp_table} ({columns}) SELECT {columns} FROM {upstream_table} AS u
+        WHERE TRUE
         """
         )
     else:  # approach == 'advanced'
-        tertiary_column_setup = metric_column_setup
         select_insert = dedent(
             """
         INSERT INTO {temp_table} ({columns})
@@ -181,6 +207,12 @@ def get_copy_data_query(
         """
         )
 
+    lower, upper = identifier_range or (None, None)
+    if lower is not None:
+        select_insert += "    AND u.identifier >= {lower}::uuid\n"
+    if upper is not None:
+        select_insert += "    AND u.identifier < {upper}::uuid\n"
+
     # If a limit is requested, add the condition onto the select at the very end
     if limit:
         select_insert += "    LIMIT {limit}"
@@ -188,24 +220,37 @@ def get_copy_data_query(
     # Always add a semi-colon at the end
     select_insert += ";"
 
-    steps = [
-        table_creation,
-        id_column_setup,
-        tertiary_column_setup,
-        select_insert,
-        conclusion,
-    ]
-
-    return SQL("".join(steps)).format(
-        downstream_table=Identifier(downstream_table),
+    return SQL(select_insert).format(
         temp_table=Identifier(f"temp_import_{downstream_table}"),
         upstream_table=Identifier("upstream_schema", upstream_table),
         deleted_table=Identifier(f"api_deleted{downstream_table}"),
         columns=SQL(",").join([Identifier(col) for col in columns]),
         limit=PgLiteral(limit),
+        lower=PgLiteral(lower),
+        upper=PgLiteral(upper),
     )
 
 
+def get_copy_conclusion_query(downstream_table: str):
+    """
+    Get the query for finalising the temp table once all the data has been copied.
+
+    This adds the primary key to the temp table and drops the "upstream" FDW server.
+
+    :param downstream_table: the name of the downstream table being replaced
+    :return: the SQL query for finalising the copy
+    """
+
+    return SQL(
+        dedent(
+            """
+    ALTER TABLE {temp_table} ADD PRIMARY KEY (id);
+    DROP SERVER upstream CASCADE;
+    """
+        )
+    ).format(temp_table=Identifier(f"temp_import_{downstream_table}"))
+
+
 def get_go_live_query(table: str, index_mapping: dict[str, str]):
     """
     Get the query for replacing the old table with new temporary table.
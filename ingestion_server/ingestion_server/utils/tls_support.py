@@ -0,0 +1,99 @@
+"""
+Read and write the persistent store of which domains support TLS.
+
+The store is the ``tls_support`` table in the upstream database, which is shared with
+the catalog, where it is populated while validating URLs and by the
+``warm_tls_support_store`` DAG. Domains are keyed by their fully qualified domain name,
+or their IP address if they have none.
+"""
+
+import logging as log
+
+import psycopg2
+from decouple import config
+from psycopg2.extras import execute_values
+
+from ingestion_server.db_helpers import DB_UPSTREAM_CONFIG, database_connect
+
+
+TLS_SUPPORT_STORE_ENABLED = config(
+    "TLS_SUPPORT_STORE_ENABLED", default=False, cast=bool
+)
+TLS_SUPPORT_TTL_DAYS = config("TLS_SUPPORT_TTL_DAYS", default=30, cast=int)
+
+CREATE_TLS_SUPPORT_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS tls_support (
+  domain character varying(1000) PRIMARY KEY,
+  supported boolean NOT NULL,
+  tested_on timestamp with time zone NOT NULL DEFAULT now()
+);
+"""
+
+SELECT_TLS_SUPPORT_QUERY = """
+SELECT domain, supported FROM tls_support
+WHERE tested_on > now() - make_interval(days => %s);
+"""
+
+UPSERT_TLS_SUPPORT_QUERY = """
+INSERT INTO tls_support (domain, supported, tested_on) VALUES %s
+ON CONFLICT (domain) DO UPDATE
+SET supported = EXCLUDED.supported, tested_on = EXCLUDED.tested_on;
+"""
+
+
+def load_tls_support() -> dict[str, bool]:
+    """
+    Load all the fresh results from the store, creating it first if needed.
+
+    This is called once before the cleanup workers are forked, so that they can
+    write to the table without each trying to create it.
+
+    :return: a mapping of domains to whether they support TLS, which is empty if the
+    store is disabled or cannot be read
+    """
+
+    if not TLS_SUPPORT_STORE_ENABLED:
+        return {}
+    conn = database_connect(dbconfig=DB_UPSTREAM_CONFIG, attempt_reconnect=False)
+    if conn is None:
+        log.warning("Could not connect to the TLS support store.")
+        return {}
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute(CREATE_TLS_SUPPORT_TABLE_QUERY)
+            cur.execute(SELECT_TLS_SUPPORT_QUERY, (TLS_SUPPORT_TTL_DAYS,))
+            results = dict(cur.fetchall())
+    except psycopg2.Error as e:
+        log.warning(f"Could not read TLS support from the store: {e}")
+        return {}
+    finally:
+        conn.close()
+    log.info(f"Loaded TLS support for {len(results)} domains from the store.")
+    return results
+
+
+def save_tls_support(results: dict[str, bool]):
+    """
+    Record newly tested domains in the store, replacing previous results.
+
+    :param results: a mapping of domains to whether they support TLS
+    """
+
+    if not TLS_SUPPORT_STORE_ENABLED or not results:
+        return
+    conn = database_connect(dbconfig=DB_UPSTREAM_CONFIG, attempt_reconnect=False)
+    if conn is None:
+        log.warning("Could not connect to the TLS support store.")
+        return
+    try:
+        with conn, conn.cursor() as cur:
+            execute_values(
+                cur,
+                UPSERT_TLS_SUPPORT_QUERY,
+                list(results.items()),
+                template="(%s, %s, now())",
+            )
+    except psycopg2.Error as e:
+        log.warning(f"Could not write TLS support to the store: {e}")
+    finally:
+        conn.close()
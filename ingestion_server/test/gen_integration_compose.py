@@ -48,11 +48,20 @@ def _fixup_env(conf: dict):
     :param conf: the Docker Compose configuration
     """
 
+    services = list(conf["services"])
+
+    def _fixup_value(value: str) -> str:
+        if value in services:
+            return f"integration_{value}"
+        # Also map the hosts of URLs, e.g. ``http://ingestion_server:8001/``
+        for service in services:
+            value = value.replace(f"//{service}:", f"//integration_{service}:")
+        return value
+
     for service in {"ingestion_server", "indexer_worker"}:
         env = conf["services"][service]["environment"]
         conf["services"][service]["environment"] = {
-            key: f"integration_{value}" if value in conf["services"] else value
-            for key, value in env.items()
+            key: _fixup_value(value) for key, value in env.items()
         }
 
 
@@ -1,7 +1,30 @@
 import datetime
+from pathlib import Path
 from uuid import uuid4
 
+import pytest
+
+from ingestion_server import elasticsearch_models
 from ingestion_server.elasticsearch_models import Audio, Image
+from ingestion_server.utils.sensitive_terms import SensitiveTermsMatcher
+
+
+MOCK_SENSITIVE_TERMS = (
+    (Path(__file__).parents[2] / "ingestion_server/static/mock_sensitive_terms.txt")
+    .read_text()
+    .split()
+)
+
+
+@pytest.fixture(autouse=True)
+def sensitive_terms_matcher(monkeypatch):
+    """Use the mock sensitive terms instead of fetching them over HTTP."""
+
+    matcher = SensitiveTermsMatcher(MOCK_SENSITIVE_TERMS)
+    monkeypatch.setattr(
+        elasticsearch_models, "get_sensitive_terms_matcher", lambda: matcher
+    )
+    return matcher
 
 
 def create_mock_audio(override=None):
@@ -1,7 +1,11 @@
+import threading
+import time
+
 import pook
 from psycopg2._json import Json
 
-from ingestion_server.cleanup import FILTERED_TAG_PROVIDERS, CleanupFunctions
+from ingestion_server import cleanup
+from ingestion_server.cleanup import FILTERED_TAG_PROVIDERS, CleanupFunctions, TlsTest
 from test.unit_tests.conftest import create_mock_image
 
 
@@ -68,6 +72,53 @@ class TestCleanup:
         expected_http = "http://neverssl.com"
         assert result == expected
         assert result_http == expected_http
+        assert tls_support_cache == {"flickr.com": True, "neverssl.com": False}
+
+    @staticmethod
+    def test_test_tls_support_tests_missing_domains_concurrently(monkeypatch):
+        lock = threading.Lock()
+        in_flight = max_in_flight = 0
+        tested_urls = []
+
+        def test_tls_supported(url):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                tested_urls.append(url)
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return not url.startswith("insecure")
+
+        monkeypatch.setattr(TlsTest, "test_tls_supported", test_tls_supported)
+        monkeypatch.setattr(cleanup, "TLS_TEST_CONCURRENCY", 4)
+        sources_config = {
+            "*": {"fields": {"url": CleanupFunctions.cleanup_url}},
+            "flickr": {"fields": {"creator_url": CleanupFunctions.cleanup_url}},
+        }
+        rows = [
+            {"source": "flickr", "url": f"secure{i}.org/a.jpg", "creator_url": None}
+            for i in range(10)
+        ] + [
+            {"source": "flickr", "url": "known.org/a.jpg", "creator_url": None},
+            {"source": "flickr", "url": "https://https.org/a.jpg", "creator_url": ""},
+            {"source": "met", "url": None, "creator_url": "unused.org"},
+            {"source": "flickr", "url": None, "creator_url": "insecure.org/me"},
+            {"source": "flickr", "url": "insecure.org/a.jpg", "creator_url": None},
+        ]
+        tls_support = {"known.org": False}
+
+        cleanup._test_tls_support(rows, sources_config, tls_support)
+
+        assert tls_support == {
+            "known.org": False,
+            "insecure.org": False,
+            **{f"secure{i}.org": True for i in range(10)},
+        }
+        # Each missing domain is tested once, at most 4 at a time
+        assert len(tested_urls) == 11
+        assert max_in_flight == 4
 
     @staticmethod
     def test_rank_feature_verify():
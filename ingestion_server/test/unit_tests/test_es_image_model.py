@@ -1,3 +1,5 @@
+import pytest
+
 from ingestion_server.elasticsearch_models import Image
 from test.unit_tests.conftest import create_mock_image
 
@@ -44,3 +46,19 @@ class TestImage:
         # Default to not flagged
         sfw = create_mock_image()
         assert not sfw["mature"]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "override, expected",
+        [
+            ({}, False),
+            ({"title": "Bird on a wire"}, True),
+            ({"title": "Birdsong"}, False),
+            ({"tags": [{"name": "test"}, {"name": "Running"}]}, True),
+            ({"meta_data": {"description": "Fresh water from the tap."}}, True),
+            ({"title": None, "tags": None, "meta_data": None}, False),
+        ],
+    )
+    def test_sensitive_text(override, expected):
+        image = create_mock_image(override)
+        assert image.sensitive_text is expected
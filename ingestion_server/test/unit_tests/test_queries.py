@@ -28,11 +28,30 @@ def _join_seq(seq):
         ("advanced", "100000", True),
     ],
 )
-def test_get_copy_data_query(
+def test_get_copy_partition_query_limit(
     upstream_table, downstream_table, approach, limit, limit_expected
 ):
-    actual = queries.get_copy_data_query(
+    actual = queries.get_copy_partition_query(
         upstream_table, downstream_table, ["col1", "col2"], approach, limit
     )
     as_string = _join_seq(actual.seq).replace("\\n", "\n").strip()
     assert ("LIMIT 100000" in as_string) == limit_expected
+
+
+@pytest.mark.parametrize(
+    "identifier_range, expected_conditions",
+    [
+        (None, []),
+        ((None, "8"), ["u.identifier < 8::uuid"]),
+        (("8", None), ["u.identifier >= 8::uuid"]),
+        (("4", "8"), ["u.identifier >= 4::uuid", "u.identifier < 8::uuid"]),
+    ],
+)
+def test_get_copy_partition_query(identifier_range, expected_conditions):
+    actual = queries.get_copy_partition_query(
+        "image", "image", ["col1", "col2"], "advanced", None, identifier_range
+    )
+    as_string = _join_seq(actual.seq)
+    assert as_string.count("u.identifier ") == len(expected_conditions)
+    for condition in expected_conditions:
+        assert condition in as_string
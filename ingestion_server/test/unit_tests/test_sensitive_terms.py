@@ -0,0 +1,45 @@
+from io import BytesIO
+
+import pytest
+from decouple import UndefinedValueError
+
+from ingestion_server.utils import sensitive_terms
+from ingestion_server.utils.sensitive_terms import get_sensitive_terms
+
+
+SENSITIVE_TERMS_URL = "http://sensitive-terms.test/terms.txt"
+
+
+@pytest.fixture
+def mock_sensitive_terms(monkeypatch):
+    """Serve the given body from ``SENSITIVE_TERMS_URL``."""
+
+    def _mock_sensitive_terms(body: bytes):
+        monkeypatch.setenv("SENSITIVE_TERMS_URL", SENSITIVE_TERMS_URL)
+        monkeypatch.setattr(
+            sensitive_terms,
+            "urlopen",
+            lambda url: BytesIO(body) if url == SENSITIVE_TERMS_URL else None,
+        )
+
+    return _mock_sensitive_terms
+
+
+def test_get_sensitive_terms(mock_sensitive_terms):
+    mock_sensitive_terms(b"term1\nterm2\n")
+
+    assert get_sensitive_terms() == ["term1", "term2"]
+
+
+def test_get_sensitive_terms_requires_url(monkeypatch):
+    monkeypatch.delenv("SENSITIVE_TERMS_URL", raising=False)
+
+    with pytest.raises(UndefinedValueError):
+        get_sensitive_terms()
+
+
+def test_get_sensitive_terms_rejects_empty_list(mock_sensitive_terms):
+    mock_sensitive_terms(b"\n")
+
+    with pytest.raises(ValueError, match="is empty"):
+        get_sensitive_terms()